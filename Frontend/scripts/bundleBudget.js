@@ -0,0 +1,85 @@
+import { gzipSync } from 'zlib';
+
+// Gzipped size limits in KB. "initial" is everything a cold load of any route
+// downloads before the page chunk: the entry chunk plus its static imports.
+export const defaultBudgets = {
+  initial: 200,
+  entry: 120,
+  vendor: 80,
+  page: 60,
+  asset: 40,
+  // Per-chunk overrides by chunk name
+  chunks: {
+    // Only downloaded when a seeker exports their resume
+    'vendor-pdf': 250,
+  },
+};
+
+const kb = (bytes) => (bytes / 1024).toFixed(1);
+
+const chunkKind = (chunk) => {
+  if (chunk.isEntry) return 'entry';
+  if (chunk.name.startsWith('vendor')) return 'vendor';
+  return 'page';
+};
+
+/**
+ * Vite plugin: print every chunk's raw and gzipped size after a production
+ * build and compare them against the budgets. Over-budget chunks are reported
+ * as warnings, or fail the build when BUNDLE_BUDGET_STRICT=1 (for CI).
+ */
+export default function bundleBudget(budgets = defaultBudgets) {
+  return {
+    name: 'bundle-budget',
+    apply: 'build',
+    generateBundle(outputOptions, bundle) {
+      const rows = [];
+      const sizes = {};
+      for (const file of Object.values(bundle)) {
+        const source = file.type === 'chunk' ? file.code : file.source;
+        const gzip = gzipSync(source).length;
+        sizes[file.fileName] = gzip;
+        if (file.type === 'chunk') {
+          rows.push({ file: file.fileName, name: file.name, kind: chunkKind(file), raw: Buffer.byteLength(source), gzip });
+        } else if (/\.css$/.test(file.fileName)) {
+          rows.push({ file: file.fileName, kind: 'asset', raw: Buffer.byteLength(source), gzip });
+        }
+      }
+
+      // Walk static imports from the entry to find what every first load pays for
+      const initial = new Set();
+      const visit = (fileName) => {
+        if (initial.has(fileName)) return;
+        initial.add(fileName);
+        const chunk = bundle[fileName];
+        (chunk.imports || []).forEach(visit);
+        (chunk.viteMetadata?.importedCss || []).forEach(css => initial.add(css));
+      };
+      Object.values(bundle).filter(f => f.type === 'chunk' && f.isEntry).forEach(f => visit(f.fileName));
+      const initialSize = [...initial].reduce((sum, f) => sum + (sizes[f] || 0), 0);
+
+      const failures = [];
+      rows.sort((a, b) => b.gzip - a.gzip);
+      console.log('\nBundle budget (gzip KB):');
+      for (const row of rows) {
+        const limit = budgets.chunks?.[row.name] ?? budgets[row.kind];
+        const over = limit && row.gzip / 1024 > limit;
+        if (over) failures.push(`${row.file} ${kb(row.gzip)} KB > ${limit} KB (${row.kind})`);
+        console.log(`  ${over ? '✗' : ' '} ${row.file.padEnd(48)} ${row.kind.padEnd(6)} ${kb(row.raw).padStart(8)} raw ${kb(row.gzip).padStart(7)} gzip${initial.has(row.file) ? '  [initial]' : ''}`);
+      }
+      console.log(`  initial load: ${kb(initialSize)} KB gzip (budget ${budgets.initial} KB)\n`);
+      if (initialSize / 1024 > budgets.initial) {
+        failures.push(`initial load ${kb(initialSize)} KB > ${budgets.initial} KB`);
+      }
+
+      if (failures.length > 0) {
+        const message = `Bundle budget exceeded:\n  ${failures.join('\n  ')}`;
+        if (process.env.BUNDLE_BUDGET_STRICT === '1') {
+          this.error(message);
+        } else {
+          this.warn(message);
+        }
+      }
+    },
+  };
+}
@@ -1,46 +1,30 @@
-import React from 'react';
+import React, { Suspense } from 'react';
 import { BrowserRouter as Router, Routes, Route, Navigate } from 'react-router-dom';
 import { AuthProvider } from './contexts/AuthContext';
 import { Toaster } from 'react-hot-toast';
 
-// Auth Components
+// Auth Components (the login page is the entry route, so it stays in the main bundle)
 import Login from './pages/auth/Login';
-import Register from './pages/auth/Register';
-import TwoFA from './pages/auth/TwoFA';
-import AdminLogin from './pages/auth/AdminLogin';
 
-// Job Seeker Components
-import JobSeekerDashboard from './pages/jobseeker/Dashboard';
-import Resume from './pages/jobseeker/Resume';
-import ATS from './pages/jobseeker/ATS';
-import Jobs from './pages/jobseeker/Jobs';
-import MyJobs from './pages/jobseeker/MyJobs';
-import Meetings from './pages/jobseeker/Meetings';
-import Applications from './pages/jobseeker/Applications';
-
-// Recruiter Components
-import RecruiterDashboard from './pages/recruiter/Dashboard';
-import PostJob from './pages/recruiter/PostJob';
-import RecruiterJobs from './pages/recruiter/Jobs';
-import Applicants from './pages/recruiter/Applicants';
-import Schedule from './pages/recruiter/Schedule';
-import Email from './pages/recruiter/Email';
-
-// Admin Components
-import AdminDashboard from './pages/admin/Dashboard';
-import Users from './pages/admin/Users';
-import Recruiters from './pages/admin/Recruiters';
-import Logs from './pages/admin/Logs';
-import Duplicates from './pages/admin/Duplicates';
-
-// Common Components
-import Profile from './pages/Profile';
-import Settings from './pages/Settings';
+// Pages are lazy-loaded per route, see routes.js
+import {
+  Register, TwoFA, AdminLogin,
+  JobSeekerDashboard, Resume, ATS, Jobs, MyJobs, Meetings, Applications,
+  RecruiterDashboard, PostJob, RecruiterJobs, Applicants, Schedule, Email,
+  AdminDashboard, Users, Recruiters, Logs, Duplicates,
+  Profile
+} from './routes';
 
 // Layout Components
 import ProtectedRoute from './components/ProtectedRoute';
 import Layout from './components/Layout';
 
+const PageLoader = () => (
+  <div className="min-h-[50vh] flex items-center justify-center">
+    <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-blue-600"></div>
+  </div>
+);
+
 function App() {
   return (
     <AuthProvider>
@@ -52,6 +36,7 @@ function App() {
       >
         <div className="App">
           <Toaster position="top-right" />
+          <Suspense fallback={<PageLoader />}>
           <Routes>
             {/* Public Routes */}
             <Route path="/login" element={<Login />} />
@@ -110,6 +95,7 @@ function App() {
             {/* Default Route */}
             <Route path="/" element={<Navigate to="/login" replace />} />
           </Routes>
+          </Suspense>
         </div>
       </Router>
     </AuthProvider>
@@ -0,0 +1,10 @@
+// Date range covered by a month calendar grid (6 weeks starting on the Sunday
+// on or before the 1st), as ?from=&to= params for the interview endpoints.
+export const monthGridWindow = (date) => {
+  const first = new Date(date.getFullYear(), date.getMonth(), 1);
+  const from = new Date(first);
+  from.setDate(from.getDate() - first.getDay());
+  const to = new Date(from);
+  to.setDate(to.getDate() + 42);
+  return { from: from.toISOString(), to: to.toISOString() };
+};
@@ -1,4 +1,5 @@
 import axios from 'axios';
+import { cachedAdapter, clearQueryCache } from './queryCache';
 
 // Always use the full backend URL for API calls
 const baseURL = import.meta.env.VITE_API_URL || 'http://localhost:5000';
@@ -9,6 +10,8 @@ const client = axios.create({
     'Content-Type': 'application/json',
   },
   withCredentials: false,
+  // Shared GET cache with in-flight dedup and invalidation on writes (see queryCache.js)
+  adapter: cachedAdapter(axios.getAdapter(axios.defaults.adapter)),
 });
 
 client.interceptors.request.use((config) => {
@@ -29,6 +32,7 @@ client.interceptors.response.use(
         localStorage.removeItem('token');
         localStorage.removeItem('user');
       } catch {}
+      clearQueryCache();
       if (typeof window !== 'undefined') {
         const msg = status === 401 ? 'Please sign in again.' : 'Your session is invalid or expired. Please sign in again.';
         const params = new URLSearchParams({ message: msg });
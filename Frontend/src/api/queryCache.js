@@ -0,0 +1,172 @@
+// Shared GET cache for the axios client (installed in client.js).
+//
+// Every GET goes through cachedAdapter, so all pages share one cache that
+// survives route changes:
+//   - identical requests in flight at the same time share one network call
+//   - a response younger than its TTL is served without a request
+//   - an older response, up to maxAge, is served immediately and refreshed in
+//     the background (stale-while-revalidate); subscribers get the new data
+//   - successful POST/PUT/PATCH/DELETE requests invalidate the GETs they affect
+// Entries are keyed by URL, params and the auth token, so a different
+// signed-in user never sees another user's responses.
+// Pass { cache: false } in a request config to skip cached copies; the fresh
+// response still updates the cache.
+
+const SECOND = 1000;
+
+// First matching rule wins. ttl: served without a request; maxAge: served stale
+const cachePolicies = [
+  // Streamed exports are one-off downloads
+  [/\/export$/, null],
+  [/^\/api\/views\//, { ttl: 10 * SECOND, maxAge: 60 * SECOND }],
+  [/^\/api\/admin\//, { ttl: 5 * SECOND, maxAge: 60 * SECOND }],
+  [/^\/api\/(jobseeker|recruiter)\/stats/, { ttl: 15 * SECOND, maxAge: 5 * 60 * SECOND }],
+  [/^\/api\/jobseeker\/jobs$/, { ttl: 60 * SECOND, maxAge: 10 * 60 * SECOND }],
+  [/^\/api\//, { ttl: 30 * SECOND, maxAge: 5 * 60 * SECOND }],
+];
+
+// Mutation path -> GET path prefixes it invalidates. Unlisted mutations
+// invalidate the whole cache.
+const invalidationRules = [
+  // Beacons and read-only analyses change nothing the client has cached
+  [/^\/api\/views\/record/, () => []],
+  [/^\/api\/profile\/view/, () => []],
+  [/^\/api\/jobseeker\/ats\/analyze/, () => []],
+  [/^\/api\/(jobseeker|recruiter|admin)\//, (match) => [`/api/${match[1]}/`, '/api/profile']],
+];
+
+const MAX_ENTRIES = 200;
+
+// key -> { response, fetchedAt, promise, generation, listeners: Set, path }
+const entries = new Map();
+
+const pathOf = (config) => (config.url || '').replace(/^https?:\/\/[^/]+/, '').split('?')[0];
+
+const policyFor = (path) => cachePolicies.find(([pattern]) => pattern.test(path))?.[1] || null;
+
+// Same token the request interceptor in client.js sends
+const cacheKey = (config) => {
+  const params = config.params ? JSON.stringify(config.params, Object.keys(config.params).sort()) : '';
+  return `${localStorage.getItem('token') || ''} ${config.url} ${params}`;
+};
+
+const entryFor = (key, path) => {
+  let entry = entries.get(key);
+  if (!entry) {
+    entry = { response: null, fetchedAt: 0, promise: null, generation: 0, listeners: new Set(), path };
+    entries.set(key, entry);
+    if (entries.size > MAX_ENTRIES) {
+      // Drop the oldest entry nobody is subscribed to
+      for (const [oldKey, old] of entries) {
+        if (old.listeners.size === 0 && !old.promise) {
+          entries.delete(oldKey);
+          break;
+        }
+      }
+    }
+  }
+  return entry;
+};
+
+const notify = (entry) => {
+  entry.listeners.forEach((listener) => listener());
+};
+
+const fetchEntry = (entry, config, adapter) => {
+  if (!entry.promise) {
+    const generation = entry.generation;
+    const promise = adapter(config)
+      .then((response) => {
+        entry.response = response;
+        // A write that landed while this was in flight makes the result stale at once
+        entry.fetchedAt = generation === entry.generation ? Date.now() : 0;
+        notify(entry);
+        return response;
+      })
+      .finally(() => {
+        if (entry.promise === promise) entry.promise = null;
+      });
+    entry.promise = promise;
+  }
+  return entry.promise;
+};
+
+// Each caller gets its own copy, which axios then parses into its own data
+// object, so a page mutating response.data cannot corrupt the cache
+const withConfig = (response, config) => ({ ...response, config });
+
+/**
+ * Wrap an axios adapter with the cache. Non-GET requests pass through and,
+ * when they succeed, invalidate the affected GET entries.
+ */
+export const cachedAdapter = (adapter) => async (config) => {
+  const method = (config.method || 'get').toLowerCase();
+  const path = pathOf(config);
+
+  if (method !== 'get') {
+    const response = await adapter(config);
+    invalidateAfterMutation(path);
+    return response;
+  }
+
+  const policy = policyFor(path);
+  if (!policy) {
+    return adapter(config);
+  }
+
+  const entry = entryFor(cacheKey(config), path);
+  const age = config.cache === false ? Infinity : Date.now() - entry.fetchedAt;
+
+  if (entry.response && age < policy.ttl) {
+    return withConfig(entry.response, config);
+  }
+  if (entry.response && age < policy.maxAge) {
+    fetchEntry(entry, config, adapter).catch(() => {
+      // Keep serving the stale copy; the next read retries
+    });
+    return withConfig(entry.response, config);
+  }
+  return withConfig(await fetchEntry(entry, config, adapter), config);
+};
+
+/**
+ * Mark every cached GET whose path starts with one of the prefixes as expired
+ * and tell subscribers, so mounted pages refetch right away.
+ */
+export const invalidateQueries = (prefixes) => {
+  for (const entry of entries.values()) {
+    if (prefixes.some((prefix) => entry.path.startsWith(prefix))) {
+      entry.fetchedAt = 0;
+      entry.generation += 1;
+      // Requests from now on must not join a fetch that started before the write
+      entry.promise = null;
+      notify(entry);
+    }
+  }
+};
+
+const invalidateAfterMutation = (path) => {
+  const rule = invalidationRules.find(([pattern]) => pattern.test(path));
+  if (!rule) {
+    invalidateQueries(['/']);
+    return;
+  }
+  const prefixes = rule[1](path.match(rule[0]));
+  if (prefixes.length > 0) invalidateQueries(prefixes);
+};
+
+// Forget everything, e.g. on logout
+export const clearQueryCache = () => {
+  entries.clear();
+};
+
+/**
+ * Call `listener` whenever a request's cache entry gets new data or is
+ * invalidated; the listener should re-issue the GET (served from the cache
+ * when fresh). Returns an unsubscribe function.
+ */
+export const subscribeQuery = (config, listener) => {
+  const entry = entryFor(cacheKey(config), pathOf(config));
+  entry.listeners.add(listener);
+  return () => entry.listeners.delete(listener);
+};
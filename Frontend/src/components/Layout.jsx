@@ -1,13 +1,20 @@
-import React, { useState } from 'react';
+import React, { Suspense, useEffect, useState } from 'react';
 import { Outlet } from 'react-router-dom';
 import { useAuth } from '../contexts/AuthContext';
 import Navbar from './Navbar';
 import Sidebar from './Sidebar';
+import { preloadLikelyRoutes } from '../routes';
 
 const Layout = () => {
   const { user } = useAuth();
   const [sidebarOpen, setSidebarOpen] = useState(true); // Start with sidebar open
 
+  // Fetch the role's most visited pages in the background once the first page is up
+  useEffect(() => {
+    if (!user?.role) return undefined;
+    return preloadLikelyRoutes(user.role);
+  }, [user?.role]);
+
   const toggleSidebar = () => {
     setSidebarOpen(!sidebarOpen);
   };
@@ -37,7 +44,14 @@ const Layout = () => {
       {/* Main content area - Properly offset for sidebar */}
       <div className={`transition-all duration-300 pt-16 ${sidebarOpen ? 'pl-64' : 'pl-0'}`}>
         <main className="p-6 max-w-full min-h-[calc(100vh-4rem)]">
-          <Outlet />
+          {/* Keep the navbar and sidebar mounted while a page chunk loads */}
+          <Suspense fallback={
+            <div className="flex items-center justify-center py-24">
+              <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-blue-600"></div>
+            </div>
+          }>
+            <Outlet />
+          </Suspense>
         </main>
       </div>
     </div>
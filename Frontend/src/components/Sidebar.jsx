@@ -1,6 +1,7 @@
 import React from 'react';
 import { NavLink } from 'react-router-dom';
 import { useAuth } from '../contexts/AuthContext';
+import { preloadRoute } from '../routes';
 import {
     Home,
     User,
@@ -218,6 +219,8 @@ const Sidebar = ({ isOpen, onClose }) => {
                                 <NavLink
                                     key={item.name}
                                     to={item.href}
+                                    onMouseEnter={() => preloadRoute(item.href)}
+                                    onFocus={() => preloadRoute(item.href)}
                                     onClick={() => {
                                         if (window.innerWidth < 1024) {
                                             onClose();
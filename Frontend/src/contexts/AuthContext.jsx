@@ -1,6 +1,7 @@
 import React, { createContext, useContext, useState, useEffect } from 'react';
 
 import client from '../api/client';
+import { clearQueryCache } from '../api/queryCache';
 const AuthContext = createContext();
 const API_URL = '/api/auth';
 
@@ -160,6 +161,7 @@ export const AuthProvider = ({ children }) => {
   const logout = () => {
     localStorage.removeItem('token');
     localStorage.removeItem('user');
+    clearQueryCache();
     setUser(null);
     setIsAuthenticated(false);
   };
@@ -0,0 +1,46 @@
+import { useCallback, useEffect, useState } from 'react';
+import client from '../api/client';
+import { subscribeQuery } from '../api/queryCache';
+
+/**
+ * GET `url` through the shared query cache and keep the result current.
+ * Cached data renders immediately; the component re-renders when a background
+ * revalidation finishes or a write invalidates the entry.
+ */
+export const useCachedQuery = (url, { params, enabled = true } = {}) => {
+  const [state, setState] = useState({ data: null, error: null, loading: enabled });
+  const paramsKey = JSON.stringify(params || null);
+
+  const load = useCallback(async (config = {}) => {
+    try {
+      const res = await client.get(url, { params, ...config });
+      setState({ data: res.data, error: null, loading: false });
+      return res.data;
+    } catch (error) {
+      setState(prev => ({ ...prev, error, loading: false }));
+      return null;
+    }
+    // params is compared by value through paramsKey
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [url, paramsKey]);
+
+  useEffect(() => {
+    if (!enabled) return undefined;
+    let active = true;
+    const reload = () => { if (active) load(); };
+    reload();
+    const unsubscribe = subscribeQuery({ url, params }, reload);
+    return () => {
+      active = false;
+      unsubscribe();
+    };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [load, enabled]);
+
+  // Explicit refresh (e.g. a Refresh button) skips the cache
+  const refetch = useCallback(() => load({ cache: false }), [load]);
+
+  return { ...state, refetch };
+};
+
+export default useCachedQuery;
@@ -0,0 +1,82 @@
+import { useCallback, useEffect, useRef, useState } from 'react';
+
+/**
+ * Incrementally load a cursor-paginated list.
+ *
+ * `fetchPage(cursor)` returns { items, nextCursor } (cursor is null for the
+ * first page). The list restarts from the first page whenever `deps` change;
+ * responses for an older list are ignored. `loadMore` is safe to call
+ * repeatedly (e.g. from a scroll handler): it is a no-op while a page is
+ * loading or after the last page.
+ */
+export const useCursorList = (fetchPage, deps = [], { enabled = true, onError } = {}) => {
+  const [items, setItems] = useState([]);
+  const [loading, setLoading] = useState(enabled);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
+
+  const generation = useRef(0);
+  const busy = useRef(false);
+  const fetchRef = useRef(fetchPage);
+  fetchRef.current = fetchPage;
+  const onErrorRef = useRef(onError);
+  onErrorRef.current = onError;
+
+  const load = useCallback(async (cursor) => {
+    const current = generation.current;
+    busy.current = true;
+    if (cursor) setLoadingMore(true);
+    else setLoading(true);
+    try {
+      const page = await fetchRef.current(cursor);
+      if (current !== generation.current) return;
+      setItems(prev => (cursor ? [...prev, ...page.items] : page.items));
+      setNextCursor(page.nextCursor || null);
+    } catch (error) {
+      if (current !== generation.current) return;
+      if (!cursor) setItems([]);
+      setNextCursor(null);
+      onErrorRef.current?.(error);
+    } finally {
+      if (current === generation.current) {
+        busy.current = false;
+        setLoading(false);
+        setLoadingMore(false);
+      }
+    }
+  }, []);
+
+  const reload = useCallback(() => {
+    generation.current += 1;
+    busy.current = false;
+    setNextCursor(null);
+    return load(null);
+  }, [load]);
+
+  useEffect(() => {
+    if (!enabled) {
+      generation.current += 1;
+      setLoading(false);
+      return;
+    }
+    reload();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [enabled, ...deps]);
+
+  const loadMore = useCallback(() => {
+    if (busy.current || !nextCursor) return;
+    load(nextCursor);
+  }, [load, nextCursor]);
+
+  return {
+    items,
+    setItems,
+    loading,
+    loadingMore,
+    hasMore: nextCursor !== null,
+    loadMore,
+    reload,
+  };
+};
+
+export default useCursorList;
@@ -0,0 +1,39 @@
+import { useEffect, useState } from 'react';
+import client from '../api/client';
+
+const DEBOUNCE_MS = 120;
+
+/**
+ * Suggestions for what the user is typing, from the in-memory typeahead
+ * index (`kind`: comma-separated title, company, location, skill). Requests
+ * wait for a short pause in typing, and a response for an outdated prefix is
+ * dropped.
+ */
+export const useTypeahead = (text, { kind, limit = 8, enabled = true } = {}) => {
+  const [suggestions, setSuggestions] = useState([]);
+  const query = text.trim();
+
+  useEffect(() => {
+    if (!enabled || !query) {
+      setSuggestions([]);
+      return undefined;
+    }
+    let active = true;
+    const timer = setTimeout(async () => {
+      try {
+        const res = await client.get('/api/jobseeker/typeahead', { params: { q: query, kind, limit } });
+        if (active && res.data?.success) setSuggestions(res.data.suggestions);
+      } catch {
+        if (active) setSuggestions([]);
+      }
+    }, DEBOUNCE_MS);
+    return () => {
+      active = false;
+      clearTimeout(timer);
+    };
+  }, [query, kind, limit, enabled]);
+
+  return suggestions;
+};
+
+export default useTypeahead;
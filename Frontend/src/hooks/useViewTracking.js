@@ -1,10 +1,14 @@
 import { useState, useEffect, useRef } from 'react';
 import client from '../api/client';
 
+// Views already recorded this page session, shared by every component so
+// navigating back to a job does not send the beacon again
+const recordedViews = new Set();
+const pendingViews = new Map();
+
 // Custom hook for tracking views
 export const useViewTracking = () => {
   const [sessionId, setSessionId] = useState(null);
-  const recordedViews = useRef(new Set());
 
   useEffect(() => {
     // Generate or retrieve session ID
@@ -23,29 +27,36 @@ export const useViewTracking = () => {
     const viewKey = `${entityType}-${entityId}`;
     
     // Avoid recording the same view multiple times in the same session (unless forced)
-    if (!options.force && recordedViews.current.has(viewKey)) {
+    if (!options.force && recordedViews.has(viewKey)) {
       return { duplicate: true };
     }
+    // Another component is recording this view right now
+    if (!options.force && pendingViews.has(viewKey)) {
+      return pendingViews.get(viewKey);
+    }
 
-    try {
-      const response = await client.post('/api/views/record', {
-        entityType,
-        entityId: parseInt(entityId)
-      }, {
-        headers: {
-          'X-Session-ID': sessionId
-        }
-      });
-
-      if (response.data.success && !response.data.duplicate) {
-        recordedViews.current.add(viewKey);
+    const request = client.post('/api/views/record', {
+      entityType,
+      entityId: parseInt(entityId)
+    }, {
+      headers: {
+        'X-Session-ID': sessionId
+      }
+    }).then((response) => {
+      // The server also reports a duplicate when it already counted this session
+      if (response.data.success) {
+        recordedViews.add(viewKey);
       }
-
       return response.data;
-    } catch (error) {
+    }).catch((error) => {
       console.error('Failed to record view:', error);
       return { error: error.message };
-    }
+    }).finally(() => {
+      pendingViews.delete(viewKey);
+    });
+
+    pendingViews.set(viewKey, request);
+    return request;
   };
 
   const getViewCount = async (entityType, entityId) => {
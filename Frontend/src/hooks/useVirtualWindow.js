@@ -0,0 +1,175 @@
+import { useCallback, useEffect, useLayoutEffect, useMemo, useRef, useState } from 'react';
+
+// Index of the first row whose bottom edge is below `y` (offsets are prefix sums)
+const findIndex = (offsets, count, y) => {
+  let lo = 0;
+  let hi = count - 1;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (offsets[mid + 1] <= y) lo = mid + 1;
+    else hi = mid;
+  }
+  return Math.max(0, lo);
+};
+
+/**
+ * Windowed rendering for long lists that scroll with the page.
+ *
+ * Only the rows overlapping the viewport (plus `overscan` rows on each side)
+ * are rendered; spacers of `paddingTop` / `paddingBottom` keep the scroll
+ * height right. Rows may have any height: each rendered row is measured via
+ * `measureRef(key)` and unmeasured rows count as `estimateSize`. DOM size and
+ * per-frame work stay constant however many items are loaded.
+ *
+ * `items` should be memoized; `onEndReached` fires when the window gets within
+ * `endThreshold` rows of the end (used to fetch the next page).
+ */
+export const useVirtualWindow = ({
+  items,
+  getKey = (item, index) => index,
+  estimateSize = 120,
+  overscan = 6,
+  onEndReached,
+  endThreshold = 10,
+}) => {
+  const count = items.length;
+  const containerRef = useRef(null);
+  const sizes = useRef(new Map());
+  const [measureVersion, setMeasureVersion] = useState(0);
+  const [range, setRange] = useState({ start: 0, end: Math.min(count, 20) });
+
+  const keys = useMemo(() => items.map(getKey), [items]); // eslint-disable-line react-hooks/exhaustive-deps
+
+  const offsets = useMemo(() => {
+    const result = new Float64Array(count + 1);
+    for (let i = 0; i < count; i++) {
+      result[i + 1] = result[i] + (sizes.current.get(keys[i]) ?? estimateSize);
+    }
+    return result;
+  }, [keys, count, estimateSize, measureVersion]);
+
+  const offsetsRef = useRef(offsets);
+  offsetsRef.current = offsets;
+
+  const update = useCallback(() => {
+    const el = containerRef.current;
+    if (!el || count === 0) {
+      setRange(prev => (prev.start === 0 && prev.end === 0 ? prev : { start: 0, end: 0 }));
+      return;
+    }
+    const top = -el.getBoundingClientRect().top;
+    const bottom = top + window.innerHeight;
+    const first = findIndex(offsetsRef.current, count, Math.max(0, top));
+    const last = findIndex(offsetsRef.current, count, Math.max(0, bottom));
+    const start = Math.max(0, first - overscan);
+    const end = Math.min(count, last + 1 + overscan);
+    setRange(prev => (prev.start === start && prev.end === end ? prev : { start, end }));
+  }, [count, overscan]);
+
+  // Recompute on scroll / resize, at most once per frame
+  useEffect(() => {
+    let frame = null;
+    const schedule = () => {
+      if (frame === null) {
+        frame = requestAnimationFrame(() => {
+          frame = null;
+          update();
+        });
+      }
+    };
+    window.addEventListener('scroll', schedule, { passive: true });
+    window.addEventListener('resize', schedule);
+    return () => {
+      window.removeEventListener('scroll', schedule);
+      window.removeEventListener('resize', schedule);
+      if (frame !== null) cancelAnimationFrame(frame);
+    };
+  }, [update]);
+
+  useLayoutEffect(() => {
+    update();
+  }, [update, offsets]);
+
+  // One observer for all rendered rows; size changes are applied once per frame
+  const observed = useRef(new Map());
+  const pendingFrame = useRef(null);
+  const observer = useMemo(() => {
+    if (typeof ResizeObserver === 'undefined') return null;
+    return new ResizeObserver((entries) => {
+      let changed = false;
+      for (const entry of entries) {
+        const key = observed.current.get(entry.target);
+        if (key === undefined) continue;
+        const height = entry.borderBoxSize?.[0]?.blockSize ?? entry.target.getBoundingClientRect().height;
+        if (height > 0 && sizes.current.get(key) !== height) {
+          sizes.current.set(key, height);
+          changed = true;
+        }
+      }
+      if (changed && pendingFrame.current === null) {
+        pendingFrame.current = requestAnimationFrame(() => {
+          pendingFrame.current = null;
+          setMeasureVersion(v => v + 1);
+        });
+      }
+    });
+  }, []);
+
+  useEffect(() => () => {
+    observer?.disconnect();
+    if (pendingFrame.current !== null) cancelAnimationFrame(pendingFrame.current);
+  }, [observer]);
+
+  const refCallbacks = useRef(new Map());
+  const measureRef = useCallback((key) => {
+    let callback = refCallbacks.current.get(key);
+    if (!callback) {
+      let current = null;
+      callback = (el) => {
+        if (current && observer) {
+          observer.unobserve(current);
+          observed.current.delete(current);
+        }
+        current = el;
+        if (el && observer) {
+          observed.current.set(el, key);
+          observer.observe(el);
+        }
+      };
+      refCallbacks.current.set(key, callback);
+    }
+    return callback;
+  }, [observer]);
+
+  // Forget callbacks for rows that are no longer in the list
+  useEffect(() => {
+    const live = new Set(keys);
+    for (const key of refCallbacks.current.keys()) {
+      if (!live.has(key)) refCallbacks.current.delete(key);
+    }
+  }, [keys]);
+
+  const end = Math.min(range.end, count);
+  const start = Math.min(range.start, end);
+
+  useEffect(() => {
+    if (onEndReached && count > 0 && end >= count - endThreshold) {
+      onEndReached();
+    }
+  }, [end, count, endThreshold, onEndReached]);
+
+  const virtualItems = [];
+  for (let index = start; index < end; index++) {
+    virtualItems.push({ index, key: keys[index], item: items[index] });
+  }
+
+  return {
+    containerRef,
+    virtualItems,
+    measureRef,
+    paddingTop: offsets[start] || 0,
+    paddingBottom: Math.max(0, offsets[count] - offsets[end]),
+  };
+};
+
+export default useVirtualWindow;
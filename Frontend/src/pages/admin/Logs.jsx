@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useMemo, useCallback } from 'react';
 import toast from 'react-hot-toast';
 import {
   Activity,
@@ -21,84 +21,101 @@ import {
   Globe,
   Lock
 } from 'lucide-react';
+import useCursorList from '../../hooks/useCursorList';
+import useVirtualWindow from '../../hooks/useVirtualWindow';
+
+const PAGE_SIZE = 50;
+
+// Transform data to match expected format
+const mapLog = (log) => ({
+  id: log.log_id,
+  timestamp: log.timestamp || log.created_at,
+  level: log.level || 'info',
+  type: log.actor_type || 'system',
+  action: log.action || 'unknown',
+  userId: log.actor_id,
+  userName: log.actor_name || 'System',
+  userEmail: null,
+  ipAddress: log.ip_address || 'localhost',
+  userAgent: 'JobPortal Backend v1.0',
+  message: log.details || log.action || 'System activity',
+  details: {
+    company: log.company
+  }
+});
+
+// Earliest timestamp a date filter keeps, or null for all time
+const cutoffFor = (dateFilter) => {
+  const now = new Date();
+  const cutoffDate = new Date();
+
+  switch (dateFilter) {
+    case 'today':
+      cutoffDate.setHours(0, 0, 0, 0);
+      return cutoffDate;
+    case 'week':
+      cutoffDate.setDate(now.getDate() - 7);
+      return cutoffDate;
+    case 'month':
+      cutoffDate.setMonth(now.getMonth() - 1);
+      return cutoffDate;
+    default:
+      return null;
+  }
+};
 
 const AdminLogs = () => {
-  const [loading, setLoading] = useState(true);
-  const [logs, setLogs] = useState([]);
-  const [filteredLogs, setFilteredLogs] = useState([]);
   const [searchTerm, setSearchTerm] = useState('');
   const [levelFilter, setLevelFilter] = useState('all');
   const [typeFilter, setTypeFilter] = useState('all');
   const [dateFilter, setDateFilter] = useState('all');
   const [selectedLog, setSelectedLog] = useState(null);
   const [showLogModal, setShowLogModal] = useState(false);
-  const [pagination, setPagination] = useState({ page: 1, limit: 50, total: 0, pages: 1 });
 
-  // Fetch logs from API
-  const fetchLogs = async () => {
-    setLoading(true);
-    try {
-      const token = localStorage.getItem('token');
-      const params = new URLSearchParams();
-      if (typeFilter !== 'all') params.append('actor_type', typeFilter);
-      params.append('page', pagination.page);
-      params.append('limit', pagination.limit);
-      
-      const response = await fetch(`/api/admin/logs?${params.toString()}`, {
-        headers: {
-          'Authorization': `Bearer ${token}`,
-          'Content-Type': 'application/json'
-        }
-      });
-      
-      if (!response.ok) throw new Error('Failed to fetch logs');
-      
-      const data = await response.json();
-      if (data.success) {
-        // Transform data to match expected format
-        const transformedLogs = data.logs.map((log, index) => ({
-          id: log.log_id || index + 1,
-          timestamp: log.timestamp || log.created_at,
-          level: log.level || 'info',
-          type: log.actor_type || 'system',
-          action: log.action || 'unknown',
-          userId: log.actor_id,
-          userName: log.actor_name || 'System',
-          userEmail: null,
-          ipAddress: log.ip_address || 'localhost',
-          userAgent: 'JobPortal Backend v1.0',
-          message: log.details || log.action || 'System activity',
-          details: {
-            company: log.company
-          }
-        }));
-        setLogs(transformedLogs);
-        setFilteredLogs(transformedLogs);
-        setPagination(data.pagination || { page: 1, limit: 50, total: transformedLogs.length, pages: 1 });
+  // Fetch logs from API, one cursor page at a time
+  const fetchLogs = async (cursor) => {
+    const token = localStorage.getItem('token');
+    const params = new URLSearchParams();
+    if (typeFilter !== 'all') params.append('actor_type', typeFilter);
+    params.append('limit', PAGE_SIZE);
+    params.append('cursor', cursor || '');
+
+    const response = await fetch(`/api/admin/logs?${params.toString()}`, {
+      headers: {
+        'Authorization': `Bearer ${token}`,
+        'Content-Type': 'application/json'
       }
-    } catch (error) {
-      console.error('Error fetching logs:', error);
-      // Show empty state instead of error for no logs
-      setLogs([]);
-      setFilteredLogs([]);
-    } finally {
-      setLoading(false);
-    }
+    });
+
+    if (!response.ok) throw new Error('Failed to fetch logs');
+
+    const data = await response.json();
+    if (!data.success) return { items: [], nextCursor: null };
+    return { items: data.logs.map(mapLog), nextCursor: data.next_cursor };
   };
 
-  useEffect(() => {
-    fetchLogs();
-  }, [typeFilter, pagination.page]);
+  const {
+    items: logs,
+    loading,
+    loadingMore,
+    hasMore,
+    loadMore,
+    reload: reloadLogs,
+  } = useCursorList(fetchLogs, [typeFilter], {
+    // Show empty state instead of error for no logs
+    onError: (error) => console.error('Error fetching logs:', error),
+  });
 
-  useEffect(() => {
-    // Client-side filtering
+  // Client-side filtering
+  const filteredLogs = useMemo(() => {
     let filtered = logs;
 
     if (searchTerm) {
+      const term = searchTerm.toLowerCase();
       filtered = filtered.filter(log =>
-        (log.message && log.message.toLowerCase().includes(searchTerm.toLowerCase())) ||
-        (log.action && log.action.toLowerCase().includes(searchTerm.toLowerCase())) ||
-        (log.userName && log.userName.toLowerCase().includes(searchTerm.toLowerCase())) ||
+        (log.message && log.message.toLowerCase().includes(term)) ||
+        (log.action && log.action.toLowerCase().includes(term)) ||
+        (log.userName && log.userName.toLowerCase().includes(term)) ||
         (log.ipAddress && log.ipAddress.includes(searchTerm))
       );
     }
@@ -107,32 +124,38 @@ const AdminLogs = () => {
       filtered = filtered.filter(log => log.level === levelFilter);
     }
 
-    if (dateFilter !== 'all') {
-      const now = new Date();
-      let cutoffDate = new Date();
-      
-      switch (dateFilter) {
-        case 'today':
-          cutoffDate.setHours(0, 0, 0, 0);
-          break;
-        case 'week':
-          cutoffDate.setDate(now.getDate() - 7);
-          break;
-        case 'month':
-          cutoffDate.setMonth(now.getMonth() - 1);
-          break;
-        default:
-          cutoffDate = null;
-      }
-
-      if (cutoffDate) {
-        filtered = filtered.filter(log => new Date(log.timestamp) >= cutoffDate);
-      }
+    const cutoffDate = cutoffFor(dateFilter);
+    if (cutoffDate) {
+      filtered = filtered.filter(log => new Date(log.timestamp) >= cutoffDate);
     }
 
-    setFilteredLogs(filtered);
+    return filtered;
   }, [searchTerm, levelFilter, dateFilter, logs]);
 
+  const stats = useMemo(() => {
+    const counts = { error: 0, warning: 0, security: 0, user_action: 0 };
+    logs.forEach(l => {
+      if (l.level === 'error') counts.error++;
+      if (l.level === 'warning') counts.warning++;
+      if (l.type === 'security') counts.security++;
+      if (l.type === 'user_action') counts.user_action++;
+    });
+    return counts;
+  }, [logs]);
+
+  const handleEndReached = useCallback(() => {
+    if (hasMore) loadMore();
+  }, [hasMore, loadMore]);
+
+  // Only the rows near the viewport are rendered; spacer rows keep the scroll height
+  const { containerRef, virtualItems, measureRef, paddingTop, paddingBottom } = useVirtualWindow({
+    items: filteredLogs,
+    getKey: (log) => log.id,
+    estimateSize: 73,
+    overscan: 10,
+    onEndReached: handleEndReached,
+  });
+
   const getLevelIcon = (level) => {
     const icons = {
       info: <Info className="w-4 h-4 text-blue-500" />,
@@ -172,31 +195,35 @@ const AdminLogs = () => {
     setShowLogModal(true);
   };
 
-  const exportLogs = () => {
-    const csvContent = [
-      ['Timestamp', 'Level', 'Type', 'Action', 'User', 'IP Address', 'Message'].join(','),
-      ...filteredLogs.map(log => [
-        new Date(log.timestamp).toISOString(),
-        log.level,
-        log.type,
-        log.action,
-        log.userName || 'System',
-        log.ipAddress,
-        `"${log.message}"`
-      ].join(','))
-    ].join('\n');
-
-    const blob = new Blob([csvContent], { type: 'text/csv' });
-    const url = window.URL.createObjectURL(blob);
-    const a = document.createElement('a');
-    a.href = url;
-    a.download = `logs_${new Date().toISOString().split('T')[0]}.csv`;
-    a.click();
-    window.URL.revokeObjectURL(url);
-    toast.success('Logs exported successfully');
+  // The server streams every matching log (not just the loaded pages) as CSV
+  const exportLogs = async () => {
+    try {
+      const token = localStorage.getItem('token');
+      const params = new URLSearchParams();
+      if (typeFilter !== 'all') params.append('actor_type', typeFilter);
+      const cutoffDate = cutoffFor(dateFilter);
+      if (cutoffDate) params.append('start_date', cutoffDate.toISOString());
+
+      const response = await fetch(`/api/admin/logs/export?${params.toString()}`, {
+        headers: { 'Authorization': `Bearer ${token}` }
+      });
+      if (!response.ok) throw new Error('Failed to export logs');
+
+      const blob = await response.blob();
+      const url = window.URL.createObjectURL(blob);
+      const a = document.createElement('a');
+      a.href = url;
+      a.download = `logs_${new Date().toISOString().split('T')[0]}.csv`;
+      a.click();
+      window.URL.revokeObjectURL(url);
+      toast.success('Logs exported successfully');
+    } catch (error) {
+      console.error('Error exporting logs:', error);
+      toast.error('Failed to export logs');
+    }
   };
 
-  if (loading) {
+  if (loading && logs.length === 0) {
     return (
       <div className="flex items-center justify-center h-64">
         <RotateCcw className="w-8 h-8 animate-spin text-blue-600" />
@@ -221,7 +248,7 @@ const AdminLogs = () => {
             Export
           </button>
           <button
-            onClick={() => window.location.reload()}
+            onClick={reloadLogs}
             className="px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 font-medium"
           >
             <RotateCcw className="w-4 h-4 inline mr-2" />
@@ -247,7 +274,7 @@ const AdminLogs = () => {
             <div>
               <p className="text-sm font-medium text-gray-600">Errors</p>
               <p className="text-2xl font-bold text-red-600">
-                {logs.filter(l => l.level === 'error').length}
+                {stats.error}
               </p>
             </div>
             <XCircle className="w-8 h-8 text-red-400" />
@@ -259,7 +286,7 @@ const AdminLogs = () => {
             <div>
               <p className="text-sm font-medium text-gray-600">Warnings</p>
               <p className="text-2xl font-bold text-yellow-600">
-                {logs.filter(l => l.level === 'warning').length}
+                {stats.warning}
               </p>
             </div>
             <AlertTriangle className="w-8 h-8 text-yellow-400" />
@@ -271,7 +298,7 @@ const AdminLogs = () => {
             <div>
               <p className="text-sm font-medium text-gray-600">Security Events</p>
               <p className="text-2xl font-bold text-purple-600">
-                {logs.filter(l => l.type === 'security').length}
+                {stats.security}
               </p>
             </div>
             <Lock className="w-8 h-8 text-purple-400" />
@@ -283,7 +310,7 @@ const AdminLogs = () => {
             <div>
               <p className="text-sm font-medium text-gray-600">User Actions</p>
               <p className="text-2xl font-bold text-blue-600">
-                {logs.filter(l => l.type === 'user_action').length}
+                {stats.user_action}
               </p>
             </div>
             <User className="w-8 h-8 text-blue-400" />
@@ -374,9 +401,12 @@ const AdminLogs = () => {
                 </th>
               </tr>
             </thead>
-            <tbody className="bg-white divide-y divide-gray-200">
-              {filteredLogs.map((log) => (
-                <tr key={log.id} className="hover:bg-gray-50">
+            <tbody ref={containerRef} className="bg-white divide-y divide-gray-200">
+              {paddingTop > 0 && (
+                <tr aria-hidden="true"><td colSpan={7} style={{ height: paddingTop, padding: 0 }} /></tr>
+              )}
+              {virtualItems.map(({ item: log }) => (
+                <tr key={log.id} ref={measureRef(log.id)} className="hover:bg-gray-50">
                   <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
                     <div className="flex items-center">
                       <Clock className="w-4 h-4 mr-2 text-gray-400" />
@@ -428,10 +458,20 @@ const AdminLogs = () => {
                   </td>
                 </tr>
               ))}
+              {paddingBottom > 0 && (
+                <tr aria-hidden="true"><td colSpan={7} style={{ height: paddingBottom, padding: 0 }} /></tr>
+              )}
             </tbody>
           </table>
         </div>
 
+        {loadingMore && (
+          <div className="flex items-center justify-center py-4 text-sm text-gray-500">
+            <RotateCcw className="w-4 h-4 mr-2 animate-spin" />
+            Loading more logs…
+          </div>
+        )}
+
         {filteredLogs.length === 0 && (
           <div className="text-center py-12">
             <Activity className="mx-auto h-12 w-12 text-gray-400" />
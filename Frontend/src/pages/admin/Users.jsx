@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo, useCallback } from 'react';
 import toast from 'react-hot-toast';
 import {
   Users,
@@ -22,84 +22,89 @@ import {
   RefreshCw,
   MoreHorizontal
 } from 'lucide-react';
+import useCursorList from '../../hooks/useCursorList';
+import useVirtualWindow from '../../hooks/useVirtualWindow';
+
+const PAGE_SIZE = 50;
+
+// Transform data to match expected format
+const mapUser = (user) => ({
+  id: user.user_id,
+  name: user.name || 'Unknown',
+  email: user.email,
+  phone: user.phone || 'Not provided',
+  location: user.location || 'Not specified',
+  role: user.role,
+  status: 'active', // Default status since we don't have status column
+  avatar: null,
+  joinDate: user.created_at,
+  lastActive: user.updated_at || user.created_at,
+  company: user.company,
+  designation: user.designation,
+  verifiedEmail: true,
+  verifiedPhone: false
+});
 
 const AdminUsers = () => {
-  const [loading, setLoading] = useState(true);
-  const [users, setUsers] = useState([]);
-  const [filteredUsers, setFilteredUsers] = useState([]);
   const [searchTerm, setSearchTerm] = useState('');
+  const [serverSearch, setServerSearch] = useState('');
   const [roleFilter, setRoleFilter] = useState('all');
   const [statusFilter, setStatusFilter] = useState('all');
   const [selectedUsers, setSelectedUsers] = useState([]);
-  const [pagination, setPagination] = useState({ page: 1, limit: 20, total: 0, pages: 1 });
 
-  // Fetch users from API
-  const fetchUsers = async () => {
-    setLoading(true);
-    try {
-      const token = localStorage.getItem('token');
-      const params = new URLSearchParams();
-      if (roleFilter !== 'all') params.append('role', roleFilter);
-      if (searchTerm) params.append('search', searchTerm);
-      params.append('page', pagination.page);
-      params.append('limit', pagination.limit);
-      
-      const response = await fetch(`/api/admin/users?${params.toString()}`, {
-        headers: {
-          'Authorization': `Bearer ${token}`,
-          'Content-Type': 'application/json'
-        }
-      });
-      
-      if (!response.ok) throw new Error('Failed to fetch users');
-      
-      const data = await response.json();
-      if (data.success) {
-        // Transform data to match expected format
-        const transformedUsers = data.users.map(user => ({
-          id: user.user_id,
-          name: user.name || 'Unknown',
-          email: user.email,
-          phone: user.phone || 'Not provided',
-          location: user.location || 'Not specified',
-          role: user.role,
-          status: 'active', // Default status since we don't have status column
-          avatar: null,
-          joinDate: user.created_at,
-          lastActive: user.updated_at || user.created_at,
-          company: user.company,
-          designation: user.designation,
-          verifiedEmail: true,
-          verifiedPhone: false
-        }));
-        setUsers(transformedUsers);
-        setFilteredUsers(transformedUsers);
-        setPagination(data.pagination || { page: 1, limit: 20, total: transformedUsers.length, pages: 1 });
-        toast.success(`Loaded ${transformedUsers.length} users`);
+  // Only ask the server again once typing pauses
+  useEffect(() => {
+    const timer = setTimeout(() => setServerSearch(searchTerm.trim()), 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
+  // Fetch users from API, one cursor page at a time
+  const fetchUsers = async (cursor) => {
+    const token = localStorage.getItem('token');
+    const params = new URLSearchParams();
+    if (roleFilter !== 'all') params.append('role', roleFilter);
+    if (serverSearch) params.append('search', serverSearch);
+    params.append('limit', PAGE_SIZE);
+    params.append('cursor', cursor || '');
+
+    const response = await fetch(`/api/admin/users?${params.toString()}`, {
+      headers: {
+        'Authorization': `Bearer ${token}`,
+        'Content-Type': 'application/json'
       }
-    } catch (error) {
-      console.error('Error fetching users:', error);
-      toast.error('Failed to fetch users');
-      setUsers([]);
-      setFilteredUsers([]);
-    } finally {
-      setLoading(false);
-    }
+    });
+
+    if (!response.ok) throw new Error('Failed to fetch users');
+
+    const data = await response.json();
+    if (!data.success) return { items: [], nextCursor: null };
+    return { items: data.users.map(mapUser), nextCursor: data.next_cursor };
   };
 
-  useEffect(() => {
-    fetchUsers();
-  }, [roleFilter, pagination.page]);
+  const {
+    items: users,
+    setItems: setUsers,
+    loading,
+    loadingMore,
+    hasMore,
+    loadMore,
+  } = useCursorList(fetchUsers, [roleFilter, serverSearch], {
+    onError: (error) => {
+      console.error('Error fetching users:', error);
+      toast.error('Failed to fetch users');
+    },
+  });
 
-  useEffect(() => {
-    // Client-side filtering for search and status
+  // Client-side filtering for search and status
+  const filteredUsers = useMemo(() => {
     let filtered = users;
 
     if (searchTerm) {
+      const term = searchTerm.toLowerCase();
       filtered = filtered.filter(user =>
-        user.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        user.email.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        (user.location && user.location.toLowerCase().includes(searchTerm.toLowerCase()))
+        user.name.toLowerCase().includes(term) ||
+        user.email.toLowerCase().includes(term) ||
+        (user.location && user.location.toLowerCase().includes(term))
       );
     }
 
@@ -107,9 +112,31 @@ const AdminUsers = () => {
       filtered = filtered.filter(user => user.status === statusFilter);
     }
 
-    setFilteredUsers(filtered);
+    return filtered;
   }, [searchTerm, statusFilter, users]);
 
+  const stats = useMemo(() => {
+    const counts = { active: 0, job_seeker: 0, recruiter: 0 };
+    users.forEach(u => {
+      if (u.status === 'active') counts.active++;
+      if (u.role in counts) counts[u.role]++;
+    });
+    return counts;
+  }, [users]);
+
+  const handleEndReached = useCallback(() => {
+    if (hasMore) loadMore();
+  }, [hasMore, loadMore]);
+
+  // Only the rows near the viewport are rendered; spacer rows keep the scroll height
+  const { containerRef, virtualItems, measureRef, paddingTop, paddingBottom } = useVirtualWindow({
+    items: filteredUsers,
+    getKey: (user) => user.id,
+    estimateSize: 73,
+    overscan: 10,
+    onEndReached: handleEndReached,
+  });
+
   const handleStatusChange = async (userId, newStatus) => {
     try {
       const token = localStorage.getItem('token');
@@ -213,7 +240,7 @@ const AdminUsers = () => {
     return colors[role] || colors.job_seeker;
   };
 
-  if (loading) {
+  if (loading && users.length === 0) {
     return (
       <div className="flex items-center justify-center h-64">
         <RefreshCw className="w-8 h-8 animate-spin text-blue-600" />
@@ -258,7 +285,7 @@ const AdminUsers = () => {
             <div>
               <p className="text-sm font-medium text-gray-600">Active Users</p>
               <p className="text-2xl font-bold text-green-600">
-                {users.filter(u => u.status === 'active').length}
+                {stats.active}
               </p>
             </div>
             <CheckCircle className="w-8 h-8 text-green-400" />
@@ -270,7 +297,7 @@ const AdminUsers = () => {
             <div>
               <p className="text-sm font-medium text-gray-600">Job Seekers</p>
               <p className="text-2xl font-bold text-blue-600">
-                {users.filter(u => u.role === 'job_seeker').length}
+                {stats.job_seeker}
               </p>
             </div>
             <Users className="w-8 h-8 text-blue-400" />
@@ -282,7 +309,7 @@ const AdminUsers = () => {
             <div>
               <p className="text-sm font-medium text-gray-600">Recruiters</p>
               <p className="text-2xl font-bold text-purple-600">
-                {users.filter(u => u.role === 'recruiter').length}
+                {stats.recruiter}
               </p>
             </div>
             <Shield className="w-8 h-8 text-purple-400" />
@@ -404,10 +431,14 @@ const AdminUsers = () => {
                 </th>
               </tr>
             </thead>
-            <tbody className="bg-white divide-y divide-gray-200">
-              {filteredUsers.map((user) => (
+            <tbody ref={containerRef} className="bg-white divide-y divide-gray-200">
+              {paddingTop > 0 && (
+                <tr aria-hidden="true"><td colSpan={7} style={{ height: paddingTop, padding: 0 }} /></tr>
+              )}
+              {virtualItems.map(({ item: user }) => (
                 <tr
                   key={user.id}
+                  ref={measureRef(user.id)}
                   className={`hover:bg-gray-50 ${selectedUsers.includes(user.id) ? 'bg-blue-50' : ''}`}
                 >
                   <td className="px-6 py-4">
@@ -501,10 +532,20 @@ const AdminUsers = () => {
                   </td>
                 </tr>
               ))}
+              {paddingBottom > 0 && (
+                <tr aria-hidden="true"><td colSpan={7} style={{ height: paddingBottom, padding: 0 }} /></tr>
+              )}
             </tbody>
           </table>
         </div>
 
+        {loadingMore && (
+          <div className="flex items-center justify-center py-4 text-sm text-gray-500">
+            <RefreshCw className="w-4 h-4 mr-2 animate-spin" />
+            Loading more users…
+          </div>
+        )}
+
         {filteredUsers.length === 0 && (
           <div className="text-center py-12">
             <Users className="mx-auto h-12 w-12 text-gray-400" />
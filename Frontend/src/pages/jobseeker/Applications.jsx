@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import client from '../../api/client';
+import useCachedQuery from '../../hooks/useCachedQuery';
 import {
   Search,
   Calendar,
@@ -21,7 +21,8 @@ const glass = "bg-white/30 backdrop-blur-md border border-white/20 shadow-lg";
 
 const Applications = () => {
   const [applications, setApplications] = useState([]);
-  const [loading, setLoading] = useState(true);
+  // Shared query cache: revisiting the page renders the last list immediately
+  const { data, loading } = useCachedQuery('/api/jobseeker/applications');
 
   const [filters, setFilters] = useState({
     status: '',
@@ -33,41 +34,29 @@ const Applications = () => {
   const [selectedApplication, setSelectedApplication] = useState(null);
   const [isModalOpen, setIsModalOpen] = useState(false);
 
-  // Load applications from backend
+  // Map backend applications for display
   useEffect(() => {
-    const loadApplications = async () => {
-      setLoading(true);
-      try {
-        const res = await client.get('/api/jobseeker/applications');
-        if (res.data?.success) {
-          const mapped = res.data.applications.map(a => {
-            // Normalize status - treat null, undefined, empty string as 'applied'
-            const normalizedStatus = (a.status && a.status.trim()) ? a.status.trim().toLowerCase() : 'applied';
-            return {
-              id: a.application_id,
-              jobTitle: a.title,
-              company: a.company,
-              location: a.location || 'Remote',
-              salary: a.salary ? `$${Number(a.salary).toLocaleString()}` : '—',
-              appliedDate: new Date(a.applied_timestamp).toLocaleDateString(),
-              status: normalizedStatus,
-              stage: getStageFromStatus(normalizedStatus),
-              nextAction: getNextActionFromStatus(normalizedStatus),
-              recruiterName: a.recruiter_name || 'Not assigned',
-              notes: a.notes || 'No notes available',
-              logo: '/api/placeholder/40/40',
-            };
-          });
-          setApplications(mapped);
-        }
-      } catch (e) {
-        console.error('Error loading applications:', e);
-      } finally {
-        setLoading(false);
-      }
-    };
-    loadApplications();
-  }, []);
+    if (!data?.success) return;
+    const mapped = data.applications.map(a => {
+      // Normalize status - treat null, undefined, empty string as 'applied'
+      const normalizedStatus = (a.status && a.status.trim()) ? a.status.trim().toLowerCase() : 'applied';
+      return {
+        id: a.application_id,
+        jobTitle: a.title,
+        company: a.company,
+        location: a.location || 'Remote',
+        salary: a.salary ? `$${Number(a.salary).toLocaleString()}` : '—',
+        appliedDate: new Date(a.applied_timestamp).toLocaleDateString(),
+        status: normalizedStatus,
+        stage: getStageFromStatus(normalizedStatus),
+        nextAction: getNextActionFromStatus(normalizedStatus),
+        recruiterName: a.recruiter_name || 'Not assigned',
+        notes: a.notes || 'No notes available',
+        logo: '/api/placeholder/40/40',
+      };
+    });
+    setApplications(mapped);
+  }, [data]);
 
   const getStageFromStatus = (status) => {
     switch (status) {
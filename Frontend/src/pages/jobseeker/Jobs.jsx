@@ -1,4 +1,4 @@
-import React, { useEffect, useState } from 'react';
+import React, { useCallback, useDeferredValue, useEffect, useMemo, useState } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { useNavigate } from 'react-router-dom';
 import {
@@ -16,12 +16,69 @@ import {
 import client from '../../api/client';
 import toast from 'react-hot-toast';
 import Avatar from '../../components/Avatar';
+import useCursorList from '../../hooks/useCursorList';
+import useVirtualWindow from '../../hooks/useVirtualWindow';
+import useTypeahead from '../../hooks/useTypeahead';
+
+const PAGE_SIZE = 50;
+
+// Only the columns mapJob reads; the API skips the rest (and the joins behind them)
+const JOB_FIELDS = 'job_id,title,company,location,salary,job_type,created_at,job_description,skills_required,application_count';
+
+// Calculate match score based on skills and requirements
+const calculateMatchScore = (job) => {
+  // Simple match calculation - in real app, this would be more sophisticated
+  return Math.floor(Math.random() * 30) + 70; // 70-100% match
+};
+
+// Map backend jobs to UI shape
+const mapJob = (j) => {
+  const match = calculateMatchScore(j);
+  return ({
+    id: j.job_id,
+    title: j.title,
+    company: j.company || j.jobseeker_name || 'Self-employed',
+    location: j.location || 'Remote',
+    salary: j.salary ? `$${Number(j.salary).toLocaleString()}` : '—',
+    type: j.job_type || 'Full-time',
+    posted: new Date(j.created_at).toLocaleDateString(),
+    description: j.job_description || '',
+    requirements: Array.isArray(j.skills_required) ? j.skills_required : [],
+    benefits: j.benefits || [],
+    match,
+    // logo field removed - will use Avatar component
+    featured: j.featured ?? (match >= 90),
+    applicationCount: j.application_count || 0,
+    postedBy: j.jobseeker_name ? 'Job Seeker' : 'Recruiter',
+  });
+};
+
+const SUGGESTION_LABELS = { title: 'Title', company: 'Company', location: 'Location', skill: 'Skill' };
+
+// Dropdown under a search input; mousedown keeps the input from blurring first
+const SuggestionList = ({ suggestions, onPick }) => {
+  if (suggestions.length === 0) return null;
+  return (
+    <ul className="absolute z-20 left-0 right-0 mt-1 card-glass py-1 max-h-72 overflow-y-auto">
+      {suggestions.map(s => (
+        <li key={`${s.kind}:${s.value}`}>
+          <button
+            type="button"
+            onMouseDown={(e) => e.preventDefault()}
+            onClick={() => onPick(s.value)}
+            className="w-full flex items-center justify-between px-4 py-2 text-left text-gray-900 hover:bg-white/40"
+          >
+            <span className="truncate">{s.value}</span>
+            <span className="ml-3 text-xs text-gray-500">{SUGGESTION_LABELS[s.kind]}</span>
+          </button>
+        </li>
+      ))}
+    </ul>
+  );
+};
 
 const Jobs = () => {
   const navigate = useNavigate();
-  const [jobs, setJobs] = useState([]);
-  const [allJobs, setAllJobs] = useState([]);
-  const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
 
   const [filters, setFilters] = useState({
@@ -32,10 +89,23 @@ const Jobs = () => {
     experience: '',
   });
 
+  // Typing filters the loaded rows and suggests completions; the server search
+  // (filters.searchTerm / filters.location) runs on submit or on a pick
+  const [searchInput, setSearchInput] = useState('');
+  const [locationInput, setLocationInput] = useState('');
+  const [openSuggestions, setOpenSuggestions] = useState(null); // search | location
+  const searchSuggestions = useTypeahead(searchInput, {
+    kind: 'title,skill,company',
+    enabled: openSuggestions === 'search',
+  });
+  const locationSuggestions = useTypeahead(locationInput, {
+    kind: 'location',
+    enabled: openSuggestions === 'location',
+  });
+
   const [showFilters, setShowFilters] = useState(false);
   const [savedJobs, setSavedJobs] = useState(new Set());
   const [appliedJobs, setAppliedJobs] = useState(new Set());
-  const [currentPage, setCurrentPage] = useState(1);
   const [selectedJob, setSelectedJob] = useState(null);
   const [showJobModal, setShowJobModal] = useState(false);
   const [showResumePicker, setShowResumePicker] = useState(false);
@@ -44,60 +114,39 @@ const Jobs = () => {
   const [viewFilter, setViewFilter] = useState('all'); // all | saved | featured
   const [showApplied, setShowApplied] = useState(false); // debug/recruiter toggle
   const [hideSaved, setHideSaved] = useState(false); // user cleanliness toggle
-  const pageSize = 5;
 
-  useEffect(() => {
-    const fetchJobs = async () => {
-      setLoading(true);
-      setError('');
-      try {
-        const params = {};
-        if (filters.searchTerm) params.search = filters.searchTerm;
-        if (filters.experience) params.experience = filters.experience;
-        if (filters.location) params.location = filters.location;
-        if (filters.jobType) params.job_type = filters.jobType;
-        if (filters.salaryRange) params.salary_range = filters.salaryRange;
-        
-const res = await client.get('/api/jobseeker/jobs', { params });
-        if (res.data?.success) {
-          // Map backend jobs to UI shape
-          const mapped = res.data.jobs.map((j) => {
-            const match = calculateMatchScore(j);
-            return ({
-              id: j.job_id,
-              title: j.title,
-              company: j.company || j.jobseeker_name || 'Self-employed',
-              location: j.location || 'Remote',
-              salary: j.salary ? `$${Number(j.salary).toLocaleString()}` : '—',
-              type: j.job_type || 'Full-time',
-              posted: new Date(j.created_at).toLocaleDateString(),
-              description: j.job_description || '',
-              requirements: Array.isArray(j.skills_required) ? j.skills_required : [],
-              benefits: j.benefits || [],
-              saved: savedJobs.has(j.job_id),
-              applied: appliedJobs.has(j.job_id),
-              match,
-              // logo field removed - will use Avatar component
-              featured: j.featured ?? (match >= 90),
-              applicationCount: j.application_count || 0,
-              postedBy: j.jobseeker_name ? 'Job Seeker' : 'Recruiter',
-            });
-          });
-          setAllJobs(mapped);
-          setJobs(mapped);
-          console.log('Total jobs loaded:', mapped.length);
-          console.log('Jobs with applied flag:', mapped.filter(j => j.applied).length);
-        } else {
-          setError(res.data?.error || 'Failed to load jobs');
-        }
-      } catch (e) {
-        setError('Failed to load jobs');
-      } finally {
-        setLoading(false);
-      }
-    };
-    fetchJobs();
-  }, [filters.searchTerm, filters.location, filters.jobType, filters.salaryRange, filters.experience]);
+  // Server-side filters restart the list; further pages load as the user scrolls
+  const {
+    items: fetchedJobs,
+    loading,
+    loadingMore,
+    hasMore,
+    loadMore,
+  } = useCursorList(async (cursor) => {
+    const params = { limit: PAGE_SIZE, cursor: cursor || undefined, fields: JOB_FIELDS };
+    if (filters.searchTerm) params.search = filters.searchTerm;
+    if (filters.experience) params.experience = filters.experience;
+    if (filters.location) params.location = filters.location;
+    if (filters.jobType) params.job_type = filters.jobType;
+    if (filters.salaryRange) params.salary_range = filters.salaryRange;
+
+    setError('');
+    const res = await client.get('/api/jobseeker/jobs', { params });
+    if (!res.data?.success) {
+      setError(res.data?.error || 'Failed to load jobs');
+      return { items: [], nextCursor: null };
+    }
+    return { items: res.data.jobs.map(mapJob), nextCursor: res.data.next_cursor };
+  }, [filters.searchTerm, filters.location, filters.jobType, filters.salaryRange, filters.experience], {
+    onError: () => setError('Failed to load jobs'),
+  });
+
+  // Saved/applied flags come from the sets, so toggling one never rebuilds the pages
+  const allJobs = useMemo(() => fetchedJobs.map(j => ({
+    ...j,
+    saved: savedJobs.has(j.id),
+    applied: appliedJobs.has(j.id)
+  })), [fetchedJobs, savedJobs, appliedJobs]);
 
   // Fetch saved jobs and applications
   useEffect(() => {
@@ -112,7 +161,7 @@ const res = await client.get('/api/jobseeker/jobs', { params });
         }
 
         // Fetch applications
-        const appsRes = await client.get('/api/jobseeker/applications');
+        const appsRes = await client.get('/api/jobseeker/applications', { params: { fields: 'job_id' } });
         let appliedJobIds = new Set();
         if (appsRes.data?.success) {
           appliedJobIds = new Set(appsRes.data.applications.map(a => a.job_id));
@@ -121,19 +170,6 @@ const res = await client.get('/api/jobseeker/jobs', { params });
           console.log('Applications data:', appsRes.data.applications);
         }
 
-        // Sync flags onto current lists so UI updates immediately
-        setAllJobs(prev => prev.map(j => ({
-          ...j,
-          saved: savedJobIds.has(j.id),
-          applied: appliedJobIds.has(j.id)
-        })));
-        setJobs(prev => prev.map(j => ({
-          ...j,
-          saved: savedJobIds.has(j.id),
-          applied: appliedJobIds.has(j.id)
-        })));
-        console.log('Jobs after sync - applied count:', appliedJobIds.size);
-
         // Fetch user resumes for resume picker
         try {
           const resumesRes = await client.get('/api/jobseeker/resumes');
@@ -153,39 +189,22 @@ const res = await client.get('/api/jobseeker/jobs', { params });
     fetchUserData();
   }, []);
 
-  // Keep job flags in sync if sets change later
-  useEffect(() => {
-    setAllJobs(prev => prev.map(j => ({
-      ...j,
-      saved: savedJobs.has(j.id),
-      applied: appliedJobs.has(j.id)
-    })));
-    setJobs(prev => prev.map(j => ({
-      ...j,
-      saved: savedJobs.has(j.id),
-      applied: appliedJobs.has(j.id)
-    })));
-    // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [savedJobs, appliedJobs]);
-
-  // Calculate match score based on skills and requirements
-  const calculateMatchScore = (job) => {
-    // Simple match calculation - in real app, this would be more sophisticated
-    return Math.floor(Math.random() * 30) + 70; // 70-100% match
-  };
-
   const handleSearch = (e) => {
     e.preventDefault();
-    // Reset to page 1 when searching
-    setCurrentPage(1);
-    // Force re-filter by triggering state update
-    setFilters(prev => ({ ...prev }));
+    setOpenSuggestions(null);
+    setFilters(prev => ({ ...prev, searchTerm: searchInput.trim(), location: locationInput.trim() }));
   };
 
-  // Real-time search as user types
-  useEffect(() => {
-    setCurrentPage(1);
-  }, [filters.searchTerm, filters.location, filters.jobType, filters.salaryRange, filters.experience]);
+  const pickSuggestion = (field, value) => {
+    setOpenSuggestions(null);
+    if (field === 'location') {
+      setLocationInput(value);
+      setFilters(prev => ({ ...prev, location: value }));
+    } else {
+      setSearchInput(value);
+      setFilters(prev => ({ ...prev, searchTerm: value }));
+    }
+  };
 
   const toggleSaveJob = async (jobId) => {
     try {
@@ -198,8 +217,6 @@ const res = await client.get('/api/jobseeker/jobs', { params });
           newSavedJobs.delete(jobId);
         }
         setSavedJobs(newSavedJobs);
-        setJobs(jobs.map(job => job.id === jobId ? { ...job, saved: res.data.saved } : job));
-        setAllJobs(allJobs.map(job => job.id === jobId ? { ...job, saved: res.data.saved } : job));
       }
     } catch (e) {
       console.error('Error saving job:', e);
@@ -215,8 +232,6 @@ const res = await client.get('/api/jobseeker/jobs', { params });
         const newAppliedJobs = new Set(appliedJobs);
         newAppliedJobs.add(jobId);
         setAppliedJobs(newAppliedJobs);
-        setJobs(jobs.map(job => job.id === jobId ? { ...job, applied: true } : job));
-        setAllJobs(allJobs.map(job => job.id === jobId ? { ...job, applied: true } : job));
         toast.success('Application submitted successfully!');
       }
     } catch (e) {
@@ -225,30 +240,21 @@ const res = await client.get('/api/jobseeker/jobs', { params });
     }
   };
 
-  const loadMoreJobs = () => {
-    if (hasMore) {
-      setCurrentPage((p) => p + 1);
-      const nextPageSize = (currentPage + 1) * pageSize;
-      const totalVisible = Math.min(nextPageSize, filteredJobs.length);
-      toast.success(`Loading more jobs... Showing ${totalVisible} of ${filteredJobs.length} jobs`);
-    } else {
-      toast.info('No more jobs to load');
-    }
-  };
-
   const viewJobDetails = (jobId) => {
-    const job = jobs.find(j => j.id === jobId);
+    const job = allJobs.find(j => j.id === jobId);
     if (job) {
       setSelectedJob(job);
       setShowJobModal(true);
     }
   };
 
-  // Derived lists
-  const filteredByBasics = (() => {
-    let filtered = [...allJobs];
-    if (filters.searchTerm) {
-      const searchLower = filters.searchTerm.toLowerCase();
+  // Derived lists; typing filters against a deferred copy of the inputs
+  const deferredSearch = useDeferredValue(searchInput.trim());
+  const deferredLocation = useDeferredValue(locationInput.trim());
+  const filteredByBasics = useMemo(() => {
+    let filtered = allJobs;
+    if (deferredSearch) {
+      const searchLower = deferredSearch.toLowerCase();
       filtered = filtered.filter(job => 
         job.title.toLowerCase().includes(searchLower) ||
         job.company.toLowerCase().includes(searchLower) ||
@@ -256,8 +262,8 @@ const res = await client.get('/api/jobseeker/jobs', { params });
         job.requirements.some(req => req.toLowerCase().includes(searchLower))
       );
     }
-    if (filters.location) {
-      const locationLower = filters.location.toLowerCase();
+    if (deferredLocation) {
+      const locationLower = deferredLocation.toLowerCase();
       filtered = filtered.filter(job => 
         job.location.toLowerCase().includes(locationLower) ||
         job.company.toLowerCase().includes(locationLower)
@@ -275,10 +281,10 @@ const res = await client.get('/api/jobseeker/jobs', { params });
       });
     }
     return filtered;
-  })();
+  }, [allJobs, deferredSearch, deferredLocation, filters.jobType, filters.salaryRange]);
 
-  const filteredJobs = (() => {
-    let list = [...filteredByBasics];
+  const filteredJobs = useMemo(() => {
+    let list = filteredByBasics;
     // Respect the Show Applied toggle
     if (!showApplied) {
       list = list.filter(j => !appliedJobs.has(j.id));
@@ -288,10 +294,25 @@ const res = await client.get('/api/jobseeker/jobs', { params });
     if (viewFilter === 'saved') return list.filter(j => j.saved);
     if (viewFilter === 'featured') return list.filter(j => j.featured);
     return list;
-  })();
-
-  const visibleJobs = filteredJobs.slice(0, currentPage * pageSize);
-  const hasMore = visibleJobs.length < filteredJobs.length;
+  }, [filteredByBasics, showApplied, appliedJobs, hideSaved, viewFilter]);
+
+  const stats = useMemo(() => ({
+    saved: filteredJobs.filter(j => j.saved).length,
+    featured: filteredJobs.filter(j => j.featured).length,
+  }), [filteredJobs]);
+
+  const handleEndReached = useCallback(() => {
+    if (hasMore) loadMore();
+  }, [hasMore, loadMore]);
+
+  // Only the cards near the viewport are mounted, however many pages are loaded
+  const { containerRef, virtualItems, measureRef, paddingTop, paddingBottom } = useVirtualWindow({
+    items: filteredJobs,
+    getKey: (job) => job.id,
+    estimateSize: 420,
+    overscan: 3,
+    onEndReached: handleEndReached,
+  });
 
 
   if (loading) {
@@ -337,9 +358,9 @@ const res = await client.get('/api/jobseeker/jobs', { params });
           transition={{ duration: 0.6, delay: 0.4 }}
         >
           {[
-            { key: 'saved', label: 'Saved Jobs', value: filteredJobs.filter(j => j.saved).length, icon: Bookmark, color: 'pink', onClick: () => setViewFilter('saved') },
+            { key: 'saved', label: 'Saved Jobs', value: stats.saved, icon: Bookmark, color: 'pink', onClick: () => setViewFilter('saved') },
             { key: 'applied', label: 'Applied', value: appliedJobs.size, icon: TrendingUp, color: 'blue', onClick: () => navigate('/jobseeker/applications') },
-            { key: 'featured', label: 'Featured', value: filteredJobs.filter(j => j.featured).length, icon: Star, color: 'green', onClick: () => setViewFilter('featured') },
+            { key: 'featured', label: 'Featured', value: stats.featured, icon: Star, color: 'green', onClick: () => setViewFilter('featured') },
           ].map((stat, index) => (
             <motion.button
               type="button"
@@ -419,20 +440,40 @@ const res = await client.get('/api/jobseeker/jobs', { params });
                 <input
                   type="text"
                   placeholder="Job title, skills, or company"
-                  value={filters.searchTerm}
-                  onChange={(e) => setFilters({ ...filters, searchTerm: e.target.value })}
+                  value={searchInput}
+                  onChange={(e) => {
+                    setSearchInput(e.target.value);
+                    setOpenSuggestions('search');
+                  }}
+                  onFocus={() => setOpenSuggestions('search')}
+                  onBlur={() => setOpenSuggestions(null)}
+                  autoComplete="off"
                   className="input-glass w-full pl-10"
                 />
+                <SuggestionList
+                  suggestions={openSuggestions === 'search' ? searchSuggestions : []}
+                  onPick={(value) => pickSuggestion('search', value)}
+                />
               </div>
               <div className="relative">
                 <MapPin className="absolute left-3 top-1/2 transform -translate-y-1/2 h-5 w-5 text-pink-400" />
                 <input
                   type="text"
                   placeholder="Location (Remote, City, State)"
-                  value={filters.location}
-                  onChange={(e) => setFilters({ ...filters, location: e.target.value })}
+                  value={locationInput}
+                  onChange={(e) => {
+                    setLocationInput(e.target.value);
+                    setOpenSuggestions('location');
+                  }}
+                  onFocus={() => setOpenSuggestions('location')}
+                  onBlur={() => setOpenSuggestions(null)}
+                  autoComplete="off"
                   className="input-glass w-full pl-10"
                 />
+                <SuggestionList
+                  suggestions={openSuggestions === 'location' ? locationSuggestions : []}
+                  onPick={(value) => pickSuggestion('location', value)}
+                />
               </div>
               <button
                 type="submit"
@@ -519,12 +560,13 @@ const res = await client.get('/api/jobseeker/jobs', { params });
         </motion.div>
 
         {/* Job Cards */}
-        <div className="grid grid-cols-1 gap-6">
-          {visibleJobs.map((job, index) => (
+        <div ref={containerRef} style={{ paddingTop, paddingBottom }}>
+          {virtualItems.map(({ index, item: job }) => (
+            // Spacing lives inside the measured wrapper so row heights include it
+            <div key={job.id} ref={measureRef(job.id)} className="pb-6">
             <motion.div
-              key={job.id}
               className="card-glass hover:shadow-xl group cursor-pointer relative overflow-hidden"
-              initial={{ opacity: 0, y: 30 }}
+              initial={index < 5 ? { opacity: 0, y: 30 } : false}
               animate={{ opacity: 1, y: 0 }}
               transition={{ duration: 0.5, delay: 1.2 + index * 0.1 }}
               whileHover={{ y: -5, scale: 1.01 }}
@@ -681,6 +723,7 @@ const res = await client.get('/api/jobseeker/jobs', { params });
                 </div>
               </div>
             </motion.div>
+            </div>
           ))}
         </div>
 
@@ -693,10 +736,11 @@ const res = await client.get('/api/jobseeker/jobs', { params });
           transition={{ duration: 0.6, delay: 1.8 }}
         >
           <button
-              onClick={loadMoreJobs}
+              onClick={loadMore}
+              disabled={loadingMore}
             className="btn-primary hover-glow px-8 py-3 text-lg font-semibold"
           >
-            🔄 Load More Jobs
+            {loadingMore ? 'Loading more jobs…' : '🔄 Load More Jobs'}
           </button>
         </motion.div>
         )}
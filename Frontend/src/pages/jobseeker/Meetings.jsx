@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import client from '../../api/client';
+import { monthGridWindow } from '../../api/calendar';
 import toast from 'react-hot-toast';
 import Avatar from '../../components/Avatar';
 import {
@@ -33,43 +34,45 @@ const statusColors = {
   unknown: 'bg-gray-100 text-gray-800'
 };
 
+const toMeeting = (i) => ({
+  id: i.interview_id,
+  title: i.job_title || 'Interview',
+  company: i.company || 'Unknown Company',
+  interviewer: i.recruiter_name || 'TBD',
+  interviewerEmail: i.recruiter_email || '',
+  interviewerRole: 'Recruiter',
+  date: i.schedule ? new Date(i.schedule).toISOString().split('T')[0] : null, // Keep as ISO date string for calendar
+  dateDisplay: i.schedule ? new Date(i.schedule).toLocaleDateString() : 'TBD', // For display purposes
+  time: i.schedule ? new Date(i.schedule).toLocaleTimeString() : 'TBD',
+  duration: i.duration ? `${i.duration} minutes` : '60 minutes',
+  type: i.type || 'video',
+  status: i.status || i.result || 'scheduled',
+  meetingLink: i.meeting_link || '',
+  location: i.location || '',
+  notes: i.notes || '',
+  agenda: ['Introduction', 'Technical Questions', 'Q&A'],
+  // companyLogo removed - will use Avatar component
+});
+
 const Meetings = () => {
   const [meetings, setMeetings] = useState([]);
   const [loading, setLoading] = useState(true);
+  // The calendar fetches just its visible 6-week window
+  const [calendarMeetings, setCalendarMeetings] = useState([]);
+  const [calendarLoading, setCalendarLoading] = useState(false);
   const [viewMode, setViewMode] = useState('list'); // 'list' or 'calendar'
 
   const [filter, setFilter] = useState('all');
   const [searchTerm, setSearchTerm] = useState('');
   const [currentDate, setCurrentDate] = useState(new Date());
 
-  // Load meetings from backend
+  // Every meeting, for the list view and the summary cards
   useEffect(() => {
     let timer;
     const loadMeetings = async () => {
       try {
         const res = await client.get('/api/jobseeker/interviews');
-        if (res.data?.success) {
-          const mapped = res.data.interviews.map(i => ({
-            id: i.interview_id,
-            title: i.job_title || 'Interview',
-            company: i.company || 'Unknown Company',
-            interviewer: i.recruiter_name || 'TBD',
-            interviewerEmail: i.recruiter_email || '',
-            interviewerRole: 'Recruiter',
-            date: i.schedule ? new Date(i.schedule).toISOString().split('T')[0] : null, // Keep as ISO date string for calendar
-            dateDisplay: i.schedule ? new Date(i.schedule).toLocaleDateString() : 'TBD', // For display purposes
-            time: i.schedule ? new Date(i.schedule).toLocaleTimeString() : 'TBD',
-            duration: i.duration ? `${i.duration} minutes` : '60 minutes',
-            type: i.type || 'video',
-            status: i.status || i.result || 'scheduled',
-            meetingLink: i.meeting_link || '',
-            location: i.location || '',
-            notes: i.notes || '',
-            agenda: ['Introduction', 'Technical Questions', 'Q&A'],
-            // companyLogo removed - will use Avatar component
-          }));
-          setMeetings(mapped);
-        }
+        if (res.data?.success) setMeetings(res.data.interviews.map(toMeeting));
       } catch (e) {
         console.error('Error loading meetings:', e);
       }
@@ -84,6 +87,34 @@ const Meetings = () => {
     return () => { if (timer) clearInterval(timer); };
   }, []);
 
+  // Only the meetings in the visible month grid, while the calendar is shown
+  useEffect(() => {
+    if (viewMode !== 'calendar') return undefined;
+    let active = true;
+    let timer;
+    const loadMonth = async () => {
+      try {
+        const res = await client.get('/api/jobseeker/interviews', { params: monthGridWindow(currentDate) });
+        if (active && res.data?.success) setCalendarMeetings(res.data.interviews.map(toMeeting));
+      } catch (e) {
+        console.error('Error loading calendar meetings:', e);
+      }
+    };
+    const start = async () => {
+      setCalendarLoading(true);
+      setCalendarMeetings([]);
+      await loadMonth();
+      if (!active) return;
+      setCalendarLoading(false);
+      timer = setInterval(loadMonth, 30000);
+    };
+    start();
+    return () => {
+      active = false;
+      if (timer) clearInterval(timer);
+    };
+  }, [viewMode, currentDate.getFullYear(), currentDate.getMonth()]);
+
   // Update interview status
   const updateInterviewStatus = async (interviewId, newStatus, notes = '') => {
     try {
@@ -93,11 +124,13 @@ const Meetings = () => {
       });
       
       // Update local state
-      setMeetings(prev => prev.map(meeting => 
+      const update = (prev) => prev.map(meeting => 
         meeting.id === interviewId 
           ? { ...meeting, status: newStatus, notes: notes || meeting.notes }
           : meeting
-      ));
+      );
+      setMeetings(update);
+      setCalendarMeetings(update);
     } catch (error) {
       console.error('Error updating interview status:', error);
       toast.error('Failed to update interview status');
@@ -168,7 +201,7 @@ const Meetings = () => {
 
     for (let i = 0; i < 42; i++) {
       const dateStr = getLocalDateStr(currentDay);
-      const dayInterviews = meetings.filter(meeting => {
+      const dayInterviews = calendarMeetings.filter(meeting => {
         if (!meeting.date) return false;
 
         // Check if date is valid before processing
@@ -344,7 +377,8 @@ const Meetings = () => {
             <h2 className="text-2xl font-bold bg-gradient-to-r from-teal-600 to-violet-600 bg-clip-text text-transparent">
               📅 {currentDate.toLocaleDateString('en-US', { month: 'long', year: 'numeric' })}
             </h2>
-            <div className="flex space-x-3">
+            <div className="flex items-center space-x-3">
+              {calendarLoading && <span className="text-sm font-medium text-gray-500">Loading...</span>}
               <button
                 onClick={() => setCurrentDate(new Date(currentDate.getFullYear(), currentDate.getMonth() - 1))}
                 className="p-3 hover:bg-gradient-to-r hover:from-teal-500 hover:to-violet-500 hover:text-white rounded-xl transition-all duration-300 hover:scale-110 hover:shadow-lg border border-gray-200"
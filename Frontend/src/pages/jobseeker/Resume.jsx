@@ -2,8 +2,6 @@ import React, { useEffect, useState, useRef } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { Plus, Trash2, Download, Upload, Eye, Star, FileText } from 'lucide-react';
 import client from '../../api/client';
-import jsPDF from 'jspdf';
-import html2canvas from 'html2canvas';
 import toast from 'react-hot-toast';
 import { useAuth } from '../../contexts/AuthContext';
 
@@ -316,6 +314,11 @@ const Resume = () => {
       const resumeId = await saveResumeToDatabase();
       
       if (!previewRef.current) return;
+      // The PDF libraries are large and only needed here, so load them on demand
+      const [{ default: html2canvas }, { default: jsPDF }] = await Promise.all([
+        import('html2canvas'),
+        import('jspdf')
+      ]);
       const canvas = await html2canvas(previewRef.current, {
         scale: 2,
         backgroundColor: '#ffffff'
@@ -1,7 +1,9 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo, useCallback, useDeferredValue } from 'react';
 import { useNavigate, useLocation } from 'react-router-dom';
 import toast from 'react-hot-toast';
 import client from '../../api/client';
+import useCursorList from '../../hooks/useCursorList';
+import useVirtualWindow from '../../hooks/useVirtualWindow';
 import {
   Search,
   Filter,
@@ -29,6 +31,42 @@ import {
   Edit
 } from 'lucide-react';
 
+// Applicants are fetched in pages of this size as the list is scrolled
+const PAGE_SIZE = 50;
+
+// Only the columns mapApplicant reads; the resume join is skipped
+const APPLICANT_FIELDS = 'application_id,seeker_id,job_id,name,email,phone_no,address,applied_timestamp,status,star';
+
+const mapApplicant = (a, jobs) => ({
+  id: a.application_id, // use application id as primary id in UI
+  application_id: a.application_id,
+  seeker_id: a.seeker_id,
+  name: a.name,
+  email: a.email,
+  phone: a.phone_no,
+  location: a.address || '—',
+  jobTitle: a.job_title || jobs.find(j => j.id === a.job_id)?.title || '—',
+  jobId: a.job_id,
+  appliedDate: a.applied_timestamp,
+  status: a.status || 'new',
+  experience: a.experiences?.length ? `${a.experiences.length} entries` : '—',
+  education: a.education?.length ? `${a.education.length} entries` : '—',
+  skills: Array.isArray(a.skills) ? a.skills : [],
+  rating: 0,
+  starred: !!a.star,
+  resumeUrl: '',
+});
+
+// status_counts rows of the whole job, keyed like mapApplicant's status
+const toStatusTotals = (rows = []) => {
+  const totals = {};
+  rows.forEach(({ status, count }) => {
+    const key = status || 'new';
+    totals[key] = (totals[key] || 0) + count;
+  });
+  return totals;
+};
+
 const modalBackdropStyle = {
   position: 'fixed', inset: 0, background: 'rgba(17,24,39,0.5)', zIndex: 50, display: 'flex', alignItems: 'center', justifyContent: 'center'
 };
@@ -39,9 +77,7 @@ const modalCardStyle = {
 const Applicants = () => {
 const navigate = useNavigate();
   const location = useLocation();
-  const [loading, setLoading] = useState(true);
-  const [applicants, setApplicants] = useState([]);
-  const [filteredApplicants, setFilteredApplicants] = useState([]);
+  const [jobsLoading, setJobsLoading] = useState(true);
   const [searchTerm, setSearchTerm] = useState('');
   const [statusFilter, setStatusFilter] = useState('all');
   const [jobFilter, setJobFilter] = useState('all');
@@ -70,55 +106,55 @@ const [scheduleDateTime, setScheduleDateTime] = useState('');
 
   const [jobs, setJobs] = useState([]);
   const [selectedJobId, setSelectedJobId] = useState(null);
+  // Per-status totals of the selected job; the loaded pages may be a fraction of it
+  const [statusTotals, setStatusTotals] = useState({});
 
   useEffect(() => {
-    const loadJobsAndApplicants = async () => {
-      setLoading(true);
+    const loadJobs = async () => {
       try {
-        // Load jobs to populate filter
+        // Load jobs to populate filter; the first job's applicants load below
         const jobsRes = await client.get('/api/recruiter/jobs/my');
         if (jobsRes.data?.success) {
           const jobOptions = jobsRes.data.jobs.map(j => ({ id: j.job_id, title: j.title }));
           setJobs(jobOptions);
-          const defaultJobId = jobOptions[0]?.id || null;
-          setSelectedJobId(defaultJobId);
-          if (defaultJobId) {
-            const appsRes = await client.get(`/api/recruiter/jobs/${defaultJobId}/applicants`);
-            if (appsRes.data?.success) {
-              const mapped = appsRes.data.applicants.map(a => ({
-                id: a.application_id, // use application id as primary id in UI
-                application_id: a.application_id,
-                seeker_id: a.seeker_id,
-                name: a.name,
-                email: a.email,
-                phone: a.phone_no,
-                location: a.address || '—',
-                jobTitle: a.job_title || jobsRes.data.jobs.find(j=>j.job_id===a.job_id)?.title || '—',
-                jobId: a.job_id,
-                appliedDate: a.applied_timestamp,
-                status: a.status || 'new',
-                experience: a.experiences?.length ? `${a.experiences.length} entries` : '—',
-                education: a.education?.length ? `${a.education.length} entries` : '—',
-                skills: Array.isArray(a.skills) ? a.skills : [],
-                rating: 0,
-                starred: !!a.star,
-                resumeUrl: '',
-              }));
-              setApplicants(mapped);
-              setFilteredApplicants(mapped);
-            }
-          }
+          setSelectedJobId(jobOptions[0]?.id || null);
         }
       } catch (error) {
         toast.error('Failed to fetch applicants');
       } finally {
-        setLoading(false);
+        setJobsLoading(false);
       }
     };
 
-    loadJobsAndApplicants();
+    loadJobs();
   }, []);
 
+  // Applicants of the selected job, one cursor page at a time
+  const {
+    items: applicants,
+    setItems: setApplicants,
+    loading: applicantsLoading,
+    loadingMore,
+    hasMore,
+    loadMore,
+    reload: reloadApplicants,
+  } = useCursorList(async (cursor) => {
+    const res = await client.get(`/api/recruiter/jobs/${selectedJobId}/applicants`, {
+      params: { limit: PAGE_SIZE, cursor: cursor || undefined, fields: APPLICANT_FIELDS },
+    });
+    if (!res.data?.success) return { items: [], nextCursor: null };
+    if (!cursor) setStatusTotals(toStatusTotals(res.data.status_counts));
+    return {
+      items: res.data.applicants.map(a => mapApplicant(a, jobs)),
+      nextCursor: res.data.next_cursor,
+    };
+  }, [selectedJobId], {
+    enabled: !!selectedJobId,
+    onError: () => toast.error('Failed to fetch applicants'),
+  });
+
+  const loading = jobsLoading || applicantsLoading;
+
   useEffect(() => {
     if (location.state?.openProfileApplicationId && applicants.length > 0) {
       const appId = location.state.openProfileApplicationId;
@@ -127,15 +163,18 @@ const [scheduleDateTime, setScheduleDateTime] = useState('');
     }
   }, [location.state, applicants]);
 
-  useEffect(() => {
+  // Typing stays responsive: the list filters against a deferred copy of the search term
+  const deferredSearch = useDeferredValue(searchTerm);
+  const filteredApplicants = useMemo(() => {
     let filtered = applicants;
+    const term = deferredSearch.toLowerCase();
 
-    if (searchTerm) {
+    if (term) {
       filtered = filtered.filter(applicant =>
-        applicant.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        applicant.email.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        applicant.jobTitle.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        applicant.skills.some(skill => skill.toLowerCase().includes(searchTerm.toLowerCase()))
+        applicant.name.toLowerCase().includes(term) ||
+        applicant.email.toLowerCase().includes(term) ||
+        applicant.jobTitle.toLowerCase().includes(term) ||
+        applicant.skills.some(skill => skill.toLowerCase().includes(term))
       );
     }
 
@@ -152,14 +191,42 @@ const [scheduleDateTime, setScheduleDateTime] = useState('');
       filtered = filtered.filter(applicant => applicant.rating >= rating);
     }
 
-    setFilteredApplicants(filtered);
-  }, [searchTerm, statusFilter, jobFilter, ratingFilter, applicants]);
+    return filtered;
+  }, [deferredSearch, statusFilter, jobFilter, ratingFilter, applicants]);
+
+  const totalApplicants = useMemo(
+    () => Object.values(statusTotals).reduce((sum, n) => sum + n, 0),
+    [statusTotals]
+  );
+
+  // Keep the totals in step with local status changes
+  const moveStatusTotals = (applicationIds, newStatus) => {
+    const moved = applicants.filter(a => applicationIds.includes(a.application_id) && a.status !== newStatus);
+    if (moved.length === 0) return;
+    setStatusTotals(prev => {
+      const next = { ...prev };
+      moved.forEach(a => { next[a.status] = Math.max((next[a.status] || 0) - 1, 0); });
+      next[newStatus] = (next[newStatus] || 0) + moved.length;
+      return next;
+    });
+  };
+
+  const handleEndReached = useCallback(() => {
+    if (hasMore) loadMore();
+  }, [hasMore, loadMore]);
+
+  const { containerRef, virtualItems, measureRef, paddingTop, paddingBottom } = useVirtualWindow({
+    items: filteredApplicants,
+    getKey: (applicant) => applicant.id,
+    estimateSize: 180,
+    onEndReached: handleEndReached,
+  });
 
   const handleStatusChange = async (applicationId, newStatus) => {
     try {
       await client.put(`/api/recruiter/applications/${applicationId}/status`, { status: newStatus });
+      moveStatusTotals([applicationId], newStatus);
       setApplicants(prev => prev.map(a => a.application_id === applicationId ? { ...a, status: newStatus } : a));
-      setFilteredApplicants(prev => prev.map(a => a.application_id === applicationId ? { ...a, status: newStatus } : a));
       toast.success(`Status updated to ${newStatus.replace('_', ' ')}`);
     } catch (e) {
       toast.error('Failed to update status');
@@ -194,8 +261,8 @@ const [scheduleDateTime, setScheduleDateTime] = useState('');
     const newStatus = action === 'shortlist' ? 'shortlisted' : action === 'reject' ? 'rejected' : 'under_review';
     try {
       await Promise.all(selectedApplicants.map(id => client.put(`/api/recruiter/applications/${id}/status`, { status: newStatus })));
+      moveStatusTotals(selectedApplicants, newStatus);
       setApplicants(prev => prev.map(a => selectedApplicants.includes(a.application_id) ? { ...a, status: newStatus } : a));
-      setFilteredApplicants(prev => prev.map(a => selectedApplicants.includes(a.application_id) ? { ...a, status: newStatus } : a));
       setSelectedApplicants([]);
       toast.success(`${selectedApplicants.length} applicant(s) updated`);
     } catch (e) {
@@ -426,45 +493,36 @@ const submitSchedule = async () => {
               <option key={j.id} value={j.id}>{j.title}</option>
             ))}
           </select>
+          <button
+            onClick={() => {
+              if (selectedJobId) reloadApplicants();
+            }}
+            className="px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 font-medium"
+          >
+            <Search className="w-4 h-4 inline mr-2" />
+            Load Applicants
+          </button>
           <button
             onClick={async () => {
               if (!selectedJobId) return;
-              setLoading(true);
               try {
-                const appsRes = await client.get(`/api/recruiter/jobs/${selectedJobId}/applicants`);
-                if (appsRes.data?.success) {
-                    const mapped = appsRes.data.applicants.map(a => ({
-                    id: a.application_id,
-                    application_id: a.application_id,
-                    seeker_id: a.seeker_id,
-                    name: a.name,
-                    email: a.email,
-                    phone: a.phone_no,
-                    location: a.address || '—',
-                    jobTitle: a.job_title || jobs.find(j=>j.id===a.job_id)?.title || '—',
-                    jobId: a.job_id,
-                    appliedDate: a.applied_timestamp,
-                    status: a.status || 'new',
-                    experience: '—',
-                    education: '—',
-                    skills: [],
-                    rating: 0,
-                    starred: !!a.star,
-                    resumeUrl: '',
-                  }));
-                  setApplicants(mapped);
-                  setFilteredApplicants(mapped);
-                }
+                // Streamed by the server: every applicant of the job, not just the loaded pages
+                const resp = await client.get(`/api/recruiter/jobs/${selectedJobId}/applicants/export`, { responseType: 'blob' });
+                const url = window.URL.createObjectURL(resp.data);
+                const link = document.createElement('a');
+                link.href = url;
+                link.download = `job-${selectedJobId}-applicants.csv`;
+                link.click();
+                window.URL.revokeObjectURL(url);
               } catch (e) {
-                toast.error('Failed to fetch applicants');
-              } finally {
-                setLoading(false);
+                toast.error('Failed to export applicants');
               }
             }}
-            className="px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 font-medium"
+            disabled={!selectedJobId}
+            className="px-4 py-2 bg-gray-100 text-gray-700 rounded-lg hover:bg-gray-200 font-medium"
           >
-            <Search className="w-4 h-4 inline mr-2" />
-            Load Applicants
+            <Download className="w-4 h-4 inline mr-2" />
+            Export CSV
           </button>
         </div>
       </div>
@@ -581,7 +639,7 @@ const submitSchedule = async () => {
           <div className="flex items-center justify-between">
             <div>
               <p className="text-sm font-medium text-gray-600">Total</p>
-              <p className="text-2xl font-bold text-gray-900">{applicants.length}</p>
+              <p className="text-2xl font-bold text-gray-900">{totalApplicants}</p>
             </div>
             <User className="w-8 h-8 text-gray-400" />
           </div>
@@ -592,7 +650,7 @@ const submitSchedule = async () => {
             <div>
               <p className="text-sm font-medium text-gray-600">New</p>
               <p className="text-2xl font-bold text-blue-600">
-                {applicants.filter(a => a.status === 'new').length}
+                {statusTotals['new'] || 0}
               </p>
             </div>
             <Clock className="w-8 h-8 text-blue-400" />
@@ -604,7 +662,7 @@ const submitSchedule = async () => {
             <div>
               <p className="text-sm font-medium text-gray-600">Hired</p>
               <p className="text-2xl font-bold text-emerald-600">
-                {applicants.filter(a => a.status === 'hired').length}
+                {statusTotals['hired'] || 0}
               </p>
             </div>
             <Award className="w-8 h-8 text-emerald-400" />
@@ -616,7 +674,7 @@ const submitSchedule = async () => {
             <div>
               <p className="text-sm font-medium text-gray-600">Under Review</p>
               <p className="text-2xl font-bold text-purple-600">
-                {applicants.filter(a => a.status === 'under_review').length}
+                {statusTotals['under_review'] || 0}
               </p>
             </div>
             <Eye className="w-8 h-8 text-purple-400" />
@@ -628,7 +686,7 @@ const submitSchedule = async () => {
             <div>
               <p className="text-sm font-medium text-gray-600">Rejected</p>
               <p className="text-2xl font-bold text-red-600">
-                {applicants.filter(a => a.status === 'rejected').length}
+                {statusTotals['rejected'] || 0}
               </p>
             </div>
             <XCircle className="w-8 h-8 text-red-400" />
@@ -727,9 +785,10 @@ const submitSchedule = async () => {
 
       {/* Applicants List */}
       <div className="bg-white rounded-lg shadow border">
-        <div className="divide-y divide-gray-200">
-          {filteredApplicants.map((applicant) => (
-            <div key={applicant.id} className="p-6 hover:bg-gray-50">
+        {/* Only the rows near the viewport are mounted; spacers keep the scroll height */}
+        <div ref={containerRef} className="divide-y divide-gray-200" style={{ paddingTop, paddingBottom }}>
+          {virtualItems.map(({ item: applicant }) => (
+            <div key={applicant.id} ref={measureRef(applicant.id)} className="p-6 hover:bg-gray-50">
               <div className="flex items-start space-x-4">
                 <input
                   type="checkbox"
@@ -840,7 +899,7 @@ const submitSchedule = async () => {
                           <Edit className="w-4 h-4" />
                         </button>
                         <button
-                          onClick={() => navigate('/recruiter/email', { state: { to: applicant.email, subject: `Regarding your application for ${applicant.jobTitle}`, body: `Dear ${applicant.name},\n\n` } })}
+                          onClick={() => navigate('/recruiter/email', { state: { to: applicant.email, applicationId: applicant.application_id, subject: `Regarding your application for ${applicant.jobTitle}`, body: `Dear ${applicant.name},\n\n` } })}
                           className="p-2 text-purple-600 hover:bg-purple-50 rounded-lg"
                           title="Send Message (Email)"
                         >
@@ -874,6 +933,10 @@ const submitSchedule = async () => {
           ))}
         </div>
 
+        {loadingMore && (
+          <div className="py-4 text-center text-sm text-gray-500">Loading more applicants…</div>
+        )}
+
         {filteredApplicants.length === 0 && (
           <div className="text-center py-12">
             <User className="mx-auto h-12 w-12 text-gray-400" />
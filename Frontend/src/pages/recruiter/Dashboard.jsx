@@ -101,7 +101,9 @@ useEffect(() => {
         }
 
         // Recent applications across all jobs
-        const appsRes = await client.get('/api/recruiter/applications/recent');
+        const appsRes = await client.get('/api/recruiter/applications/recent', {
+          params: { fields: 'application_id,seeker_name,job_title,status,applied_timestamp' },
+        });
         if (appsRes.data?.success) {
           const mappedApps = appsRes.data.applications.map(a => ({
             id: a.application_id,
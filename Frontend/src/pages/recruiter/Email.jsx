@@ -39,13 +39,17 @@ const Email = () => {
   const [selectedEmails, setSelectedEmails] = useState([]);
   const [showCompose, setShowCompose] = useState(false);
   const [selectedEmail, setSelectedEmail] = useState(null);
+  // True when the server sends mail itself (SMTP outbox); otherwise Gmail opens
+  const [serverDelivery, setServerDelivery] = useState(false);
   const [composeData, setComposeData] = useState({
     to: '',
     cc: '',
     bcc: '',
     subject: '',
     body: '',
-    attachments: []
+    attachments: [],
+    // Set when composing to an applicant; required for server delivery
+    applicationId: null
   });
 
   // No mock email data — emails and templates load from API.
@@ -60,7 +64,8 @@ const Email = () => {
         ...prev,
         to: location.state.to || '',
         subject: location.state.subject || '',
-        body: location.state.body || ''
+        body: location.state.body || '',
+        applicationId: location.state.applicationId || null
       }));
       // Clear state so back nav doesn't reopen compose
       navigate('.', { replace: true, state: null });
@@ -69,6 +74,9 @@ const Email = () => {
     const init = async () => {
       setLoading(true);
       try {
+        client.get('/api/recruiter/email/config')
+          .then((c) => setServerDelivery(Boolean(c.data?.serverDelivery)))
+          .catch(() => {});
         // Load sent emails metadata
         try {
           const s = await client.get('/api/recruiter/email/sent');
@@ -189,7 +197,8 @@ const mapped = (s.data.emails || []).map((e) => ({
       bcc: '',
       subject: '',
       body: '',
-      attachments: []
+      attachments: [],
+      applicationId: null
     });
   };
 
@@ -201,7 +210,8 @@ const mapped = (s.data.emails || []).map((e) => ({
       bcc: '',
       subject: `Re: ${email.subject}`,
       body: `\n\n--- Original Message ---\nFrom: ${email.fromName}\nDate: ${new Date(email.date).toLocaleString()}\nSubject: ${email.subject}\n\n${email.body}`,
-      attachments: []
+      attachments: [],
+      applicationId: email.applicationId || null
     });
   };
 
@@ -210,25 +220,32 @@ const handleSendEmail = async () => {
       toast.error('Please fill in required fields');
       return;
     }
+    if (serverDelivery && !composeData.applicationId) {
+      toast.error('Email candidates from the Applicants page');
+      return;
+    }
     try {
-      // 1) Open Gmail compose in a new tab (actual sending happens in user's Gmail)
-      const gmailUrl = new URL('https://mail.google.com/mail/');
-      gmailUrl.searchParams.set('view', 'cm');
-      gmailUrl.searchParams.set('fs', '1');
-      gmailUrl.searchParams.set('to', composeData.to);
-      gmailUrl.searchParams.set('su', composeData.subject);
-      gmailUrl.searchParams.set('body', composeData.body);
-      window.open(gmailUrl.toString(), '_blank');
-
-      // 2) Log the email locally so it appears in Email Management
+      // 1) Without server delivery, open Gmail compose in a new tab (actual sending happens in user's Gmail)
+      if (!serverDelivery) {
+        const gmailUrl = new URL('https://mail.google.com/mail/');
+        gmailUrl.searchParams.set('view', 'cm');
+        gmailUrl.searchParams.set('fs', '1');
+        gmailUrl.searchParams.set('to', composeData.to);
+        gmailUrl.searchParams.set('su', composeData.subject);
+        gmailUrl.searchParams.set('body', composeData.body);
+        window.open(gmailUrl.toString(), '_blank');
+      }
+
+      // 2) Log the email so it appears in Email Management (and queue it for delivery on the server)
       await client.post('/api/recruiter/email/send', {
         to: composeData.to,
         subject: composeData.subject,
-        body: composeData.body
+        body: composeData.body,
+        application_id: composeData.applicationId || undefined
       });
 
       setShowCompose(false);
-      toast.success('Opened Gmail and logged email');
+      toast.success(serverDelivery ? 'Email queued for delivery' : 'Opened Gmail and logged email');
       // Refresh list best-effort
       try {
         const s = await client.get('/api/recruiter/email/sent');
@@ -516,6 +533,7 @@ const handleSendEmail = async () => {
                       type="email"
                       value={composeData.to}
                       onChange={(e) => setComposeData(prev => ({ ...prev, to: e.target.value }))}
+                      readOnly={serverDelivery}
                       className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-blue-500"
                       placeholder="recipient@email.com"
                     />
@@ -2,6 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import toast from 'react-hot-toast';
 import client from '../../api/client';
+import { monthGridWindow } from '../../api/calendar';
 import {
   Calendar,
   Clock,
@@ -26,10 +27,31 @@ import {
   AlertTriangle
 } from 'lucide-react';
 
+const toInterview = (i) => ({
+  id: i.interview_id,
+  candidateName: i.seeker_name,
+  candidateEmail: i.seeker_email,
+  jobTitle: i.job_title,
+  date: i.schedule ? String(i.schedule).substring(0,10) : '',
+  time: i.schedule ? new Date(i.schedule).toLocaleTimeString() : '',
+  duration: i.duration || 60,
+  type: i.type || 'video',
+  status: i.status || 'scheduled',
+  meetingLink: i.meeting_link || '',
+  location: i.location || '',
+  interviewer: 'Recruiter',
+  notes: i.notes || '',
+  reminder: false,
+  candidateAvatar: '/api/placeholder/40/40'
+});
+
 const Schedule = () => {
   const navigate = useNavigate();
   const [loading, setLoading] = useState(true);
   const [interviews, setInterviews] = useState([]);
+  // The calendar fetches just its visible 6-week window
+  const [calendarInterviews, setCalendarInterviews] = useState([]);
+  const [calendarLoading, setCalendarLoading] = useState(false);
   const [filteredInterviews, setFilteredInterviews] = useState([]);
   const [searchTerm, setSearchTerm] = useState('');
   const [statusFilter, setStatusFilter] = useState('all');
@@ -179,29 +201,14 @@ const Schedule = () => {
     }
   ];
 
+  // Every interview, for the list view and the summary cards
   useEffect(() => {
     const fetchInterviews = async () => {
       setLoading(true);
       try {
         const res = await client.get('/api/recruiter/interviews');
         if (res.data?.success) {
-          const mapped = res.data.interviews.map(i => ({
-            id: i.interview_id,
-            candidateName: i.seeker_name,
-            candidateEmail: i.seeker_email,
-            jobTitle: i.job_title,
-            date: i.schedule ? String(i.schedule).substring(0,10) : '',
-            time: i.schedule ? new Date(i.schedule).toLocaleTimeString() : '',
-            duration: i.duration || 60,
-            type: i.type || 'video',
-            status: i.status || 'scheduled',
-            meetingLink: i.meeting_link || '',
-            location: i.location || '',
-            interviewer: 'Recruiter',
-            notes: i.notes || '',
-            reminder: false,
-            candidateAvatar: '/api/placeholder/40/40'
-          }));
+          const mapped = res.data.interviews.map(toInterview);
           setInterviews(mapped);
           setFilteredInterviews(mapped);
         }
@@ -215,8 +222,35 @@ const Schedule = () => {
     fetchInterviews();
   }, []);
 
+  // Only the interviews in the visible month grid, while the calendar is shown
   useEffect(() => {
-    let filtered = interviews;
+    if (viewMode !== 'calendar') return undefined;
+    let active = true;
+    const fetchMonth = async () => {
+      setCalendarLoading(true);
+      setCalendarInterviews([]);
+      try {
+        const res = await client.get('/api/recruiter/interviews', { params: monthGridWindow(currentDate) });
+        if (active && res.data?.success) setCalendarInterviews(res.data.interviews.map(toInterview));
+      } catch (error) {
+        if (active) toast.error('Failed to fetch interviews');
+      } finally {
+        if (active) setCalendarLoading(false);
+      }
+    };
+
+    fetchMonth();
+    return () => { active = false; };
+  }, [viewMode, currentDate.getFullYear(), currentDate.getMonth()]);
+
+  // Local edits apply to both the full list and the calendar's month
+  const updateInterviews = (update) => {
+    setInterviews(update);
+    setCalendarInterviews(update);
+  };
+
+  const applyFilters = (list) => {
+    let filtered = list;
 
     if (searchTerm) {
       filtered = filtered.filter(interview =>
@@ -234,13 +268,17 @@ const Schedule = () => {
       filtered = filtered.filter(interview => interview.type === typeFilter);
     }
 
-    setFilteredInterviews(filtered);
+    return filtered;
+  };
+
+  useEffect(() => {
+    setFilteredInterviews(applyFilters(interviews));
   }, [searchTerm, statusFilter, typeFilter, interviews]);
 
   const handleStatusChange = async (interviewId, newStatus) => {
     try {
       await client.put(`/api/recruiter/interviews/${interviewId}`, { status: newStatus });
-      setInterviews(prevInterviews =>
+      updateInterviews(prevInterviews =>
         prevInterviews.map(interview =>
           interview.id === interviewId ? { ...interview, status: newStatus } : interview
         )
@@ -287,7 +325,7 @@ const saveEditInterview = async () => {
       Object.keys(payload).forEach(k => payload[k] === undefined && delete payload[k]);
       await client.put(`/api/recruiter/interviews/${editInterviewId}`, payload);
       // Update local state best-effort
-      setInterviews(prev => prev.map(i => i.id === editInterviewId ? {
+      updateInterviews(prev => prev.map(i => i.id === editInterviewId ? {
         ...i,
         date: editForm.scheduleDateTime ? editForm.scheduleDateTime.substring(0,10) : i.date,
         time: editForm.scheduleDateTime ? new Date(editForm.scheduleDateTime).toLocaleTimeString() : i.time,
@@ -308,7 +346,7 @@ const saveEditInterview = async () => {
     if (!window.confirm('Are you sure you want to delete this interview?')) return;
     try {
       await client.delete(`/api/recruiter/interviews/${interviewId}`);
-      setInterviews(prevInterviews => 
+      updateInterviews(prevInterviews => 
         prevInterviews.filter(interview => interview.id !== interviewId)
       );
       toast.success('Interview deleted');
@@ -321,7 +359,7 @@ const saveEditInterview = async () => {
     if (!window.confirm('Are you sure you want to cancel this interview?')) return;
     try {
       await client.put(`/api/recruiter/interviews/${interviewId}`, { status: 'cancelled' });
-      setInterviews(prevInterviews =>
+      updateInterviews(prevInterviews =>
         prevInterviews.map(interview =>
           interview.id === interviewId ? { ...interview, status: 'cancelled' } : interview
         )
@@ -409,10 +447,11 @@ const saveEditInterview = async () => {
     const todayStr = getLocalDateStr(new Date());
     const days = [];
     const currentDay = new Date(startDate);
+    const monthInterviews = applyFilters(calendarInterviews);
 
     for (let i = 0; i < 42; i++) {
       const dateStr = getLocalDateStr(currentDay);
-      const dayInterviews = filteredInterviews.filter(interview => interview.date === dateStr);
+      const dayInterviews = monthInterviews.filter(interview => interview.date === dateStr);
       
       days.push({
         date: new Date(currentDay),
@@ -634,7 +673,8 @@ const saveEditInterview = async () => {
             <h2 className="text-2xl font-bold bg-gradient-to-r from-purple-600 to-blue-600 bg-clip-text text-transparent">
               📅 {currentDate.toLocaleDateString('en-US', { month: 'long', year: 'numeric' })}
             </h2>
-            <div className="flex space-x-3">
+            <div className="flex items-center space-x-3">
+              {calendarLoading && <span className="text-sm font-medium text-gray-500">Loading...</span>}
               <button
                 onClick={() => setCurrentDate(new Date(currentDate.getFullYear(), currentDate.getMonth() - 1))}
                 className="p-3 hover:bg-gradient-to-r hover:from-purple-500 hover:to-blue-500 hover:text-white rounded-xl transition-all duration-300 hover:scale-110 hover:shadow-lg border border-gray-200"
@@ -871,7 +911,7 @@ const saveEditInterview = async () => {
                   reminder: formData.get('reminder') === 'on',
                   candidateAvatar: 'https://images.unsplash.com/photo-1472099645785-5658abf4ff4e?w=150'
                 };
-                setInterviews(prev => [...prev, newInterview]);
+                updateInterviews(prev => [...prev, newInterview]);
                 setShowScheduleModal(false);
                 toast.success('🎉 Interview scheduled successfully!');
               }} className="space-y-6 p-8">
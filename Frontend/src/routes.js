@@ -0,0 +1,144 @@
+import { lazy } from 'react';
+
+// Route-level code splitting. Each page is its own chunk, loaded the first time
+// its route renders; preloadRoute() starts the download earlier (sidebar hover,
+// idle time after a dashboard mounts) so navigation does not wait on it.
+
+const RELOAD_FLAG = 'chunk-reload';
+
+// After a redeploy an open tab may ask for chunk files that no longer exist;
+// reload once to pick up the new index.html instead of showing a blank page.
+const importWithReload = (factory) => () =>
+  factory().then(
+    (module) => {
+      sessionStorage.removeItem(RELOAD_FLAG);
+      return module;
+    },
+    (error) => {
+      if (!sessionStorage.getItem(RELOAD_FLAG)) {
+        sessionStorage.setItem(RELOAD_FLAG, '1');
+        window.location.reload();
+      }
+      throw error;
+    }
+  );
+
+const lazyPage = (factory) => {
+  let promise = null;
+  const preload = () => {
+    if (!promise) {
+      promise = factory().catch((error) => {
+        promise = null;
+        throw error;
+      });
+    }
+    return promise;
+  };
+  // Only a route that is actually rendering may trigger the reload, not a preload
+  const Component = lazy(importWithReload(preload));
+  Component.preload = preload;
+  return Component;
+};
+
+// Auth
+export const Register = lazyPage(() => import('./pages/auth/Register'));
+export const TwoFA = lazyPage(() => import('./pages/auth/TwoFA'));
+export const AdminLogin = lazyPage(() => import('./pages/auth/AdminLogin'));
+
+// Job Seeker
+export const JobSeekerDashboard = lazyPage(() => import('./pages/jobseeker/Dashboard'));
+export const Resume = lazyPage(() => import('./pages/jobseeker/Resume'));
+export const ATS = lazyPage(() => import('./pages/jobseeker/ATS'));
+export const Jobs = lazyPage(() => import('./pages/jobseeker/Jobs'));
+export const MyJobs = lazyPage(() => import('./pages/jobseeker/MyJobs'));
+export const Meetings = lazyPage(() => import('./pages/jobseeker/Meetings'));
+export const Applications = lazyPage(() => import('./pages/jobseeker/Applications'));
+
+// Recruiter
+export const RecruiterDashboard = lazyPage(() => import('./pages/recruiter/Dashboard'));
+export const PostJob = lazyPage(() => import('./pages/recruiter/PostJob'));
+export const RecruiterJobs = lazyPage(() => import('./pages/recruiter/Jobs'));
+export const Applicants = lazyPage(() => import('./pages/recruiter/Applicants'));
+export const Schedule = lazyPage(() => import('./pages/recruiter/Schedule'));
+export const Email = lazyPage(() => import('./pages/recruiter/Email'));
+
+// Admin
+export const AdminDashboard = lazyPage(() => import('./pages/admin/Dashboard'));
+export const Users = lazyPage(() => import('./pages/admin/Users'));
+export const Recruiters = lazyPage(() => import('./pages/admin/Recruiters'));
+export const Logs = lazyPage(() => import('./pages/admin/Logs'));
+export const Duplicates = lazyPage(() => import('./pages/admin/Duplicates'));
+
+// Common
+export const Profile = lazyPage(() => import('./pages/Profile'));
+
+// First path segment after the role prefix -> page, for preloading by URL
+const routePages = {
+  jobseeker: {
+    dashboard: JobSeekerDashboard,
+    resume: Resume,
+    ats: ATS,
+    jobs: Jobs,
+    'my-jobs': MyJobs,
+    meetings: Meetings,
+    applications: Applications,
+    profile: Profile,
+  },
+  recruiter: {
+    dashboard: RecruiterDashboard,
+    'post-job': PostJob,
+    jobs: RecruiterJobs,
+    applicants: Applicants,
+    schedule: Schedule,
+    email: Email,
+    profile: Profile,
+  },
+  admin: {
+    dashboard: AdminDashboard,
+    users: Users,
+    recruiters: Recruiters,
+    logs: Logs,
+    duplicates: Duplicates,
+    profile: Profile,
+  },
+};
+
+// Pages a user of each role is likely to open next, preloaded when idle
+const likelyNextRoutes = {
+  jobseeker: ['/jobseeker/jobs', '/jobseeker/applications', '/jobseeker/resume'],
+  recruiter: ['/recruiter/jobs', '/recruiter/applicants', '/recruiter/post-job'],
+  admin: ['/admin/users', '/admin/recruiters'],
+};
+
+export const preloadRoute = (href) => {
+  const [role, page] = href.split('/').filter(Boolean);
+  const Component = routePages[role]?.[page];
+  if (Component) {
+    Component.preload().catch(() => {
+      // The route will retry (and report) when it is actually rendered
+    });
+  }
+};
+
+const whenIdle = (callback) => {
+  if ('requestIdleCallback' in window) {
+    const id = window.requestIdleCallback(callback, { timeout: 5000 });
+    return () => window.cancelIdleCallback(id);
+  }
+  const id = setTimeout(callback, 2000);
+  return () => clearTimeout(id);
+};
+
+/**
+ * Preload the likely next pages for a role once the browser is idle. Skipped
+ * on metered or slow connections. Returns a cancel function for effects.
+ */
+export const preloadLikelyRoutes = (role) => {
+  const connection = navigator.connection;
+  if (connection?.saveData || /2g/.test(connection?.effectiveType || '')) {
+    return () => {};
+  }
+  return whenIdle(() => {
+    (likelyNextRoutes[role] || []).forEach(preloadRoute);
+  });
+};
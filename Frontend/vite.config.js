@@ -1,9 +1,28 @@
 import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
+import bundleBudget from './scripts/bundleBudget.js'
+
+// Third-party code grouped into long-lived chunks that change less often than
+// the app. Libraries only used by lazy pages (framer-motion, date-fns, the PDF
+// export) get their own chunks so the login and dashboard routes never load them.
+const vendorChunks = [
+  ['vendor-react', ['react', 'react-dom', 'scheduler', 'react-router', 'react-router-dom', '@remix-run']],
+  ['vendor-motion', ['framer-motion', 'motion-dom', 'motion-utils']],
+  ['vendor-pdf', ['jspdf', 'html2canvas', 'canvg', 'dompurify', 'fflate']],
+  ['vendor-date', ['date-fns']],
+  ['vendor', ['axios', 'react-hot-toast', 'goober', 'react-hook-form', 'lucide-react']],
+]
+
+const manualChunks = (id) => {
+  const match = id.match(/node_modules\/((?:@[^/]+\/)?[^/]+)\//)
+  if (!match) return undefined
+  const found = vendorChunks.find(([, packages]) => packages.includes(match[1]) || packages.some(p => match[1].startsWith(`${p}/`)))
+  return found?.[0]
+}
 
 // https://vitejs.dev/config/
 export default defineConfig({
-  plugins: [react()],
+  plugins: [react(), bundleBudget()],
   server: {
     port: 3000,
     host: '0.0.0.0',
@@ -35,5 +54,13 @@ export default defineConfig({
       compress: {
         drop_console: process.env.NODE_ENV === 'production', // Remove console logs in production
       },
-    },  },
+    },
+    rollupOptions: {
+      output: {
+        manualChunks,
+      },
+    },
+    // Per-chunk limits are enforced by the bundle budget report instead
+    chunkSizeWarningLimit: 1000,
+  },
 })
\ No newline at end of file
@@ -1,68 +1,102 @@
+// Remove duplicate resume rows and enforce the normalized unique keys.
+// Usage: node cleanup-duplicates.js [--table=experiences] [--batch-size=1000]
+//          [--pause-ms=50] [--restart] [--no-enforce]
+//
+// Tables are cleaned in small id-ordered batches (see services/dedup.js), each
+// in its own short transaction, so the application keeps writing while this
+// runs. Progress is saved after every batch: Ctrl+C stops after the current
+// batch and the next run resumes there (--restart starts over). Once a table is
+// clean its unique index is built, so duplicates cannot come back.
+// Duplicate user accounts are only reported; merge those by hand.
 import pool from './db.js';
+import { dedupTargets, cleanupTable, enforceUnique, findDuplicateUsers } from './services/dedup.js';
+
+const args = Object.fromEntries(
+  process.argv.slice(2).map(a => {
+    const [k, v] = a.replace(/^--/, '').split('=');
+    return [k, v === undefined ? true : v];
+  })
+);
+
+const BATCH_SIZE = Number(args['batch-size'] || 1000);
+const PAUSE_MS = Number(args['pause-ms'] ?? 50);
+
+let stopping = false;
+process.on('SIGINT', () => {
+  if (stopping) process.exit(130);
+  stopping = true;
+  console.log('\n⏸️  Stopping after the current batch (Ctrl+C again to quit now)...');
+});
+
+const reportProgress = () => {
+  const startedAt = Date.now();
+  let lastPrinted = 0;
+  return ({ table, lastId, maxId, removed }) => {
+    const now = Date.now();
+    if (now - lastPrinted < 1000 && lastId < maxId) return;
+    lastPrinted = now;
+    const pct = maxId > 0 ? Math.min(100, (lastId / maxId) * 100) : 100;
+    const elapsed = (now - startedAt) / 1000;
+    console.log(`   ${table}: ${pct.toFixed(1)}% (id ${lastId}/${maxId}), ${removed} removed, ${elapsed.toFixed(0)}s`);
+  };
+};
 
 async function cleanupDuplicates() {
+  let exitCode = 0;
   try {
     console.log('🧹 Cleaning up duplicate records...\n');
-    
-    // Clean up duplicate experiences
-    console.log('Cleaning experiences...');
-    const dupExperiences = await pool.query(`
-      DELETE FROM experiences 
-      WHERE experience_id NOT IN (
-        SELECT MIN(experience_id) 
-        FROM experiences 
-        GROUP BY resume_id, company, job_title, duration, description
-      )
-    `);
-    console.log(`✅ Removed ${dupExperiences.rowCount} duplicate experiences`);
-    
-    // Clean up duplicate education records
-    console.log('Cleaning education...');
-    const dupEducation = await pool.query(`
-      DELETE FROM education 
-      WHERE education_id NOT IN (
-        SELECT MIN(education_id) 
-        FROM education 
-        GROUP BY resume_id, qualification, college, gpa
-      )
-    `);
-    console.log(`✅ Removed ${dupEducation.rowCount} duplicate education records`);
-    
-    // Clean up duplicate skills (keep latest)
-    console.log('Cleaning skills...');
-    const dupSkills = await pool.query(`
-      DELETE FROM skills 
-      WHERE skill_id NOT IN (
-        SELECT MAX(skill_id) 
-        FROM skills 
-        GROUP BY resume_id, skill_type
-      )
-    `);
-    console.log(`✅ Removed ${dupSkills.rowCount} duplicate skills records`);
-    
-    // Show final counts
-    console.log('\n📊 Final record counts:');
-    const counts = await pool.query(`
-      SELECT 
-        (SELECT COUNT(*) FROM experiences) as experiences,
-        (SELECT COUNT(*) FROM education) as education,
-        (SELECT COUNT(*) FROM skills) as skills,
-        (SELECT COUNT(*) FROM resumes) as resumes
-    `);
-    
-    const c = counts.rows[0];
-    console.log(`Experiences: ${c.experiences}`);
-    console.log(`Education: ${c.education}`);
-    console.log(`Skills: ${c.skills}`);
-    console.log(`Resumes: ${c.resumes}`);
-    
-    console.log('\n🎉 Cleanup completed successfully!');
-    
+
+    const tables = args.table
+      ? [args.table]
+      : Object.keys(dedupTargets).filter(t => !dedupTargets[t].reportOnly);
+
+    for (const table of tables) {
+      if (!dedupTargets[table] || dedupTargets[table].reportOnly) {
+        throw new Error(`Unknown table "${table}" (expected one of ${Object.keys(dedupTargets).filter(t => !dedupTargets[t].reportOnly).join(', ')})`);
+      }
+
+      console.log(`Cleaning ${table}...`);
+      const { removed, completed } = await cleanupTable(table, {
+        batchSize: BATCH_SIZE,
+        pauseMs: PAUSE_MS,
+        restart: Boolean(args.restart),
+        onProgress: reportProgress(),
+        shouldStop: () => stopping,
+      });
+
+      if (!completed) {
+        console.log(`⏸️  ${table}: stopped with ${removed} removed so far; run again to resume`);
+        break;
+      }
+      console.log(`✅ ${table}: ${removed} duplicates removed`);
+
+      if (!args['no-enforce']) {
+        const enforced = await enforceUnique(table);
+        console.log(enforced
+          ? `🔒 ${table}: ${dedupTargets[table].uniqueIndex} in place`
+          : `⚠️  ${table}: new duplicates were written during cleanup; run again`);
+        if (!enforced) exitCode = 1;
+      }
+    }
+
+    const duplicateUsers = await findDuplicateUsers();
+    if (duplicateUsers.length > 0) {
+      console.log(`\n👥 ${duplicateUsers.length} email(s) shared by several accounts (merge manually):`);
+      duplicateUsers.slice(0, 20).forEach(d => console.log(`   ${d.email}: users ${d.user_ids.join(', ')}`));
+    }
+
+    if (!stopping) console.log('\n🎉 Cleanup completed successfully!');
   } catch (error) {
-    console.error('❌ Cleanup failed:', error);
+    if (error.code === '42P01') {
+      console.error('❌ dedup_progress is missing: apply migrations/014_dedup_keys.sql first');
+    } else {
+      console.error('❌ Cleanup failed:', error);
+    }
+    exitCode = 1;
   } finally {
-    process.exit(0);
+    await pool.end().catch(() => {});
+    process.exit(exitCode);
   }
 }
 
-cleanupDuplicates();
\ No newline at end of file
+cleanupDuplicates();
@@ -1,6 +1,6 @@
 import pool from '../db.js';
-import bcrypt from 'bcrypt';
 import jwt from 'jsonwebtoken';
+import { checkPassword, rehashPassword } from '../services/passwords.js';
 
 export const adminLogin = async (req, res) => {
   try {
@@ -15,10 +15,13 @@ export const adminLogin = async (req, res) => {
     }
 
     const admin = adminResult.rows[0];
-    const isMatch = await bcrypt.compare(password, admin.password);
-    if (!isMatch) {
+    const { match, legacy } = await checkPassword(password, admin.password);
+    if (!match) {
       return res.status(401).json({ success: false, error: 'Invalid email or password' });
     }
+    if (legacy) {
+      await rehashPassword(pool, 'admins', 'admin_id', admin.admin_id, password);
+    }
 
     const token = jwt.sign(
       { id: admin.admin_id, role: 'admin' },
@@ -1,9 +1,24 @@
 import pool from '../db.js';
+import { revokeUser, setUserStatus } from '../services/authState.js';
+import { parseCursorPage, toCursorPage } from '../services/pagination.js';
+import { streamExport } from '../services/exportStream.js';
+import { findDuplicateUsers } from '../services/dedup.js';
+import { readPool } from '../services/readRouting.js';
+import { defineFieldset, selectFields } from '../services/fieldsets.js';
+import { listOutbox, retryDeadEmails } from '../services/emailOutbox.js';
+import { unindexJob } from '../services/typeahead.js';
 
 // Get all users
 export const getAllUsers = async (req, res) => {
   try {
+    const db = readPool(req);
     const { role, search, page = 1, limit = 10 } = req.query;
+
+    // ?cursor= (empty for the first page) switches from OFFSET pages to keyset pages
+    const cursorPage = 'cursor' in req.query ? parseCursorPage(req.query) : null;
+    if (cursorPage?.error) {
+      return res.status(400).json({ success: false, error: cursorPage.error });
+    }
     
     let query = `
       SELECT u.*, 
@@ -15,6 +30,7 @@ export const getAllUsers = async (req, res) => {
                WHEN u.role = 'recruiter' THEN r.designation
                ELSE NULL
              END as designation
+             ${cursorPage ? ', ARRAY[u.created_at::text, u.user_id::text] AS _cursor' : ''}
       FROM users u
       LEFT JOIN recruiters r ON u.user_id = r.user_id
       WHERE 1=1
@@ -35,14 +51,28 @@ export const getAllUsers = async (req, res) => {
       paramCount++;
     }
 
-    query += ` ORDER BY u.created_at DESC`;
+    if (cursorPage?.after) {
+      query += ` AND (u.created_at, u.user_id) < ($${paramCount}::timestamp, $${paramCount + 1}::int)`;
+      queryParams.push(...cursorPage.after);
+      paramCount += 2;
+    }
+
+    query += ` ORDER BY u.created_at DESC, u.user_id DESC`;
+
+    if (cursorPage) {
+      query += ` LIMIT $${paramCount}`;
+      queryParams.push(cursorPage.limit + 1);
+      const result = await db.query(query, queryParams);
+      const { items, next_cursor } = toCursorPage(result.rows, cursorPage.limit);
+      return res.json({ success: true, users: items, next_cursor });
+    }
 
     // Add pagination
     const offset = (page - 1) * limit;
     query += ` LIMIT $${paramCount} OFFSET $${paramCount + 1}`;
     queryParams.push(limit, offset);
 
-    const result = await pool.query(query, queryParams);
+    const result = await db.query(query, queryParams);
 
     // Get total count for pagination
     let countQuery = `
@@ -66,7 +96,7 @@ export const getAllUsers = async (req, res) => {
       countParamCount++;
     }
 
-    const countResult = await pool.query(countQuery, countParams);
+    const countResult = await db.query(countQuery, countParams);
     const total = parseInt(countResult.rows[0].total);
 
     res.json({ 
@@ -86,12 +116,36 @@ export const getAllUsers = async (req, res) => {
 };
 
 // Get user by ID
+// ?fields= for a single user (password hashes are never selectable)
+const userFields = defineFieldset({
+  required: ['user_id'],
+  fields: {
+    user_id: 'u.user_id',
+    name: 'u.name',
+    email: 'u.email',
+    phone_no: 'u.phone_no',
+    role: 'u.role',
+    status: 'u.status',
+    created_at: 'u.created_at',
+    company: { sql: "CASE WHEN u.role = 'recruiter' THEN r.company END", join: 'recruiter' },
+    designation: { sql: "CASE WHEN u.role = 'recruiter' THEN r.designation END", join: 'recruiter' },
+  },
+  joins: {
+    recruiter: 'LEFT JOIN recruiters r ON u.user_id = r.user_id',
+  },
+});
+
 export const getUserById = async (req, res) => {
   try {
     const { id } = req.params;
+    const projection = selectFields(req.query, userFields);
+    if (projection?.error) {
+      return res.status(400).json({ success: false, error: projection.error });
+    }
 
-    const userResult = await pool.query(
-      `SELECT u.*, 
+    const userResult = await pool.query(projection
+      ? `SELECT ${projection.select} FROM users u ${projection.joins} WHERE u.user_id = $1`
+      : `SELECT u.*, 
               CASE 
                 WHEN u.role = 'recruiter' THEN r.company
                 ELSE NULL
@@ -123,9 +177,34 @@ export const updateUserStatus = async (req, res) => {
     const { id } = req.params;
     const { status } = req.body;
 
-    // For now, we'll just return success since we don't have a status column
-    // You might want to add an 'active' or 'status' column to the users table
-    res.json({ success: true, message: 'User status updated' });
+    if (!['active', 'suspended'].includes(status)) {
+      return res.status(400).json({ success: false, error: 'Invalid status' });
+    }
+
+    let persisted = true;
+    try {
+      const result = await pool.query(
+        `UPDATE users SET status = $1, status_changed_at = NOW()
+         WHERE user_id = $2 RETURNING user_id`,
+        [status, id]
+      );
+      if (result.rows.length === 0) {
+        return res.status(404).json({ success: false, error: 'User not found' });
+      }
+    } catch (err) {
+      // users.status missing (migration 007 not applied): enforce in memory only
+      if (err?.code === '42703') {
+        console.warn('users.status column missing; user status is not persisted');
+        persisted = false;
+      } else {
+        throw err;
+      }
+    }
+
+    // Takes effect on this instance immediately, elsewhere on the next status refresh
+    setUserStatus(id, status);
+
+    res.json({ success: true, message: persisted ? 'User status updated' : 'User status updated (not persisted on this schema)' });
   } catch (error) {
     console.error('Error updating user status:', error);
     res.status(500).json({ success: false, error: 'Failed to update user status' });
@@ -146,6 +225,9 @@ export const deleteUser = async (req, res) => {
     // Delete user (cascade will handle related records)
     await pool.query('DELETE FROM users WHERE user_id = $1', [id]);
 
+    // Reject the deleted user's outstanding tokens
+    await revokeUser(id);
+
     res.json({ success: true, message: 'User deleted successfully' });
   } catch (error) {
     console.error('Error deleting user:', error);
@@ -156,18 +238,20 @@ export const deleteUser = async (req, res) => {
 // Get all jobs
 export const getAllJobs = async (req, res) => {
   try {
+    const db = readPool(req);
     const { search, company, status, page = 1, limit = 10 } = req.query;
     
     let query = `
-      SELECT j.*, 
-             COUNT(a.application_id) as application_count,
-             u.name as recruiter_name,
-             r.company as recruiter_company
+      SELECT j.*, rec.recruiter_name, rec.recruiter_company
       FROM jobs j
-      LEFT JOIN applications a ON j.job_id = a.job_id
-      LEFT JOIN operates o ON j.job_id = o.job_id
-      LEFT JOIN recruiters r ON o.recruiter_id = r.recruiter_id
-      LEFT JOIN users u ON r.user_id = u.user_id
+      LEFT JOIN LATERAL (
+        SELECT u.name AS recruiter_name, r.company AS recruiter_company
+        FROM operates o
+        JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+        LEFT JOIN users u ON r.user_id = u.user_id
+        WHERE o.job_id = j.job_id
+        LIMIT 1
+      ) rec ON true
       WHERE 1=1
     `;
     
@@ -186,14 +270,14 @@ export const getAllJobs = async (req, res) => {
       paramCount++;
     }
 
-    query += ` GROUP BY j.job_id, u.name, r.company ORDER BY j.created_at DESC`;
+    query += ` ORDER BY j.created_at DESC`;
 
     // Add pagination
     const offset = (page - 1) * limit;
     query += ` LIMIT $${paramCount} OFFSET $${paramCount + 1}`;
     queryParams.push(limit, offset);
 
-    const result = await pool.query(query, queryParams);
+    const result = await db.query(query, queryParams);
 
     // Get total count for pagination
     let countQuery = `
@@ -217,7 +301,7 @@ export const getAllJobs = async (req, res) => {
       countParamCount++;
     }
 
-    const countResult = await pool.query(countQuery, countParams);
+    const countResult = await db.query(countQuery, countParams);
     const total = parseInt(countResult.rows[0].total);
 
     res.json({ 
@@ -239,13 +323,14 @@ export const getAllJobs = async (req, res) => {
 // Get all applications
 export const getAllApplications = async (req, res) => {
   try {
+    const db = readPool(req);
     const { status, job_id, page = 1, limit = 10 } = req.query;
     
     let query = `
       SELECT a.*, 
              j.title as job_title, j.company as job_company,
              u.name as seeker_name, u.email as seeker_email,
-             r.name as recruiter_name, r.company as recruiter_company
+             ru.name as recruiter_name, r.company as recruiter_company
       FROM applications a
       JOIN jobs j ON a.job_id = j.job_id
       JOIN job_seekers js ON a.seeker_id = js.seeker_id
@@ -278,7 +363,7 @@ export const getAllApplications = async (req, res) => {
     query += ` LIMIT $${paramCount} OFFSET $${paramCount + 1}`;
     queryParams.push(limit, offset);
 
-    const result = await pool.query(query, queryParams);
+    const result = await db.query(query, queryParams);
 
     // Get total count for pagination
     let countQuery = `
@@ -302,7 +387,7 @@ export const getAllApplications = async (req, res) => {
       countParamCount++;
     }
 
-    const countResult = await pool.query(countQuery, countParams);
+    const countResult = await db.query(countQuery, countParams);
     const total = parseInt(countResult.rows[0].total);
 
     res.json({ 
@@ -321,10 +406,72 @@ export const getAllApplications = async (req, res) => {
   }
 };
 
+// Export applications (same filters as the list) as CSV or NDJSON
+export const exportApplications = async (req, res) => {
+  const { status, job_id } = req.query;
+
+  let query = `
+    SELECT a.application_id, a.status, a.applied_timestamp,
+           j.job_id, j.title as job_title, j.company as job_company,
+           u.name as seeker_name, u.email as seeker_email,
+           ru.name as recruiter_name, r.company as recruiter_company
+    FROM applications a
+    JOIN jobs j ON a.job_id = j.job_id
+    JOIN job_seekers js ON a.seeker_id = js.seeker_id
+    JOIN users u ON js.user_id = u.user_id
+    LEFT JOIN operates o ON j.job_id = o.job_id
+    LEFT JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+    LEFT JOIN users ru ON r.user_id = ru.user_id
+    WHERE 1=1
+  `;
+
+  const queryParams = [];
+  let paramCount = 1;
+
+  if (status) {
+    query += ` AND a.status = $${paramCount}`;
+    queryParams.push(status);
+    paramCount++;
+  }
+
+  if (job_id) {
+    query += ` AND a.job_id = $${paramCount}`;
+    queryParams.push(job_id);
+    paramCount++;
+  }
+
+  query += ` ORDER BY a.applied_timestamp DESC, a.application_id DESC`;
+
+  await streamExport(req, res, {
+    sql: query,
+    params: queryParams,
+    filename: 'applications',
+    columns: [
+      { key: 'application_id', header: 'Application ID' },
+      { key: 'status', header: 'Status' },
+      { key: 'applied_timestamp', header: 'Applied At' },
+      { key: 'job_id', header: 'Job ID' },
+      { key: 'job_title', header: 'Job Title' },
+      { key: 'job_company', header: 'Company' },
+      { key: 'seeker_name', header: 'Applicant' },
+      { key: 'seeker_email', header: 'Applicant Email' },
+      { key: 'recruiter_name', header: 'Recruiter' },
+      { key: 'recruiter_company', header: 'Recruiter Company' }
+    ]
+  });
+};
+
 // Get system logs
 export const getSystemLogs = async (req, res) => {
   try {
+    const db = readPool(req);
     const { actor_type, start_date, end_date, page = 1, limit = 10 } = req.query;
+
+    // ?cursor= (empty for the first page) switches from OFFSET pages to keyset pages
+    const cursorPage = 'cursor' in req.query ? parseCursorPage(req.query) : null;
+    if (cursorPage?.error) {
+      return res.status(400).json({ success: false, error: cursorPage.error });
+    }
     
     let query = `
       SELECT sl.*, 
@@ -333,6 +480,7 @@ export const getSystemLogs = async (req, res) => {
                WHEN sl.actor_type = 'recruiter' THEN r.company
                ELSE NULL
              END as company
+             ${cursorPage ? ', ARRAY[sl.timestamp::text, sl.log_id::text] AS _cursor' : ''}
       FROM system_logs sl
       LEFT JOIN users u ON sl.actor_id = u.user_id
       LEFT JOIN recruiters r ON sl.actor_id = r.user_id AND sl.actor_type = 'recruiter'
@@ -360,14 +508,28 @@ export const getSystemLogs = async (req, res) => {
       paramCount++;
     }
 
-    query += ` ORDER BY sl.timestamp DESC`;
+    if (cursorPage?.after) {
+      query += ` AND (sl.timestamp, sl.log_id) < ($${paramCount}::timestamp, $${paramCount + 1}::int)`;
+      queryParams.push(...cursorPage.after);
+      paramCount += 2;
+    }
+
+    query += ` ORDER BY sl.timestamp DESC, sl.log_id DESC`;
+
+    if (cursorPage) {
+      query += ` LIMIT $${paramCount}`;
+      queryParams.push(cursorPage.limit + 1);
+      const result = await db.query(query, queryParams);
+      const { items, next_cursor } = toCursorPage(result.rows, cursorPage.limit);
+      return res.json({ success: true, logs: items, next_cursor });
+    }
 
     // Add pagination
     const offset = (page - 1) * limit;
     query += ` LIMIT $${paramCount} OFFSET $${paramCount + 1}`;
     queryParams.push(limit, offset);
 
-    const result = await pool.query(query, queryParams);
+    const result = await db.query(query, queryParams);
 
     // Get total count for pagination
     let countQuery = `
@@ -397,7 +559,7 @@ export const getSystemLogs = async (req, res) => {
       countParamCount++;
     }
 
-    const countResult = await pool.query(countQuery, countParams);
+    const countResult = await db.query(countQuery, countParams);
     const total = parseInt(countResult.rows[0].total);
 
     res.json({ 
@@ -416,13 +578,72 @@ export const getSystemLogs = async (req, res) => {
   }
 };
 
+// Export system logs (same filters as the list) as CSV or NDJSON
+export const exportSystemLogs = async (req, res) => {
+  const { actor_type, start_date, end_date } = req.query;
+
+  let query = `
+    SELECT sl.log_id, sl.timestamp, sl.actor_type, sl.actor_id,
+           u.name as actor_name,
+           CASE 
+             WHEN sl.actor_type = 'recruiter' THEN r.company
+             ELSE NULL
+           END as company,
+           sl.action_desc, sl.details
+    FROM system_logs sl
+    LEFT JOIN users u ON sl.actor_id = u.user_id
+    LEFT JOIN recruiters r ON sl.actor_id = r.user_id AND sl.actor_type = 'recruiter'
+    WHERE 1=1
+  `;
+
+  const queryParams = [];
+  let paramCount = 1;
+
+  if (actor_type) {
+    query += ` AND sl.actor_type = $${paramCount}`;
+    queryParams.push(actor_type);
+    paramCount++;
+  }
+
+  if (start_date) {
+    query += ` AND sl.timestamp >= $${paramCount}`;
+    queryParams.push(start_date);
+    paramCount++;
+  }
+
+  if (end_date) {
+    query += ` AND sl.timestamp <= $${paramCount}`;
+    queryParams.push(end_date);
+    paramCount++;
+  }
+
+  query += ` ORDER BY sl.timestamp DESC, sl.log_id DESC`;
+
+  await streamExport(req, res, {
+    sql: query,
+    params: queryParams,
+    filename: 'system-logs',
+    columns: [
+      { key: 'log_id', header: 'Log ID' },
+      { key: 'timestamp', header: 'Timestamp' },
+      { key: 'actor_type', header: 'Actor Type' },
+      { key: 'actor_id', header: 'Actor ID' },
+      { key: 'actor_name', header: 'Actor' },
+      { key: 'company', header: 'Company' },
+      { key: 'action_desc', header: 'Action' },
+      { key: 'details', header: 'Details' }
+    ]
+  });
+};
+
 // Get dashboard statistics
 export const getDashboardStats = async (req, res) => {
   try {
+    const db = readPool(req);
     console.log('Fetching dashboard statistics...');
     
     // Get total users by role
-    const usersStats = await pool.query(`
+    const usersStats = await db.query(`
       SELECT role, COUNT(*) as count
       FROM users
       GROUP BY role
@@ -430,32 +651,32 @@ export const getDashboardStats = async (req, res) => {
     console.log('Users stats:', usersStats.rows);
 
     // Get total jobs
-    const jobsCount = await pool.query('SELECT COUNT(*) as count FROM jobs');
+    const jobsCount = await db.query('SELECT COUNT(*) as count FROM jobs');
     console.log('Jobs count:', jobsCount.rows[0]);
     
     // Get total applications
-    const applicationsCount = await pool.query('SELECT COUNT(*) as count FROM applications');
+    const applicationsCount = await db.query('SELECT COUNT(*) as count FROM applications');
     console.log('Applications count:', applicationsCount.rows[0]);
     
     // Get total interviews
-    const interviewsCount = await pool.query('SELECT COUNT(*) as count FROM interviews');
+    const interviewsCount = await db.query('SELECT COUNT(*) as count FROM interviews');
     console.log('Interviews count:', interviewsCount.rows[0]);
     
     // Get recent activity (last 7 days) - simplified query
-    const recentUsersCount = await pool.query(`
+    const recentUsersCount = await db.query(`
       SELECT COUNT(*) as count
       FROM users
       WHERE created_at >= NOW() - INTERVAL '7 days'
     `);
     
-    const recentJobsCount = await pool.query(`
+    const recentJobsCount = await db.query(`
       SELECT COUNT(*) as count
       FROM jobs
       WHERE created_at >= NOW() - INTERVAL '7 days'
     `);
 
     // Get applications by status
-    const applicationsByStatus = await pool.query(`
+    const applicationsByStatus = await db.query(`
       SELECT COALESCE(status, 'pending') as status, COUNT(*) as count
       FROM applications
       GROUP BY status
@@ -509,6 +730,7 @@ export const deleteJob = async (req, res) => {
 
     // Delete job (cascade will handle related records)
     await pool.query('DELETE FROM jobs WHERE job_id = $1', [id]);
+    unindexJob(id);
 
     res.json({ success: true, message: 'Job deleted successfully' });
   } catch (error) {
@@ -517,20 +739,45 @@ export const deleteJob = async (req, res) => {
   }
 };
 
-// Get duplicate users (users with same email)
+// List outbox emails by status (dead letters by default)
+export const getEmailOutbox = async (req, res) => {
+  try {
+    const { status = 'dead', limit = 100 } = req.query;
+    if (!['pending', 'sent', 'dead'].includes(status)) {
+      return res.status(400).json({ success: false, error: 'status must be pending, sent or dead' });
+    }
+    const emails = await listOutbox({ status, limit: Math.min(Number(limit) || 100, 500) });
+    res.json({ success: true, emails });
+  } catch (error) {
+    if (error.code === '42P01') {
+      return res.json({ success: true, emails: [] });
+    }
+    console.error('Error fetching email outbox:', error);
+    res.status(500).json({ success: false, error: 'Failed to fetch email outbox' });
+  }
+};
+
+// Requeue dead-lettered emails (`ids`, or all of them when omitted)
+export const retryEmailOutbox = async (req, res) => {
+  try {
+    const ids = Array.isArray(req.body.ids)
+      ? req.body.ids.map(Number).filter(id => Number.isInteger(id) && id > 0)
+      : [];
+    const requeued = await retryDeadEmails(ids);
+    res.json({ success: true, requeued: requeued.length, ids: requeued });
+  } catch (error) {
+    console.error('Error retrying emails:', error);
+    res.status(500).json({ success: false, error: 'Failed to retry emails' });
+  }
+};
+
+// Get duplicate users (users with the same email, ignoring case).
+// Once uniq_users_email_lower exists this is a catalog lookup, not a scan.
 export const getDuplicateUsers = async (req, res) => {
   try {
-    const duplicates = await pool.query(`
-      SELECT email, COUNT(*) as count, 
-             ARRAY_AGG(user_id) as user_ids,
-             ARRAY_AGG(name) as names
-      FROM users
-      GROUP BY email
-      HAVING COUNT(*) > 1
-      ORDER BY count DESC
-    `);
+    const duplicates = await findDuplicateUsers();
 
-    res.json({ success: true, duplicates: duplicates.rows });
+    res.json({ success: true, duplicates });
   } catch (error) {
     console.error('Error fetching duplicate users:', error);
     res.status(500).json({ success: false, error: 'Failed to fetch duplicate users' });
@@ -583,21 +830,22 @@ export const updateAdminProfile = async (req, res) => {
 // Get admin stats (for profile page)
 export const getAdminStats = async (req, res) => {
   try {
+    const db = readPool(req);
     // Get total job seekers
-    const jobSeekersCount = await pool.query(
+    const jobSeekersCount = await db.query(
       "SELECT COUNT(*) as count FROM users WHERE role = 'job_seeker'"
     );
     
     // Get total recruiters
-    const recruitersCount = await pool.query(
+    const recruitersCount = await db.query(
       "SELECT COUNT(*) as count FROM users WHERE role = 'recruiter'"
     );
     
     // Get total jobs
-    const jobsCount = await pool.query('SELECT COUNT(*) as count FROM jobs');
+    const jobsCount = await db.query('SELECT COUNT(*) as count FROM jobs');
     
     // Get total applications
-    const applicationsCount = await pool.query('SELECT COUNT(*) as count FROM applications');
+    const applicationsCount = await db.query('SELECT COUNT(*) as count FROM applications');
     
     res.json({
       success: true,
@@ -1,5 +1,6 @@
 import pool from '../db.js';
 import dotenv from 'dotenv';
+import { analysisCacheKey, getCachedAnalysis, normalizeJobDescription, recordAnalysis } from '../services/atsCache.js';
 
 dotenv.config();
 
@@ -374,81 +375,95 @@ const generateIndustryInsights = (jobDescription) => {
   return insights;
 };
 
+// Resume, its experience/education/skills and (for the default resume) the
+// account's contact details, as analyzeResumeWithAI expects them
+const loadResumeData = async (resumeId, withContact) => {
+  const result = await pool.query(
+    `SELECT r.*, 
+      json_agg(DISTINCT e.*) as experiences,
+      json_agg(DISTINCT ed.*) as education,
+      json_agg(DISTINCT s.*) as skills
+      ${withContact ? ', u.email, u.name, u.phone_no' : ''}
+     FROM resumes r
+     LEFT JOIN experiences e ON r.resume_id = e.resume_id
+     LEFT JOIN education ed ON r.resume_id = ed.resume_id
+     LEFT JOIN skills s ON r.resume_id = s.resume_id
+     ${withContact ? 'JOIN job_seekers js ON r.seeker_id = js.seeker_id JOIN users u ON js.user_id = u.user_id' : ''}
+     WHERE r.resume_id = $1
+     GROUP BY r.resume_id${withContact ? ', u.email, u.name, u.phone_no' : ''}`,
+    [resumeId]
+  );
+  return result.rows[0];
+};
+
+// Resolve the resume to analyze and its content version (null before migration 011)
+const resolveResume = async (user_id, resumeId) => {
+  const run = (version) => resumeId
+    ? pool.query(
+        `SELECT r.resume_id, ${version} AS content_version FROM resumes r WHERE r.resume_id = $1`,
+        [resumeId]
+      )
+    : pool.query(
+        // Default resume: the primary one, otherwise the most recent
+        `SELECT r.resume_id, ${version} AS content_version
+         FROM job_seekers js
+         LEFT JOIN LATERAL (
+           SELECT * FROM resumes WHERE seeker_id = js.seeker_id
+           ORDER BY is_primary DESC NULLS LAST, created_at DESC
+           LIMIT 1
+         ) r ON true
+         WHERE js.user_id = $1`,
+        [user_id]
+      );
+
+  try {
+    return (await run('r.content_version')).rows[0];
+  } catch (error) {
+    if (error.code !== '42703') throw error;
+    return (await run('NULL::int')).rows[0];
+  }
+};
+
 // ATS Analysis Endpoint
 export const analyzeResume = async (req, res) => {
   try {
     const user_id = req.user.id;
-    const { jobDescription, resumeId } = req.body;
-    
-    // Get job seeker's resume
-    let resumeData;
-    if (resumeId) {
-      const resumeResult = await pool.query(
-        `SELECT r.*, 
-          json_agg(DISTINCT e.*) as experiences,
-          json_agg(DISTINCT ed.*) as education,
-          json_agg(DISTINCT s.*) as skills
-         FROM resumes r
-LEFT JOIN experiences e ON r.resume_id = e.resume_id
-         LEFT JOIN education ed ON r.resume_id = ed.resume_id
-         LEFT JOIN skills s ON r.resume_id = s.resume_id
-         WHERE r.resume_id = $1
-         GROUP BY r.resume_id`,
-        [resumeId]
-      );
-      resumeData = resumeResult.rows[0];
-    } else {
-      // Get default resume
-      const seekerResult = await pool.query(
-        'SELECT seeker_id FROM job_seekers WHERE user_id = $1',
-        [user_id]
-      );
-      
-      if (seekerResult.rows.length === 0) {
-        return res.status(404).json({ success: false, error: 'Job seeker profile not found' });
-      }
-      
-      const seeker_id = seekerResult.rows[0].seeker_id;
-      
-      const resumeResult = await pool.query(
-        `SELECT r.*, 
-          json_agg(DISTINCT e.*) as experiences,
-          json_agg(DISTINCT ed.*) as education,
-          json_agg(DISTINCT s.*) as skills,
-          u.email, u.name, u.phone_no
-         FROM resumes r
-LEFT JOIN experiences e ON r.resume_id = e.resume_id
-         LEFT JOIN education ed ON r.resume_id = ed.resume_id
-         LEFT JOIN skills s ON r.resume_id = s.resume_id
-         JOIN job_seekers js ON r.seeker_id = js.seeker_id
-         JOIN users u ON js.user_id = u.user_id
-         WHERE r.seeker_id = $1 AND (r.is_primary = true OR r.resume_id = (
-           SELECT resume_id FROM resumes WHERE seeker_id = $1 ORDER BY created_at DESC LIMIT 1
-         ))
-         GROUP BY r.resume_id, u.email, u.name, u.phone_no
-         LIMIT 1`,
-        [seeker_id]
-      );
-      
-      if (resumeResult.rows.length === 0) {
-        return res.status(404).json({ success: false, error: 'No resume found' });
+    const { resumeId } = req.body;
+    const jobDescription = normalizeJobDescription(req.body.jobDescription);
+
+    const resume = await resolveResume(user_id, resumeId);
+    if (!resume) {
+      return res.status(404).json({
+        success: false,
+        error: resumeId ? 'Resume not found' : 'Job seeker profile not found'
+      });
+    }
+    if (!resume.resume_id) {
+      return res.status(404).json({ success: false, error: 'No resume found' });
+    }
+
+    // Same description against an unchanged resume: reuse the earlier result
+    const variant = resumeId ? 'resume' : 'default';
+    const key = resume.content_version == null ? null : analysisCacheKey({
+      jobDescription,
+      resumeId: resume.resume_id,
+      contentVersion: resume.content_version,
+      variant
+    });
+    if (key) {
+      const cached = await getCachedAnalysis(key);
+      if (cached) {
+        return res.json({ success: true, analysis: cached, cached: true });
       }
-      
-      resumeData = resumeResult.rows[0];
     }
+
+    const resumeData = await loadResumeData(resume.resume_id, !resumeId);
     
     // Analyze resume with AI or local algorithm
     const analysis = await analyzeResumeWithAI(resumeData, jobDescription);
     
-    // Store analysis history (optional)
-    await pool.query(
-      `INSERT INTO ats_analysis_history (user_id, resume_id, job_description, overall_score, analysis_data, created_at)
-       VALUES ($1, $2, $3, $4, $5, NOW())
-       ON CONFLICT DO NOTHING`,
-      [user_id, resumeData.resume_id, jobDescription, analysis.scores.overallScore, JSON.stringify(analysis)]
-    ).catch(() => {
-      // Table might not exist, ignore error
-    });
+    // Store analysis history (written after the response is sent)
+    recordAnalysis({ key, userId: user_id, resumeId: resume.resume_id, jobDescription, analysis });
     
     res.json({
       success: true,
@@ -1,20 +1,73 @@
 import pool from '../db.js';
+import { bumpRecruiterStatsForJob, bumpSeekerStats, reconcileSeekerStats } from '../services/statsCounters.js';
+import { isOverlapError, parseWindow } from '../services/interviewCalendar.js';
+import { parseCursorPage, toCursorPage } from '../services/pagination.js';
+import { conflictKey } from '../services/dedup.js';
+import { readPool } from '../services/readRouting.js';
+import { defineFieldset, selectFields } from '../services/fieldsets.js';
+import { KINDS as SUGGESTION_KINDS, MAX_SUGGESTIONS, suggest, typeaheadReady } from '../services/typeahead.js';
+
+// One recruiter per job (operates can hold several rows per job)
+const RECRUITER_JOIN = `LEFT JOIN LATERAL (
+                  SELECT u.name AS recruiter_name, r.company AS recruiter_company
+                  FROM operates o
+                  JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+                  LEFT JOIN users u ON r.user_id = u.user_id
+                  WHERE o.job_id = j.job_id
+                  LIMIT 1
+                ) rec ON true`;
+
+// ?fields= for the job board. The application count is the counter kept by
+// migration 009 and the recruiter a single-row lateral join, so a board that
+// shows no recruiter reads nothing but jobs.
+const jobListFields = defineFieldset({
+  required: ['job_id'],
+  fields: {
+    job_id: 'j.job_id',
+    title: 'j.title',
+    company: 'j.company',
+    location: 'j.location',
+    salary: 'j.salary',
+    job_type: 'j.job_type',
+    min_experience: 'j.min_experience',
+    skills_required: 'j.skills_required',
+    status: 'j.status',
+    job_description: 'j.job_description',
+    created_at: 'j.created_at',
+    application_count: 'j.application_count',
+    recruiter_name: { sql: 'rec.recruiter_name', join: 'recruiter' },
+    recruiter_company: { sql: 'rec.recruiter_company', join: 'recruiter' },
+  },
+  joins: { recruiter: RECRUITER_JOIN },
+});
 
 // Get all available jobs
 export const getAllJobs = async (req, res) => {
   try {
+    const db = readPool(req);
     const { search, location, job_type, salary_min, salary_max, experience } = req.query;
-    
-let query = `
-      SELECT j.*, 
-             COUNT(a.application_id) as application_count,
-             u.name as recruiter_name,
-             r.company as recruiter_company
+
+    // ?limit=&cursor= pages through jobs newest first; without them the full board is returned
+    const page = parseCursorPage(req.query);
+    if (page?.error) {
+      return res.status(400).json({ success: false, error: page.error });
+    }
+    const projection = selectFields(req.query, jobListFields);
+    if (projection?.error) {
+      return res.status(400).json({ success: false, error: projection.error });
+    }
+    const cursorColumn = page ? ', ARRAY[j.created_at::text, j.job_id::text] AS _cursor' : '';
+
+    let query = projection ? `
+      SELECT ${projection.select}${cursorColumn}
       FROM jobs j
-      LEFT JOIN applications a ON j.job_id = a.job_id
-      LEFT JOIN operates o ON j.job_id = o.job_id
-      LEFT JOIN recruiters r ON o.recruiter_id = r.recruiter_id
-      LEFT JOIN users u ON r.user_id = u.user_id
+      ${projection.joins}
+      WHERE 1=1
+    ` : `
+      SELECT j.*, rec.recruiter_name, rec.recruiter_company
+             ${cursorColumn}
+      FROM jobs j
+      ${RECRUITER_JOIN}
       WHERE 1=1
     `;
     
@@ -57,9 +110,24 @@ let query = `
       paramCount++;
     }
 
-query += ` GROUP BY j.job_id, u.name, r.company ORDER BY j.created_at DESC`;
+    if (page?.after) {
+      query += ` AND (j.created_at, j.job_id) < ($${paramCount}::timestamp, $${paramCount + 1}::int)`;
+      queryParams.push(...page.after);
+      paramCount += 2;
+    }
+
+    query += ` ORDER BY j.created_at DESC, j.job_id DESC`;
 
-    const result = await pool.query(query, queryParams);
+    if (page) {
+      query += ` LIMIT $${paramCount}`;
+      queryParams.push(page.limit + 1);
+    }
+
+    const result = await db.query(query, queryParams);
+    if (page) {
+      const { items, next_cursor } = toCursorPage(result.rows, page.limit);
+      return res.json({ success: true, jobs: items, next_cursor });
+    }
     res.json({ success: true, jobs: result.rows });
   } catch (error) {
     console.error('Error fetching jobs:', error);
@@ -68,7 +136,81 @@ query += ` GROUP BY j.job_id, u.name, r.company ORDER BY j.created_at DESC`;
 };
 
 // Apply for a job
+// Resolves the seeker and resume and inserts in one statement. The unique
+// (seeker_id, job_id) constraint makes double submits race-free: a conflicting
+// 'saved' placeholder is promoted to an application, anything else is rejected.
 export const applyForJob = async (req, res) => {
+  try {
+    const { job_id } = req.params;
+    const { resume_id } = req.body; // Optional: specific resume to attach
+    const user_id = req.user.id;
+
+    let result;
+    try {
+      result = await pool.query(
+        `WITH seeker AS (
+           SELECT seeker_id FROM job_seekers WHERE user_id = $1
+         ),
+         resume AS (
+           -- The requested resume if it is the seeker's, else primary, else most recent
+           SELECT r.resume_id FROM resumes r JOIN seeker s ON r.seeker_id = s.seeker_id
+           WHERE $3::int IS NULL OR r.resume_id = $3
+           ORDER BY r.is_primary DESC NULLS LAST, r.created_at DESC
+           LIMIT 1
+         ),
+         inserted AS (
+           INSERT INTO applications (seeker_id, job_id, resume_id, status, star)
+           SELECT s.seeker_id, $2, r.resume_id, 'applied', true FROM seeker s, resume r
+           ON CONFLICT (seeker_id, job_id) DO UPDATE
+             SET status = 'applied', resume_id = EXCLUDED.resume_id, applied_timestamp = NOW()
+             WHERE applications.status = 'saved'
+           RETURNING *, (xmax = 0) AS created
+         )
+         SELECT s.seeker_id AS resolved_seeker_id, r.resume_id AS resolved_resume_id, i.*
+         FROM (SELECT 1) one
+         LEFT JOIN seeker s ON true
+         LEFT JOIN resume r ON true
+         LEFT JOIN inserted i ON true`,
+        [user_id, job_id, resume_id || null]
+      );
+    } catch (err) {
+      // 42P10: unique constraint missing, 42703: resume columns missing (older schema)
+      if (err?.code === '42P10' || err?.code === '42703') return applyForJobLegacy(req, res);
+      // 23503: job does not exist
+      if (err?.code === '23503') return res.status(404).json({ success: false, error: 'Job not found' });
+      throw err;
+    }
+
+    const { resolved_seeker_id, resolved_resume_id, created, ...application } = result.rows[0];
+
+    if (!resolved_seeker_id) {
+      return res.status(404).json({ success: false, error: 'Job seeker profile not found' });
+    }
+    if (!resolved_resume_id) {
+      return res.status(400).json({
+        success: false,
+        error: resume_id ? 'Invalid resume selected' : 'Please create or upload a resume before applying'
+      });
+    }
+    if (!application.application_id) {
+      return res.status(400).json({ success: false, error: 'Already applied for this job' });
+    }
+
+    // A promoted 'saved' row was already counted when it was saved
+    if (created) {
+      await bumpSeekerStats(resolved_seeker_id, { applied_jobs: 1 });
+      await bumpRecruiterStatsForJob(job_id, { total_applications: 1, new_applications: 1 });
+    }
+
+    res.status(201).json({ success: true, application });
+  } catch (error) {
+    console.error('Error applying for job:', error);
+    res.status(500).json({ success: false, error: 'Failed to apply for job' });
+  }
+};
+
+// Multi-query apply flow for databases without migration 009
+const applyForJobLegacy = async (req, res) => {
   try {
     const { job_id } = req.params;
     const { resume_id } = req.body; // Optional: specific resume to attach
@@ -147,6 +289,9 @@ export const applyForJob = async (req, res) => {
       }
     }
 
+    await bumpSeekerStats(seeker_id, { applied_jobs: 1 });
+    await bumpRecruiterStatsForJob(job_id, { total_applications: 1, new_applications: 1 });
+
     res.status(201).json({ success: true, application: applicationResult.rows[0] });
   } catch (error) {
     console.error('Error applying for job:', error);
@@ -154,10 +299,61 @@ export const applyForJob = async (req, res) => {
   }
 };
 
+// Typeahead for the search boxes: ?q=prefix&kind=title,company,location,skill&limit=8.
+// Served from memory (services/typeahead.js); nothing here touches the database.
+export const getJobSuggestions = (req, res) => {
+  const q = String(req.query.q ?? '').slice(0, 100);
+  const kinds = req.query.kind ? String(req.query.kind).split(',').map(k => k.trim()) : SUGGESTION_KINDS;
+  if (kinds.some(k => !SUGGESTION_KINDS.includes(k))) {
+    return res.status(400).json({ success: false, error: `kind must be one of: ${SUGGESTION_KINDS.join(', ')}` });
+  }
+  const limit = Math.min(Math.max(Number.parseInt(req.query.limit, 10) || 8, 1), MAX_SUGGESTIONS);
+
+  // Let the browser reuse an answer briefly, but never a shared cache (the route
+  // needs a login), and not an empty answer from before the first build
+  const ready = typeaheadReady();
+  res.set('Cache-Control', ready ? 'private, max-age=60' : 'no-store');
+  res.json({ success: true, ready, suggestions: suggest(q, { kinds, limit }) });
+};
+
 // Get user's applications
+// ?fields= for the seeker's applications
+const myApplicationFields = defineFieldset({
+  required: ['application_id'],
+  fields: {
+    application_id: 'a.application_id',
+    job_id: 'a.job_id',
+    status: 'a.status',
+    star: 'a.star',
+    applied_timestamp: 'a.applied_timestamp',
+    resume_id: 'a.resume_id',
+    title: { sql: 'j.title', join: 'job' },
+    company: { sql: 'j.company', join: 'job' },
+    salary: { sql: 'j.salary', join: 'job' },
+    job_description: { sql: 'j.job_description', join: 'job' },
+    recruiter_name: { sql: 'rec.recruiter_name', join: 'recruiter' },
+    recruiter_company: { sql: 'rec.recruiter_company', join: 'recruiter' },
+  },
+  joins: {
+    job: 'JOIN jobs j ON a.job_id = j.job_id',
+    recruiter: `LEFT JOIN LATERAL (
+                  SELECT u.name AS recruiter_name, r.company AS recruiter_company
+                  FROM operates o
+                  JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+                  LEFT JOIN users u ON r.user_id = u.user_id
+                  WHERE o.job_id = a.job_id
+                  LIMIT 1
+                ) rec ON true`,
+  },
+});
+
 export const getMyApplications = async (req, res) => {
   try {
     const user_id = req.user.id;
+    const projection = selectFields(req.query, myApplicationFields);
+    if (projection?.error) {
+      return res.status(400).json({ success: false, error: projection.error });
+    }
 
     // Get job seeker ID
     const seekerResult = await pool.query(
@@ -171,17 +367,23 @@ export const getMyApplications = async (req, res) => {
 
     const seeker_id = seekerResult.rows[0].seeker_id;
 
-    // Get all applications with job details
+    // Get all applications with job details (or just the requested ?fields=)
     const applicationsResult = await pool.query(
-      `SELECT a.*, j.title, j.company, j.salary, j.job_description,
-              u.name as recruiter_name, r.company as recruiter_company
-       FROM applications a
-       JOIN jobs j ON a.job_id = j.job_id
-       LEFT JOIN operates o ON j.job_id = o.job_id
-       LEFT JOIN recruiters r ON o.recruiter_id = r.recruiter_id
-       LEFT JOIN users u ON r.user_id = u.user_id
-       WHERE a.seeker_id = $1
-       ORDER BY a.applied_timestamp DESC`,
+      projection
+        ? `SELECT ${projection.select}
+           FROM applications a
+           ${projection.joins}
+           WHERE a.seeker_id = $1
+           ORDER BY a.applied_timestamp DESC`
+        : `SELECT a.*, j.title, j.company, j.salary, j.job_description,
+                  u.name as recruiter_name, r.company as recruiter_company
+           FROM applications a
+           JOIN jobs j ON a.job_id = j.job_id
+           LEFT JOIN operates o ON j.job_id = o.job_id
+           LEFT JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+           LEFT JOIN users u ON r.user_id = u.user_id
+           WHERE a.seeker_id = $1
+           ORDER BY a.applied_timestamp DESC`,
       [seeker_id]
     );
 
@@ -225,11 +427,17 @@ export const toggleSaveJob = async (req, res) => {
       );
       res.json({ success: true, saved: newStarStatus });
     } else {
-      // Create new application with star = true (saved but not applied)
-      await pool.query(
-        'INSERT INTO applications (seeker_id, job_id, status, star) VALUES ($1, $2, $3, $4)',
+      // Create new application with star = true (saved but not applied);
+      // a concurrent save/apply for the same job wins the race
+      const inserted = await pool.query(
+        'INSERT INTO applications (seeker_id, job_id, status, star) VALUES ($1, $2, $3, $4) ON CONFLICT DO NOTHING',
         [seeker_id, job_id, 'saved', true]
       );
+      if (inserted.rowCount > 0) {
+        // Saved jobs are application rows, so they count like one on both dashboards
+        await bumpSeekerStats(seeker_id, { applied_jobs: 1 });
+        await bumpRecruiterStatsForJob(job_id, { total_applications: 1, new_applications: 1 });
+      }
       res.json({ success: true, saved: true });
     }
   } catch (error) {
@@ -402,10 +610,24 @@ export const addExperience = async (req, res) => {
       resume_id = resumeResult.rows[0].resume_id;
     }
 
-    const experienceResult = await pool.query(
-      'INSERT INTO experiences (resume_id, company, duration, job_title, description) VALUES ($1, $2, $3, $4, $5) RETURNING *',
-      [resume_id, company, duration, job_title, description]
-    );
+    const values = [resume_id, company, duration, job_title, description];
+    let experienceResult;
+    try {
+      // Adding an entry identical to an existing one (normalized key) returns that row
+      experienceResult = await pool.query(
+        `INSERT INTO experiences (resume_id, company, duration, job_title, description) VALUES ($1, $2, $3, $4, $5)
+         ON CONFLICT (${conflictKey('experiences')}) DO UPDATE SET resume_id = EXCLUDED.resume_id
+         RETURNING *`,
+        values
+      );
+    } catch (error) {
+      // 42P10: the unique key is not built yet (existing duplicates await `npm run dedup`)
+      if (error.code !== '42P10') throw error;
+      experienceResult = await pool.query(
+        'INSERT INTO experiences (resume_id, company, duration, job_title, description) VALUES ($1, $2, $3, $4, $5) RETURNING *',
+        values
+      );
+    }
 
     res.status(201).json({ success: true, experience: experienceResult.rows[0] });
   } catch (error) {
@@ -455,6 +677,9 @@ export const updateExperience = async (req, res) => {
 
     res.json({ success: true });
   } catch (error) {
+    if (error.code === '23505') {
+      return res.status(409).json({ success: false, error: 'An identical experience already exists on this resume' });
+    }
     console.error('Error updating experience:', error);
     res.status(500).json({ success: false, error: 'Failed to update experience' });
   }
@@ -484,30 +709,42 @@ export const addSkills = async (req, res) => {
       resume_id = resumeResult.rows[0].resume_id;
     }
 
-    // Check if skills of this type already exist
-    const existingSkills = await pool.query(
-      'SELECT * FROM skills WHERE resume_id = $1 AND skill_type = $2',
-      [resume_id, skill_type]
-    );
-
     // Ensure skills is an array for PostgreSQL and format it properly
     const skillsArray = Array.isArray(skills) ? skills : (typeof skills === 'string' ? skills.split(',').map(s => s.trim()).filter(s => s) : [skills]);
     
     // Format as PostgreSQL array string
     const skillsArrayString = `{${skillsArray.map(skill => `"${skill.replace(/"/g, '\\"')}"`).join(',')}}`;
 
-    if (existingSkills.rows.length > 0) {
-      // Update existing skills
-      await pool.query(
-        'UPDATE skills SET skills = $1 WHERE resume_id = $2 AND skill_type = $3',
-        [skillsArrayString, resume_id, skill_type]
-      );
-    } else {
-      // Add new skills
+    try {
+      // One row per resume and type: replace the skills in a single statement
       await pool.query(
-        'INSERT INTO skills (resume_id, skill_type, skills) VALUES ($1, $2, $3)',
+        `INSERT INTO skills (resume_id, skill_type, skills) VALUES ($1, $2, $3)
+         ON CONFLICT (${conflictKey('skills')}) DO UPDATE SET skills = EXCLUDED.skills`,
         [resume_id, skill_type, skillsArrayString]
       );
+    } catch (error) {
+      // 42P10: the unique key is not built yet (existing duplicates await `npm run dedup`)
+      if (error.code !== '42P10') throw error;
+
+      // Check if skills of this type already exist
+      const existingSkills = await pool.query(
+        'SELECT * FROM skills WHERE resume_id = $1 AND skill_type = $2',
+        [resume_id, skill_type]
+      );
+
+      if (existingSkills.rows.length > 0) {
+        // Update existing skills
+        await pool.query(
+          'UPDATE skills SET skills = $1 WHERE resume_id = $2 AND skill_type = $3',
+          [skillsArrayString, resume_id, skill_type]
+        );
+      } else {
+        // Add new skills
+        await pool.query(
+          'INSERT INTO skills (resume_id, skill_type, skills) VALUES ($1, $2, $3)',
+          [resume_id, skill_type, skillsArrayString]
+        );
+      }
     }
 
     res.json({ success: true, message: 'Skills updated successfully' });
@@ -541,10 +778,24 @@ export const addEducation = async (req, res) => {
       resume_id = resumeResult.rows[0].resume_id;
     }
 
-    const educationResult = await pool.query(
-      'INSERT INTO education (resume_id, qualification, college, gpa, start_date, end_date) VALUES ($1, $2, $3, $4, $5, $6) RETURNING *',
-      [resume_id, qualification, college, gpa, start_date, end_date]
-    );
+    const values = [resume_id, qualification, college, gpa, start_date, end_date];
+    let educationResult;
+    try {
+      // Adding an entry identical to an existing one (normalized key) returns that row
+      educationResult = await pool.query(
+        `INSERT INTO education (resume_id, qualification, college, gpa, start_date, end_date) VALUES ($1, $2, $3, $4, $5, $6)
+         ON CONFLICT (${conflictKey('education')}) DO UPDATE SET start_date = EXCLUDED.start_date, end_date = EXCLUDED.end_date
+         RETURNING *`,
+        values
+      );
+    } catch (error) {
+      // 42P10: the unique key is not built yet (existing duplicates await `npm run dedup`)
+      if (error.code !== '42P10') throw error;
+      educationResult = await pool.query(
+        'INSERT INTO education (resume_id, qualification, college, gpa, start_date, end_date) VALUES ($1, $2, $3, $4, $5, $6) RETURNING *',
+        values
+      );
+    }
 
     res.status(201).json({ success: true, education: educationResult.rows[0] });
   } catch (error) {
@@ -591,6 +842,9 @@ export const updateEducation = async (req, res) => {
 
     res.json({ success: true });
   } catch (error) {
+    if (error.code === '23505') {
+      return res.status(409).json({ success: false, error: 'An identical education entry already exists on this resume' });
+    }
     console.error('Error updating education:', error);
     res.status(500).json({ success: false, error: 'Failed to update education' });
   }
@@ -643,6 +897,17 @@ export const getInterviews = async (req, res) => {
 
     const seeker_id = seekerResult.rows[0].seeker_id;
 
+    // Optional ?from=&to= window (by start time); without it the full history is returned
+    const dateWindow = parseWindow(req.query);
+    if (dateWindow?.error) return res.status(400).json({ success: false, error: dateWindow.error });
+
+    const params = [seeker_id];
+    let windowClause = '';
+    if (dateWindow) {
+      params.push(dateWindow.from, dateWindow.to);
+      windowClause = 'AND i.schedule >= $2 AND i.schedule < $3';
+    }
+
     // Get interviews with enhanced data
     const interviewsResult = await pool.query(
       `SELECT i.*, j.title as job_title, j.company, u.name as recruiter_name, u.email as recruiter_email
@@ -650,9 +915,9 @@ export const getInterviews = async (req, res) => {
        JOIN jobs j ON i.job_id = j.job_id
        JOIN recruiters r ON i.recruiter_id = r.recruiter_id
        JOIN users u ON r.user_id = u.user_id
-       WHERE i.seeker_id = $1
+       WHERE i.seeker_id = $1 ${windowClause}
        ORDER BY i.schedule DESC`,
-      [seeker_id]
+      params
     );
 
     res.json({ success: true, interviews: interviewsResult.rows });
@@ -691,11 +956,16 @@ export const updateInterviewStatus = async (req, res) => {
       return res.status(404).json({ success: false, error: 'Interview not found' });
     }
 
-    // Update interview status
-    await pool.query(
-      'UPDATE interviews SET status = $1, notes = COALESCE($2, notes) WHERE interview_id = $3',
-      [status, notes, interview_id]
-    );
+    // Update interview status; re-activating a cancelled slot can collide with a newer booking
+    try {
+      await pool.query(
+        'UPDATE interviews SET status = $1, notes = COALESCE($2, notes) WHERE interview_id = $3',
+        [status, notes, interview_id]
+      );
+    } catch (err) {
+      if (!isOverlapError(err)) throw err;
+      return res.status(409).json({ success: false, error: 'Interview overlaps another scheduled interview' });
+    }
 
     res.json({ success: true });
   } catch (error) {
@@ -754,88 +1024,39 @@ export const getConversationWithRecruiter = async (req, res) => {
   }
 };
 
-// Live jobseeker stats
+// Jobseeker stats: a single primary-key read of the materialized counters
 export const getJobseekerStats = async (req, res) => {
   try {
     const user_id = req.user.id;
 
-    const seekerResult = await pool.query('SELECT seeker_id FROM job_seekers WHERE user_id = $1', [user_id]);
-    if (seekerResult.rows.length === 0) return res.status(404).json({ success: false, error: 'Job seeker profile not found' });
-    const seeker_id = seekerResult.rows[0].seeker_id;
-
-    // Applications count (schema-tolerant)
-    let appliedJobs = 0;
+    let seekerResult;
     try {
-      const appsRes = await pool.query('SELECT COUNT(*)::int AS cnt FROM applications WHERE seeker_id = $1', [seeker_id]);
-      appliedJobs = appsRes.rows[0]?.cnt || 0;
-    } catch (err) {
-      if (err?.code === '42P01') {
-        appliedJobs = 0;
-      } else { throw err; }
-    }
-
-    // Interviews count (schema-tolerant)
-    let interviewsScheduled = 0;
-    try {
-      // First check all interviews for debugging
-      const allInterviews = await pool.query(
-        `SELECT COUNT(*)::int AS cnt FROM interviews WHERE seeker_id = $1`,
-        [seeker_id]
-      );
-
-      // Then check upcoming interviews with more flexible time comparison
-      const interviewsRes = await pool.query(
-        `SELECT COUNT(*)::int AS cnt FROM interviews
-         WHERE seeker_id = $1 AND schedule >= NOW() AT TIME ZONE 'UTC'`,
-        [seeker_id]
+      seekerResult = await pool.query(
+        `SELECT js.seeker_id, s.applied_jobs, s.interviews_scheduled, s.profile_views
+         FROM job_seekers js
+         LEFT JOIN seeker_stats s ON s.seeker_id = js.seeker_id
+         WHERE js.user_id = $1`,
+        [user_id]
       );
-      interviewsScheduled = interviewsRes.rows[0]?.cnt || 0;
-
-      // If no upcoming interviews but interviews exist, log for debugging
-      if (interviewsScheduled === 0 && allInterviews.rows[0]?.cnt > 0) {
-        console.warn(`Jobseeker ${seeker_id} has ${allInterviews.rows[0]?.cnt} total interviews but 0 upcoming. Check schedule times.`);
-      }
     } catch (err) {
-      if (err?.code === '42P01' || err?.code === '42703') {
-        interviewsScheduled = 0;
-      } else { throw err; }
+      // seeker_stats missing (migration 006 not applied): compute live
+      if (err?.code !== '42P01') throw err;
+      seekerResult = await pool.query('SELECT seeker_id FROM job_seekers WHERE user_id = $1', [user_id]);
+      if (seekerResult.rows.length === 0) return res.status(404).json({ success: false, error: 'Job seeker profile not found' });
+      return res.json({ success: true, stats: await computeLiveJobseekerStats(seekerResult.rows[0].seeker_id, user_id) });
     }
+    if (seekerResult.rows.length === 0) return res.status(404).json({ success: false, error: 'Job seeker profile not found' });
 
-    // Optional: profile views table may not exist. Try, else 0.
-    let profileViews = 0;
-    try {
-      const viewsRes = await pool.query(
-        `SELECT COUNT(DISTINCT viewer_id) as cnt FROM profile_views WHERE viewed_user_id = $1`,
-        [user_id]
-      );
-      profileViews = viewsRes.rows[0]?.cnt || 0;
-    } catch (err) {
-      if (err?.code === '42P01') {
-        // Table doesn't exist yet, try to create it
-        try {
-          await pool.query(`
-            CREATE TABLE IF NOT EXISTS profile_views (
-              viewer_id INTEGER REFERENCES users(user_id),
-              viewed_user_id INTEGER REFERENCES users(user_id),
-              viewed_at TIMESTAMP DEFAULT NOW(),
-              PRIMARY KEY (viewer_id, viewed_user_id)
-            )
-          `);
-          profileViews = 0;
-        } catch (createErr) {
-          console.warn('Could not create profile_views table:', createErr.message);
-          profileViews = 0;
-        }
-      } else {
-        console.warn('Error fetching profile views:', err.message);
-        profileViews = 0;
-      }
+    let row = seekerResult.rows[0];
+    if (row.applied_jobs === null) {
+      // First read for this seeker: build the row from the source tables
+      row = await reconcileSeekerStats(row.seeker_id);
     }
 
     res.json({ success: true, stats: {
-      appliedJobs,
-      interviewsScheduled,
-      profileViews
+      appliedJobs: row.applied_jobs,
+      interviewsScheduled: row.interviews_scheduled,
+      profileViews: row.profile_views
     }});
   } catch (error) {
     console.error('Error computing jobseeker stats:', error);
@@ -843,6 +1064,72 @@ export const getJobseekerStats = async (req, res) => {
   }
 };
 
+// Live jobseeker stats straight from the source tables (schema-tolerant)
+const computeLiveJobseekerStats = async (seeker_id, user_id) => {
+  // Applications count (schema-tolerant)
+  let appliedJobs = 0;
+  try {
+    const appsRes = await pool.query('SELECT COUNT(*)::int AS cnt FROM applications WHERE seeker_id = $1', [seeker_id]);
+    appliedJobs = appsRes.rows[0]?.cnt || 0;
+  } catch (err) {
+    if (err?.code === '42P01') {
+      appliedJobs = 0;
+    } else { throw err; }
+  }
+
+  // Interviews count (schema-tolerant)
+  let interviewsScheduled = 0;
+  try {
+    const interviewsRes = await pool.query(
+      `SELECT COUNT(*)::int AS cnt FROM interviews
+       WHERE seeker_id = $1 AND schedule >= NOW() AT TIME ZONE 'UTC'`,
+      [seeker_id]
+    );
+    interviewsScheduled = interviewsRes.rows[0]?.cnt || 0;
+  } catch (err) {
+    if (err?.code === '42P01' || err?.code === '42703') {
+      interviewsScheduled = 0;
+    } else { throw err; }
+  }
+
+  // Optional: profile views table may not exist. Try, else 0.
+  let profileViews = 0;
+  try {
+    const viewsRes = await pool.query(
+      `SELECT COUNT(DISTINCT viewer_id) as cnt FROM profile_views WHERE viewed_user_id = $1`,
+      [user_id]
+    );
+    profileViews = viewsRes.rows[0]?.cnt || 0;
+  } catch (err) {
+    if (err?.code === '42P01') {
+      // Table doesn't exist yet, try to create it
+      try {
+        await pool.query(`
+          CREATE TABLE IF NOT EXISTS profile_views (
+            viewer_id INTEGER REFERENCES users(user_id),
+            viewed_user_id INTEGER REFERENCES users(user_id),
+            viewed_at TIMESTAMP DEFAULT NOW(),
+            PRIMARY KEY (viewer_id, viewed_user_id)
+          )
+        `);
+        profileViews = 0;
+      } catch (createErr) {
+        console.warn('Could not create profile_views table:', createErr.message);
+        profileViews = 0;
+      }
+    } else {
+      console.warn('Error fetching profile views:', err.message);
+      profileViews = 0;
+    }
+  }
+
+  return {
+    appliedJobs,
+    interviewsScheduled,
+    profileViews
+  };
+};
+
 // Increment job view counter (simple counter)
 export const incrementJobView = async (req, res) => {
   try {
@@ -1139,7 +1426,7 @@ export const updateJobseekerProfile = async (req, res) => {
       if (name || email || phone_no) {
         await client.query(
           'UPDATE users SET name = COALESCE($1, name), email = COALESCE($2, email), phone_no = COALESCE($3, phone_no) WHERE user_id = $4',
-          [name, email, phone_no, user_id]
+          [name, email ? email.toLowerCase().trim() : null, phone_no, user_id]
         );
       }
       
@@ -1246,6 +1533,9 @@ export const updateJobseekerProfile = async (req, res) => {
       client.release();
     }
   } catch (error) {
+    if (error.code === '23505' && /email/.test(error.constraint || '')) {
+      return res.status(409).json({ success: false, error: 'Email is already in use' });
+    }
     console.error('Error updating job seeker profile:', error);
     res.status(500).json({ success: false, error: 'Failed to update profile' });
   }
@@ -1,138 +1,194 @@
 import pool from '../db.js';
-
-// Live recruiter stats
+import {
+  HIRED_STATUSES,
+  bumpRecruiterStats,
+  bumpRecruiterStatsForJob,
+  bumpSeekerStats,
+  reconcileRecruiterStats,
+  refreshRecruiterStats,
+  refreshSeekerStats
+} from '../services/statsCounters.js';
+import { findConflicts, findFreeSlots, isOverlapError, parseWindow } from '../services/interviewCalendar.js';
+import { parseCursorPage, toCursorPage } from '../services/pagination.js';
+import { streamExport } from '../services/exportStream.js';
+import { defineFieldset, selectFields } from '../services/fieldsets.js';
+import { emailDeliveryEnabled, queueEmails, wakeDispatcher } from '../services/emailOutbox.js';
+import { indexJob, reindexJob, unindexJob } from '../services/typeahead.js';
+
+// Applications only count towards hiredCandidates while inside the 30-day window
+const RECENT_HIRE_WINDOW = "a.applied_timestamp >= NOW() - INTERVAL '30 days' AS recent_hire_window";
+
+// Change in the hired counter when an application moves between statuses
+const hiredDelta = (from, to) =>
+  Number(HIRED_STATUSES.includes(to)) - Number(HIRED_STATUSES.includes(from));
+
+// Recruiter stats: a single primary-key read of the materialized counters
 export const getRecruiterStats = async (req, res) => {
   try {
     const recruiter_user_id = req.user.id;
-    const rec = await pool.query('SELECT recruiter_id FROM recruiters WHERE user_id = $1', [recruiter_user_id]);
-    if (rec.rows.length === 0) return res.status(404).json({ success: false, error: 'Recruiter profile not found' });
-    const recruiter_id = rec.rows[0].recruiter_id;
 
-    // Jobs managed by recruiter (deduplicate by job_id; schema-tolerant)
-    let jobs = [];
+    let rec;
     try {
-      const jobsRes = await pool.query(
+      rec = await pool.query(
+        `SELECT r.recruiter_id, s.total_jobs, s.active_jobs, s.total_applications, s.total_views,
+                s.new_applications, s.scheduled_interviews, s.hired_candidates
+         FROM recruiters r
+         LEFT JOIN recruiter_stats s ON s.recruiter_id = r.recruiter_id
+         WHERE r.user_id = $1`,
+        [recruiter_user_id]
+      );
+    } catch (err) {
+      // recruiter_stats missing (migration 006 not applied): compute live
+      if (err?.code !== '42P01') throw err;
+      rec = await pool.query('SELECT recruiter_id FROM recruiters WHERE user_id = $1', [recruiter_user_id]);
+      if (rec.rows.length === 0) return res.status(404).json({ success: false, error: 'Recruiter profile not found' });
+      return res.json({ success: true, stats: await computeLiveRecruiterStats(rec.rows[0].recruiter_id) });
+    }
+    if (rec.rows.length === 0) return res.status(404).json({ success: false, error: 'Recruiter profile not found' });
+
+    let row = rec.rows[0];
+    if (row.total_jobs === null) {
+      // First read for this recruiter: build the row from the source tables
+      row = await reconcileRecruiterStats(row.recruiter_id);
+    }
+
+    res.json({ success: true, stats: {
+      totalJobs: row.total_jobs,
+      activeJobs: row.active_jobs,
+      totalApplications: row.total_applications,
+      totalViews: Number(row.total_views),
+      newApplications: row.new_applications,
+      scheduledInterviews: row.scheduled_interviews,
+      hiredCandidates: row.hired_candidates
+    }});
+  } catch (error) {
+    console.error('Error computing recruiter stats:', error);
+    res.status(500).json({ success: false, error: 'Failed to load stats' });
+  }
+};
+
+// Live recruiter stats straight from the source tables (schema-tolerant)
+const computeLiveRecruiterStats = async (recruiter_id) => {
+  // Jobs managed by recruiter (deduplicate by job_id; schema-tolerant)
+  let jobs = [];
+  try {
+    const jobsRes = await pool.query(
+      `WITH rec_jobs AS (
+         SELECT DISTINCT job_id FROM operates WHERE recruiter_id = $1
+       )
+       SELECT j.job_id, j.status, COALESCE(j.views,0) as views, j.application_count
+       FROM jobs j
+       JOIN rec_jobs o ON j.job_id = o.job_id`,
+      [recruiter_id]
+    );
+    jobs = jobsRes.rows;
+  } catch (err) {
+    // Handle missing columns like status/views (42703)
+    if (err?.code === '42703') {
+      const fallback = await pool.query(
         `WITH rec_jobs AS (
            SELECT DISTINCT job_id FROM operates WHERE recruiter_id = $1
          )
-         SELECT j.job_id, j.status, COALESCE(j.views,0) as views,
+         SELECT j.job_id,
                 (SELECT COUNT(*) FROM applications a WHERE a.job_id=j.job_id) as application_count
          FROM jobs j
          JOIN rec_jobs o ON j.job_id = o.job_id`,
         [recruiter_id]
       );
-      jobs = jobsRes.rows;
-    } catch (err) {
-      // Handle missing columns like status/views (42703)
-      if (err?.code === '42703') {
-        const fallback = await pool.query(
-          `WITH rec_jobs AS (
-             SELECT DISTINCT job_id FROM operates WHERE recruiter_id = $1
-           )
-           SELECT j.job_id,
-                  (SELECT COUNT(*) FROM applications a WHERE a.job_id=j.job_id) as application_count
-           FROM jobs j
-           JOIN rec_jobs o ON j.job_id = o.job_id`,
-          [recruiter_id]
-        );
-        jobs = fallback.rows.map(r => ({
-          job_id: r.job_id,
-          status: 'active', // assume active if no status column
-          views: 0,
-          application_count: Number(r.application_count || 0)
-        }));
-      } else {
-        throw err;
-      }
+      jobs = fallback.rows.map(r => ({
+        job_id: r.job_id,
+        status: 'active', // assume active if no status column
+        views: 0,
+        application_count: Number(r.application_count || 0)
+      }));
+    } else {
+      throw err;
     }
+  }
 
-    const totalJobs = jobs.length;
-    const activeJobs = jobs.filter(j => j.status === 'active').length;
-    const totalApplications = jobs.reduce((sum, j) => sum + Number(j.application_count || 0), 0);
-    const totalViews = jobs.reduce((sum, j) => sum + Number(j.views || 0), 0);
+  const totalJobs = jobs.length;
+  const activeJobs = jobs.filter(j => j.status === 'active').length;
+  const totalApplications = jobs.reduce((sum, j) => sum + Number(j.application_count || 0), 0);
+  const totalViews = jobs.reduce((sum, j) => sum + Number(j.views || 0), 0);
 
-    // New applications in last 7 days (schema-tolerant)
-    let newApplications = 0;
-    try {
-      const newAppsRes = await pool.query(
+  // New applications in last 7 days (schema-tolerant)
+  let newApplications = 0;
+  try {
+    const newAppsRes = await pool.query(
+      `SELECT COUNT(*)::int AS cnt
+       FROM applications a
+       JOIN jobs j ON a.job_id = j.job_id
+       JOIN operates o ON j.job_id = o.job_id
+       WHERE o.recruiter_id = $1 AND a.applied_timestamp >= NOW() - INTERVAL '7 days'`,
+      [recruiter_id]
+    );
+    newApplications = newAppsRes.rows[0]?.cnt || 0;
+  } catch (err) {
+    // If applied_timestamp missing, fall back to total applications for this recruiter
+    if (err?.code === '42703') {
+      const allApps = await pool.query(
         `SELECT COUNT(*)::int AS cnt
          FROM applications a
          JOIN jobs j ON a.job_id = j.job_id
          JOIN operates o ON j.job_id = o.job_id
-         WHERE o.recruiter_id = $1 AND a.applied_timestamp >= NOW() - INTERVAL '7 days'`,
+       WHERE o.recruiter_id = $1`,
         [recruiter_id]
       );
-      newApplications = newAppsRes.rows[0]?.cnt || 0;
-    } catch (err) {
-      // If applied_timestamp missing, fall back to total applications for this recruiter
-      if (err?.code === '42703') {
-        const allApps = await pool.query(
-          `SELECT COUNT(*)::int AS cnt
-           FROM applications a
-           JOIN jobs j ON a.job_id = j.job_id
-           JOIN operates o ON j.job_id = o.job_id
-         WHERE o.recruiter_id = $1`,
-          [recruiter_id]
-        );
 
-        newApplications = allApps.rows[0]?.cnt || 0;
-      } else {
-        throw err;
-      }
+      newApplications = allApps.rows[0]?.cnt || 0;
+    } else {
+      throw err;
     }
+  }
 
-    // Upcoming interviews (schema-tolerant)
-    let scheduledInterviews = 0;
-    try {
-      const upcomingInterviewsRes = await pool.query(
-        `SELECT COUNT(*)::int AS cnt FROM interviews i
-         WHERE i.recruiter_id = $1 AND i.schedule >= NOW() AT TIME ZONE 'UTC'`,
-        [recruiter_id]
-      );
+  // Upcoming interviews (schema-tolerant)
+  let scheduledInterviews = 0;
+  try {
+    const upcomingInterviewsRes = await pool.query(
+      `SELECT COUNT(*)::int AS cnt FROM interviews i
+       WHERE i.recruiter_id = $1 AND i.schedule >= NOW() AT TIME ZONE 'UTC'`,
+      [recruiter_id]
+    );
 
-      scheduledInterviews = upcomingInterviewsRes.rows[0]?.cnt || 0;
-    } catch (err) {
-      // Table or columns may be missing
-      if (err?.code === '42P01' || err?.code === '42703') {
-        scheduledInterviews = 0;
-      } else {
-        throw err;
-      }
+    scheduledInterviews = upcomingInterviewsRes.rows[0]?.cnt || 0;
+  } catch (err) {
+    // Table or columns may be missing
+    if (err?.code === '42P01' || err?.code === '42703') {
+      scheduledInterviews = 0;
+    } else {
+      throw err;
     }
+  }
 
-    // Hired candidates (schema-tolerant)
-    let hiredCandidates = 0;
-    try {
-      const hiredRes = await pool.query(
-        `SELECT COUNT(*)::int AS cnt FROM applications a
-         JOIN jobs j ON a.job_id = j.job_id
-         JOIN operates o ON j.job_id = o.job_id
-         WHERE o.recruiter_id = $1 AND a.status IN ('hired','accepted') AND a.applied_timestamp >= NOW() - INTERVAL '30 days'`,
-        [recruiter_id]
-      );
-      hiredCandidates = hiredRes.rows[0]?.cnt || 0;
-    } catch (err) {
-      if (err?.code === '42703') {
-        // Missing status or applied_timestamp column; fallback to 0
-        hiredCandidates = 0;
-      } else {
-        throw err;
-      }
+  // Hired candidates (schema-tolerant)
+  let hiredCandidates = 0;
+  try {
+    const hiredRes = await pool.query(
+      `SELECT COUNT(*)::int AS cnt FROM applications a
+       JOIN jobs j ON a.job_id = j.job_id
+       JOIN operates o ON j.job_id = o.job_id
+       WHERE o.recruiter_id = $1 AND a.status IN ('hired','accepted') AND a.applied_timestamp >= NOW() - INTERVAL '30 days'`,
+      [recruiter_id]
+    );
+    hiredCandidates = hiredRes.rows[0]?.cnt || 0;
+  } catch (err) {
+    if (err?.code === '42703') {
+      // Missing status or applied_timestamp column; fallback to 0
+      hiredCandidates = 0;
+    } else {
+      throw err;
     }
-
-    res.json({ success: true, stats: {
-      totalJobs,
-      activeJobs,
-      totalApplications,
-      totalViews,
-      newApplications,
-      scheduledInterviews,
-      hiredCandidates
-    }});
-  } catch (error) {
-    console.error('Error computing recruiter stats:', error);
-    res.status(500).json({ success: false, error: 'Failed to load stats' });
   }
+
+  return {
+    totalJobs,
+    activeJobs,
+    totalApplications,
+    totalViews,
+    newApplications,
+    scheduledInterviews,
+    hiredCandidates
+  };
 };
 
 // Create a new job posting
@@ -176,6 +232,9 @@ export const createJob = async (req, res) => {
       [actualRecruiterId, job.job_id, 'created']
     );
 
+    await bumpRecruiterStats(actualRecruiterId, { total_jobs: 1, active_jobs: job.status === 'active' ? 1 : 0 });
+    indexJob(job);
+
     res.status(201).json({ success: true, job });
   } catch (error) {
     console.error('Error creating job:', error);
@@ -208,12 +267,9 @@ export const getMyJobs = async (req, res) => {
          WHERE recruiter_id = $1
          GROUP BY job_id
        )
-       SELECT j.*, rj.first_created AS posted_at,
-              COUNT(a.application_id) AS application_count
+       SELECT j.*, rj.first_created AS posted_at
        FROM jobs j
        JOIN rec_jobs rj ON j.job_id = rj.job_id
-       LEFT JOIN applications a ON j.job_id = a.job_id
-       GROUP BY j.job_id, rj.first_created
        ORDER BY rj.first_created DESC`,
       [actualRecruiterId]
     );
@@ -225,6 +281,39 @@ export const getMyJobs = async (req, res) => {
   }
 };
 
+// ?fields= for a job's applicant list
+const applicantFields = defineFieldset({
+  required: ['application_id'],
+  fields: {
+    application_id: 'a.application_id',
+    job_id: 'a.job_id',
+    seeker_id: 'a.seeker_id',
+    status: 'a.status',
+    star: 'a.star',
+    applied_timestamp: 'a.applied_timestamp',
+    resume_id: 'a.resume_id',
+    nationality: { sql: 'js.nationality', join: 'seeker' },
+    address: { sql: 'js.address', join: 'seeker' },
+    dob: { sql: 'js.dob', join: 'seeker' },
+    name: { sql: 'u.name', join: 'user' },
+    email: { sql: 'u.email', join: 'user' },
+    phone_no: { sql: 'u.phone_no', join: 'user' },
+    resume_title: { sql: 'r.title', join: 'resume' },
+    statement_profile: { sql: 'r.statement_profile', join: 'resume' },
+    linkedin_url: { sql: 'r.linkedin_url', join: 'resume' },
+    github_url: { sql: 'r.github_url', join: 'resume' },
+    file_name: { sql: 'r.file_name', join: 'resume' },
+    file_size: { sql: 'r.file_size', join: 'resume' },
+    file_type: { sql: 'r.file_type', join: 'resume' },
+    resume_type: { sql: "CASE WHEN r.file_data IS NOT NULL THEN 'uploaded' ELSE 'manual' END", join: 'resume' },
+  },
+  joins: {
+    seeker: 'JOIN job_seekers js ON a.seeker_id = js.seeker_id',
+    user: { sql: 'JOIN users u ON js.user_id = u.user_id', requires: ['seeker'] },
+    resume: 'LEFT JOIN resumes r ON a.resume_id = r.resume_id',
+  },
+});
+
 // Get applicants for a specific job
 export const getApplicants = async (req, res) => {
   try {
@@ -244,28 +333,124 @@ export const getApplicants = async (req, res) => {
       return res.status(404).json({ success: false, error: 'Job not found or access denied' });
     }
 
-    // Get all applicants for this job with their attached resume
+    // ?limit=&cursor= pages through applicants newest first; without them the full list is returned
+    const page = parseCursorPage(req.query);
+    if (page?.error) {
+      return res.status(400).json({ success: false, error: page.error });
+    }
+    const projection = selectFields(req.query, applicantFields);
+    if (projection?.error) {
+      return res.status(400).json({ success: false, error: projection.error });
+    }
+
+    const params = [job_id];
+    let keyset = '';
+    let limit = '';
+    if (page) {
+      if (page.after) {
+        params.push(...page.after);
+        keyset = 'AND (a.applied_timestamp, a.application_id) < ($2::timestamp, $3::int)';
+      }
+      params.push(page.limit + 1);
+      limit = `LIMIT $${params.length}`;
+    }
+
+    const cursorColumn = page ? ', ARRAY[a.applied_timestamp::text, a.application_id::text] AS _cursor' : '';
+    // Get applicants for this job with their attached resume (or just the requested ?fields=)
     const applicantsResult = await pool.query(
-      `SELECT a.*, js.*, u.name, u.email, u.phone_no, 
-              r.resume_id, r.title as resume_title, r.statement_profile, 
-              r.linkedin_url, r.github_url, r.file_name, r.file_size, r.file_type,
-              CASE WHEN r.file_data IS NOT NULL THEN 'uploaded' ELSE 'manual' END as resume_type
-       FROM applications a
-       JOIN job_seekers js ON a.seeker_id = js.seeker_id
-       JOIN users u ON js.user_id = u.user_id
-       LEFT JOIN resumes r ON a.resume_id = r.resume_id
-       WHERE a.job_id = $1
-       ORDER BY a.applied_timestamp DESC`,
-      [job_id]
+      `${projection
+        ? `SELECT ${projection.select}${cursorColumn}
+           FROM applications a
+           ${projection.joins}`
+        : `SELECT a.*, js.*, u.name, u.email, u.phone_no, 
+                  r.resume_id, r.title as resume_title, r.statement_profile, 
+                  r.linkedin_url, r.github_url, r.file_name, r.file_size, r.file_type,
+                  CASE WHEN r.file_data IS NOT NULL THEN 'uploaded' ELSE 'manual' END as resume_type
+                  ${cursorColumn}
+           FROM applications a
+           JOIN job_seekers js ON a.seeker_id = js.seeker_id
+           JOIN users u ON js.user_id = u.user_id
+           LEFT JOIN resumes r ON a.resume_id = r.resume_id`}
+       WHERE a.job_id = $1 ${keyset}
+       ORDER BY a.applied_timestamp DESC, a.application_id DESC
+       ${limit}`,
+      params
     );
 
-    res.json({ success: true, applicants: applicantsResult.rows });
+    // Per-status totals for the whole job, with the first page only
+    let status_counts;
+    if (!page?.after) {
+      const counts = await pool.query(
+        'SELECT status, COUNT(*)::int AS count FROM applications WHERE job_id = $1 GROUP BY status',
+        [job_id]
+      );
+      status_counts = counts.rows;
+    }
+
+    if (page) {
+      const { items, next_cursor } = toCursorPage(applicantsResult.rows, page.limit);
+      return res.json({ success: true, applicants: items, next_cursor, status_counts });
+    }
+    res.json({ success: true, applicants: applicantsResult.rows, status_counts });
   } catch (error) {
     console.error('Error fetching applicants:', error);
     res.status(500).json({ success: false, error: 'Failed to fetch applicants' });
   }
 };
 
+// Export all applicants of a job as CSV or NDJSON
+export const exportApplicants = async (req, res) => {
+  try {
+    const { id: job_id } = req.params;
+    const recruiter_id = req.user.id;
+
+    // Verify the job belongs to this recruiter
+    const jobCheck = await pool.query(
+      `SELECT j.job_id FROM jobs j
+       JOIN operates o ON j.job_id = o.job_id
+       JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+       WHERE j.job_id = $1 AND r.user_id = $2`,
+      [job_id, recruiter_id]
+    );
+
+    if (jobCheck.rows.length === 0) {
+      return res.status(404).json({ success: false, error: 'Job not found or access denied' });
+    }
+
+    await streamExport(req, res, {
+      sql: `SELECT a.application_id, a.status, a.applied_timestamp,
+                   u.name, u.email, u.phone_no, js.nationality,
+                   r.resume_id, r.title as resume_title, r.linkedin_url, r.github_url,
+                   CASE WHEN r.file_data IS NOT NULL THEN 'uploaded' ELSE 'manual' END as resume_type
+            FROM applications a
+            JOIN job_seekers js ON a.seeker_id = js.seeker_id
+            JOIN users u ON js.user_id = u.user_id
+            LEFT JOIN resumes r ON a.resume_id = r.resume_id
+            WHERE a.job_id = $1
+            ORDER BY a.applied_timestamp DESC, a.application_id DESC`,
+      params: [job_id],
+      filename: `job-${job_id}-applicants`,
+      columns: [
+        { key: 'application_id', header: 'Application ID' },
+        { key: 'status', header: 'Status' },
+        { key: 'applied_timestamp', header: 'Applied At' },
+        { key: 'name', header: 'Name' },
+        { key: 'email', header: 'Email' },
+        { key: 'phone_no', header: 'Phone' },
+        { key: 'nationality', header: 'Nationality' },
+        { key: 'resume_id', header: 'Resume ID' },
+        { key: 'resume_title', header: 'Resume Title' },
+        { key: 'resume_type', header: 'Resume Type' },
+        { key: 'linkedin_url', header: 'LinkedIn' },
+        { key: 'github_url', header: 'GitHub' }
+      ]
+    });
+  } catch (error) {
+    console.error('Error exporting applicants:', error);
+    res.status(500).json({ success: false, error: 'Failed to export applicants' });
+  }
+};
+
 // Update job status
 export const updateJobStatus = async (req, res) => {
   try {
@@ -303,6 +488,11 @@ export const updateJobStatus = async (req, res) => {
       }
     }
 
+    const wasActive = jobCheck.rows[0].status === 'active';
+    if (persisted && wasActive !== (status === 'active')) {
+      await bumpRecruiterStatsForJob(job_id, { active_jobs: wasActive ? -1 : 1 });
+    }
+
     // Best-effort action log in operates
     try {
       const recId = jobCheck.rows[0].recruiter_id;
@@ -333,18 +523,65 @@ export const updateJobStatus = async (req, res) => {
   }
 };
 
-// Send email to candidate via SMTP
-import nodemailer from 'nodemailer';
+// Tell the client whether the server delivers mail (SMTP outbox) or the
+// recruiter's own mail client has to send it
+export const getEmailConfig = async (req, res) => {
+  res.json({ success: true, serverDelivery: emailDeliveryEnabled() });
+};
 
+// Log and queue emails in their own transaction (see services/emailOutbox.js)
+const queueInTransaction = async (sender_user_id, emails) => {
+  const client = await pool.connect();
+  try {
+    await client.query('BEGIN');
+    const ids = await queueEmails(client, sender_user_id, emails);
+    await client.query('COMMIT');
+    wakeDispatcher();
+    return ids;
+  } catch (error) {
+    await client.query('ROLLBACK').catch(() => {});
+    throw error;
+  } finally {
+    client.release();
+  }
+};
+
+// Record an email to a candidate. With SMTP configured it is queued in the
+// outbox and delivered in the background, and only to the applicant of one of
+// the recruiter's own applications; otherwise the client sends it (Gmail) and
+// this only stores a record for Email Management.
 export const sendEmailToCandidate = async (req, res) => {
-  // Logging-only: We open Gmail on the client; server stores a record for Email Management
   try {
     const sender_user_id = req.user.id;
-    const { to, subject, body, application_id } = req.body;
+    const { subject, body } = req.body;
+    let { to } = req.body;
+    const application_id = parseOptionalId(req.body.application_id);
+    if (Number.isNaN(application_id)) {
+      return res.status(400).json({ success: false, error: 'application_id must be a positive integer' });
+    }
+
+    const delivering = emailDeliveryEnabled();
+    if (delivering && !application_id) {
+      return res.status(400).json({ success: false, error: 'application_id is required when the server delivers email' });
+    }
+    if (application_id) {
+      const owned = await loadOwnedApplications(pool, [application_id], sender_user_id);
+      const app = owned.get(application_id);
+      if (!app) {
+        return res.status(404).json({ success: false, error: 'Application not found or access denied' });
+      }
+      // The server only mails the applicant, whatever `to` says
+      if (delivering || !to) to = app.seeker_email;
+    }
     if (!to || !subject || !body) {
       return res.status(400).json({ success: false, error: 'Missing to, subject, or body' });
     }
 
+    if (delivering) {
+      const [email_id] = await queueInTransaction(sender_user_id, [{ to, subject, body, application_id }]);
+      return res.json({ success: true, logged: true, queued: true, email_id });
+    }
+
     const preview = String(body).slice(0, 1000);
 
     try {
@@ -467,6 +704,24 @@ export const getSentEmails = async (req, res) => {
   }
 };
 
+// Export every email this recruiter has sent as CSV or NDJSON
+export const exportSentEmails = async (req, res) => {
+  await streamExport(req, res, {
+    sql: `SELECT id, sent_at, to_email, subject, body_preview, application_id
+          FROM email_logs WHERE sender_user_id = $1 ORDER BY sent_at DESC, id DESC`,
+    params: [req.user.id],
+    filename: 'sent-emails',
+    columns: [
+      { key: 'id', header: 'Email ID' },
+      { key: 'sent_at', header: 'Sent At' },
+      { key: 'to_email', header: 'To' },
+      { key: 'subject', header: 'Subject' },
+      { key: 'body_preview', header: 'Preview' },
+      { key: 'application_id', header: 'Application ID' }
+    ]
+  });
+};
+
 // List interviews for this recruiter
 export const getMyInterviews = async (req, res) => {
   try {
@@ -477,6 +732,17 @@ export const getMyInterviews = async (req, res) => {
     if (rec.rows.length === 0) return res.status(404).json({ success: false, error: 'Recruiter profile not found' });
     const recruiter_id = rec.rows[0].recruiter_id;
 
+    // Optional ?from=&to= window (by start time); without it the full history is returned
+    const dateWindow = parseWindow(req.query);
+    if (dateWindow?.error) return res.status(400).json({ success: false, error: dateWindow.error });
+
+    const params = [recruiter_id];
+    let windowClause = '';
+    if (dateWindow) {
+      params.push(dateWindow.from, dateWindow.to);
+      windowClause = 'AND i.schedule >= $2 AND i.schedule < $3';
+    }
+
     const result = await pool.query(
       `SELECT i.*, j.title as job_title, j.company,
               u.name as seeker_name, u.email as seeker_email
@@ -484,9 +750,9 @@ export const getMyInterviews = async (req, res) => {
        JOIN jobs j ON i.job_id = j.job_id
        JOIN job_seekers js ON i.seeker_id = js.seeker_id
        JOIN users u ON js.user_id = u.user_id
-       WHERE i.recruiter_id = $1
+       WHERE i.recruiter_id = $1 ${windowClause}
        ORDER BY i.schedule DESC NULLS LAST, i.created_at DESC`,
-      [recruiter_id]
+      params
     );
 
     res.json({ success: true, interviews: result.rows });
@@ -504,7 +770,7 @@ export const scheduleInterview = async (req, res) => {
 
     // Get application details and verify ownership
     const applicationResult = await pool.query(
-      `SELECT a.*, j.job_id FROM applications a
+      `SELECT a.*, j.job_id, ${RECENT_HIRE_WINDOW} FROM applications a
        JOIN jobs j ON a.job_id = j.job_id
        JOIN operates o ON j.job_id = o.job_id
        JOIN recruiters r ON o.recruiter_id = r.recruiter_id
@@ -526,23 +792,93 @@ export const scheduleInterview = async (req, res) => {
 
     const actualRecruiterId = recruiterResult.rows[0].recruiter_id;
 
-    // Schedule the interview
-    const interviewResult = await pool.query(
-      `INSERT INTO interviews (seeker_id, recruiter_id, job_id, schedule, meeting_link, type, location, notes, duration, status)
-       VALUES ($1, $2, $3, $4, $5, COALESCE($6, 'video'), $7, $8, COALESCE($9, 60), 'scheduled') RETURNING *`,
-      [application.seeker_id, actualRecruiterId, application.job_id, schedule_time, meeting_link || null, type || null, location || null, notes || null, duration || null]
-    );
+    // Schedule the interview; the calendar constraints reject double-bookings
+    let interviewResult;
+    try {
+      interviewResult = await pool.query(
+        `INSERT INTO interviews (seeker_id, recruiter_id, job_id, schedule, meeting_link, type, location, notes, duration, status)
+         VALUES ($1, $2, $3, $4, $5, COALESCE($6, 'video'), $7, $8, COALESCE($9, 60), 'scheduled')
+         RETURNING *, schedule >= NOW() AT TIME ZONE 'UTC' AS upcoming`,
+        [application.seeker_id, actualRecruiterId, application.job_id, schedule_time, meeting_link || null, type || null, location || null, notes || null, duration || null]
+      );
+    } catch (err) {
+      if (!isOverlapError(err)) throw err;
+      const conflicts = await findConflicts([
+        { seeker_id: application.seeker_id, recruiter_id: actualRecruiterId, schedule: schedule_time, duration }
+      ]);
+      return res.status(409).json({ success: false, error: 'Interview overlaps an existing interview', conflicts: conflicts.get(0) || [] });
+    }
+    const { upcoming, ...interview } = interviewResult.rows[0];
 
     // Update application status to interview_scheduled (non-final)
     await pool.query('UPDATE applications SET status = $1 WHERE application_id = $2', ['under_review', application_id]);
 
-    res.status(201).json({ success: true, interview: interviewResult.rows[0] });
+    if (upcoming) {
+      await bumpRecruiterStats(actualRecruiterId, { scheduled_interviews: 1 });
+      await bumpSeekerStats(application.seeker_id, { interviews_scheduled: 1 });
+    }
+    if (application.recent_hire_window) {
+      await bumpRecruiterStatsForJob(application.job_id, { hired_candidates: hiredDelta(application.status, 'under_review') });
+    }
+
+    res.status(201).json({ success: true, interview });
   } catch (error) {
     console.error('Error scheduling interview:', error);
     res.status(500).json({ success: false, error: 'Failed to schedule interview' });
   }
 };
 
+// Free interview start times in a window (?from=&to=&duration=&step=&seeker_id=)
+export const getFreeSlots = async (req, res) => {
+  try {
+    const rec = await pool.query('SELECT recruiter_id FROM recruiters WHERE user_id = $1', [req.user.id]);
+    if (rec.rows.length === 0) return res.status(404).json({ success: false, error: 'Recruiter profile not found' });
+
+    const dateWindow = parseWindow(req.query);
+    if (!dateWindow) return res.status(400).json({ success: false, error: 'Missing from or to' });
+    if (dateWindow.error) return res.status(400).json({ success: false, error: dateWindow.error });
+
+    const duration = Number(req.query.duration || 60);
+    const step = Number(req.query.step || 30);
+    if (!Number.isInteger(duration) || duration < 5 || duration > 480 || !Number.isInteger(step) || step < 5 || step > 240) {
+      return res.status(400).json({ success: false, error: 'duration must be 5-480 and step 5-240 minutes' });
+    }
+
+    // A seeker's calendar is only visible for someone who applied to one of this recruiter's jobs
+    const seekerId = parseOptionalId(req.query.seeker_id);
+    if (Number.isNaN(seekerId)) {
+      return res.status(400).json({ success: false, error: 'seeker_id must be a positive integer' });
+    }
+    if (seekerId) {
+      const applicant = await pool.query(
+        `SELECT EXISTS (
+           SELECT 1 FROM applications a
+           JOIN operates o ON a.job_id = o.job_id
+           WHERE a.seeker_id = $1 AND o.recruiter_id = $2
+         ) AS ok`,
+        [seekerId, rec.rows[0].recruiter_id]
+      );
+      if (!applicant.rows[0].ok) {
+        return res.status(404).json({ success: false, error: 'Applicant not found or access denied' });
+      }
+    }
+
+    const slots = await findFreeSlots({
+      recruiterId: rec.rows[0].recruiter_id,
+      seekerId,
+      from: dateWindow.from,
+      to: dateWindow.to,
+      duration,
+      step
+    });
+
+    res.json({ success: true, duration, slots });
+  } catch (error) {
+    console.error('Error finding free slots:', error);
+    res.status(500).json({ success: false, error: 'Failed to find free slots' });
+  }
+};
+
 // Send a message from recruiter to a seeker
 export const sendMessageToSeeker = async (req, res) => {
   try {
@@ -603,7 +939,9 @@ export const updateInterview = async (req, res) => {
 
     // Verify ownership and fetch seeker/job for outcome
     const own = await pool.query(
-      `SELECT i.interview_id, i.seeker_id, i.job_id FROM interviews i
+      `SELECT i.interview_id, i.seeker_id, i.job_id, i.recruiter_id, i.schedule, i.duration,
+              i.schedule >= NOW() AT TIME ZONE 'UTC' AS was_upcoming
+       FROM interviews i
        JOIN recruiters r ON i.recruiter_id = r.recruiter_id
        WHERE i.interview_id = $1 AND r.user_id = $2`,
       [interview_id, recruiter_user_id]
@@ -614,30 +952,55 @@ export const updateInterview = async (req, res) => {
 
     const irow = own.rows[0];
 
-    await pool.query(
-      `UPDATE interviews
-       SET status = COALESCE($1, status),
-           schedule = COALESCE($2, schedule),
-           type = COALESCE($3, type),
-           meeting_link = COALESCE($4, meeting_link),
-           location = COALESCE($5, location),
-           notes = COALESCE($6, notes),
-           duration = COALESCE($7, duration)
-       WHERE interview_id = $8`,
-      [status, schedule_time, type, meeting_link, location, notes, duration, interview_id]
-    );
+    let updated;
+    try {
+      updated = await pool.query(
+        `UPDATE interviews
+         SET status = COALESCE($1, status),
+             schedule = COALESCE($2, schedule),
+             type = COALESCE($3, type),
+             meeting_link = COALESCE($4, meeting_link),
+             location = COALESCE($5, location),
+             notes = COALESCE($6, notes),
+             duration = COALESCE($7, duration)
+         WHERE interview_id = $8
+         RETURNING schedule >= NOW() AT TIME ZONE 'UTC' AS upcoming`,
+        [status, schedule_time, type, meeting_link, location, notes, duration, interview_id]
+      );
+    } catch (err) {
+      if (!isOverlapError(err)) throw err;
+      const conflicts = await findConflicts([{
+        seeker_id: irow.seeker_id,
+        recruiter_id: irow.recruiter_id,
+        schedule: schedule_time || irow.schedule,
+        duration: duration || irow.duration,
+        interview_id: irow.interview_id
+      }]);
+      return res.status(409).json({ success: false, error: 'Interview overlaps an existing interview', conflicts: conflicts.get(0) || [] });
+    }
+
+    // Rescheduling can move the interview into or out of the upcoming count
+    const upcomingDelta = Number(Boolean(updated.rows[0]?.upcoming)) - Number(irow.was_upcoming);
+    if (upcomingDelta !== 0) {
+      await bumpRecruiterStats(irow.recruiter_id, { scheduled_interviews: upcomingDelta });
+      await bumpSeekerStats(irow.seeker_id, { interviews_scheduled: upcomingDelta });
+    }
 
     // Optional: update application status outcome
     const allowed = new Set(['under_review','shortlisted','rejected','hired']);
     if (outcome && allowed.has(String(outcome))) {
       try {
         const app = await pool.query(
-          `SELECT application_id FROM applications WHERE seeker_id = $1 AND job_id = $2 ORDER BY applied_timestamp DESC LIMIT 1`,
+          `SELECT application_id, status, ${RECENT_HIRE_WINDOW} FROM applications a
+           WHERE seeker_id = $1 AND job_id = $2 ORDER BY applied_timestamp DESC LIMIT 1`,
           [irow.seeker_id, irow.job_id]
         );
         const appId = app.rows[0]?.application_id;
         if (appId) {
           await pool.query('UPDATE applications SET status = $1 WHERE application_id = $2', [outcome, appId]);
+          if (app.rows[0].recent_hire_window) {
+            await bumpRecruiterStatsForJob(irow.job_id, { hired_candidates: hiredDelta(app.rows[0].status, outcome) });
+          }
         }
       } catch (e) {
         console.warn('Failed to set application outcome for interview', interview_id, e.message);
@@ -659,7 +1022,9 @@ export const deleteInterview = async (req, res) => {
 
     // Verify ownership
     const own = await pool.query(
-      `SELECT i.interview_id FROM interviews i
+      `SELECT i.interview_id, i.seeker_id, i.recruiter_id,
+              i.schedule >= NOW() AT TIME ZONE 'UTC' AS upcoming
+       FROM interviews i
        JOIN recruiters r ON i.recruiter_id = r.recruiter_id
        WHERE i.interview_id = $1 AND r.user_id = $2`,
       [interview_id, recruiter_user_id]
@@ -669,6 +1034,13 @@ export const deleteInterview = async (req, res) => {
     }
 
     await pool.query('DELETE FROM interviews WHERE interview_id = $1', [interview_id]);
+
+    const irow = own.rows[0];
+    if (irow.upcoming) {
+      await bumpRecruiterStats(irow.recruiter_id, { scheduled_interviews: -1 });
+      await bumpSeekerStats(irow.seeker_id, { interviews_scheduled: -1 });
+    }
+
     res.json({ success: true });
   } catch (error) {
     console.error('Error deleting interview:', error);
@@ -697,6 +1069,14 @@ export const deleteJob = async (req, res) => {
 
     const recId = jobCheck.rows[0].recruiter_id;
 
+    // Everyone whose counters include this job; operates/applications rows are gone after the delete
+    const affected = await pool.query(
+      `SELECT ARRAY(SELECT DISTINCT recruiter_id FROM operates WHERE job_id = $1) AS recruiter_ids,
+              ARRAY(SELECT seeker_id FROM applications WHERE job_id = $1
+                    UNION SELECT seeker_id FROM interviews WHERE job_id = $1) AS seeker_ids`,
+      [job_id]
+    );
+
     // Perform deletion in a transaction to avoid FK errors (e.g., interviews without ON DELETE CASCADE)
     try {
       await pool.query('BEGIN');
@@ -729,6 +1109,11 @@ export const deleteJob = async (req, res) => {
       await pool.query('DELETE FROM jobs WHERE job_id = $1', [job_id]);
 
       await pool.query('COMMIT');
+      unindexJob(job_id);
+
+      await refreshRecruiterStats(affected.rows[0].recruiter_ids);
+      await refreshSeekerStats(affected.rows[0].seeker_ids);
+
       res.json({ success: true, message: 'Job deleted successfully' });
     } catch (txErr) {
       await pool.query('ROLLBACK');
@@ -750,7 +1135,7 @@ export const updateApplicationStatus = async (req, res) => {
 
     // Verify the application belongs to a job posted by this recruiter
     const applicationCheck = await pool.query(
-      `SELECT a.* FROM applications a
+      `SELECT a.*, ${RECENT_HIRE_WINDOW} FROM applications a
        JOIN jobs j ON a.job_id = j.job_id
        JOIN operates o ON j.job_id = o.job_id
        JOIN recruiters r ON o.recruiter_id = r.recruiter_id
@@ -768,6 +1153,11 @@ export const updateApplicationStatus = async (req, res) => {
       [status, application_id]
     );
 
+    const application = applicationCheck.rows[0];
+    if (application.recent_hire_window) {
+      await bumpRecruiterStatsForJob(application.job_id, { hired_candidates: hiredDelta(application.status, status) });
+    }
+
     res.json({ success: true, message: 'Application status updated' });
   } catch (error) {
     console.error('Error updating application status:', error);
@@ -775,10 +1165,334 @@ export const updateApplicationStatus = async (req, res) => {
   }
 };
 
+// Recruiter ids behind a user account (normally exactly one)
+const ownRecruiterIds = async (recruiter_user_id) => {
+  const result = await pool.query('SELECT recruiter_id FROM recruiters WHERE user_id = $1', [recruiter_user_id]);
+  return result.rows.map(r => r.recruiter_id);
+};
+
+// Bulk operations accept up to this many applications per request
+const MAX_BULK_ITEMS = 500;
+
+// Normalize a list of ids from the request body into unique positive integers
+const parseIdList = (ids) => {
+  if (!Array.isArray(ids)) return [];
+  return [...new Set(ids.map(Number).filter(id => Number.isInteger(id) && id > 0))];
+};
+
+// An optional id from the request body: null when absent, NaN when it is not a positive integer
+const parseOptionalId = (value) => {
+  if (value === undefined || value === null || value === '') return null;
+  const id = Number(value);
+  return Number.isInteger(id) && id > 0 ? id : NaN;
+};
+
+// Resolve which of the given applications belong to jobs managed by this recruiter (one query)
+const loadOwnedApplications = async (db, applicationIds, recruiter_user_id) => {
+  const result = await db.query(
+    `SELECT DISTINCT ON (a.application_id)
+            a.application_id, a.seeker_id, a.job_id, r.recruiter_id, u.email AS seeker_email
+     FROM applications a
+     JOIN operates o ON a.job_id = o.job_id
+     JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+     JOIN job_seekers js ON a.seeker_id = js.seeker_id
+     JOIN users u ON js.user_id = u.user_id
+     WHERE a.application_id = ANY($1::int[]) AND r.user_id = $2
+     ORDER BY a.application_id`,
+    [applicationIds, recruiter_user_id]
+  );
+  return new Map(result.rows.map(row => [row.application_id, row]));
+};
+
+const notOwned = (application_id) => ({
+  application_id,
+  success: false,
+  error: 'Application not found or access denied'
+});
+
+// Bulk update application status. With `notify: { subject, body }` (needs SMTP
+// configured) every updated applicant is emailed; the emails are queued in the
+// same transaction as the status change, so both happen or neither does.
+export const bulkUpdateApplicationStatus = async (req, res) => {
+  try {
+    const recruiter_user_id = req.user.id;
+    const { application_ids, status, notify } = req.body;
+    const ids = parseIdList(application_ids);
+
+    if (ids.length === 0 || !status) {
+      return res.status(400).json({ success: false, error: 'Missing application_ids or status' });
+    }
+    if (ids.length > MAX_BULK_ITEMS) {
+      return res.status(400).json({ success: false, error: `At most ${MAX_BULK_ITEMS} applications per request` });
+    }
+    if (notify && (!notify.subject || !notify.body)) {
+      return res.status(400).json({ success: false, error: 'notify needs a subject and body' });
+    }
+    if (notify && !emailDeliveryEnabled()) {
+      return res.status(400).json({ success: false, error: 'Server-side email delivery is not configured' });
+    }
+
+    const db = notify ? await pool.connect() : pool;
+    let updated;
+    const emailIds = new Map();
+    try {
+      if (notify) await db.query('BEGIN');
+
+      // Ownership check and update in one statement
+      updated = await db.query(
+        `UPDATE applications a SET status = $1
+         WHERE a.application_id = ANY($2::int[])
+           AND EXISTS (
+             SELECT 1 FROM operates o
+             JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+             WHERE o.job_id = a.job_id AND r.user_id = $3
+           )
+         RETURNING a.application_id`,
+        [status, ids, recruiter_user_id]
+      );
+
+      if (notify && updated.rows.length > 0) {
+        const recipients = await db.query(
+          `SELECT a.application_id, u.email
+           FROM applications a
+           JOIN job_seekers js ON a.seeker_id = js.seeker_id
+           JOIN users u ON js.user_id = u.user_id
+           WHERE a.application_id = ANY($1::int[])
+           ORDER BY a.application_id`,
+          [updated.rows.map(r => r.application_id)]
+        );
+        const queued = await queueEmails(db, recruiter_user_id, recipients.rows.map(r => ({
+          to: r.email,
+          subject: notify.subject,
+          body: notify.body,
+          application_id: r.application_id
+        })));
+        recipients.rows.forEach((r, i) => emailIds.set(r.application_id, queued[i]));
+      }
+
+      if (notify) await db.query('COMMIT');
+    } catch (error) {
+      if (notify) await db.query('ROLLBACK').catch(() => {});
+      throw error;
+    } finally {
+      if (notify) db.release();
+    }
+    if (emailIds.size > 0) wakeDispatcher();
+
+    if (updated.rows.length > 0) {
+      await refreshRecruiterStats(await ownRecruiterIds(recruiter_user_id));
+    }
+
+    const done = new Set(updated.rows.map(r => r.application_id));
+    const results = ids.map(id => {
+      if (!done.has(id)) return notOwned(id);
+      return emailIds.has(id) ? { application_id: id, success: true, email_id: emailIds.get(id) } : { application_id: id, success: true };
+    });
+
+    res.json({ success: true, updated: done.size, failed: ids.length - done.size, emailed: emailIds.size, results });
+  } catch (error) {
+    console.error('Error bulk updating application status:', error);
+    res.status(500).json({ success: false, error: 'Failed to update application status' });
+  }
+};
+
+// Bulk schedule interviews (also marks each application under review)
+export const bulkScheduleInterviews = async (req, res) => {
+  const client = await pool.connect();
+  try {
+    const recruiter_user_id = req.user.id;
+    const items = Array.isArray(req.body.interviews) ? req.body.interviews : [];
+
+    if (items.length === 0) {
+      return res.status(400).json({ success: false, error: 'Missing interviews' });
+    }
+    if (items.length > MAX_BULK_ITEMS) {
+      return res.status(400).json({ success: false, error: `At most ${MAX_BULK_ITEMS} interviews per request` });
+    }
+
+    const owned = await loadOwnedApplications(client, parseIdList(items.map(i => i.application_id)), recruiter_user_id);
+
+    const results = new Array(items.length);
+    const candidates = [];
+    items.forEach((item, index) => {
+      const application_id = Number(item.application_id);
+      const app = owned.get(application_id);
+      if (!app) {
+        results[index] = notOwned(application_id);
+      } else if (!item.schedule_time) {
+        results[index] = { application_id, success: false, error: 'Missing schedule_time' };
+      } else {
+        candidates.push({ index, app, item });
+      }
+    });
+
+    // Drop items that overlap an existing interview or an earlier item in this batch
+    const conflicts = await findConflicts(candidates.map(c => ({
+      seeker_id: c.app.seeker_id,
+      recruiter_id: c.app.recruiter_id,
+      schedule: c.item.schedule_time,
+      duration: c.item.duration
+    })), client);
+    const rows = candidates.filter((c, i) => {
+      if (!conflicts.has(i)) return true;
+      results[c.index] = {
+        application_id: c.app.application_id,
+        success: false,
+        error: 'Interview overlaps an existing interview',
+        conflicts: conflicts.get(i)
+      };
+      return false;
+    });
+
+    if (rows.length > 0) {
+      await client.query('BEGIN');
+      const inserted = await client.query(
+        `INSERT INTO interviews (seeker_id, recruiter_id, job_id, schedule, meeting_link, type, location, notes, duration, status)
+         SELECT t.seeker_id, t.recruiter_id, t.job_id, t.schedule, t.meeting_link,
+                COALESCE(t.type, 'video'), t.location, t.notes, COALESCE(t.duration, 60), 'scheduled'
+         FROM unnest($1::int[], $2::int[], $3::int[], $4::timestamp[], $5::text[], $6::text[], $7::text[], $8::text[], $9::int[])
+           WITH ORDINALITY AS t(seeker_id, recruiter_id, job_id, schedule, meeting_link, type, location, notes, duration, ord)
+         ORDER BY t.ord
+         RETURNING *`,
+        [
+          rows.map(r => r.app.seeker_id),
+          rows.map(r => r.app.recruiter_id),
+          rows.map(r => r.app.job_id),
+          rows.map(r => r.item.schedule_time),
+          rows.map(r => r.item.meeting_link || null),
+          rows.map(r => r.item.type || null),
+          rows.map(r => r.item.location || null),
+          rows.map(r => r.item.notes || null),
+          rows.map(r => r.item.duration || null)
+        ]
+      );
+      await client.query(
+        'UPDATE applications SET status = $1 WHERE application_id = ANY($2::int[])',
+        ['under_review', rows.map(r => r.app.application_id)]
+      );
+      await client.query('COMMIT');
+
+      await refreshRecruiterStats([...new Set(rows.map(r => r.app.recruiter_id))]);
+      await refreshSeekerStats([...new Set(rows.map(r => r.app.seeker_id))]);
+
+      rows.forEach((r, i) => {
+        results[r.index] = { application_id: r.app.application_id, success: true, interview: inserted.rows[i] };
+      });
+    }
+
+    res.status(201).json({ success: true, created: rows.length, failed: items.length - rows.length, results });
+  } catch (error) {
+    await client.query('ROLLBACK').catch(() => {});
+    if (isOverlapError(error)) {
+      // Another request booked an overlapping slot after the conflict check
+      return res.status(409).json({ success: false, error: 'Calendar changed while scheduling; please retry' });
+    }
+    console.error('Error bulk scheduling interviews:', error);
+    res.status(500).json({ success: false, error: 'Failed to schedule interviews' });
+  } finally {
+    client.release();
+  }
+};
+
+// Bulk log (and, with SMTP configured, queue) emails to candidates; the
+// recipient defaults to the applicant's email. When the server delivers, every
+// email needs one of the recruiter's applications and goes to its applicant.
+export const bulkSendEmails = async (req, res) => {
+  try {
+    const sender_user_id = req.user.id;
+    const items = Array.isArray(req.body.emails) ? req.body.emails : [];
+    const delivering = emailDeliveryEnabled();
+
+    if (items.length === 0) {
+      return res.status(400).json({ success: false, error: 'Missing emails' });
+    }
+    if (items.length > MAX_BULK_ITEMS) {
+      return res.status(400).json({ success: false, error: `At most ${MAX_BULK_ITEMS} emails per request` });
+    }
+
+    const owned = await loadOwnedApplications(pool, parseIdList(items.map(e => e.application_id)), sender_user_id);
+
+    const results = new Array(items.length);
+    const rows = [];
+    items.forEach((item, index) => {
+      const application_id = parseOptionalId(item.application_id);
+      const app = application_id ? owned.get(application_id) : null;
+      const to = delivering ? app?.seeker_email : item.to || app?.seeker_email;
+      if (Number.isNaN(application_id)) {
+        results[index] = { application_id: item.application_id, success: false, error: 'application_id must be a positive integer' };
+      } else if (application_id && !app) {
+        results[index] = notOwned(application_id);
+      } else if (delivering && !application_id) {
+        results[index] = { application_id, success: false, error: 'application_id is required when the server delivers email' };
+      } else if (!to || !item.subject || !item.body) {
+        results[index] = { application_id, success: false, error: 'Missing to, subject, or body' };
+      } else {
+        rows.push({ index, application_id, to, subject: item.subject, body: item.body, preview: String(item.body).slice(0, 1000) });
+      }
+    });
+
+    if (rows.length > 0 && delivering) {
+      const ids = await queueInTransaction(sender_user_id, rows);
+      rows.forEach((r, i) => {
+        results[r.index] = { application_id: r.application_id, to: r.to, success: true, email_id: ids[i] };
+      });
+    } else if (rows.length > 0) {
+      const inserted = await pool.query(
+        `INSERT INTO email_logs (sender_user_id, to_email, subject, body_preview, application_id)
+         SELECT $1, t.to_email, t.subject, t.body_preview, t.application_id
+         FROM unnest($2::text[], $3::text[], $4::text[], $5::int[]) WITH ORDINALITY
+           AS t(to_email, subject, body_preview, application_id, ord)
+         ORDER BY t.ord
+         RETURNING id`,
+        [
+          sender_user_id,
+          rows.map(r => r.to),
+          rows.map(r => r.subject),
+          rows.map(r => r.preview),
+          rows.map(r => r.application_id)
+        ]
+      );
+      rows.forEach((r, i) => {
+        results[r.index] = { application_id: r.application_id, to: r.to, success: true, email_id: inserted.rows[i].id };
+      });
+    }
+
+    res.json({ success: true, logged: rows.length, queued: delivering ? rows.length : 0, failed: items.length - rows.length, results });
+  } catch (error) {
+    console.error('Error bulk logging emails:', error);
+    res.status(500).json({ success: false, error: 'Failed to log emails' });
+  }
+};
+
 // Get recent applications for the recruiter
+// ?fields= for the dashboard's recent applications
+const recentApplicationFields = defineFieldset({
+  required: ['application_id'],
+  fields: {
+    application_id: 'a.application_id',
+    job_id: 'a.job_id',
+    seeker_id: 'a.seeker_id',
+    status: 'a.status',
+    star: 'a.star',
+    applied_timestamp: 'a.applied_timestamp',
+    job_title: 'j.title',
+    company: 'j.company',
+    seeker_name: { sql: 'u.name', join: 'user' },
+    seeker_email: { sql: 'u.email', join: 'user' },
+  },
+  joins: {
+    seeker: 'JOIN job_seekers js ON a.seeker_id = js.seeker_id',
+    user: { sql: 'JOIN users u ON js.user_id = u.user_id', requires: ['seeker'] },
+  },
+});
+
 export const getRecentApplications = async (req, res) => {
   try {
     const recruiter_id = req.user.id;
+    const projection = selectFields(req.query, recentApplicationFields);
+    if (projection?.error) {
+      return res.status(400).json({ success: false, error: projection.error });
+    }
 
     // Get recruiter_id from recruiters table
     const recruiterResult = await pool.query(
@@ -794,12 +1508,18 @@ export const getRecentApplications = async (req, res) => {
 
     // Get recent applications (last 30 days) for jobs managed by this recruiter
     const recentAppsResult = await pool.query(
-      `SELECT a.*, j.title as job_title, j.company, u.name as seeker_name, u.email as seeker_email
-       FROM applications a
-       JOIN jobs j ON a.job_id = j.job_id
-       JOIN operates o ON j.job_id = o.job_id
-       JOIN job_seekers js ON a.seeker_id = js.seeker_id
-       JOIN users u ON js.user_id = u.user_id
+      `${projection
+        ? `SELECT ${projection.select}
+           FROM applications a
+           JOIN jobs j ON a.job_id = j.job_id
+           JOIN operates o ON j.job_id = o.job_id
+           ${projection.joins}`
+        : `SELECT a.*, j.title as job_title, j.company, u.name as seeker_name, u.email as seeker_email
+           FROM applications a
+           JOIN jobs j ON a.job_id = j.job_id
+           JOIN operates o ON j.job_id = o.job_id
+           JOIN job_seekers js ON a.seeker_id = js.seeker_id
+           JOIN users u ON js.user_id = u.user_id`}
        WHERE o.recruiter_id = $1 AND a.applied_timestamp >= NOW() - INTERVAL '30 days'
        ORDER BY a.applied_timestamp DESC LIMIT 100`,
       [actualRecruiterId]
@@ -1116,6 +1836,9 @@ export const updateJob = async (req, res) => {
       }
     }
 
+    // The update ran as several statements; pick up whatever ended up in the row
+    await reindexJob(id);
+
     res.json({ success: true, message: 'Job updated successfully' });
   } catch (error) {
     console.error('Error updating job:', error);
@@ -1140,11 +1863,16 @@ export const debugInterviewStats = async (req, res) => {
 
     const actualRecruiterId = recruiterResult.rows[0].recruiter_id;
 
-    // Check all interviews for this recruiter
+    // Total plus the most recent interviews for this recruiter (not the whole history)
+    const totalRes = await pool.query(
+      'SELECT COUNT(*)::int AS cnt FROM interviews WHERE recruiter_id = $1',
+      [actualRecruiterId]
+    );
     const allInterviews = await pool.query(
-      `SELECT i.*, j.title as job_title FROM interviews i
-       JOIN jobs j ON i.job_id = j.job_id
-       WHERE i.recruiter_id = $1`,
+      `SELECT i.interview_id, i.schedule, i.status FROM interviews i
+       WHERE i.recruiter_id = $1
+       ORDER BY i.schedule DESC NULLS LAST
+       LIMIT 50`,
       [actualRecruiterId]
     );
 
@@ -1162,7 +1890,7 @@ export const debugInterviewStats = async (req, res) => {
       success: true,
       debug: {
         actualRecruiterId,
-        totalInterviews: allInterviews.rows.length,
+        totalInterviews: totalRes.rows[0].cnt,
         upcomingCount: upcomingInterviewsRes.rows[0]?.cnt || 0,
         currentTime: currentTime.rows[0].current_time,
         allInterviews: allInterviews.rows.map(i => ({
@@ -1,5 +1,6 @@
 import pool from '../db.js';
 import crypto from 'crypto';
+import { readPool } from '../services/readRouting.js';
 
 // Helper function to generate session ID
 const generateSessionId = (req) => {
@@ -86,6 +87,7 @@ export const recordView = async (req, res) => {
 // Get view statistics for an entity
 export const getViewStats = async (req, res) => {
   try {
+    const db = readPool(req);
     const { entityType, entityId } = req.params;
     const { period = '30d' } = req.query; // 1d, 7d, 30d, 90d, all
 
@@ -122,7 +124,7 @@ export const getViewStats = async (req, res) => {
       ${dateFilter}
     `;
 
-    const statsResult = await pool.query(statsQuery, [entityType, entityId]);
+    const statsResult = await db.query(statsQuery, [entityType, entityId]);
     const stats = statsResult.rows[0];
 
     // Get daily breakdown
@@ -141,7 +143,7 @@ export const getViewStats = async (req, res) => {
       LIMIT 30
     `;
 
-    const dailyResult = await pool.query(dailyQuery, [entityType, entityId]);
+    const dailyResult = await db.query(dailyQuery, [entityType, entityId]);
 
     // Get hourly breakdown for recent activity (last 7 days)
     const hourlyQuery = `
@@ -157,7 +159,7 @@ export const getViewStats = async (req, res) => {
       ORDER BY hour
     `;
 
-    const hourlyResult = await pool.query(hourlyQuery, [entityType, entityId]);
+    const hourlyResult = await db.query(hourlyQuery, [entityType, entityId]);
 
     res.json({
       success: true,
@@ -242,6 +244,7 @@ export const getViewCount = async (req, res) => {
 // Get trending entities based on recent views
 export const getTrendingEntities = async (req, res) => {
   try {
+    const db = readPool(req);
     const { entityType, limit = 10, period = '7d' } = req.query;
 
     // Determine date filter
@@ -274,7 +277,7 @@ export const getTrendingEntities = async (req, res) => {
     `;
     queryParams.push(parseInt(limit));
 
-    const result = await pool.query(query, queryParams);
+    const result = await db.query(query, queryParams);
 
     // If entityType is job, get additional job details
     if (entityType === 'job' && result.rows.length > 0) {
@@ -285,7 +288,7 @@ export const getTrendingEntities = async (req, res) => {
         WHERE j.job_id = ANY($1)
       `;
       
-      const jobsResult = await pool.query(jobsQuery, [jobIds]);
+      const jobsResult = await db.query(jobsQuery, [jobIds]);
       const jobsMap = {};
       jobsResult.rows.forEach(job => {
         jobsMap[job.job_id] = job;
@@ -322,6 +325,7 @@ export const getTrendingEntities = async (req, res) => {
 // Get analytics dashboard data
 export const getAnalyticsDashboard = async (req, res) => {
   try {
+    const db = readPool(req);
     const { period = '30d' } = req.query;
     const days = period.replace('d', '');
 
@@ -337,7 +341,7 @@ export const getAnalyticsDashboard = async (req, res) => {
       WHERE view_timestamp >= NOW() - INTERVAL '${days} days'
     `;
 
-    const overallStats = await pool.query(overallStatsQuery);
+    const overallStats = await db.query(overallStatsQuery);
 
     // Get views by entity type
     const entityTypeQuery = `
@@ -351,7 +355,7 @@ export const getAnalyticsDashboard = async (req, res) => {
       ORDER BY view_count DESC
     `;
 
-    const entityTypeStats = await pool.query(entityTypeQuery);
+    const entityTypeStats = await db.query(entityTypeQuery);
 
     // Get daily trends
     const dailyTrendsQuery = `
@@ -367,7 +371,7 @@ export const getAnalyticsDashboard = async (req, res) => {
       LIMIT 30
     `;
 
-    const dailyTrends = await pool.query(dailyTrendsQuery);
+    const dailyTrends = await db.query(dailyTrendsQuery);
 
     res.json({
       success: true,
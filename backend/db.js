@@ -21,14 +21,20 @@ const poolConfig = process.env.DATABASE_URL
 
 const pool = new Pool(poolConfig);
 
-pool.connect()
-  .then(client => {
-    console.log('Connected to PostgreSQL database');
-    client.release();
-  })
-  .catch(err => {
-    console.error('Database connection failed:', err.message);
-    // Do not exit — allow the server to start so non-DB endpoints and tooling can run
-  });
+// Optional read replicas: comma-separated connection strings. Read-only
+// handlers are routed to them by services/readRouting.js; everything else
+// uses the primary pool above.
+export const replicaPools = (process.env.DATABASE_REPLICA_URLS || '')
+  .split(',')
+  .map(url => url.trim())
+  .filter(Boolean)
+  .map(connectionString => new Pool({
+    connectionString,
+    max: Number(process.env.DB_REPLICA_POOL_SIZE || 10),
+    ssl: process.env.DB_REPLICA_SSL === 'true' ? { rejectUnauthorized: false } : false
+  }));
+
+// No connection is opened here: server.js waits for the database during boot
+// (services/boot.js) and scripts connect on their first query.
 
 export default pool;
@@ -1,13 +1,28 @@
 import jwt from 'jsonwebtoken';
+import { getCachedToken, cacheToken, getBlockedStatus } from '../services/authState.js';
 
 export function authenticateToken(req, res, next) {
   const authHeader = req.headers['authorization'];
   const token = authHeader && authHeader.split(' ')[1];
   if (!token) return res.sendStatus(401);
 
-  jwt.verify(token, process.env.JWT_SECRET, (err, user) => {
-    if (err) return res.sendStatus(403);
-    req.user = user;
-    next();
-  });
+  // Verified tokens are cached until their expiry to skip the signature check
+  let user = getCachedToken(token);
+  if (!user) {
+    try {
+      user = jwt.verify(token, process.env.JWT_SECRET);
+    } catch (err) {
+      return res.sendStatus(403);
+    }
+    cacheToken(token, user);
+  }
+
+  // Suspended or deleted accounts are rejected even while their token is valid
+  const blocked = getBlockedStatus(user);
+  if (blocked) {
+    return res.status(403).json({ success: false, error: `Account ${blocked}` });
+  }
+
+  req.user = user;
+  next();
 }
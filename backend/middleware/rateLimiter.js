@@ -0,0 +1,169 @@
+import pool from '../db.js';
+
+/**
+ * Sliding-window rate limiting with pluggable stores.
+ *
+ * Each key keeps two fixed-window counters (previous and current). The usage
+ * seen by a request is the current count plus the previous count weighted by
+ * how much of the previous window still overlaps the sliding window, which
+ * avoids the burst-at-the-boundary problem of fixed windows in three numbers
+ * per key.
+ *
+ * Requests consume `cost(req)` units instead of 1, so cheap beacons and
+ * expensive endpoints can share one budget.
+ */
+
+// Roll a [windowStart, prev, curr] bucket forward to the window containing now
+const rollBucket = (bucket, windowStart, windowMs) => {
+  if (bucket[0] === windowStart) return bucket;
+  const prev = bucket[0] === windowStart - windowMs ? bucket[2] : 0;
+  return [windowStart, prev, 0];
+};
+
+/**
+ * Per-process store. The number of tracked keys is capped; the least recently
+ * seen key is evicted first, which at worst forgets an idle client's usage.
+ */
+export class MemoryStore {
+  constructor({ maxKeys = Number(process.env.RATE_LIMIT_MAX_KEYS || 50000) } = {}) {
+    this.maxKeys = maxKeys;
+    this.buckets = new Map();
+  }
+
+  async hit(key, cost, windowStart, windowMs) {
+    const existing = this.buckets.get(key);
+    const bucket = rollBucket(existing || [windowStart, 0, 0], windowStart, windowMs);
+    bucket[2] += cost;
+
+    // Re-insert so Map order tracks recency
+    this.buckets.delete(key);
+    this.buckets.set(key, bucket);
+    if (this.buckets.size > this.maxKeys) {
+      this.buckets.delete(this.buckets.keys().next().value);
+    }
+    return { prev: bucket[1], curr: bucket[2] };
+  }
+}
+
+/**
+ * Shared store for multi-instance deployments (rate_limit_buckets, migration 008).
+ * One upsert per request rolls the window and adds the cost atomically. If the
+ * database is unavailable the limiter falls back to a per-process MemoryStore
+ * rather than rejecting traffic.
+ */
+export class PostgresStore {
+  constructor({ db = pool, pruneIntervalMs = 60 * 1000 } = {}) {
+    this.db = db;
+    this.fallback = new MemoryStore();
+    this.lastWarning = 0;
+    this.pruneTimer = setInterval(() => this.prune(), pruneIntervalMs);
+    this.pruneTimer.unref();
+  }
+
+  async hit(key, cost, windowStart, windowMs) {
+    try {
+      // Epoch-ms values overflow int4: without the casts Postgres may infer
+      // integer parameters and every hit would land in the fallback
+      const result = await this.db.query(
+        `INSERT INTO rate_limit_buckets (bucket_key, window_start, prev_count, curr_count, expires_at)
+         VALUES ($1, $2::bigint, 0, $3, $2::bigint + 2 * $4::bigint)
+         ON CONFLICT (bucket_key) DO UPDATE SET
+           prev_count = CASE
+             WHEN rate_limit_buckets.window_start = EXCLUDED.window_start THEN rate_limit_buckets.prev_count
+             WHEN rate_limit_buckets.window_start = EXCLUDED.window_start - $4 THEN rate_limit_buckets.curr_count
+             ELSE 0 END,
+           curr_count = CASE
+             WHEN rate_limit_buckets.window_start = EXCLUDED.window_start THEN rate_limit_buckets.curr_count + EXCLUDED.curr_count
+             ELSE EXCLUDED.curr_count END,
+           window_start = EXCLUDED.window_start,
+           expires_at = EXCLUDED.expires_at
+         RETURNING prev_count, curr_count`,
+        [key, windowStart, cost, windowMs]
+      );
+      return { prev: result.rows[0].prev_count, curr: result.rows[0].curr_count };
+    } catch (err) {
+      if (Date.now() - this.lastWarning > 60 * 1000) {
+        console.warn('Rate limit store unavailable, using in-memory counts:', err.message);
+        this.lastWarning = Date.now();
+      }
+      return this.fallback.hit(key, cost, windowStart, windowMs);
+    }
+  }
+
+  async prune() {
+    try {
+      await this.db.query('DELETE FROM rate_limit_buckets WHERE expires_at < $1', [Date.now()]);
+    } catch (err) {
+      // Table missing or database down; hit() already reports this
+    }
+  }
+}
+
+let defaultStore = null;
+
+/**
+ * Store selected by RATE_LIMIT_STORE (memory | postgres), shared by all limiters
+ */
+export const getDefaultStore = () => {
+  if (!defaultStore) {
+    defaultStore = process.env.RATE_LIMIT_STORE === 'postgres' ? new PostgresStore() : new MemoryStore();
+  }
+  return defaultStore;
+};
+
+/**
+ * Cost lookup from a list of [pattern, cost] pairs matched against the request path
+ */
+export const routeCosts = (table, defaultCost = 1) => (req) => {
+  const path = req.originalUrl.split('?')[0];
+  for (const [pattern, cost] of table) {
+    if (pattern.test(path)) return cost;
+  }
+  return defaultCost;
+};
+
+/**
+ * Create a rate limiting middleware.
+ * Options mirror the express-rate-limit ones this replaces (windowMs, max,
+ * message, skip) plus `name` (key prefix, so limiters sharing a store keep
+ * separate budgets), `cost` (number or req => number) and `store`.
+ */
+export const createRateLimiter = ({
+  name,
+  windowMs,
+  max,
+  message = 'Too many requests, please try again later',
+  cost = 1,
+  skip = () => false,
+  keyGenerator = (req) => req.ip,
+  store = getDefaultStore(),
+}) => {
+  const costOf = typeof cost === 'function' ? cost : () => cost;
+
+  return async (req, res, next) => {
+    if (skip(req)) return next();
+
+    try {
+      const now = Date.now();
+      const windowStart = now - (now % windowMs);
+      const { prev, curr } = await store.hit(`${name}:${keyGenerator(req)}`, costOf(req), windowStart, windowMs);
+
+      const overlap = 1 - (now - windowStart) / windowMs;
+      const used = prev * overlap + curr;
+      const remaining = Math.max(0, Math.floor(max - used));
+
+      // IETF draft RateLimit headers, as express-rate-limit's standardHeaders
+      res.setHeader('RateLimit-Limit', max);
+      res.setHeader('RateLimit-Remaining', remaining);
+      res.setHeader('RateLimit-Reset', Math.ceil((windowStart + windowMs - now) / 1000));
+
+      if (used > max) {
+        res.setHeader('Retry-After', Math.ceil((windowStart + windowMs - now) / 1000));
+        return res.status(429).send(message);
+      }
+      next();
+    } catch (err) {
+      next(err);
+    }
+  };
+};
@@ -0,0 +1,98 @@
+import xss from 'xss';
+
+/**
+ * Schema-driven request body sanitization.
+ *
+ * Every string in the body, at any depth, is handled by the action its field
+ * name maps to (array elements use the array's field name):
+ *   html   - filter through the xss whitelist (the default)
+ *   escape - escape all markup; for fields that never contain HTML
+ *   skip   - leave untouched, including nested values (binary data, secrets)
+ * Strings without '<' or '>' are returned as-is: neither action would change
+ * them, so the common case costs one regex test and no allocation.
+ */
+
+const MARKUP = /[<>]/;
+
+const actions = {
+  html: (value) => (MARKUP.test(value) ? xss(value) : value),
+  escape: (value) => (MARKUP.test(value) ? value.replace(/</g, '&lt;').replace(/>/g, '&gt;') : value),
+  skip: null,
+};
+
+const compileFields = (fields) => {
+  const compiled = new Map();
+  for (const [name, action] of Object.entries(fields)) {
+    if (!Object.hasOwn(actions, action)) throw new Error(`Unknown sanitize action "${action}" for ${name}`);
+    compiled.set(name, actions[action]);
+  }
+  return compiled;
+};
+
+const assign = (node, key, value) => {
+  // A parsed "__proto__" key is an own property; plain assignment would not reach it
+  if (key === '__proto__') {
+    Object.defineProperty(node, key, { value, writable: true, enumerable: true, configurable: true });
+  } else {
+    node[key] = value;
+  }
+};
+
+// Iterative, in-place walk: one pass over the body, no recursion depth limit
+const walk = (root, fields, fallback) => {
+  const stack = [root, fallback];
+  while (stack.length > 0) {
+    const action = stack.pop();
+    const node = stack.pop();
+
+    if (Array.isArray(node)) {
+      for (let i = 0; i < node.length; i++) {
+        const value = node[i];
+        if (typeof value === 'string') {
+          const clean = action(value);
+          if (clean !== value) node[i] = clean;
+        } else if (value !== null && typeof value === 'object') {
+          stack.push(value, action);
+        }
+      }
+      continue;
+    }
+
+    for (const key of Object.keys(node)) {
+      const fieldAction = fields.has(key) ? fields.get(key) : action;
+      if (fieldAction === null) continue;
+      const value = node[key];
+      if (typeof value === 'string') {
+        const clean = fieldAction(value);
+        if (clean !== value) assign(node, key, clean);
+      } else if (value !== null && typeof value === 'object') {
+        stack.push(value, fieldAction);
+      }
+    }
+  }
+};
+
+/**
+ * Build the sanitization middleware. `fields` maps field names to actions for
+ * every route; `routes` is a list of [pathPattern, fields] whose first match
+ * adds to (and overrides) them for that route.
+ */
+export const createSanitizer = ({ fields = {}, routes = [], defaultAction = 'html' } = {}) => {
+  const fallback = actions[defaultAction];
+  if (!fallback) throw new Error('defaultAction must be html or escape');
+  const globalFields = compileFields(fields);
+  const routeFields = routes.map(([pattern, overrides]) => [
+    pattern,
+    new Map([...globalFields, ...compileFields(overrides)]),
+  ]);
+
+  return (req, res, next) => {
+    const body = req.body;
+    if (body !== null && typeof body === 'object') {
+      const path = req.originalUrl.split('?')[0];
+      const match = routeFields.find(([pattern]) => pattern.test(path));
+      walk(body, match ? match[1] : globalFields, fallback);
+    }
+    next();
+  };
+};
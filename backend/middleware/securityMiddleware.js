@@ -1,29 +1,41 @@
-import rateLimit from 'express-rate-limit';
 import { body, param, validationResult } from 'express-validator';
-import xss from 'xss';
+import { createRateLimiter, routeCosts } from './rateLimiter.js';
+import { createSanitizer } from './sanitizer.js';
 
 /**
  * Rate limiting middleware for authentication endpoints
  * Prevents brute force attacks on login/register
  */
-export const authLimiter = rateLimit({
+export const authLimiter = createRateLimiter({
+  name: 'auth',
   windowMs: 15 * 60 * 1000, // 15 minutes
   max: 5, // limit each IP to 5 requests per windowMs
   message: 'Too many authentication attempts, please try again later',
-  standardHeaders: true,
-  legacyHeaders: false,
   skip: (req) => process.env.NODE_ENV === 'development', // Disable in development
 });
 
+/**
+ * Per-route cost in budget units (default 1): view beacons and typeahead
+ * keystrokes are cheap, analytics and resume analysis are expensive
+ */
+export const API_ROUTE_COSTS = [
+  [/^\/api\/views\/record$/, 0.25],
+  [/^\/api\/views\/count\//, 0.25],
+  [/^\/api\/jobseeker\/typeahead$/, 0.25],
+  [/^\/api\/views\/(dashboard|trending|refresh-stats)/, 5],
+  [/^\/api\/jobseeker\/ats\/analyze$/, 5],
+  [/^\/api\/admin\/(stats|dashboard\/stats|logs)/, 3],
+];
+
 /**
  * General API rate limiter for all requests
  */
-export const apiLimiter = rateLimit({
+export const apiLimiter = createRateLimiter({
+  name: 'api',
   windowMs: 15 * 60 * 1000, // 15 minutes
-  max: 100, // limit each IP to 100 requests per windowMs
+  max: 100, // 100 budget units per IP per windowMs
+  cost: routeCosts(API_ROUTE_COSTS),
   message: 'Too many requests, please try again later',
-  standardHeaders: true,
-  legacyHeaders: false,
   skip: (req) => process.env.NODE_ENV === 'development',
 });
 
@@ -85,19 +97,36 @@ export const handleValidationErrors = (req, res, next) => {
 };
 
 /**
- * XSS protection middleware - sanitizes user input
+ * Sanitization policy for every route: secrets are only hashed or compared,
+ * identity fields never contain markup. Everything else is xss-filtered.
  */
-export const sanitizeInputs = (req, res, next) => {
-  if (req.body) {
-    Object.keys(req.body).forEach(key => {
-      if (typeof req.body[key] === 'string') {
-        req.body[key] = xss(req.body[key]);
-      }
-    });
-  }
-  next();
+export const SANITIZE_FIELDS = {
+  password: 'skip',
+  currentPassword: 'skip',
+  newPassword: 'skip',
+  name: 'escape',
+  email: 'escape',
+  phone: 'escape',
+  phone_no: 'escape',
 };
 
+/**
+ * Per-route additions, first match wins: base64 uploads are decoded to
+ * bytes, never rendered, and are by far the largest bodies
+ */
+export const SANITIZE_ROUTES = [
+  [/^\/api\/jobseeker\/resumes\/upload$/, { fileData: 'skip' }],
+];
+
+/**
+ * XSS protection middleware - sanitizes user input, including nested
+ * objects and arrays
+ */
+export const sanitizeInputs = createSanitizer({
+  fields: SANITIZE_FIELDS,
+  routes: SANITIZE_ROUTES,
+});
+
 /**
  * Parameter validation for numeric IDs
  */
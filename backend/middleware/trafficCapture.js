@@ -0,0 +1,175 @@
+import fs from 'fs';
+
+/**
+ * Opt-in production traffic capture for perf/replay_traffic.py.
+ *
+ * With TRAFFIC_CAPTURE_FILE set, every sampled /api request appends one NDJSON
+ * line when its response finishes:
+ *   { t, m, r, p, q, b, a, s, d, z }
+ * start time (epoch ms), method, matched route pattern, path params, query,
+ * body shape, caller role, status, duration (ms) and response bytes.
+ *
+ * No headers, tokens, IPs or free-text values are written, and the caller is
+ * recorded by role only. Internal numeric ids are kept so a replay hits the
+ * same rows: path params that are numeric (`/users/:id`, `/messages/:seeker_id`)
+ * or short keywords (`job`, `profile`), numeric query values, and integer
+ * `*_id`/`*_ids` body values. A capture can therefore link requests to user,
+ * seeker and job ids; treat the file like the database it mirrors. Query
+ * values of the filters in KEPT_QUERY (status, dates, page size) are kept as
+ * well. Every other string is replaced by a placeholder of the same length, so
+ * a replayed search does the same work without the search text. Bodies keep
+ * their keys and types, array lengths, integer ids and the enum fields in
+ * KEPT_BODY only. Requests that match no route are not recorded.
+ */
+
+const KEYWORD = /^[a-z_]{1,20}$/;
+const INTEGER = /^\d{1,12}$/;
+const ID_KEY = /(^|_)ids?$/;
+const MAX_DEPTH = 6;
+
+// Filters whose values are enums, dates or field lists, never user input
+const KEPT_QUERY = new Set([
+  'status', 'role', 'job_type', 'entityType', 'actor_type', 'period', 'format',
+  'fields', 'kind', 'from', 'to', 'start_date', 'end_date', 'duration', 'step',
+]);
+const KEPT_BODY = new Set(['status', 'role', 'job_type', 'entityType', 'entity', 'interview_type']);
+
+// Keyset cursors encode another database's rows; a replay starts from page one
+const DROPPED_QUERY = new Set(['cursor']);
+
+const placeholder = (value) => 'x'.repeat(Math.min(value.length, 200));
+
+const scrubParams = (params) => {
+  const keys = Object.keys(params || {});
+  if (keys.length === 0) return undefined;
+  return Object.fromEntries(keys.map((key) => {
+    const value = String(params[key]);
+    return [key, INTEGER.test(value) || KEYWORD.test(value) ? value : placeholder(value)];
+  }));
+};
+
+const scrubQueryValue = (key, value) => {
+  if (KEPT_QUERY.has(key)) return value.slice(0, 200);
+  return INTEGER.test(value) ? value : placeholder(value);
+};
+
+const scrubQuery = (query) => {
+  const keys = Object.keys(query || {});
+  if (keys.length === 0) return undefined;
+  return Object.fromEntries(keys.map((key) => {
+    if (DROPPED_QUERY.has(key)) return [key, ''];
+    const value = query[key];
+    return [key, Array.isArray(value)
+      ? value.map((v) => scrubQueryValue(key, String(v)))
+      : scrubQueryValue(key, String(value))];
+  }));
+};
+
+/**
+ * Shape of a request body: strings become "s:<length>" (enum fields keep
+ * their value), numbers "n" unless they sit under an id key, arrays
+ * { $a: length, of: shape of the first element }.
+ */
+export const bodyShape = (value, key = '', depth = 0) => {
+  if (value === null || value === undefined) return null;
+  if (depth > MAX_DEPTH) return '...';
+  switch (typeof value) {
+    case 'string':
+      return KEPT_BODY.has(key) && KEYWORD.test(value) ? value : `s:${value.length}`;
+    case 'number':
+      return ID_KEY.test(key) && Number.isInteger(value) ? value : 'n';
+    case 'boolean':
+      return value;
+    case 'object':
+      break;
+    default:
+      return null;
+  }
+  if (Array.isArray(value)) {
+    // Id lists are kept whole (bulk endpoints), anything else by its first element
+    if (ID_KEY.test(key) && value.every(Number.isInteger)) return value;
+    return { $a: value.length, of: value.length > 0 ? bodyShape(value[0], key, depth + 1) : null };
+  }
+  const shape = {};
+  for (const k of Object.keys(value)) shape[k] = bodyShape(value[k], k, depth + 1);
+  return shape;
+};
+
+/**
+ * Build the capture middleware, or return null when capture is off.
+ * `sampleRate` is the fraction of requests recorded; capture stops once the
+ * file grows past `maxBytes` in this process.
+ */
+export const createTrafficCapture = ({
+  file = process.env.TRAFFIC_CAPTURE_FILE,
+  sampleRate = Number(process.env.TRAFFIC_CAPTURE_SAMPLE || 1),
+  maxBytes = Number(process.env.TRAFFIC_CAPTURE_MAX_MB || 100) * 1024 * 1024,
+} = {}) => {
+  if (!file || !(sampleRate > 0)) return null;
+
+  const out = fs.createWriteStream(file, { flags: 'a' });
+  let written = 0;
+  let blocked = false;
+  let dropped = 0;
+  let stopped = false;
+
+  out.on('drain', () => {
+    blocked = false;
+  });
+  out.on('error', (error) => {
+    stopped = true;
+    console.error(`Traffic capture disabled (${file}):`, error.message);
+  });
+
+  const record = (entry) => {
+    if (stopped) return;
+    // Never let a slow disk hold responses in memory: drop until it drains
+    if (blocked) {
+      dropped++;
+      return;
+    }
+    if (dropped > 0) {
+      console.warn(`Traffic capture dropped ${dropped} requests while the log was busy`);
+      dropped = 0;
+    }
+    const line = `${JSON.stringify(entry)}\n`;
+    written += line.length;
+    if (written > maxBytes) {
+      stopped = true;
+      out.end();
+      console.warn(`Traffic capture stopped: ${file} reached TRAFFIC_CAPTURE_MAX_MB`);
+      return;
+    }
+    blocked = !out.write(line);
+  };
+
+  console.log(`Capturing ${sampleRate < 1 ? `${sampleRate * 100}% of ` : ''}API traffic to ${file}`);
+
+  return (req, res, next) => {
+    if (stopped || !req.path.startsWith('/api/') || (sampleRate < 1 && Math.random() >= sampleRate)) {
+      return next();
+    }
+    const startedAt = performance.timeOrigin + performance.now();
+    const start = performance.now();
+
+    res.once('finish', () => {
+      if (!req.route) return;
+      const length = Number(res.getHeader('content-length'));
+      record({
+        t: Math.round(startedAt * 10) / 10,
+        m: req.method,
+        r: `${req.baseUrl || ''}${req.route.path}`,
+        p: scrubParams(req.params),
+        q: scrubQuery(req.query),
+        b: req.body && typeof req.body === 'object' && Object.keys(req.body).length > 0
+          ? bodyShape(req.body)
+          : undefined,
+        a: req.user?.role,
+        s: res.statusCode,
+        d: Math.round((performance.now() - start) * 100) / 100,
+        z: Number.isFinite(length) ? length : undefined,
+      });
+    });
+    next();
+  };
+};
@@ -0,0 +1,44 @@
+-- Migration: Add materialized dashboard counters
+-- recruiter_stats / seeker_stats hold the numbers shown on the dashboards so the
+-- stats endpoints become a single primary-key read. Write paths adjust the
+-- counters incrementally (services/statsCounters.js) and a periodic
+-- reconciliation job recomputes them to repair drift and age out the
+-- time-windowed counts.
+
+CREATE TABLE IF NOT EXISTS recruiter_stats (
+    recruiter_id INT PRIMARY KEY REFERENCES recruiters(recruiter_id) ON DELETE CASCADE,
+    total_jobs INT NOT NULL DEFAULT 0,
+    active_jobs INT NOT NULL DEFAULT 0,
+    total_applications INT NOT NULL DEFAULT 0,
+    total_views BIGINT NOT NULL DEFAULT 0,
+    new_applications INT NOT NULL DEFAULT 0,      -- applied in the last 7 days
+    scheduled_interviews INT NOT NULL DEFAULT 0,  -- schedule in the future
+    hired_candidates INT NOT NULL DEFAULT 0,      -- hired/accepted, applied in the last 30 days
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS seeker_stats (
+    seeker_id INT PRIMARY KEY REFERENCES job_seekers(seeker_id) ON DELETE CASCADE,
+    applied_jobs INT NOT NULL DEFAULT 0,
+    interviews_scheduled INT NOT NULL DEFAULT 0,  -- schedule in the future
+    profile_views INT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Columns and tables the reconciliation queries read
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS view_count INT DEFAULT 0;
+
+CREATE TABLE IF NOT EXISTS profile_views (
+    viewer_id INTEGER REFERENCES users(user_id),
+    viewed_user_id INTEGER REFERENCES users(user_id),
+    viewed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (viewer_id, viewed_user_id)
+);
+
+-- Indexes that keep per-recruiter / per-seeker reconciliation cheap
+CREATE INDEX IF NOT EXISTS idx_applications_job_id ON applications(job_id);
+CREATE INDEX IF NOT EXISTS idx_applications_seeker_id ON applications(seeker_id);
+CREATE INDEX IF NOT EXISTS idx_operates_recruiter_job ON operates(recruiter_id, job_id);
+CREATE INDEX IF NOT EXISTS idx_interviews_recruiter_schedule ON interviews(recruiter_id, schedule);
+CREATE INDEX IF NOT EXISTS idx_interviews_seeker_schedule ON interviews(seeker_id, schedule);
+CREATE INDEX IF NOT EXISTS idx_profile_views_viewed ON profile_views(viewed_user_id);
@@ -0,0 +1,22 @@
+-- Migration: Add user status and revocation tracking
+-- users.status backs the admin suspend/activate action. revoked_users records
+-- deleted accounts so every server instance can reject their still-valid
+-- tokens; rows older than the longest token lifetime (24h) can be pruned.
+
+ALTER TABLE users ADD COLUMN IF NOT EXISTS status VARCHAR(20) NOT NULL DEFAULT 'active';
+ALTER TABLE users ADD COLUMN IF NOT EXISTS status_changed_at TIMESTAMP;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'users_status_check') THEN
+        ALTER TABLE users ADD CONSTRAINT users_status_check CHECK (status IN ('active', 'suspended'));
+    END IF;
+END $$;
+
+-- The auth status refresh only reads the (small) set of non-active users
+CREATE INDEX IF NOT EXISTS idx_users_inactive ON users(user_id) WHERE status <> 'active';
+
+CREATE TABLE IF NOT EXISTS revoked_users (
+    user_id INT PRIMARY KEY,
+    revoked_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
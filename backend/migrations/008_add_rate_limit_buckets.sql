@@ -0,0 +1,14 @@
+-- Migration: Add shared rate limit buckets
+-- Used by the Postgres rate limit store (RATE_LIMIT_STORE=postgres) so every
+-- server instance counts against the same sliding window. UNLOGGED: counters
+-- are disposable and skipping WAL keeps the per-request upsert cheap.
+
+CREATE UNLOGGED TABLE IF NOT EXISTS rate_limit_buckets (
+    bucket_key TEXT PRIMARY KEY,          -- '<limiter>:<client ip>'
+    window_start BIGINT NOT NULL,         -- epoch ms of the current fixed window
+    prev_count DOUBLE PRECISION NOT NULL DEFAULT 0,
+    curr_count DOUBLE PRECISION NOT NULL DEFAULT 0,
+    expires_at BIGINT NOT NULL            -- epoch ms after which the row is useless
+);
+
+CREATE INDEX IF NOT EXISTS idx_rate_limit_buckets_expires ON rate_limit_buckets(expires_at);
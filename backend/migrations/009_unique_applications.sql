@@ -0,0 +1,56 @@
+-- Migration: One application per (seeker, job) and a per-job application counter
+-- applyForJob relies on the unique constraint (INSERT ... ON CONFLICT) instead
+-- of a check-then-insert, and jobs.application_count is kept in the same
+-- transaction as every insert/delete on applications by a trigger. The job
+-- board, the admin and recruiter job lists and the recruiter stats read the
+-- counter instead of counting applications per request.
+
+-- Remove duplicate applications, keeping a real application over a 'saved'
+-- placeholder and otherwise the oldest row (referencing rows are SET NULL)
+DELETE FROM applications
+WHERE application_id IN (
+    SELECT application_id FROM (
+        SELECT application_id,
+               ROW_NUMBER() OVER (PARTITION BY seeker_id, job_id
+                                  ORDER BY (status = 'saved'), application_id) AS rn
+        FROM applications
+    ) ranked
+    WHERE rn > 1
+);
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'applications_seeker_job_unique') THEN
+        ALTER TABLE applications
+            ADD CONSTRAINT applications_seeker_job_unique UNIQUE (seeker_id, job_id);
+    END IF;
+END $$;
+
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS application_count INT NOT NULL DEFAULT 0;
+
+UPDATE jobs j
+SET application_count = COALESCE(c.cnt, 0)
+FROM (
+    SELECT jobs.job_id, COUNT(a.application_id) AS cnt
+    FROM jobs LEFT JOIN applications a ON a.job_id = jobs.job_id
+    GROUP BY jobs.job_id
+) c
+WHERE c.job_id = j.job_id;
+
+CREATE OR REPLACE FUNCTION maintain_job_application_count() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') AND OLD.job_id IS NOT NULL THEN
+        UPDATE jobs SET application_count = GREATEST(application_count - 1, 0) WHERE job_id = OLD.job_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.job_id IS NOT NULL THEN
+        UPDATE jobs SET application_count = application_count + 1 WHERE job_id = NEW.job_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_applications_count ON applications;
+CREATE TRIGGER trg_applications_count
+    AFTER INSERT OR DELETE OR UPDATE OF job_id ON applications
+    FOR EACH ROW
+    EXECUTE FUNCTION maintain_job_application_count();
@@ -0,0 +1,41 @@
+-- Migration: Interview calendar
+-- Each interview occupies slot = [schedule, schedule + duration). Exclusion
+-- constraints reject overlapping active interviews for the same recruiter or
+-- the same seeker atomically, and their GiST indexes answer availability
+-- queries. Cancelled/completed/declined interviews do not block the calendar.
+--
+-- Adding the constraints fails if overlapping active interviews already exist.
+-- List them with:
+--   SELECT a.interview_id, b.interview_id FROM interviews a JOIN interviews b
+--     ON a.interview_id < b.interview_id AND a.slot && b.slot
+--    AND (a.recruiter_id = b.recruiter_id OR a.seeker_id = b.seeker_id)
+--   WHERE COALESCE(a.status, 'scheduled') NOT IN ('cancelled', 'completed', 'declined')
+--     AND COALESCE(b.status, 'scheduled') NOT IN ('cancelled', 'completed', 'declined');
+-- and cancel or reschedule one side before re-running.
+
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
+ALTER TABLE interviews ADD COLUMN IF NOT EXISTS slot tsrange
+    GENERATED ALWAYS AS (
+        CASE WHEN schedule IS NULL THEN NULL
+             ELSE tsrange(schedule, schedule + make_interval(mins => COALESCE(duration, 60)), '[)')
+        END
+    ) STORED;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'interviews_recruiter_no_overlap') THEN
+        ALTER TABLE interviews ADD CONSTRAINT interviews_recruiter_no_overlap
+            EXCLUDE USING gist (recruiter_id WITH =, slot WITH &&)
+            WHERE (COALESCE(status, 'scheduled') NOT IN ('cancelled', 'completed', 'declined'));
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'interviews_seeker_no_overlap') THEN
+        ALTER TABLE interviews ADD CONSTRAINT interviews_seeker_no_overlap
+            EXCLUDE USING gist (seeker_id WITH =, slot WITH &&)
+            WHERE (COALESCE(status, 'scheduled') NOT IN ('cancelled', 'completed', 'declined'));
+    END IF;
+END $$;
+
+-- Date-windowed listings (Schedule / Meetings) read by start time
+CREATE INDEX IF NOT EXISTS idx_interviews_recruiter_schedule ON interviews(recruiter_id, schedule);
+CREATE INDEX IF NOT EXISTS idx_interviews_seeker_schedule ON interviews(seeker_id, schedule);
@@ -0,0 +1,73 @@
+-- Migration: Memoize ATS analyses
+-- resumes.content_version increases whenever a resume or one of its
+-- experiences / education / skills rows changes, so an analysis keyed by
+-- (job description hash, resume_id, content_version) can be reused until the
+-- resume is edited. ats_analysis_history.cache_key stores that key and is
+-- looked up when the in-process cache misses.
+
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS content_version INT NOT NULL DEFAULT 1;
+
+CREATE OR REPLACE FUNCTION bump_resume_content_version() RETURNS TRIGGER AS $$
+BEGIN
+    -- Skip when the update already bumped the version (child-row trigger below)
+    IF NEW.content_version = OLD.content_version AND NEW IS DISTINCT FROM OLD THEN
+        NEW.content_version := OLD.content_version + 1;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_resumes_content_version ON resumes;
+CREATE TRIGGER trg_resumes_content_version
+    BEFORE UPDATE ON resumes
+    FOR EACH ROW
+    EXECUTE FUNCTION bump_resume_content_version();
+
+CREATE OR REPLACE FUNCTION bump_parent_resume_content_version() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE resumes SET content_version = content_version + 1 WHERE resume_id = OLD.resume_id;
+    END IF;
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.resume_id IS DISTINCT FROM OLD.resume_id) THEN
+        UPDATE resumes SET content_version = content_version + 1 WHERE resume_id = NEW.resume_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_experiences_resume_version ON experiences;
+CREATE TRIGGER trg_experiences_resume_version
+    AFTER INSERT OR UPDATE OR DELETE ON experiences
+    FOR EACH ROW
+    EXECUTE FUNCTION bump_parent_resume_content_version();
+
+DROP TRIGGER IF EXISTS trg_education_resume_version ON education;
+CREATE TRIGGER trg_education_resume_version
+    AFTER INSERT OR UPDATE OR DELETE ON education
+    FOR EACH ROW
+    EXECUTE FUNCTION bump_parent_resume_content_version();
+
+DROP TRIGGER IF EXISTS trg_skills_resume_version ON skills;
+CREATE TRIGGER trg_skills_resume_version
+    AFTER INSERT OR UPDATE OR DELETE ON skills
+    FOR EACH ROW
+    EXECUTE FUNCTION bump_parent_resume_content_version();
+
+CREATE TABLE IF NOT EXISTS ats_analysis_history (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(user_id) ON DELETE CASCADE,
+    resume_id INTEGER REFERENCES resumes(resume_id) ON DELETE CASCADE,
+    job_description TEXT,
+    overall_score INTEGER,
+    analysis_data JSONB,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE ats_analysis_history ADD COLUMN IF NOT EXISTS cache_key CHAR(64);
+
+-- One stored analysis per key; the existing ON CONFLICT DO NOTHING insert relies on it
+CREATE UNIQUE INDEX IF NOT EXISTS uniq_ats_analysis_cache_key
+ON ats_analysis_history (cache_key)
+WHERE cache_key IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_ats_analysis_user_created ON ats_analysis_history(user_id, created_at DESC);
@@ -0,0 +1,14 @@
+-- Migration: Indexes for cursor-paginated lists
+-- Each index matches a list's ORDER BY (newest first, id as tie-breaker), so
+-- fetching the page after a cursor is an index range scan of `limit` rows.
+
+-- Recruiter applicants for a job (getApplicants)
+CREATE INDEX IF NOT EXISTS idx_applications_job_applied
+ON applications(job_id, applied_timestamp DESC, application_id DESC);
+
+-- Job seeker job board (getAllJobs)
+CREATE INDEX IF NOT EXISTS idx_jobs_created_id ON jobs(created_at DESC, job_id DESC);
+
+-- Admin user and log lists
+CREATE INDEX IF NOT EXISTS idx_users_created_id ON users(created_at DESC, user_id DESC);
+CREATE INDEX IF NOT EXISTS idx_system_logs_timestamp_id ON system_logs(timestamp DESC, log_id DESC);
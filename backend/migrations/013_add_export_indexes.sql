@@ -0,0 +1,12 @@
+-- Migration: Indexes for streaming exports
+-- Exports read through a cursor in the list order. With an index matching the
+-- ORDER BY the first batch is sent right away instead of after sorting the
+-- whole table.
+
+-- Admin applications export (all jobs, newest first)
+CREATE INDEX IF NOT EXISTS idx_applications_applied_id
+ON applications(applied_timestamp DESC, application_id DESC);
+
+-- Recruiter sent-email export
+CREATE INDEX IF NOT EXISTS idx_email_logs_sender_sent
+ON email_logs(sender_user_id, sent_at DESC, id DESC);
@@ -0,0 +1,61 @@
+-- Migration: Normalized duplicate keys
+-- Unique indexes on normalized keys stop new duplicates at write time. The key
+-- expressions must match services/dedup.js. A table that already holds
+-- duplicates gets its index later, from `npm run dedup`, which removes them in
+-- resumable batches and then builds the index without blocking writes.
+
+CREATE TABLE IF NOT EXISTS dedup_progress (
+    target VARCHAR(50) PRIMARY KEY,
+    last_id INT NOT NULL DEFAULT 0,
+    removed BIGINT NOT NULL DEFAULT 0,
+    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    completed_at TIMESTAMP
+);
+
+DO $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM experiences
+    GROUP BY resume_id, lower(btrim(coalesce(company, ''))), lower(btrim(coalesce(job_title, ''))),
+             lower(btrim(coalesce(duration, ''))), md5(lower(btrim(coalesce(description, ''))))
+    HAVING COUNT(*) > 1
+  ) THEN
+    CREATE UNIQUE INDEX IF NOT EXISTS uniq_experiences_dedup_key ON experiences (
+      resume_id, lower(btrim(coalesce(company, ''))), lower(btrim(coalesce(job_title, ''))),
+      lower(btrim(coalesce(duration, ''))), md5(lower(btrim(coalesce(description, ''))))
+    );
+  ELSE
+    RAISE NOTICE 'experiences has duplicates: run npm run dedup to remove them and add uniq_experiences_dedup_key';
+  END IF;
+
+  IF NOT EXISTS (
+    SELECT 1 FROM education
+    GROUP BY resume_id, lower(btrim(coalesce(qualification, ''))), lower(btrim(coalesce(college, ''))),
+             coalesce(gpa, -1)
+    HAVING COUNT(*) > 1
+  ) THEN
+    CREATE UNIQUE INDEX IF NOT EXISTS uniq_education_dedup_key ON education (
+      resume_id, lower(btrim(coalesce(qualification, ''))), lower(btrim(coalesce(college, ''))),
+      coalesce(gpa, -1)
+    );
+  ELSE
+    RAISE NOTICE 'education has duplicates: run npm run dedup to remove them and add uniq_education_dedup_key';
+  END IF;
+
+  IF NOT EXISTS (SELECT 1 FROM skills GROUP BY resume_id, skill_type HAVING COUNT(*) > 1) THEN
+    CREATE UNIQUE INDEX IF NOT EXISTS uniq_skills_resume_type ON skills (resume_id, skill_type);
+  ELSE
+    RAISE NOTICE 'skills has duplicates: run npm run dedup to remove them and add uniq_skills_resume_type';
+  END IF;
+
+  -- Emails are stored lowercased by registration; older mixed-case rows may
+  -- collide. Those accounts need a manual merge, so without the unique index a
+  -- plain expression index still serves login and the duplicate report.
+  IF NOT EXISTS (SELECT 1 FROM users GROUP BY lower(email) HAVING COUNT(*) > 1) THEN
+    CREATE UNIQUE INDEX IF NOT EXISTS uniq_users_email_lower ON users (lower(email));
+  ELSE
+    CREATE INDEX IF NOT EXISTS idx_users_email_lower ON users (lower(email));
+    RAISE NOTICE 'users has case-insensitive duplicate emails: see GET /api/admin/users/duplicates';
+  END IF;
+END $$;
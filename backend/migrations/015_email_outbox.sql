@@ -0,0 +1,45 @@
+-- Migration: Transactional email outbox
+-- Handlers write an email_outbox row in the same transaction as the change the
+-- email is about; services/emailOutbox.js delivers the rows over SMTP in the
+-- background, retrying with backoff and dead-lettering ('dead') after the last
+-- attempt. Delivery state is mirrored to email_logs for the Sent list.
+
+-- email_logs used to be created on first use; make sure it exists
+CREATE TABLE IF NOT EXISTS email_logs (
+    id SERIAL PRIMARY KEY,
+    sender_user_id INT REFERENCES users(user_id) ON DELETE CASCADE,
+    to_email VARCHAR(255) NOT NULL,
+    subject TEXT,
+    body_preview TEXT,
+    application_id INT REFERENCES applications(application_id) ON DELETE SET NULL,
+    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- NULL: logged only (sent from the recruiter's own mail client)
+ALTER TABLE email_logs ADD COLUMN IF NOT EXISTS delivery_status VARCHAR(20)
+    CHECK (delivery_status IN ('queued', 'sent', 'failed'));
+
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id BIGSERIAL PRIMARY KEY,
+    email_log_id INT REFERENCES email_logs(id) ON DELETE SET NULL,
+    to_email VARCHAR(255) NOT NULL,
+    reply_to VARCHAR(255),
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'sent', 'dead')),
+    attempts INT NOT NULL DEFAULT 0,
+    -- Due time; claiming a row pushes it out by the claim timeout, so rows of a
+    -- dispatcher that died mid-send become due again
+    next_attempt_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    last_error TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    sent_at TIMESTAMP
+);
+
+-- Dispatcher poll: due pending rows, oldest first
+CREATE INDEX IF NOT EXISTS idx_email_outbox_due
+ON email_outbox(next_attempt_at, id) WHERE status = 'pending';
+
+-- Dead-letter listing
+CREATE INDEX IF NOT EXISTS idx_email_outbox_dead
+ON email_outbox(id) WHERE status = 'dead';
@@ -0,0 +1,202 @@
+// Query-plan regression check for the hot controller queries in perf/hotQueries.js.
+// Usage: node perf/check-query-plans.js [--update-baseline] [--only=<name>]
+//          [--seq-scan-min-rows=10000] [--estimate-ratio=10] [--cost-tolerance=0.25]
+//
+// Every query runs under EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) inside a
+// transaction that is always rolled back. A query fails when it
+//   - sequentially scans a large table that the baseline did not already scan,
+//   - mis-estimates a node's row count by more than --estimate-ratio where the
+//     baseline did not, or
+//   - has a total plan cost more than --cost-tolerance above its baseline.
+// Known problems recorded in the baseline are reported as warnings so the
+// check ratchets: it only goes red when something gets worse. A query with no
+// baseline entry is reported as new: its large seq scans and misestimates
+// still fail, but there is no cost to compare against until one is recorded
+// with --update-baseline on the perf:seed dataset.
+import fs from 'fs';
+import path from 'path';
+import { fileURLToPath } from 'url';
+import pool from '../db.js';
+import { hotQueries, fixtureQueries } from './hotQueries.js';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const BASELINE_PATH = path.join(__dirname, 'query-plan-baseline.json');
+
+const args = Object.fromEntries(
+  process.argv.slice(2).map(a => {
+    const [k, v] = a.replace(/^--/, '').split('=');
+    return [k, v === undefined ? true : v];
+  })
+);
+
+const SEQ_SCAN_MIN_ROWS = Number(args['seq-scan-min-rows'] || 10000);
+const ESTIMATE_RATIO = Number(args['estimate-ratio'] || 10);
+const ESTIMATE_MIN_ROWS = 1000; // ignore misestimates on tiny nodes
+const COST_TOLERANCE = Number(args['cost-tolerance'] || 0.25);
+
+const loadBaseline = () => {
+  try {
+    return JSON.parse(fs.readFileSync(BASELINE_PATH, 'utf8'));
+  } catch (err) {
+    if (err.code === 'ENOENT') return {};
+    throw err;
+  }
+};
+
+const resolveFixtures = async (client) => {
+  const one = async (sql, params = []) => {
+    const r = await client.query(sql, params);
+    const row = r.rows[0];
+    return row ? Object.values(row)[0] : null;
+  };
+  const f = {};
+  f.recruiterUserId = await one(fixtureQueries.recruiterUserId);
+  f.recruiterId = await one(fixtureQueries.recruiterId, [f.recruiterUserId]);
+  f.seekerUserId = await one(fixtureQueries.seekerUserId);
+  f.seekerId = await one(fixtureQueries.seekerId, [f.seekerUserId]);
+  f.jobId = await one(fixtureQueries.jobId);
+  f.applicationId = await one(fixtureQueries.applicationId);
+  f.resumeId = await one(fixtureQueries.resumeId, [f.seekerId]);
+  f.seekerEmail = await one(fixtureQueries.seekerEmail, [f.seekerUserId]);
+  return f;
+};
+
+const loadTableSizes = async (client) => {
+  const r = await client.query(
+    `SELECT c.relname, GREATEST(c.reltuples, 0)::bigint AS rows
+     FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+     WHERE c.relkind IN ('r', 'm', 'p') AND n.nspname = 'public'`
+  );
+  return Object.fromEntries(r.rows.map(row => [row.relname, Number(row.rows)]));
+};
+
+// Walk the plan tree and collect the facts the checks care about
+const inspectPlan = (root, tableSizes) => {
+  const seqScans = new Set();
+  const misestimates = new Set();
+
+  const visit = (node) => {
+    const relation = node['Relation Name'];
+    if (/Seq Scan$/.test(node['Node Type']) && relation && (tableSizes[relation] || 0) >= SEQ_SCAN_MIN_ROWS) {
+      seqScans.add(relation);
+    }
+
+    const loops = node['Actual Loops'] || 1;
+    const actual = (node['Actual Rows'] || 0) * loops;
+    const planned = (node['Plan Rows'] || 0) * loops;
+    const hi = Math.max(actual, planned);
+    const lo = Math.max(Math.min(actual, planned), 1);
+    if (hi >= ESTIMATE_MIN_ROWS && hi / lo >= ESTIMATE_RATIO) {
+      misestimates.add(`${node['Node Type']}${relation ? ` on ${relation}` : ''}`);
+    }
+
+    (node.Plans || []).forEach(visit);
+  };
+  visit(root);
+
+  return {
+    totalCost: root['Total Cost'],
+    sharedBlocks: (root['Shared Hit Blocks'] || 0) + (root['Shared Read Blocks'] || 0),
+    seqScans: [...seqScans].sort(),
+    misestimates: [...misestimates].sort(),
+  };
+};
+
+const compare = (result, base) => {
+  const findings = [];
+  const known = (list, item) => Boolean(base && (base[list] || []).includes(item));
+
+  result.seqScans.forEach(rel => {
+    findings.push({ level: known('seqScans', rel) ? 'warn' : 'fail', message: `Seq Scan on large table ${rel}` });
+  });
+  result.misestimates.forEach(node => {
+    findings.push({
+      level: known('misestimates', node) ? 'warn' : 'fail',
+      message: `row estimate off by >=${ESTIMATE_RATIO}x at ${node}`,
+    });
+  });
+  if (base && base.totalCost > 0 && result.totalCost > base.totalCost * (1 + COST_TOLERANCE)) {
+    const pct = Math.round((result.totalCost / base.totalCost - 1) * 100);
+    findings.push({ level: 'fail', message: `plan cost ${base.totalCost.toFixed(0)} -> ${result.totalCost.toFixed(0)} (+${pct}%)` });
+  }
+  if (!base) findings.push({ level: 'new', message: 'no baseline entry, cost not compared' });
+  return findings;
+};
+
+async function checkQueryPlans() {
+  const client = await pool.connect();
+  const baseline = loadBaseline();
+  const nextBaseline = { ...baseline };
+  let failures = 0;
+  const unbaselined = [];
+
+  try {
+    const tableSizes = await loadTableSizes(client);
+    const fixtures = await resolveFixtures(client);
+    const queries = hotQueries.filter(q => !args.only || q.name === args.only);
+
+    console.log(`🔍 Checking ${queries.length} query plans (seq scan threshold ${SEQ_SCAN_MIN_ROWS} rows)\n`);
+
+    for (const q of queries) {
+      const missing = (q.requires || []).filter(t => !(t in tableSizes));
+      if (missing.length > 0) {
+        console.log(`⏭  ${q.name} skipped (missing ${missing.join(', ')})`);
+        continue;
+      }
+
+      let plan;
+      try {
+        await client.query('BEGIN');
+        const r = await client.query(`EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) ${q.sql}`, q.params(fixtures));
+        plan = r.rows[0]['QUERY PLAN'][0];
+      } catch (err) {
+        console.log(`❌ ${q.name} failed to run: ${err.message}`);
+        failures++;
+        continue;
+      } finally {
+        await client.query('ROLLBACK').catch(() => {});
+      }
+
+      const result = inspectPlan(plan.Plan, tableSizes);
+      const findings = compare(result, baseline[q.name]);
+      const failed = findings.some(f => f.level === 'fail');
+      if (failed) failures++;
+
+      if (!baseline[q.name]) unbaselined.push(q.name);
+      const icon = failed ? '❌' : findings.some(f => f.level === 'warn') ? '⚠️ ' : !baseline[q.name] ? '🆕' : '✅';
+      console.log(`${icon} ${q.name}  cost=${result.totalCost.toFixed(0)} buffers=${result.sharedBlocks} time=${plan['Execution Time'].toFixed(1)}ms`);
+      findings.forEach(f => console.log(`     ${f.level.toUpperCase()}: ${f.message}`));
+
+      nextBaseline[q.name] = {
+        source: q.source,
+        totalCost: Math.round(result.totalCost * 100) / 100,
+        seqScans: result.seqScans,
+        misestimates: result.misestimates,
+      };
+    }
+
+    if (unbaselined.length > 0 && !args['update-baseline']) {
+      console.log(`\n🆕 ${unbaselined.length} query(s) have no baseline entry, so plan cost regressions go unchecked for them.`);
+      console.log('   Seed with npm run perf:seed, then run npm run perf:plans:baseline and commit perf/query-plan-baseline.json.');
+    }
+
+    if (args['update-baseline']) {
+      const sorted = Object.fromEntries(Object.keys(nextBaseline).sort().map(k => [k, nextBaseline[k]]));
+      fs.writeFileSync(BASELINE_PATH, JSON.stringify(sorted, null, 2) + '\n');
+      console.log(`\n📝 Baseline written to ${path.relative(process.cwd(), BASELINE_PATH)}`);
+    } else if (failures > 0) {
+      console.log(`\n❌ ${failures} query plan regression(s)`);
+      process.exitCode = 1;
+    } else {
+      console.log('\n✅ No query plan regressions');
+    }
+  } finally {
+    client.release();
+    await pool.end();
+  }
+}
+
+checkQueryPlans().catch(err => {
+  console.error('Query plan check failed:', err);
+  process.exit(1);
+});
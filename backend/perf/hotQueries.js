@@ -0,0 +1,608 @@
+// Registry of hot controller queries checked by perf/check-query-plans.js.
+// Each entry mirrors the SQL a controller sends on a request path. `params`
+// receives the fixture ids resolved from the seeded database, so the same
+// registry works against any seed size. Keep the SQL in sync with the
+// controller when the handler changes.
+
+export const fixtureQueries = {
+  recruiterUserId: `SELECT r.user_id FROM recruiters r
+                    JOIN operates o ON o.recruiter_id = r.recruiter_id
+                    GROUP BY r.user_id ORDER BY COUNT(*) DESC LIMIT 1`,
+  recruiterId: `SELECT recruiter_id FROM recruiters WHERE user_id = $1`,
+  seekerUserId: `SELECT js.user_id FROM job_seekers js
+                 JOIN applications a ON a.seeker_id = js.seeker_id
+                 GROUP BY js.user_id ORDER BY COUNT(*) DESC LIMIT 1`,
+  seekerId: `SELECT seeker_id FROM job_seekers WHERE user_id = $1`,
+  jobId: `SELECT job_id FROM applications GROUP BY job_id ORDER BY COUNT(*) DESC LIMIT 1`,
+  applicationId: `SELECT MAX(application_id) AS application_id FROM applications`,
+  resumeId: `SELECT resume_id FROM resumes WHERE seeker_id = $1 ORDER BY resume_id DESC LIMIT 1`,
+  seekerEmail: `SELECT lower(email) AS email FROM users WHERE user_id = $1`,
+};
+
+// Six-week window around today, as the Schedule / Meetings calendars request
+const monthWindow = () => {
+  const from = new Date(Date.now() - 7 * 24 * 60 * 60 * 1000);
+  const to = new Date(from.getTime() + 42 * 24 * 60 * 60 * 1000);
+  return [from.toISOString(), to.toISOString()];
+};
+
+export const hotQueries = [
+  // routes/authRoutes.js
+  {
+    name: 'auth.loginLookup',
+    source: 'authRoutes POST /login',
+    sql: `SELECT u.*, js.seeker_id, r.recruiter_id FROM users u
+          LEFT JOIN job_seekers js ON u.user_id = js.user_id
+          LEFT JOIN recruiters r ON u.user_id = r.user_id
+          WHERE lower(u.email)=$1 ORDER BY u.user_id LIMIT 1`,
+    params: (f) => [f.seekerEmail],
+  },
+
+  // jobseekerController.js
+  {
+    name: 'jobseeker.getAllJobs',
+    source: 'jobseekerController.getAllJobs',
+    sql: `SELECT j.*, rec.recruiter_name, rec.recruiter_company
+          FROM jobs j
+          LEFT JOIN LATERAL (
+            SELECT u.name AS recruiter_name, r.company AS recruiter_company
+            FROM operates o
+            JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+            LEFT JOIN users u ON r.user_id = u.user_id
+            WHERE o.job_id = j.job_id
+            LIMIT 1
+          ) rec ON true
+          WHERE 1=1
+          ORDER BY j.created_at DESC, j.job_id DESC`,
+    params: () => [],
+  },
+  {
+    name: 'jobseeker.getAllJobs.page',
+    source: 'jobseekerController.getAllJobs (?limit=&cursor=)',
+    sql: `SELECT j.*, rec.recruiter_name, rec.recruiter_company,
+                 ARRAY[j.created_at::text, j.job_id::text] AS _cursor
+          FROM jobs j
+          LEFT JOIN LATERAL (
+            SELECT u.name AS recruiter_name, r.company AS recruiter_company
+            FROM operates o
+            JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+            LEFT JOIN users u ON r.user_id = u.user_id
+            WHERE o.job_id = j.job_id
+            LIMIT 1
+          ) rec ON true
+          WHERE 1=1 AND (j.created_at, j.job_id) < ($1::timestamp, $2::int)
+          ORDER BY j.created_at DESC, j.job_id DESC
+          LIMIT $3`,
+    params: () => [new Date(Date.now() - 30 * 24 * 60 * 60 * 1000).toISOString(), 2147483647, 51],
+  },
+  {
+    name: 'jobseeker.getAllJobs.fields',
+    source: 'jobseekerController.getAllJobs (?fields= as sent by the Jobs page)',
+    sql: `SELECT j.job_id AS job_id, j.title AS title, j.company AS company, j.location AS location,
+                 j.salary AS salary, j.job_type AS job_type, j.created_at AS created_at,
+                 j.job_description AS job_description, j.skills_required AS skills_required,
+                 j.application_count AS application_count,
+                 ARRAY[j.created_at::text, j.job_id::text] AS _cursor
+          FROM jobs j
+          WHERE 1=1 AND (j.created_at, j.job_id) < ($1::timestamp, $2::int)
+          ORDER BY j.created_at DESC, j.job_id DESC
+          LIMIT $3`,
+    params: () => [new Date(Date.now() - 30 * 24 * 60 * 60 * 1000).toISOString(), 2147483647, 51],
+  },
+  {
+    name: 'jobseeker.getAllJobs.search',
+    source: 'jobseekerController.getAllJobs',
+    sql: `SELECT j.*, rec.recruiter_name, rec.recruiter_company
+          FROM jobs j
+          LEFT JOIN LATERAL (
+            SELECT u.name AS recruiter_name, r.company AS recruiter_company
+            FROM operates o
+            JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+            LEFT JOIN users u ON r.user_id = u.user_id
+            WHERE o.job_id = j.job_id
+            LIMIT 1
+          ) rec ON true
+          WHERE 1=1 AND (j.title ILIKE $1 OR j.job_description ILIKE $1 OR j.company ILIKE $1)
+          ORDER BY j.created_at DESC, j.job_id DESC`,
+    params: () => ['%engineer%'],
+  },
+  {
+    name: 'jobseeker.applyForJob',
+    source: 'jobseekerController.applyForJob',
+    sql: `WITH seeker AS (
+            SELECT seeker_id FROM job_seekers WHERE user_id = $1
+          ),
+          resume AS (
+            SELECT r.resume_id FROM resumes r JOIN seeker s ON r.seeker_id = s.seeker_id
+            WHERE $3::int IS NULL OR r.resume_id = $3
+            ORDER BY r.is_primary DESC NULLS LAST, r.created_at DESC
+            LIMIT 1
+          ),
+          inserted AS (
+            INSERT INTO applications (seeker_id, job_id, resume_id, status, star)
+            SELECT s.seeker_id, $2, r.resume_id, 'applied', true FROM seeker s, resume r
+            ON CONFLICT (seeker_id, job_id) DO UPDATE
+              SET status = 'applied', resume_id = EXCLUDED.resume_id, applied_timestamp = NOW()
+              WHERE applications.status = 'saved'
+            RETURNING *, (xmax = 0) AS created
+          )
+          SELECT s.seeker_id AS resolved_seeker_id, r.resume_id AS resolved_resume_id, i.*
+          FROM (SELECT 1) one
+          LEFT JOIN seeker s ON true
+          LEFT JOIN resume r ON true
+          LEFT JOIN inserted i ON true`,
+    params: (f) => [f.seekerUserId, f.jobId, null],
+  },
+  {
+    name: 'jobseeker.seekerByUser',
+    source: 'jobseekerController (every handler)',
+    sql: 'SELECT seeker_id FROM job_seekers WHERE user_id = $1',
+    params: (f) => [f.seekerUserId],
+  },
+  {
+    name: 'jobseeker.getMyApplications',
+    source: 'jobseekerController.getMyApplications',
+    sql: `SELECT a.*, j.title, j.company, j.salary, j.job_description,
+                 u.name as recruiter_name, r.company as recruiter_company
+          FROM applications a
+          JOIN jobs j ON a.job_id = j.job_id
+          LEFT JOIN operates o ON j.job_id = o.job_id
+          LEFT JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+          LEFT JOIN users u ON r.user_id = u.user_id
+          WHERE a.seeker_id = $1
+          ORDER BY a.applied_timestamp DESC`,
+    params: (f) => [f.seekerId],
+  },
+  {
+    name: 'jobseeker.getSavedJobs',
+    source: 'jobseekerController.getSavedJobs',
+    sql: `SELECT j.*, a.star, a.applied_timestamp as saved_at
+          FROM jobs j
+          JOIN applications a ON j.job_id = a.job_id
+          WHERE a.seeker_id = $1 AND a.star = true
+          ORDER BY a.applied_timestamp DESC`,
+    params: (f) => [f.seekerId],
+  },
+  {
+    name: 'jobseeker.getInterviews',
+    source: 'jobseekerController.getInterviews',
+    sql: `SELECT i.*, j.title as job_title, j.company, u.name as recruiter_name, u.email as recruiter_email
+          FROM interviews i
+          JOIN jobs j ON i.job_id = j.job_id
+          JOIN recruiters r ON i.recruiter_id = r.recruiter_id
+          JOIN users u ON r.user_id = u.user_id
+          WHERE i.seeker_id = $1 AND i.schedule >= $2 AND i.schedule < $3
+          ORDER BY i.schedule DESC`,
+    params: (f) => [f.seekerId, ...monthWindow()],
+  },
+  {
+    name: 'jobseeker.getJobseekerStats',
+    source: 'jobseekerController.getJobseekerStats',
+    sql: `SELECT js.seeker_id, s.applied_jobs, s.interviews_scheduled, s.profile_views
+          FROM job_seekers js
+          LEFT JOIN seeker_stats s ON s.seeker_id = js.seeker_id
+          WHERE js.user_id = $1`,
+    params: (f) => [f.seekerUserId],
+    requires: ['seeker_stats'],
+  },
+  {
+    name: 'jobseeker.listResumes',
+    source: 'jobseekerController.listResumes',
+    sql: `SELECT resume_id, title, file_name, file_size, file_type, is_primary, created_at,
+                 statement_profile, linkedin_url, github_url,
+                 CASE WHEN file_data IS NOT NULL THEN 'uploaded' ELSE 'manual' END as type
+          FROM resumes WHERE seeker_id = $1
+          ORDER BY is_primary DESC, resume_id DESC`,
+    params: (f) => [f.seekerId],
+  },
+  {
+    name: 'jobseeker.getResume.experiences',
+    source: 'jobseekerController.getResume',
+    sql: 'SELECT * FROM experiences WHERE resume_id = $1 ORDER BY experience_id DESC',
+    params: (f) => [f.resumeId],
+  },
+
+  // recruiterController.js
+  {
+    name: 'recruiter.getRecruiterStats',
+    source: 'recruiterController.getRecruiterStats',
+    sql: `SELECT r.recruiter_id, s.total_jobs, s.active_jobs, s.total_applications, s.total_views,
+                 s.new_applications, s.scheduled_interviews, s.hired_candidates
+          FROM recruiters r
+          LEFT JOIN recruiter_stats s ON s.recruiter_id = r.recruiter_id
+          WHERE r.user_id = $1`,
+    params: (f) => [f.recruiterUserId],
+    requires: ['recruiter_stats'],
+  },
+  {
+    name: 'recruiter.getMyJobs',
+    source: 'recruiterController.getMyJobs',
+    sql: `WITH rec_jobs AS (
+            SELECT job_id, MIN(created_at) AS first_created
+            FROM operates
+            WHERE recruiter_id = $1
+            GROUP BY job_id
+          )
+          SELECT j.*, rj.first_created AS posted_at
+          FROM jobs j
+          JOIN rec_jobs rj ON j.job_id = rj.job_id
+          ORDER BY rj.first_created DESC`,
+    params: (f) => [f.recruiterId],
+  },
+  {
+    name: 'recruiter.jobOwnership',
+    source: 'recruiterController (getApplicants, updateJobStatus, deleteJob)',
+    sql: `SELECT j.*, r.recruiter_id FROM jobs j
+          JOIN operates o ON j.job_id = o.job_id
+          JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+          WHERE j.job_id = $1 AND r.user_id = $2`,
+    params: (f) => [f.jobId, f.recruiterUserId],
+  },
+  {
+    name: 'recruiter.getApplicants',
+    source: 'recruiterController.getApplicants',
+    sql: `SELECT a.*, js.*, u.name, u.email, u.phone_no,
+                 r.resume_id, r.title as resume_title, r.statement_profile,
+                 r.linkedin_url, r.github_url, r.file_name, r.file_size, r.file_type,
+                 CASE WHEN r.file_data IS NOT NULL THEN 'uploaded' ELSE 'manual' END as resume_type
+          FROM applications a
+          JOIN job_seekers js ON a.seeker_id = js.seeker_id
+          JOIN users u ON js.user_id = u.user_id
+          LEFT JOIN resumes r ON a.resume_id = r.resume_id
+          WHERE a.job_id = $1
+          ORDER BY a.applied_timestamp DESC, a.application_id DESC`,
+    params: (f) => [f.jobId],
+  },
+  {
+    name: 'recruiter.getApplicants.statusCounts',
+    source: 'recruiterController.getApplicants (first page)',
+    sql: 'SELECT status, COUNT(*)::int AS count FROM applications WHERE job_id = $1 GROUP BY status',
+    params: (f) => [f.jobId],
+  },
+  {
+    name: 'recruiter.getApplicants.page',
+    source: 'recruiterController.getApplicants (?limit=&cursor=)',
+    sql: `SELECT a.*, js.*, u.name, u.email, u.phone_no,
+                 r.resume_id, r.title as resume_title, r.statement_profile,
+                 r.linkedin_url, r.github_url, r.file_name, r.file_size, r.file_type,
+                 CASE WHEN r.file_data IS NOT NULL THEN 'uploaded' ELSE 'manual' END as resume_type,
+                 ARRAY[a.applied_timestamp::text, a.application_id::text] AS _cursor
+          FROM applications a
+          JOIN job_seekers js ON a.seeker_id = js.seeker_id
+          JOIN users u ON js.user_id = u.user_id
+          LEFT JOIN resumes r ON a.resume_id = r.resume_id
+          WHERE a.job_id = $1 AND (a.applied_timestamp, a.application_id) < ($2::timestamp, $3::int)
+          ORDER BY a.applied_timestamp DESC, a.application_id DESC
+          LIMIT $4`,
+    params: (f) => [f.jobId, new Date().toISOString(), 2147483647, 51],
+  },
+  {
+    name: 'recruiter.getApplicants.fields',
+    source: 'recruiterController.getApplicants (?fields= as sent by the Applicants page)',
+    sql: `SELECT a.application_id AS application_id, a.seeker_id AS seeker_id, a.job_id AS job_id,
+                 a.status AS status, a.star AS star, a.applied_timestamp AS applied_timestamp,
+                 js.address AS address, u.name AS name, u.email AS email, u.phone_no AS phone_no,
+                 ARRAY[a.applied_timestamp::text, a.application_id::text] AS _cursor
+          FROM applications a
+          JOIN job_seekers js ON a.seeker_id = js.seeker_id
+          JOIN users u ON js.user_id = u.user_id
+          WHERE a.job_id = $1 AND (a.applied_timestamp, a.application_id) < ($2::timestamp, $3::int)
+          ORDER BY a.applied_timestamp DESC, a.application_id DESC
+          LIMIT $4`,
+    params: (f) => [f.jobId, new Date().toISOString(), 2147483647, 51],
+  },
+  {
+    name: 'recruiter.exportApplicants',
+    source: 'recruiterController.exportApplicants (cursor query)',
+    sql: `SELECT a.application_id, a.status, a.applied_timestamp,
+                 u.name, u.email, u.phone_no, js.nationality,
+                 r.resume_id, r.title as resume_title, r.linkedin_url, r.github_url,
+                 CASE WHEN r.file_data IS NOT NULL THEN 'uploaded' ELSE 'manual' END as resume_type
+          FROM applications a
+          JOIN job_seekers js ON a.seeker_id = js.seeker_id
+          JOIN users u ON js.user_id = u.user_id
+          LEFT JOIN resumes r ON a.resume_id = r.resume_id
+          WHERE a.job_id = $1
+          ORDER BY a.applied_timestamp DESC, a.application_id DESC`,
+    params: (f) => [f.jobId],
+  },
+  {
+    name: 'recruiter.applicationOwnership',
+    source: 'recruiterController (updateApplicationStatus, scheduleInterview, reviews)',
+    sql: `SELECT a.* FROM applications a
+          JOIN jobs j ON a.job_id = j.job_id
+          JOIN operates o ON j.job_id = o.job_id
+          JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+          WHERE a.application_id = $1 AND r.user_id = $2`,
+    params: (f) => [f.applicationId, f.recruiterUserId],
+  },
+  {
+    name: 'recruiter.bulkApplicationOwnership',
+    source: 'recruiterController (bulkScheduleInterviews, bulkSendEmails)',
+    sql: `SELECT DISTINCT ON (a.application_id)
+                 a.application_id, a.seeker_id, a.job_id, r.recruiter_id, u.email AS seeker_email
+          FROM applications a
+          JOIN operates o ON a.job_id = o.job_id
+          JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+          JOIN job_seekers js ON a.seeker_id = js.seeker_id
+          JOIN users u ON js.user_id = u.user_id
+          WHERE a.application_id = ANY($1::int[]) AND r.user_id = $2
+          ORDER BY a.application_id`,
+    params: (f) => [[f.applicationId, f.applicationId - 1, f.applicationId - 2], f.recruiterUserId],
+  },
+  {
+    name: 'recruiter.getMyInterviews',
+    source: 'recruiterController.getMyInterviews',
+    sql: `SELECT i.*, j.title as job_title, j.company,
+                 u.name as seeker_name, u.email as seeker_email
+          FROM interviews i
+          JOIN jobs j ON i.job_id = j.job_id
+          JOIN job_seekers js ON i.seeker_id = js.seeker_id
+          JOIN users u ON js.user_id = u.user_id
+          WHERE i.recruiter_id = $1 AND i.schedule >= $2 AND i.schedule < $3
+          ORDER BY i.schedule DESC NULLS LAST, i.created_at DESC`,
+    params: (f) => [f.recruiterId, ...monthWindow()],
+  },
+  {
+    name: 'recruiter.getFreeSlots',
+    source: 'interviewCalendar.findFreeSlots',
+    sql: `SELECT s.start, s.start + make_interval(mins => $4) AS "end"
+          FROM generate_series($2::timestamp, $3::timestamp - make_interval(mins => $4), make_interval(mins => $5)) AS s(start)
+          WHERE NOT EXISTS (
+            SELECT 1 FROM interviews i
+            WHERE (i.recruiter_id = $1 OR i.seeker_id = $6)
+              AND i.slot && tsrange(s.start, s.start + make_interval(mins => $4), '[)')
+              AND COALESCE(i.status, 'scheduled') <> ALL($7::text[])
+          )
+          ORDER BY s.start`,
+    params: (f) => [f.recruiterId, ...monthWindow(), 60, 30, f.seekerId, ['cancelled', 'completed', 'declined']],
+  },
+  {
+    name: 'recruiter.getRecentApplications',
+    source: 'recruiterController.getRecentApplications',
+    sql: `SELECT a.*, j.title as job_title, j.company, u.name as seeker_name, u.email as seeker_email
+          FROM applications a
+          JOIN jobs j ON a.job_id = j.job_id
+          JOIN operates o ON j.job_id = o.job_id
+          JOIN job_seekers js ON a.seeker_id = js.seeker_id
+          JOIN users u ON js.user_id = u.user_id
+          WHERE o.recruiter_id = $1 AND a.applied_timestamp >= NOW() - INTERVAL '30 days'
+          ORDER BY a.applied_timestamp DESC LIMIT 100`,
+    params: (f) => [f.recruiterId],
+  },
+  {
+    name: 'recruiter.getSentEmails',
+    source: 'recruiterController.getSentEmails',
+    sql: `SELECT id, to_email, subject, body_preview, sent_at, application_id
+          FROM email_logs WHERE sender_user_id = $1 ORDER BY sent_at DESC LIMIT 500`,
+    params: (f) => [f.recruiterUserId],
+  },
+
+  // adminController.js
+  {
+    name: 'admin.getAllUsers',
+    source: 'adminController.getAllUsers',
+    sql: `SELECT u.*,
+                 CASE WHEN u.role = 'recruiter' THEN r.company ELSE NULL END as company,
+                 CASE WHEN u.role = 'recruiter' THEN r.designation ELSE NULL END as designation
+          FROM users u
+          LEFT JOIN recruiters r ON u.user_id = r.user_id
+          WHERE 1=1
+          ORDER BY u.created_at DESC, u.user_id DESC LIMIT $1 OFFSET $2`,
+    params: () => [10, 0],
+  },
+  {
+    name: 'admin.getAllUsers.page',
+    source: 'adminController.getAllUsers (?cursor=)',
+    sql: `SELECT u.*,
+                 CASE WHEN u.role = 'recruiter' THEN r.company ELSE NULL END as company,
+                 CASE WHEN u.role = 'recruiter' THEN r.designation ELSE NULL END as designation,
+                 ARRAY[u.created_at::text, u.user_id::text] AS _cursor
+          FROM users u
+          LEFT JOIN recruiters r ON u.user_id = r.user_id
+          WHERE 1=1 AND (u.created_at, u.user_id) < ($1::timestamp, $2::int)
+          ORDER BY u.created_at DESC, u.user_id DESC LIMIT $3`,
+    params: () => [new Date().toISOString(), 2147483647, 51],
+  },
+  {
+    name: 'admin.getAllJobs',
+    source: 'adminController.getAllJobs',
+    sql: `SELECT j.*, rec.recruiter_name, rec.recruiter_company
+          FROM jobs j
+          LEFT JOIN LATERAL (
+            SELECT u.name AS recruiter_name, r.company AS recruiter_company
+            FROM operates o
+            JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+            LEFT JOIN users u ON r.user_id = u.user_id
+            WHERE o.job_id = j.job_id
+            LIMIT 1
+          ) rec ON true
+          WHERE 1=1
+          ORDER BY j.created_at DESC
+          LIMIT $1 OFFSET $2`,
+    params: () => [10, 0],
+  },
+  {
+    name: 'admin.getAllApplications',
+    source: 'adminController.getAllApplications',
+    sql: `SELECT a.*,
+                 j.title as job_title, j.company as job_company,
+                 u.name as seeker_name, u.email as seeker_email,
+                 ru.name as recruiter_name, r.company as recruiter_company
+          FROM applications a
+          JOIN jobs j ON a.job_id = j.job_id
+          JOIN job_seekers js ON a.seeker_id = js.seeker_id
+          JOIN users u ON js.user_id = u.user_id
+          LEFT JOIN operates o ON j.job_id = o.job_id
+          LEFT JOIN recruiters r ON o.recruiter_id = r.recruiter_id
+          LEFT JOIN users ru ON r.user_id = ru.user_id
+          WHERE 1=1
+          ORDER BY a.applied_timestamp DESC LIMIT $1 OFFSET $2`,
+    params: () => [10, 0],
+  },
+  {
+    name: 'admin.getSystemLogs',
+    source: 'adminController.getSystemLogs',
+    sql: `SELECT sl.*,
+                 u.name as actor_name,
+                 CASE WHEN sl.actor_type = 'recruiter' THEN r.company ELSE NULL END as company
+          FROM system_logs sl
+          LEFT JOIN users u ON sl.actor_id = u.user_id
+          LEFT JOIN recruiters r ON sl.actor_id = r.user_id AND sl.actor_type = 'recruiter'
+          WHERE 1=1
+          ORDER BY sl.timestamp DESC, sl.log_id DESC LIMIT $1 OFFSET $2`,
+    params: () => [10, 0],
+  },
+  {
+    name: 'admin.getSystemLogs.page',
+    source: 'adminController.getSystemLogs (?cursor=)',
+    sql: `SELECT sl.*,
+                 u.name as actor_name,
+                 CASE WHEN sl.actor_type = 'recruiter' THEN r.company ELSE NULL END as company,
+                 ARRAY[sl.timestamp::text, sl.log_id::text] AS _cursor
+          FROM system_logs sl
+          LEFT JOIN users u ON sl.actor_id = u.user_id
+          LEFT JOIN recruiters r ON sl.actor_id = r.user_id AND sl.actor_type = 'recruiter'
+          WHERE 1=1 AND (sl.timestamp, sl.log_id) < ($1::timestamp, $2::int)
+          ORDER BY sl.timestamp DESC, sl.log_id DESC LIMIT $3`,
+    params: () => [new Date(Date.now() - 24 * 60 * 60 * 1000).toISOString(), 2147483647, 51],
+  },
+  {
+    name: 'admin.getDuplicateUsers',
+    source: 'adminController.getDuplicateUsers',
+    sql: `SELECT email, COUNT(*) as count,
+                 ARRAY_AGG(user_id) as user_ids,
+                 ARRAY_AGG(name) as names
+          FROM users
+          GROUP BY email
+          HAVING COUNT(*) > 1
+          ORDER BY count DESC`,
+    params: () => [],
+  },
+
+  // atsController.js / services/atsCache.js (memoized analysis)
+  {
+    name: 'ats.resolveDefaultResume',
+    source: 'atsController.analyzeResume',
+    sql: `SELECT r.resume_id, r.content_version AS content_version
+          FROM job_seekers js
+          LEFT JOIN LATERAL (
+            SELECT * FROM resumes WHERE seeker_id = js.seeker_id
+            ORDER BY is_primary DESC NULLS LAST, created_at DESC
+            LIMIT 1
+          ) r ON true
+          WHERE js.user_id = $1`,
+    params: (f) => [f.seekerUserId],
+  },
+  {
+    name: 'ats.cacheLookup',
+    source: 'atsCache.getCachedAnalysis',
+    sql: `SELECT analysis_data FROM ats_analysis_history WHERE cache_key = $1`,
+    params: () => ['0'.repeat(64)],
+    requires: ['ats_analysis_history'],
+  },
+
+  // services/statsCounters.js (targeted rebuild on first read and after job deletion)
+  {
+    name: 'stats.reconcileRecruiter',
+    source: 'statsCounters.reconcileRecruiterStats',
+    sql: `SELECT r.recruiter_id,
+                 COUNT(j.job_id)::int,
+                 COUNT(j.job_id) FILTER (WHERE j.status = 'active')::int,
+                 COALESCE(SUM(ja.total), 0)::int,
+                 COALESCE(SUM(j.view_count), 0)::bigint,
+                 COALESCE(SUM(ja.recent), 0)::int,
+                 (SELECT COUNT(*) FROM interviews i
+                  WHERE i.recruiter_id = r.recruiter_id AND i.schedule >= NOW() AT TIME ZONE 'UTC')::int,
+                 COALESCE(SUM(ja.hired), 0)::int
+          FROM recruiters r
+          LEFT JOIN (SELECT DISTINCT recruiter_id, job_id FROM operates) o ON o.recruiter_id = r.recruiter_id
+          LEFT JOIN jobs j ON j.job_id = o.job_id
+          LEFT JOIN LATERAL (
+            SELECT COUNT(*) AS total,
+                   COUNT(*) FILTER (WHERE a.applied_timestamp >= NOW() - INTERVAL '7 days') AS recent,
+                   COUNT(*) FILTER (WHERE a.status = ANY($2::text[])
+                                      AND a.applied_timestamp >= NOW() - INTERVAL '30 days') AS hired
+            FROM applications a WHERE a.job_id = j.job_id
+          ) ja ON true
+          WHERE r.recruiter_id = ANY($1::int[])
+          GROUP BY r.recruiter_id`,
+    params: (f) => [[f.recruiterId], ['hired', 'accepted']],
+  },
+  {
+    name: 'stats.reconcileSeeker',
+    source: 'statsCounters.reconcileSeekerStats',
+    sql: `SELECT js.seeker_id,
+                 (SELECT COUNT(*) FROM applications a WHERE a.seeker_id = js.seeker_id)::int,
+                 (SELECT COUNT(*) FROM interviews i
+                  WHERE i.seeker_id = js.seeker_id AND i.schedule >= NOW() AT TIME ZONE 'UTC')::int,
+                 (SELECT COUNT(DISTINCT pv.viewer_id) FROM profile_views pv WHERE pv.viewed_user_id = js.user_id)::int
+          FROM job_seekers js
+          WHERE js.seeker_id = ANY($1::int[])`,
+    params: (f) => [[f.seekerId]],
+    requires: ['profile_views'],
+  },
+
+  // viewsController.js
+  {
+    name: 'views.recordView.recentCheck',
+    source: 'viewsController.recordView',
+    sql: `SELECT view_id FROM views
+          WHERE viewed_entity_type = $1
+          AND viewed_entity_id = $2
+          AND (viewer_user_id = $3 OR session_id = $4)
+          AND view_timestamp > NOW() - INTERVAL '5 minutes'`,
+    params: (f) => ['job', f.jobId, f.seekerUserId, 'perf-session'],
+    requires: ['views'],
+  },
+  {
+    name: 'views.getViewStats',
+    source: 'viewsController.getViewStats',
+    sql: `SELECT COUNT(*) as total_views,
+                 COUNT(DISTINCT viewer_user_id) as unique_users,
+                 COUNT(DISTINCT session_id) as unique_sessions,
+                 COUNT(DISTINCT DATE(view_timestamp)) as active_days,
+                 MAX(view_timestamp) as last_view,
+                 MIN(view_timestamp) as first_view
+          FROM views
+          WHERE viewed_entity_type = $1
+          AND viewed_entity_id = $2
+          AND view_timestamp >= NOW() - INTERVAL '30 days'`,
+    params: (f) => ['job', f.jobId],
+    requires: ['views'],
+  },
+  {
+    name: 'views.getTrendingEntities',
+    source: 'viewsController.getTrendingEntities',
+    sql: `SELECT viewed_entity_id,
+                 COUNT(*) as view_count,
+                 COUNT(DISTINCT viewer_user_id) as unique_users,
+                 COUNT(DISTINCT session_id) as unique_sessions,
+                 MAX(view_timestamp) as latest_view
+          FROM views
+          WHERE view_timestamp >= NOW() - INTERVAL '7 days'
+          AND viewed_entity_type = $1
+          GROUP BY viewed_entity_type, viewed_entity_id
+          ORDER BY view_count DESC, unique_users DESC
+          LIMIT $2`,
+    params: () => ['job', 10],
+    requires: ['views'],
+  },
+  {
+    name: 'views.getAnalyticsDashboard.daily',
+    source: 'viewsController.getAnalyticsDashboard',
+    sql: `SELECT DATE(view_timestamp) as date,
+                 COUNT(*) as total_views,
+                 COUNT(DISTINCT viewer_user_id) as unique_users,
+                 COUNT(DISTINCT session_id) as unique_sessions
+          FROM views
+          WHERE view_timestamp >= NOW() - INTERVAL '30 days'
+          GROUP BY DATE(view_timestamp)
+          ORDER BY date DESC
+          LIMIT 30`,
+    params: () => [],
+    requires: ['views'],
+  },
+];
+
+export default hotQueries;
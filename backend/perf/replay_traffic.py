@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""Replay captured API traffic against a local server and compare builds.
+
+Usage:
+  python perf/replay_traffic.py summary capture.ndjson
+  python perf/replay_traffic.py replay capture.ndjson --out before.json
+      [--base-url http://localhost:5000] [--speed 1] [--concurrency 20]
+      [--login job_seeker=EMAIL:PASSWORD] [--token recruiter=JWT]
+      [--writes] [--route REGEX] [--limit N] [--timeout 30] [--label NAME]
+  python perf/replay_traffic.py diff before.json after.json
+      [--min-count 20] [--threshold 10] [--fail]
+
+The capture comes from middleware/trafficCapture.js (TRAFFIC_CAPTURE_FILE).
+Requests are sent in capture order with their original inter-arrival times,
+divided by --speed, by at most --concurrency workers; a request whose worker
+is busy starts late and the delay is reported as scheduling lag. Placeholder
+strings and body shapes are filled in the same way on every run, so two
+replays of one capture send identical requests.
+
+Authenticated requests need a token for the caller's role (job_seeker,
+recruiter, admin): pass one with --token or have the tool log in with --login.
+Requests for a role without a token are skipped. Only GET requests are
+replayed unless --writes is given; writes change the target database, so run
+them against a disposable copy.
+
+Standard library only.
+"""
+
+import argparse
+import http.client
+import json
+import re
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlsplit
+
+READ_METHODS = {"GET", "HEAD"}
+LOGIN_PATHS = {"admin": "/api/admin/auth/login"}
+DEFAULT_LOGIN_PATH = "/api/auth/login"
+
+
+# ---------------------------------------------------------------------------
+# Capture log
+
+
+def load_capture(path):
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                print(f"{path}:{line_no}: skipping malformed line", file=sys.stderr)
+                continue
+            if entry.get("r"):
+                entries.append(entry)
+    # Lines are written when responses finish; replay in arrival order
+    entries.sort(key=lambda e: e["t"])
+    return entries
+
+
+def route_key(entry):
+    return f'{entry["m"]} {entry["r"]}'
+
+
+def fill_path(entry):
+    params = entry.get("p") or {}
+    return re.sub(r":(\w+)", lambda m: str(params.get(m.group(1), "0")), entry["r"])
+
+
+def fill_body(shape):
+    """Turn a captured body shape back into a request body."""
+    if isinstance(shape, str):
+        if shape.startswith("s:"):
+            return "x" * int(shape[2:])
+        if shape == "n":
+            return 1
+        if shape == "...":
+            return None
+        return shape
+    if isinstance(shape, dict):
+        if "$a" in shape:
+            return [fill_body(shape["of"]) for _ in range(shape["$a"])]
+        return {key: fill_body(value) for key, value in shape.items()}
+    return shape
+
+
+# ---------------------------------------------------------------------------
+# Statistics
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def route_stats(samples):
+    """samples: iterable of (route, status, ms) -> {route: stats}."""
+    by_route = {}
+    for route, status, ms in samples:
+        by_route.setdefault(route, []).append((status, ms))
+    stats = {}
+    for route, rows in by_route.items():
+        times = sorted(ms for _, ms in rows)
+        stats[route] = {
+            "count": len(rows),
+            "errors": sum(1 for status, _ in rows if status == 0 or status >= 500),
+            "p50": percentile(times, 50),
+            "p95": percentile(times, 95),
+            "p99": percentile(times, 99),
+        }
+    return stats
+
+
+def fmt_ms(value):
+    return "-" if value is None else f"{value:.1f}"
+
+
+def print_stats(stats, total):
+    width = max([len(r) for r in stats] + [5])
+    print(f'{"route".ljust(width)}  {"count":>7}  {"share":>6}  {"p50":>8}  {"p95":>8}  {"p99":>8}  {"5xx":>5}')
+    for route, s in sorted(stats.items(), key=lambda item: -item[1]["count"]):
+        print(
+            f'{route.ljust(width)}  {s["count"]:>7}  {s["count"] * 100 / total:>5.1f}%  '
+            f'{fmt_ms(s["p50"]):>8}  {fmt_ms(s["p95"]):>8}  {fmt_ms(s["p99"]):>8}  {s["errors"]:>5}'
+        )
+
+
+def cmd_summary(args):
+    entries = load_capture(args.capture)
+    if not entries:
+        print("No requests in capture")
+        return 0
+    span_s = (entries[-1]["t"] - entries[0]["t"]) / 1000
+    print(f"{len(entries)} requests over {span_s:.0f} s ({len(entries) / max(span_s, 1):.1f} req/s), as captured:")
+    print_stats(route_stats((route_key(e), e["s"], e["d"]) for e in entries), len(entries))
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Replay
+
+
+class Target:
+    """One keep-alive connection per worker thread."""
+
+    def __init__(self, base_url, timeout):
+        parts = urlsplit(base_url)
+        self.https = parts.scheme == "https"
+        self.host = parts.hostname
+        self.port = parts.port
+        self.timeout = timeout
+        self.local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            conn = cls(self.host, self.port, timeout=self.timeout)
+            conn.connect()
+            # Small requests would otherwise wait on Nagle + delayed ACK (~40 ms)
+            conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.local.conn = conn
+        return conn
+
+    def request(self, method, path, body=None, token=None):
+        headers = {}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        for attempt in (1, 2):
+            conn = self._connection()
+            try:
+                conn.request(method, path, body=payload, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+                return response.status, data
+            except (http.client.HTTPException, ConnectionError):
+                # The server closed an idle keep-alive connection; reconnect once
+                conn.close()
+                self.local.conn = None
+                if attempt == 2:
+                    raise
+
+
+def login(target, role, credentials):
+    email, _, password = credentials.partition(":")
+    status, data = target.request(
+        "POST", LOGIN_PATHS.get(role, DEFAULT_LOGIN_PATH), {"email": email, "password": password}
+    )
+    if status != 200:
+        raise SystemExit(f"Login as {role} failed ({status}): {data[:200].decode(errors='replace')}")
+    return json.loads(data)["token"]
+
+
+def parse_pairs(values, name):
+    pairs = {}
+    for value in values or []:
+        role, sep, rest = value.partition("=")
+        if not sep:
+            raise SystemExit(f"--{name} expects ROLE=VALUE, got {value!r}")
+        pairs[role] = rest
+    return pairs
+
+
+def cmd_replay(args):
+    entries = load_capture(args.capture)
+    route_filter = re.compile(args.route) if args.route else None
+    skipped = {}
+
+    def skip(reason):
+        skipped[reason] = skipped.get(reason, 0) + 1
+
+    target = Target(args.base_url, args.timeout)
+    tokens = parse_pairs(args.token, "token")
+    for role, credentials in parse_pairs(args.login, "login").items():
+        tokens[role] = login(target, role, credentials)
+
+    plan = []
+    for entry in entries:
+        if entry["m"] not in READ_METHODS and not args.writes:
+            skip("write (use --writes)")
+        elif route_filter and not route_filter.search(entry["r"]):
+            skip("route filter")
+        elif entry.get("a") and entry["a"] not in tokens:
+            skip(f'no token for {entry["a"]}')
+        else:
+            plan.append(entry)
+    if args.limit:
+        plan = plan[: args.limit]
+    if not plan:
+        print("Nothing to replay", skipped)
+        return 1
+
+    results = []
+    lock = threading.Lock()
+    t0 = plan[0]["t"]
+
+    def send(entry, due):
+        started = time.perf_counter()
+        path = fill_path(entry)
+        if entry.get("q"):
+            path += "?" + urlencode(entry["q"], doseq=True)
+        body = fill_body(entry["b"]) if entry.get("b") is not None and entry["m"] not in READ_METHODS else None
+        try:
+            status, _ = target.request(entry["m"], path, body, tokens.get(entry.get("a")))
+        except (OSError, http.client.HTTPException):
+            status = 0
+        finished = time.perf_counter()
+        with lock:
+            results.append([
+                route_key(entry),
+                status,
+                round((finished - started) * 1000, 2),
+                round(max(0.0, started - due) * 1000, 2),
+            ])
+
+    print(f"Replaying {len(plan)} requests at {args.speed}x with {args.concurrency} workers against {args.base_url}")
+    started_at = time.time()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as workers:
+        for entry in plan:
+            due = start + (entry["t"] - t0) / 1000 / args.speed
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            workers.submit(send, entry, due)
+    elapsed = time.perf_counter() - start
+
+    run = {
+        "label": args.label or args.out,
+        "capture": args.capture,
+        "base_url": args.base_url,
+        "speed": args.speed,
+        "concurrency": args.concurrency,
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started_at)),
+        "elapsed_s": round(elapsed, 2),
+        "skipped": skipped,
+        # [route, status, ms, scheduling lag ms]
+        "requests": results,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(run, f)
+
+    lags = sorted(r[3] for r in results)
+    print(f"Done in {elapsed:.1f} s; scheduling lag p95 {fmt_ms(percentile(lags, 95))} ms; skipped {skipped or 'none'}")
+    print_stats(route_stats((r[0], r[1], r[2]) for r in results), len(results))
+    print(f"Results written to {args.out}")
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Diff
+
+
+def load_run(path):
+    with open(path, encoding="utf-8") as f:
+        run = json.load(f)
+    return run, route_stats((r[0], r[1], r[2]) for r in run["requests"])
+
+
+def change(before, after):
+    if before is None or after is None or before == 0:
+        return None
+    return (after - before) * 100 / before
+
+
+def cmd_diff(args):
+    base_run, base = load_run(args.base)
+    cand_run, cand = load_run(args.candidate)
+    if base_run.get("capture") != cand_run.get("capture"):
+        print(f'warning: runs replayed different captures ({base_run.get("capture")} vs {cand_run.get("capture")})')
+
+    rows = []
+    for route in sorted(set(base) | set(cand)):
+        b, c = base.get(route), cand.get(route)
+        if not b or not c:
+            rows.append((route, b, c, None, None))
+            continue
+        rows.append((route, b, c, change(b["p50"], c["p50"]), change(b["p95"], c["p95"])))
+    # Biggest p95 regressions first; routes missing from one run at the end
+    rows.sort(key=lambda row: (row[4] is None, -(row[4] or 0)))
+
+    width = max([len(r[0]) for r in rows] + [5])
+    print(f'{base_run.get("label")} -> {cand_run.get("label")}')
+    print(f'{"route".ljust(width)}  {"count":>7}  {"p50":>17}  {"p95":>17}  {"p95 %":>7}  {"5xx":>9}')
+    regressions = []
+    for route, b, c, p50_change, p95_change in rows:
+        if not b or not c:
+            print(f'{route.ljust(width)}  only in {"candidate" if c else "base"}')
+            continue
+        flag = ""
+        if p95_change is not None and min(b["count"], c["count"]) >= args.min_count:
+            if p95_change > args.threshold:
+                flag = "  slower"
+                regressions.append(route)
+            elif p95_change < -args.threshold:
+                flag = "  faster"
+        print(
+            f'{route.ljust(width)}  {c["count"]:>7}  '
+            f'{fmt_ms(b["p50"]):>7} -> {fmt_ms(c["p50"]):>7}  '
+            f'{fmt_ms(b["p95"]):>7} -> {fmt_ms(c["p95"]):>7}  '
+            f'{"-" if p95_change is None else f"{p95_change:+.0f}%":>7}  '
+            f'{b["errors"]:>3} -> {c["errors"]:<3}{flag}'
+        )
+
+    print(
+        f"{len(regressions)} route(s) with p95 more than {args.threshold}% slower "
+        f"(routes with fewer than {args.min_count} requests are not flagged)"
+    )
+    return 1 if args.fail and regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    summary = sub.add_parser("summary", help="route mix and captured latencies")
+    summary.add_argument("capture")
+    summary.set_defaults(func=cmd_summary)
+
+    replay = sub.add_parser("replay", help="replay a capture and record latencies")
+    replay.add_argument("capture")
+    replay.add_argument("--out", required=True, help="results file for diff")
+    replay.add_argument("--base-url", default="http://localhost:5000")
+    replay.add_argument("--speed", type=float, default=1.0, help="2 replays twice as fast")
+    replay.add_argument("--concurrency", type=int, default=20)
+    replay.add_argument("--token", action="append", metavar="ROLE=JWT")
+    replay.add_argument("--login", action="append", metavar="ROLE=EMAIL:PASSWORD")
+    replay.add_argument("--writes", action="store_true", help="also replay POST/PUT/DELETE")
+    replay.add_argument("--route", help="only replay routes matching this regex")
+    replay.add_argument("--limit", type=int, help="replay the first N requests")
+    replay.add_argument("--timeout", type=float, default=30)
+    replay.add_argument("--label", help="name shown in diff output (defaults to --out)")
+    replay.set_defaults(func=cmd_replay)
+
+    diff = sub.add_parser("diff", help="per-route latency diff between two replays")
+    diff.add_argument("base")
+    diff.add_argument("candidate")
+    diff.add_argument("--min-count", type=int, default=20)
+    diff.add_argument("--threshold", type=float, default=10, help="p95 change (percent) flagged as slower/faster")
+    diff.add_argument("--fail", action="store_true", help="exit 1 when a route got slower")
+    diff.set_defaults(func=cmd_diff)
+
+    args = parser.parse_args()
+    if getattr(args, "speed", 1) <= 0 or getattr(args, "concurrency", 1) <= 0:
+        parser.error("--speed and --concurrency must be positive")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+// Seed a large synthetic dataset for query-plan checks.
+// Usage: node perf/seed-large.js [--scale=1] [--reset] [--force]
+//
+// Rows are generated server-side with generate_series so even the default
+// scale (~50k seekers, ~500k applications) loads in seconds. All seeded
+// users use a perf_ email prefix so --reset can remove them again.
+import pool from '../db.js';
+
+const args = Object.fromEntries(
+  process.argv.slice(2).map(a => {
+    const [k, v] = a.replace(/^--/, '').split('=');
+    return [k, v === undefined ? true : v];
+  })
+);
+
+const scale = Number(args.scale || 1);
+const counts = {
+  recruiters: Math.round(200 * scale),
+  seekers: Math.round(50000 * scale),
+  jobs: Math.round(20000 * scale),
+  applications: Math.round(500000 * scale),
+  interviews: Math.round(50000 * scale),
+  emails: Math.round(50000 * scale),
+  logs: Math.round(200000 * scale),
+  views: Math.round(1000000 * scale),
+};
+
+const isLocalTarget = () => {
+  if (process.env.DATABASE_URL) return /@(localhost|127\.0\.0\.1)[:/]/.test(process.env.DATABASE_URL);
+  return ['localhost', '127.0.0.1', undefined].includes(process.env.DB_HOST);
+};
+
+const tableExists = async (client, name) => {
+  const r = await client.query('SELECT to_regclass($1) AS t', [name]);
+  return r.rows[0].t !== null;
+};
+
+async function seed() {
+  if (!isLocalTarget() && !args.force) {
+    console.error('❌ Refusing to seed a non-local database. Pass --force if you really mean it.');
+    process.exit(1);
+  }
+
+  const client = await pool.connect();
+  try {
+    const existing = await client.query(`SELECT COUNT(*)::int AS cnt FROM users WHERE email LIKE 'perf\\_%'`);
+    if (existing.rows[0].cnt > 0) {
+      if (!args.reset) {
+        console.log(`Perf dataset already present (${existing.rows[0].cnt} users). Use --reset to rebuild.`);
+        return;
+      }
+      console.log('🧹 Removing previous perf dataset...');
+      await client.query(`DELETE FROM interviews WHERE seeker_id IN (
+        SELECT js.seeker_id FROM job_seekers js JOIN users u ON u.user_id = js.user_id WHERE u.email LIKE 'perf\\_%')`);
+      await client.query(`DELETE FROM jobs WHERE company LIKE 'PerfCo %'`);
+      await client.query(`DELETE FROM system_logs WHERE details->>'perf' = 'true'`);
+      if (await tableExists(client, 'views')) {
+        await client.query(`DELETE FROM views WHERE session_id LIKE 'perf-%'`);
+      }
+      await client.query(`DELETE FROM users WHERE email LIKE 'perf\\_%'`);
+    }
+
+    console.log(`🌱 Seeding perf dataset (scale=${scale})...`);
+    await client.query('BEGIN');
+
+    await client.query(
+      `INSERT INTO users (name, email, password, role)
+       SELECT 'Perf Recruiter ' || g, 'perf_recruiter_' || g || '@example.test', 'x', 'recruiter'
+       FROM generate_series(1, $1) g`,
+      [counts.recruiters]
+    );
+    await client.query(
+      `INSERT INTO recruiters (user_id, company, designation)
+       SELECT user_id, 'PerfCo ' || (user_id % 50), 'Talent Partner'
+       FROM users WHERE email LIKE 'perf\\_recruiter\\_%'`
+    );
+
+    await client.query(
+      `INSERT INTO users (name, email, password, role)
+       SELECT 'Perf Seeker ' || g, 'perf_seeker_' || g || '@example.test', 'x', 'job_seeker'
+       FROM generate_series(1, $1) g`,
+      [counts.seekers]
+    );
+    await client.query(
+      `INSERT INTO job_seekers (user_id, dob, nationality)
+       SELECT user_id, DATE '1990-01-01' + (user_id % 5000), 'Testland'
+       FROM users WHERE email LIKE 'perf\\_seeker\\_%'`
+    );
+    await client.query(
+      `INSERT INTO resumes (seeker_id, title, statement_profile, is_primary)
+       SELECT js.seeker_id, 'Perf Resume', 'Engineer with experience in SQL and Node.js', true
+       FROM job_seekers js JOIN users u ON u.user_id = js.user_id
+       WHERE u.email LIKE 'perf\\_seeker\\_%'`
+    );
+    await client.query(
+      `INSERT INTO experiences (resume_id, company, duration, job_title, description)
+       SELECT r.resume_id, 'PerfCo ' || (r.resume_id % 50), '2 years', 'Software Engineer', 'Built things'
+       FROM resumes r WHERE r.title = 'Perf Resume'`
+    );
+
+    await client.query(
+      `INSERT INTO jobs (title, job_description, salary, company, min_experience, skills_required, location, job_type, created_at)
+       SELECT (ARRAY['Software Engineer','Data Analyst','Product Manager','Designer','DevOps Engineer'])[1 + g % 5] || ' ' || g,
+              'Perf job description ' || g, 40000 + (g % 100) * 1000, 'PerfCo ' || (g % 50), g % 10,
+              ARRAY['SQL','JavaScript','Python'], (ARRAY['Remote','Chennai','Bangalore','Pune'])[1 + g % 4],
+              'full-time', NOW() - (g % 365) * INTERVAL '1 day'
+       FROM generate_series(1, $1) g`,
+      [counts.jobs]
+    );
+    await client.query(
+      `WITH rec AS (SELECT recruiter_id, ROW_NUMBER() OVER (ORDER BY recruiter_id) AS rn
+                    FROM recruiters r JOIN users u ON u.user_id = r.user_id
+                    WHERE u.email LIKE 'perf\\_recruiter\\_%'),
+            pj AS (SELECT job_id, ROW_NUMBER() OVER (ORDER BY job_id) AS rn
+                   FROM jobs WHERE company LIKE 'PerfCo %')
+       INSERT INTO operates (recruiter_id, job_id, action)
+       SELECT rec.recruiter_id, pj.job_id, 'created'
+       FROM pj JOIN rec ON rec.rn = 1 + (pj.rn % $1)`,
+      [counts.recruiters]
+    );
+
+    // Skew applications so a few jobs and seekers are "hot", like real traffic
+    await client.query(
+      `WITH s AS (SELECT MIN(js.seeker_id) AS lo, MAX(js.seeker_id) AS hi
+                  FROM job_seekers js JOIN users u ON u.user_id = js.user_id WHERE u.email LIKE 'perf\\_seeker\\_%'),
+            j AS (SELECT MIN(job_id) AS lo, MAX(job_id) AS hi FROM jobs WHERE company LIKE 'PerfCo %')
+       INSERT INTO applications (seeker_id, job_id, status, star, applied_timestamp)
+       SELECT s.lo + floor(power(random(), 2) * (s.hi - s.lo))::int,
+              j.lo + floor(power(random(), 3) * (j.hi - j.lo))::int,
+              (ARRAY['applied','under_review','shortlisted','rejected','hired'])[1 + (g % 5)],
+              g % 7 = 0,
+              NOW() - (g % 90) * INTERVAL '1 day'
+       FROM generate_series(1, $1) g, s, j
+       ON CONFLICT DO NOTHING`,
+      [counts.applications]
+    );
+
+    await client.query(
+      // One-hour slots that never overlap, so the calendar exclusion constraints hold
+      `INSERT INTO interviews (seeker_id, recruiter_id, job_id, schedule, duration, status)
+       SELECT a.seeker_id, o.recruiter_id, a.job_id,
+              date_trunc('hour', NOW()) + (ROW_NUMBER() OVER (ORDER BY a.application_id) - $1 / 2) * INTERVAL '1 hour',
+              60, 'scheduled'
+       FROM (SELECT * FROM applications WHERE status = 'under_review' LIMIT $1) a
+       JOIN operates o ON o.job_id = a.job_id`,
+      [counts.interviews]
+    );
+
+    if (await tableExists(client, 'email_logs')) {
+      await client.query(
+        `INSERT INTO email_logs (sender_user_id, to_email, subject, body_preview, sent_at)
+         SELECT r.user_id, 'candidate' || g || '@example.test', 'Update', 'Hello', NOW() - (g % 60) * INTERVAL '1 day'
+         FROM generate_series(1, $1) g
+         JOIN recruiters r ON r.recruiter_id = (SELECT MIN(recruiter_id) FROM recruiters) + (g % $2)`,
+        [counts.emails, counts.recruiters]
+      );
+    }
+
+    await client.query(
+      `INSERT INTO system_logs (actor_type, actor_id, action_desc, timestamp, details)
+       SELECT (ARRAY['recruiter','job_seeker'])[1 + g % 2], g % 1000, 'perf_event',
+              NOW() - (g % 180) * INTERVAL '1 hour', '{"perf": true}'::jsonb
+       FROM generate_series(1, $1) g`,
+      [counts.logs]
+    );
+
+    if (await tableExists(client, 'views')) {
+      await client.query(
+        `WITH j AS (SELECT MIN(job_id) AS lo, MAX(job_id) AS hi FROM jobs WHERE company LIKE 'PerfCo %')
+         INSERT INTO views (viewer_user_id, viewed_entity_type, viewed_entity_id, session_id, view_timestamp)
+         SELECT NULL, 'job', j.lo + floor(power(random(), 2) * (j.hi - j.lo))::int,
+                'perf-' || (g % 20000), NOW() - (g % 60) * INTERVAL '1 day'
+         FROM generate_series(1, $1) g, j`,
+        [counts.views]
+      );
+    }
+
+    await client.query('COMMIT');
+    console.log('📊 Analyzing tables...');
+    await client.query('ANALYZE');
+    console.log('✅ Perf dataset ready:', counts);
+  } catch (error) {
+    await client.query('ROLLBACK').catch(() => {});
+    console.error('❌ Seeding failed:', error.message);
+    process.exitCode = 1;
+  } finally {
+    client.release();
+    await pool.end();
+  }
+}
+
+seed();
@@ -6,8 +6,12 @@ import {
   deleteUser,
   getAllJobs,
   getAllApplications,
+  exportApplications,
   getSystemLogs,
+  exportSystemLogs,
   getDashboardStats,
+  getEmailOutbox,
+  retryEmailOutbox,
   deleteJob,
   getDuplicateUsers,
   getAdminProfile,
@@ -37,9 +41,13 @@ router.delete('/jobs/:id', authenticateToken, requireAdmin, deleteJob);
 
 // Application management routes
 router.get('/applications', authenticateToken, requireAdmin, getAllApplications);
+router.get('/applications/export', authenticateToken, requireAdmin, exportApplications);
 
 // System management routes
 router.get('/logs', authenticateToken, requireAdmin, getSystemLogs);
+router.get('/logs/export', authenticateToken, requireAdmin, exportSystemLogs);
 router.get('/dashboard/stats', authenticateToken, requireAdmin, getDashboardStats);
+router.get('/email-outbox', authenticateToken, requireAdmin, getEmailOutbox);
+router.post('/email-outbox/retry', authenticateToken, requireAdmin, retryEmailOutbox);
 
 export default router;
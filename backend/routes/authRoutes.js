@@ -3,6 +3,7 @@ import bcrypt from 'bcrypt';
 import jwt from 'jsonwebtoken';
 import pool from '../db.js';
 import { authenticateToken } from '../middleware/authMiddleware.js';
+import { checkPassword, rehashPassword } from '../services/passwords.js';
 import {
   authLimiter,
   validateRegister,
@@ -43,8 +44,8 @@ router.post('/register', authLimiter, validateRegister, handleValidationErrors,
       return res.status(400).json({ success: false, error: 'Company name is required for recruiters' });
     }
 
-    // Check if user already exists
-    const userExists = await client.query('SELECT 1 FROM users WHERE email=$1', [email]);
+    // Check if user already exists (older rows may hold mixed-case emails)
+    const userExists = await client.query('SELECT 1 FROM users WHERE lower(email)=$1', [email]);
     if (userExists.rows.length > 0) {
       return res.status(409).json({ success: false, error: 'User with this email already exists' });
     }
@@ -96,6 +97,10 @@ router.post('/register', authLimiter, validateRegister, handleValidationErrors,
     });
   } catch (error) {
     await client.query('ROLLBACK');
+    // A concurrent registration with the same email won the race
+    if (error.code === '23505' && /email/.test(error.constraint || '')) {
+      return res.status(409).json({ success: false, error: 'User with this email already exists' });
+    }
     console.error('Registration error:', error);
     res.status(500).json({ 
       success: false, 
@@ -117,7 +122,7 @@ router.post('/login', authLimiter, validateLogin, handleValidationErrors, async
     }
 
     const userResult = await pool.query(
-      'SELECT u.*, js.seeker_id, r.recruiter_id FROM users u LEFT JOIN job_seekers js ON u.user_id = js.user_id LEFT JOIN recruiters r ON u.user_id = r.user_id WHERE u.email=$1', 
+      'SELECT u.*, js.seeker_id, r.recruiter_id FROM users u LEFT JOIN job_seekers js ON u.user_id = js.user_id LEFT JOIN recruiters r ON u.user_id = r.user_id WHERE lower(u.email)=$1 ORDER BY u.user_id LIMIT 1', 
       [email.toLowerCase().trim()]
     );
     
@@ -127,11 +132,18 @@ router.post('/login', authLimiter, validateLogin, handleValidationErrors, async
     }
 
     const user = userResult.rows[0];
-    const isMatch = await bcrypt.compare(password, user.password);
+    const { match, legacy } = await checkPassword(password, user.password);
     
-    if (!isMatch) {
+    if (!match) {
       return res.status(401).json({ success: false, error: 'Invalid email or password' });
     }
+    if (legacy) {
+      await rehashPassword(pool, 'users', 'user_id', user.user_id, password);
+    }
+
+    if (user.status === 'suspended') {
+      return res.status(403).json({ success: false, error: 'Account suspended' });
+    }
 
     const token = jwt.sign(
       { id: user.user_id, role: user.role },
@@ -290,8 +302,9 @@ router.put('/change-password', authenticateToken, async (req, res) => {
       return res.status(404).json({ success: false, error: 'User not found' });
     }
     
-    const isMatch = await bcrypt.compare(currentPassword, userResult.rows[0].password);
-    if (!isMatch) {
+    // A legacy (xss-filtered) hash is replaced by the update below
+    const { match } = await checkPassword(currentPassword, userResult.rows[0].password);
+    if (!match) {
       return res.status(400).json({ success: false, error: 'Current password is incorrect' });
     }
     
@@ -1,6 +1,7 @@
 import express from 'express';
 import { 
   getAllJobs, 
+  getJobSuggestions,
   applyForJob, 
   getMyApplications, 
   toggleSaveJob, 
@@ -37,6 +38,7 @@ const router = express.Router();
 
 // Job search and application routes
 router.get('/jobs', getAllJobs);
+router.get('/typeahead', authenticateToken, getJobSuggestions);
 router.post('/jobs/:job_id/view', authenticateToken, incrementJobView);
 router.post('/jobs/:job_id/apply', authenticateToken, applyForJob);
 router.get('/applications', authenticateToken, getMyApplications);
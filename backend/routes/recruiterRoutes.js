@@ -5,11 +5,15 @@ import {
   getJobDetails,
   updateJob,
   getApplicants, 
+  exportApplicants,
   updateJobStatus, 
   deleteJob, 
   updateApplicationStatus, 
+  bulkUpdateApplicationStatus,
   scheduleInterview,
+  bulkScheduleInterviews,
   getMyInterviews, 
+  getFreeSlots,
   updateInterview,
   deleteInterview,
   getApplicantProfile,
@@ -17,8 +21,11 @@ import {
   sendMessageToSeeker,
   getConversationWithSeeker,
   sendEmailToCandidate,
+  getEmailConfig,
+  bulkSendEmails,
   getRecruiterStats,
   getSentEmails,
+  exportSentEmails,
   getRecentApplications,
   upsertApplicationReview,
   getApplicationReview,
@@ -26,6 +33,7 @@ import {
   debugInterviewStats
 } from '../controllers/recruiterController.js';
 import { authenticateToken } from '../middleware/authMiddleware.js';
+import { requireRecruiter } from '../middleware/roleMiddleware.js';
 
 const router = express.Router();
 
@@ -39,14 +47,18 @@ router.delete('/jobs/:id', authenticateToken, deleteJob);
 
 // Application management routes
 router.get('/jobs/:id/applicants', authenticateToken, getApplicants);
+router.get('/jobs/:id/applicants/export', authenticateToken, exportApplicants);
 router.get('/applications/recent', authenticateToken, getRecentApplications);
+router.put('/applications/bulk/status', authenticateToken, bulkUpdateApplicationStatus);
 router.get('/applications/:application_id/profile', authenticateToken, getApplicantProfile);
 router.get('/applications/:application_id/resume/download', authenticateToken, downloadApplicantResume);
 router.get('/applications/:application_id/review', authenticateToken, getApplicationReview);
 router.post('/applications/:application_id/review', authenticateToken, upsertApplicationReview);
 router.put('/applications/:application_id/status', authenticateToken, updateApplicationStatus);
 router.post('/interviews', authenticateToken, scheduleInterview);
+router.post('/interviews/bulk', authenticateToken, bulkScheduleInterviews);
 router.get('/interviews', authenticateToken, getMyInterviews);
+router.get('/calendar/free-slots', authenticateToken, getFreeSlots);
 router.put('/interviews/:interview_id', authenticateToken, updateInterview);
 router.delete('/interviews/:interview_id', authenticateToken, deleteInterview);
 
@@ -55,9 +67,12 @@ router.post('/messages', authenticateToken, sendMessageToSeeker);
 router.get('/messages/:seeker_id', authenticateToken, getConversationWithSeeker);
 
 // Email
-router.post('/email/send', authenticateToken, sendEmailToCandidate);
-router.get('/email/sent', authenticateToken, getSentEmails);
-router.delete('/email/:email_id', authenticateToken, deleteEmail);
+router.get('/email/config', authenticateToken, requireRecruiter, getEmailConfig);
+router.post('/email/send', authenticateToken, requireRecruiter, sendEmailToCandidate);
+router.post('/email/bulk', authenticateToken, requireRecruiter, bulkSendEmails);
+router.get('/email/sent', authenticateToken, requireRecruiter, getSentEmails);
+router.get('/email/sent/export', authenticateToken, requireRecruiter, exportSentEmails);
+router.delete('/email/:email_id', authenticateToken, requireRecruiter, deleteEmail);
 
 // Live stats
 router.get('/stats', authenticateToken, getRecruiterStats);
@@ -3,28 +3,50 @@ import cors from 'cors';
 import dotenv from 'dotenv';
 import helmet from 'helmet';
 import pool from './db.js';
-import bcrypt from 'bcrypt';
-import jwt from 'jsonwebtoken';
-import recruiterRoutes from './routes/recruiterRoutes.js';
-import jobseekerRoutes from './routes/jobseekerRoutes.js';
-import adminRoutes from './routes/adminRoutes.js';
-import adminAuthRoutes from './routes/adminAuthRoutes.js';
-import authRoutes from './routes/authRoutes.js';
-import viewsRoutes from './routes/viewsRoutes.js';
 import { authenticateToken } from './middleware/authMiddleware.js';
+import { bumpSeekerStatsForUser, startStatsReconciler } from './services/statsCounters.js';
+import { startAuthStateRefresh } from './services/authState.js';
 import {
   validateEnvironment,
   apiLimiter,
   sanitizeInputs,
 } from './middleware/securityMiddleware.js';
+import { startReplicaMonitor, trackWrites } from './services/readRouting.js';
+import { startEmailDispatcher } from './services/emailOutbox.js';
+import { startTypeaheadRefresh } from './services/typeahead.js';
+import { createTrafficCapture } from './middleware/trafficCapture.js';
+import {
+  checkMigrations,
+  lazyRouter,
+  livenessProbe,
+  markBooted,
+  printBootReport,
+  readinessProbe,
+  recordPhase,
+  rejectUntilBooted,
+  timePhase,
+  waitForDatabase,
+} from './services/boot.js';
+
+// Everything up to here: node startup plus the static imports above
+recordPhase('process start + core imports', 0);
 
 dotenv.config();
 
 // Validate environment on startup
-validateEnvironment();
+await timePhase('validate environment', validateEnvironment);
 
 const app = express();
 
+// Probes come first: no rate limiting, parsing or auth in front of them
+app.get('/healthz', livenessProbe);
+app.get('/readyz', readinessProbe);
+
+// Opt-in request log for perf/replay_traffic.py (TRAFFIC_CAPTURE_FILE); first,
+// so recorded durations cover the whole middleware stack
+const trafficCapture = createTrafficCapture();
+if (trafficCapture) app.use(trafficCapture);
+
 // Security Middleware
 app.use(helmet()); // Sets various HTTP headers for security
 app.use(apiLimiter); // Rate limiting for all requests
@@ -47,13 +69,28 @@ app.use(express.urlencoded({ limit: '10mb', extended: true }));
 // Sanitize inputs
 app.use(sanitizeInputs);
 
-// Route imports
-app.use('/api/recruiter', recruiterRoutes);
-app.use('/api/jobseeker', jobseekerRoutes);
-app.use('/api/admin/auth', adminAuthRoutes);
-app.use('/api/admin', adminRoutes);
-app.use('/api/auth', authRoutes);
-app.use('/api/views', viewsRoutes);
+// Pin users to the primary database briefly after they write (read replicas)
+app.use(trackWrites);
+
+// Until boot finishes (routes loaded, database reachable) API calls get 503
+app.use('/api', rejectUntilBooted);
+
+// Route modules (and their controllers) are imported after the server is
+// listening; see boot() below
+const routers = {
+  recruiter: lazyRouter('recruiter routes', () => import('./routes/recruiterRoutes.js')),
+  jobseeker: lazyRouter('jobseeker routes', () => import('./routes/jobseekerRoutes.js')),
+  adminAuth: lazyRouter('admin auth routes', () => import('./routes/adminAuthRoutes.js')),
+  admin: lazyRouter('admin routes', () => import('./routes/adminRoutes.js')),
+  auth: lazyRouter('auth routes', () => import('./routes/authRoutes.js')),
+  views: lazyRouter('views routes', () => import('./routes/viewsRoutes.js')),
+};
+app.use('/api/recruiter', routers.recruiter);
+app.use('/api/jobseeker', routers.jobseeker);
+app.use('/api/admin/auth', routers.adminAuth);
+app.use('/api/admin', routers.admin);
+app.use('/api/auth', routers.auth);
+app.use('/api/views', routers.views);
 
 const PORT = process.env.PORT || 5000;
 
@@ -143,13 +180,18 @@ app.post('/api/profile/view', authenticateToken, async (req, res) => {
     // In a real app, you'd store this in a profile_views table
     // For now, we'll track it in memory or could add to database
     try {
-      await pool.query(
+      const viewResult = await pool.query(
         `INSERT INTO profile_views (viewer_id, viewed_user_id, viewed_at) 
          VALUES ($1, $2, NOW()) 
          ON CONFLICT (viewer_id, viewed_user_id) 
-         DO UPDATE SET viewed_at = NOW()`,
+         DO UPDATE SET viewed_at = NOW()
+         RETURNING (xmax = 0) AS first_view`,
         [viewerId, profileUserId]
       );
+      // Only a new viewer changes the distinct-viewer count
+      if (viewResult.rows[0]?.first_view) {
+        await bumpSeekerStatsForUser(profileUserId, { profile_views: 1 });
+      }
     } catch (err) {
       // If table doesn't exist, create it
       if (err.code === '42P01') {
@@ -223,4 +265,48 @@ app.get('/api/profile/views/:userId', authenticateToken, async (req, res) => {
   }
 });
 
-app.listen(PORT, () => console.log(`Server running on port ${PORT}`));
+// Listen first so probes answer while the rest of the startup work runs;
+// /readyz turns 200 once it is done
+const boot = async () => {
+  const routesLoaded = Promise.all(Object.values(routers).map((r) => r.load()));
+  const attempts = await timePhase('database reachable', waitForDatabase);
+  console.log(`Connected to PostgreSQL database${attempts > 1 ? ` after ${attempts} attempts` : ''}`);
+
+  const migrations = await timePhase('migration check', checkMigrations).catch((error) => {
+    console.error('Migration check failed:', error.message);
+    return null;
+  });
+  if (migrations?.pending.length) {
+    console.warn(`Migrations not applied: ${migrations.pending.join(', ')}`);
+  }
+
+  await routesLoaded;
+
+  // Background jobs need the database, so they start once it is reachable
+  // Periodically recompute dashboard counters (STATS_RECONCILE_INTERVAL_MS, 0 disables)
+  startStatsReconciler();
+  // Reload suspended/deleted users for token checks (AUTH_STATUS_REFRESH_MS)
+  startAuthStateRefresh();
+  // Poll read replica lag (REPLICA_CHECK_INTERVAL_MS)
+  startReplicaMonitor();
+  // Deliver queued emails when SMTP_HOST is set (EMAIL_POLL_INTERVAL_MS)
+  startEmailDispatcher();
+  // Build the search typeahead index and rebuild it every TYPEAHEAD_REFRESH_MS
+  startTypeaheadRefresh();
+
+  markBooted();
+  recordPhase('ready', 0);
+  printBootReport();
+};
+
+const listenStart = performance.now();
+app.listen(PORT, () => {
+  recordPhase('listen', listenStart);
+  console.log(`Server running on port ${PORT}`);
+  boot().catch((error) => {
+    // A route module that fails to import is a broken deploy: exit so it is
+    // restarted or rolled back instead of staying up unready
+    console.error('Startup failed:', error);
+    process.exit(1);
+  });
+});
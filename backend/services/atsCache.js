@@ -0,0 +1,125 @@
+// Memoized ATS analyses (ats_analysis_history.cache_key, migration 011).
+//
+// An analysis is a pure function of the job description and the resume
+// contents, so it is keyed by a hash of the normalized description, the
+// resume id and resumes.content_version (bumped by triggers on every resume
+// edit). Lookups go to a bounded in-process LRU first, then to the indexed
+// history table. New results are written to the history in batches after the
+// response has been sent.
+import crypto from 'crypto';
+import pool from '../db.js';
+
+const CACHE_SIZE = Number(process.env.ATS_CACHE_SIZE || 1000);
+
+// Map iteration order is insertion order, so the first key is the least recently used
+const cache = new Map();
+let pendingWrites = [];
+let flushScheduled = false;
+
+/**
+ * Collapse whitespace so re-pasting the same description (different line
+ * endings, trailing blanks) maps to the same key. Case is kept: extracted
+ * keywords are reported as written.
+ */
+export const normalizeJobDescription = (text) => String(text || '').replace(/\s+/g, ' ').trim();
+
+/**
+ * `variant` distinguishes analyses whose input differs beyond the resume rows
+ * (the default-resume path also loads the account's contact details).
+ */
+export const analysisCacheKey = ({ jobDescription, resumeId, contentVersion, variant }) =>
+  crypto.createHash('sha256')
+    .update(JSON.stringify([jobDescription, Number(resumeId), Number(contentVersion), variant]))
+    .digest('hex');
+
+const remember = (key, analysis) => {
+  if (CACHE_SIZE <= 0) return;
+  cache.delete(key);
+  cache.set(key, analysis);
+  if (cache.size > CACHE_SIZE) {
+    cache.delete(cache.keys().next().value);
+  }
+};
+
+export const getCachedAnalysis = async (key, db = pool) => {
+  const hit = cache.get(key);
+  if (hit) {
+    remember(key, hit);
+    return hit;
+  }
+
+  try {
+    const result = await db.query(
+      'SELECT analysis_data FROM ats_analysis_history WHERE cache_key = $1',
+      [key]
+    );
+    if (result.rows.length === 0) return null;
+    remember(key, result.rows[0].analysis_data);
+    return result.rows[0].analysis_data;
+  } catch (err) {
+    // Table or column missing (migration 011 not applied): behave as a miss
+    if (err.code !== '42P01' && err.code !== '42703') {
+      console.error('ATS cache lookup failed:', err.message);
+    }
+    return null;
+  }
+};
+
+const flushHistory = async (db) => {
+  flushScheduled = false;
+  const batch = pendingWrites;
+  pendingWrites = [];
+  if (batch.length === 0) return;
+
+  const params = [
+    batch.map(w => w.userId),
+    batch.map(w => w.resumeId),
+    batch.map(w => w.jobDescription),
+    batch.map(w => w.analysis.scores?.overallScore ?? null),
+    batch.map(w => JSON.stringify(w.analysis))
+  ];
+
+  try {
+    try {
+      await db.query(
+        `INSERT INTO ats_analysis_history (user_id, resume_id, job_description, overall_score, analysis_data, cache_key, created_at)
+         SELECT t.user_id, t.resume_id, t.job_description, t.overall_score, t.analysis_data, t.cache_key, NOW()
+         FROM unnest($1::int[], $2::int[], $3::text[], $4::int[], $5::jsonb[], $6::text[])
+           AS t(user_id, resume_id, job_description, overall_score, analysis_data, cache_key)
+         ON CONFLICT DO NOTHING`,
+        [...params, batch.map(w => w.key)]
+      );
+    } catch (err) {
+      if (err.code !== '42703') throw err;
+      // History table predates migration 011: record without the key
+      await db.query(
+        `INSERT INTO ats_analysis_history (user_id, resume_id, job_description, overall_score, analysis_data, created_at)
+         SELECT t.user_id, t.resume_id, t.job_description, t.overall_score, t.analysis_data, NOW()
+         FROM unnest($1::int[], $2::int[], $3::text[], $4::int[], $5::jsonb[])
+           AS t(user_id, resume_id, job_description, overall_score, analysis_data)
+         ON CONFLICT DO NOTHING`,
+        params
+      );
+    }
+  } catch (err) {
+    // History is best-effort, as before; the table itself is optional
+    if (err.code !== '42P01') {
+      console.error('Failed to record ATS analysis history:', err.message);
+    }
+  }
+};
+
+/**
+ * Cache a fresh analysis and queue its history row. The write happens on a
+ * later tick, batched with any other analyses finished in the meantime.
+ * `key` may be null when the resume has no content version; the row is then
+ * recorded but never served from cache.
+ */
+export const recordAnalysis = ({ key, userId, resumeId, jobDescription, analysis }, db = pool) => {
+  if (key) remember(key, analysis);
+  pendingWrites.push({ key, userId, resumeId, jobDescription, analysis });
+  if (!flushScheduled) {
+    flushScheduled = true;
+    setImmediate(() => flushHistory(db));
+  }
+};
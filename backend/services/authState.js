@@ -0,0 +1,123 @@
+// In-memory auth state for authenticateToken.
+//
+// Verified tokens: a bounded LRU keyed by the SHA-256 of the token, holding the
+// decoded payload until the token's own `exp`. A cache hit skips the HMAC
+// signature check; an expired entry is dropped and the token re-verified (and
+// rejected) by jsonwebtoken as before.
+//
+// Blocked users: user ids that are suspended (users.status) or deleted
+// (revoked_users, migration 007). Admin actions push changes into this process
+// immediately; every AUTH_STATUS_REFRESH_MS the whole set is reloaded so other
+// server instances pick the change up within that window.
+import crypto from 'crypto';
+import pool from '../db.js';
+
+const TOKEN_CACHE_SIZE = Number(process.env.AUTH_TOKEN_CACHE_SIZE || 10000);
+const STATUS_REFRESH_MS = Number(process.env.AUTH_STATUS_REFRESH_MS || 30 * 1000);
+
+// Deleted users stay revoked for the longest token lifetime we issue (24h)
+const REVOCATION_WINDOW = '24 hours';
+
+// Map iteration order is insertion order, so the first key is the least recently used
+const tokenCache = new Map();
+let blockedUsers = new Map();
+
+// Pushes made while a refresh query is in flight, one map per running refresh.
+// The refresh's snapshot may predate them, so they are re-applied after the swap.
+const refreshesInFlight = new Set();
+
+const applyStatus = (users, userId, status) => {
+  if (status === 'active') {
+    users.delete(userId);
+  } else {
+    users.set(userId, status);
+  }
+};
+
+const hashToken = (token) => crypto.createHash('sha256').update(token).digest('base64');
+
+export const getCachedToken = (token) => {
+  const key = hashToken(token);
+  const entry = tokenCache.get(key);
+  if (!entry) return null;
+  tokenCache.delete(key);
+  if (entry.expiresAt <= Date.now()) return null;
+  tokenCache.set(key, entry);
+  return entry.user;
+};
+
+export const cacheToken = (token, user) => {
+  // Tokens without an expiry are never cached; they are re-verified each time
+  if (!user?.exp || TOKEN_CACHE_SIZE <= 0) return;
+  const key = hashToken(token);
+  tokenCache.delete(key);
+  tokenCache.set(key, { user, expiresAt: user.exp * 1000 });
+  if (tokenCache.size > TOKEN_CACHE_SIZE) {
+    tokenCache.delete(tokenCache.keys().next().value);
+  }
+};
+
+// Admin tokens carry admins.admin_id, a different id space from users
+export const getBlockedStatus = (user) => {
+  if (!user || user.role === 'admin') return null;
+  return blockedUsers.get(Number(user.id)) || null;
+};
+
+// Push a status change made by this process (admin suspend/activate/delete)
+export const setUserStatus = (userId, status) => {
+  applyStatus(blockedUsers, Number(userId), status);
+  refreshesInFlight.forEach(pushes => pushes.set(Number(userId), status));
+};
+
+export const revokeUser = async (userId, db = pool) => {
+  setUserStatus(userId, 'deleted');
+  try {
+    await db.query(
+      `INSERT INTO revoked_users (user_id) VALUES ($1)
+       ON CONFLICT (user_id) DO UPDATE SET revoked_at = NOW()`,
+      [userId]
+    );
+  } catch (err) {
+    // 42P01: migration 007 not applied; revocation stays local to this process
+    if (err?.code !== '42P01') throw err;
+  }
+};
+
+export const refreshBlockedUsers = async () => {
+  const pushes = new Map();
+  refreshesInFlight.add(pushes);
+  try {
+    const result = await pool.query(
+      `SELECT user_id, status FROM users WHERE status <> 'active'
+       UNION ALL
+       SELECT user_id, 'deleted' FROM revoked_users WHERE revoked_at > NOW() - INTERVAL '${REVOCATION_WINDOW}'`
+    );
+    const next = new Map(result.rows.map(r => [r.user_id, r.status]));
+    pushes.forEach((status, userId) => applyStatus(next, userId, status));
+    blockedUsers = next;
+    refreshesInFlight.delete(pushes);
+    await pool.query(`DELETE FROM revoked_users WHERE revoked_at <= NOW() - INTERVAL '${REVOCATION_WINDOW}'`);
+  } catch (err) {
+    // 42P01/42703: migration 007 not applied; keep whatever was pushed locally
+    if (err?.code !== '42P01' && err?.code !== '42703') {
+      console.warn('Failed to refresh blocked users:', err.message);
+    }
+  } finally {
+    refreshesInFlight.delete(pushes);
+  }
+};
+
+let refreshTimer = null;
+
+export const startAuthStateRefresh = (intervalMs = STATUS_REFRESH_MS) => {
+  if (refreshTimer) return;
+  refreshBlockedUsers();
+  if (!(intervalMs > 0)) return;
+  refreshTimer = setInterval(refreshBlockedUsers, intervalMs);
+  refreshTimer.unref();
+};
+
+export const stopAuthStateRefresh = () => {
+  clearInterval(refreshTimer);
+  refreshTimer = null;
+};
@@ -0,0 +1,214 @@
+// Boot sequence, startup timing and health probes.
+//
+// server.js listens as soon as the core middleware is in place, so the probes
+// answer right away, and then loads the route modules and checks the database
+// in parallel. /healthz (liveness) only says the process is up; /readyz says
+// whether this instance can serve traffic: boot finished, database reachable,
+// pool not backed up and (optionally) migrations applied.
+
+import pool from '../db.js';
+import { replicaStatus } from './readRouting.js';
+
+const READY_TIMEOUT_MS = Number(process.env.READY_CHECK_TIMEOUT_MS || 2000);
+const READY_CACHE_MS = Number(process.env.READY_CHECK_CACHE_MS || 1000);
+const MAX_POOL_WAITING = Number(process.env.READY_MAX_POOL_WAITING || 10);
+const REQUIRE_MIGRATIONS = process.env.READY_REQUIRE_MIGRATIONS === 'true';
+const DB_RETRY_MS = Number(process.env.BOOT_DB_RETRY_MS || 2000);
+
+// ---------------------------------------------------------------------------
+// Startup timing. performance.now() counts from process start, so phases are
+// recorded as offsets from it.
+
+const phases = [];
+
+/** Record a phase that ran from `startMs` until now (or `endMs`). */
+export const recordPhase = (name, startMs, endMs = performance.now()) => {
+  phases.push({ name, startMs, ms: endMs - startMs });
+};
+
+/** Run `fn` (sync or async) and record how long it took. */
+export const timePhase = async (name, fn) => {
+  const start = performance.now();
+  try {
+    return await fn();
+  } finally {
+    recordPhase(name, start);
+  }
+};
+
+export const bootReport = () => phases
+  .slice()
+  .sort((a, b) => a.startMs - b.startMs)
+  .map(({ name, startMs, ms }) => ({ name, startMs: Math.round(startMs), ms: Math.round(ms) }));
+
+export const printBootReport = () => {
+  const rows = bootReport();
+  const width = Math.max(...rows.map((r) => r.name.length));
+  console.log(`Startup report (${Math.round(performance.now())} ms since process start):`);
+  for (const { name, startMs, ms } of rows) {
+    console.log(`  ${name.padEnd(width)}  +${String(startMs).padStart(5)} ms  ${String(ms).padStart(5)} ms`);
+  }
+};
+
+// ---------------------------------------------------------------------------
+// Lazy route modules
+
+/**
+ * A request handler standing in for a router module. `load()` imports it
+ * (once) and is called by the boot sequence after the server is listening; a
+ * request that arrives first triggers the import itself and waits for it.
+ */
+export const lazyRouter = (name, importer) => {
+  let router = null;
+  let loading = null;
+  const load = () => {
+    loading ??= timePhase(`import ${name}`, importer).then((mod) => {
+      router = mod.default;
+      return router;
+    });
+    return loading;
+  };
+  const handle = (req, res, next) => {
+    if (router) return router(req, res, next);
+    load().then((r) => r(req, res, next), next);
+  };
+  handle.load = load;
+  return handle;
+};
+
+// ---------------------------------------------------------------------------
+// Database and migrations
+
+const withTimeout = (promise, ms, message) => {
+  let timer;
+  const timeout = new Promise((_, reject) => {
+    timer = setTimeout(() => reject(new Error(message)), ms);
+  });
+  return Promise.race([promise, timeout]).finally(() => clearTimeout(timer));
+};
+
+const columnExists = (table, column) =>
+  `EXISTS (SELECT 1 FROM information_schema.columns
+           WHERE table_schema = 'public' AND table_name = '${table}' AND column_name = '${column}')`;
+const relationExists = (name) => `to_regclass('public.${name}') IS NOT NULL`;
+
+// One object each migration creates; present means the migration was applied
+const migrationMarkers = [
+  ['006_add_dashboard_counters', relationExists('recruiter_stats')],
+  ['007_add_user_status', columnExists('users', 'status')],
+  ['008_add_rate_limit_buckets', relationExists('rate_limit_buckets')],
+  ['009_unique_applications', columnExists('jobs', 'application_count')],
+  ['010_interview_calendar', columnExists('interviews', 'slot')],
+  ['011_ats_analysis_cache', columnExists('resumes', 'content_version')],
+  ['012_add_list_keyset_indexes', relationExists('idx_jobs_created_id')],
+  ['013_add_export_indexes', relationExists('idx_email_logs_sender_sent')],
+  ['014_dedup_keys', relationExists('dedup_progress')],
+  ['015_email_outbox', relationExists('email_outbox')],
+];
+
+const migrationQuery = `SELECT ${migrationMarkers.map(([name, check], i) => `${check} AS m${i}`).join(',\n       ')}`;
+
+const state = {
+  booted: false,
+  database: { ok: false, error: 'not checked yet', checkedAt: 0 },
+  migrations: null,
+};
+
+let inflight = null;
+
+const checkDatabase = () => {
+  inflight ??= withTimeout(pool.query('SELECT 1'), READY_TIMEOUT_MS, 'database check timed out')
+    .then(
+      () => ({ ok: true }),
+      (error) => ({ ok: false, error: error.message })
+    )
+    .then((result) => {
+      state.database = { ...result, checkedAt: Date.now() };
+      inflight = null;
+      return state.database;
+    });
+  return inflight;
+};
+
+/** Which known migrations are applied. Schema changes are rare, so this runs at boot only. */
+export const checkMigrations = async () => {
+  const row = (await pool.query(migrationQuery)).rows[0];
+  const applied = [];
+  const pending = [];
+  migrationMarkers.forEach(([name], i) => (row[`m${i}`] ? applied : pending).push(name));
+  state.migrations = { applied, pending };
+  return state.migrations;
+};
+
+/** Resolve once the database answers, retrying every BOOT_DB_RETRY_MS. */
+export const waitForDatabase = async () => {
+  for (let attempt = 1; ; attempt++) {
+    const result = await checkDatabase();
+    if (result.ok) return attempt;
+    console.error(`Database not reachable (attempt ${attempt}): ${result.error}`);
+    await new Promise((resolve) => setTimeout(resolve, DB_RETRY_MS));
+  }
+};
+
+export const markBooted = () => {
+  state.booted = true;
+};
+
+export const isBooted = () => state.booted;
+
+const poolStats = () => ({
+  total: pool.totalCount,
+  idle: pool.idleCount,
+  waiting: pool.waitingCount,
+});
+
+/** Readiness with the reasons it fails; the database check is cached for READY_CHECK_CACHE_MS. */
+export const readiness = async () => {
+  const database = Date.now() - state.database.checkedAt < READY_CACHE_MS
+    ? state.database
+    : await checkDatabase();
+  const poolState = poolStats();
+
+  const reasons = [];
+  if (!state.booted) reasons.push('starting');
+  if (!database.ok) reasons.push('database unreachable');
+  if (MAX_POOL_WAITING > 0 && poolState.waiting > MAX_POOL_WAITING) reasons.push('connection pool saturated');
+  if (REQUIRE_MIGRATIONS && (!state.migrations || state.migrations.pending.length > 0)) {
+    reasons.push('migrations pending');
+  }
+
+  return {
+    ready: reasons.length === 0,
+    reasons,
+    database: database.ok ? { ok: true } : { ok: false, error: database.error },
+    pool: poolState,
+    migrations: state.migrations,
+    // Informational: reads fall back to the primary when no replica is usable
+    replicas: replicaStatus(),
+  };
+};
+
+// ---------------------------------------------------------------------------
+// Probe handlers; mounted ahead of rate limiting and body parsing
+
+export const livenessProbe = (req, res) => {
+  res.set('Cache-Control', 'no-store');
+  res.json({ status: 'ok', uptime: Math.round(process.uptime()) });
+};
+
+export const readinessProbe = async (req, res) => {
+  const result = await readiness();
+  res.set('Cache-Control', 'no-store');
+  res.status(result.ready ? 200 : 503).json({
+    status: result.ready ? 'ready' : 'not ready',
+    ...result,
+    ...('verbose' in req.query ? { boot: bootReport() } : {}),
+  });
+};
+
+/** Answer API requests with 503 until boot has finished. */
+export const rejectUntilBooted = (req, res, next) => {
+  if (state.booted) return next();
+  res.set('Retry-After', '1');
+  res.status(503).json({ success: false, error: 'Server is starting, try again shortly' });
+};
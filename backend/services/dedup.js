@@ -0,0 +1,192 @@
+// Duplicate detection and cleanup.
+//
+// Each target defines a normalized key. The same key expressions back the
+// unique indexes from migrations/014_dedup_keys.sql (so new duplicates are
+// rejected on write, and ON CONFLICT can name them) and drive the batched
+// cleanup that removes existing duplicates before those indexes can be built.
+//
+// Cleanup walks a table in primary-key order, one short transaction per batch,
+// deleting rows whose key already has a keeper row. Each batch records its
+// position in dedup_progress, so an interrupted run resumes where it stopped.
+
+import pool from '../db.js';
+
+// Case- and whitespace-insensitive text; NULL and '' compare equal
+const norm = (column) => `lower(btrim(coalesce(${column}, '')))`;
+
+export const dedupTargets = {
+  experiences: {
+    id: 'experience_id',
+    keep: 'first',
+    // Long descriptions are hashed to keep index entries small
+    key: (p = '') => [
+      `${p}resume_id`, norm(`${p}company`), norm(`${p}job_title`), norm(`${p}duration`),
+      `md5(${norm(`${p}description`)})`
+    ].join(', '),
+    uniqueIndex: 'uniq_experiences_dedup_key',
+  },
+  education: {
+    id: 'education_id',
+    keep: 'first',
+    key: (p = '') => [
+      `${p}resume_id`, norm(`${p}qualification`), norm(`${p}college`), `coalesce(${p}gpa, -1)`
+    ].join(', '),
+    uniqueIndex: 'uniq_education_dedup_key',
+  },
+  skills: {
+    id: 'skill_id',
+    // Later rows replaced earlier ones for the same type, so the newest wins
+    keep: 'last',
+    key: (p = '') => `${p}resume_id, ${p}skill_type`,
+    uniqueIndex: 'uniq_skills_resume_type',
+  },
+  users: {
+    id: 'user_id',
+    // Accounts own applications, resumes and logs: report, never delete
+    reportOnly: true,
+    key: (p = '') => `lower(${p}email)`,
+    uniqueIndex: 'uniq_users_email_lower',
+  },
+};
+
+/** Conflict target for INSERT ... ON CONFLICT (...) on a target's unique index. */
+export const conflictKey = (table) => dedupTargets[table].key();
+
+// Once a unique index is valid it stays so; only "not yet" answers are re-checked
+const enforcedIndexes = new Set();
+
+export const isUniqueEnforced = async (table, db = pool) => {
+  const { uniqueIndex } = dedupTargets[table];
+  if (enforcedIndexes.has(uniqueIndex)) return true;
+  const result = await db.query(
+    `SELECT i.indisvalid FROM pg_index i
+     JOIN pg_class c ON c.oid = i.indexrelid
+     WHERE c.relname = $1`,
+    [uniqueIndex]
+  );
+  const enforced = result.rows[0]?.indisvalid === true;
+  if (enforced) enforcedIndexes.add(uniqueIndex);
+  return enforced;
+};
+
+const helperIndex = (table) => `idx_${table}_dedup_scan`;
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+/**
+ * Remove duplicates from `table` in batches of `batchSize` ids, pausing
+ * `pauseMs` between batches. Resumes from the last recorded position unless
+ * `restart` is set. `onProgress({ table, lastId, maxId, removed, batchRemoved })`
+ * is called after every batch; `shouldStop()` is checked between batches.
+ * Returns { removed, completed }.
+ */
+export const cleanupTable = async (table, { batchSize = 1000, pauseMs = 50, restart = false, onProgress, shouldStop } = {}) => {
+  const target = dedupTargets[table];
+  if (!target || target.reportOnly) throw new Error(`${table} cannot be cleaned automatically`);
+  const { id, key } = target;
+
+  // Each row finds its keeper through this index instead of a table scan
+  await pool.query(`CREATE INDEX CONCURRENTLY IF NOT EXISTS ${helperIndex(table)} ON ${table} (${key()}, ${id})`);
+
+  if (restart) await pool.query('DELETE FROM dedup_progress WHERE target = $1', [table]);
+  const progress = await pool.query(
+    `INSERT INTO dedup_progress (target) VALUES ($1)
+     ON CONFLICT (target) DO UPDATE SET updated_at = NOW()
+     RETURNING last_id, removed, completed_at`,
+    [table]
+  );
+  let { last_id: lastId, removed, completed_at: completedAt } = progress.rows[0];
+  removed = Number(removed);
+  if (completedAt) return { removed, completed: true };
+
+  const maxId = (await pool.query(`SELECT COALESCE(MAX(${id}), 0) AS max_id FROM ${table}`)).rows[0].max_id;
+  const keeper = target.keep === 'last' ? `k.${id} > d.${id}` : `k.${id} < d.${id}`;
+
+  while (lastId < maxId) {
+    if (shouldStop?.()) return { removed, completed: false };
+
+    const client = await pool.connect();
+    let batch;
+    try {
+      await client.query('BEGIN');
+      // Give way to application writes instead of queueing behind them
+      await client.query("SET LOCAL lock_timeout = '5s'");
+      batch = (await client.query(
+        `WITH batch AS (
+           SELECT ${id} AS id FROM ${table} WHERE ${id} > $1 ORDER BY ${id} LIMIT $2
+         ), removed AS (
+           DELETE FROM ${table} d USING batch b
+           WHERE d.${id} = b.id
+             AND EXISTS (SELECT 1 FROM ${table} k WHERE (${key('k.')}) = (${key('d.')}) AND ${keeper})
+           RETURNING d.${id}
+         )
+         SELECT (SELECT MAX(id) FROM batch) AS last_id, (SELECT COUNT(*) FROM removed)::int AS removed`,
+        [lastId, batchSize]
+      )).rows[0];
+      await client.query(
+        `UPDATE dedup_progress
+         SET last_id = $2, removed = removed + $3, updated_at = NOW()
+         WHERE target = $1`,
+        [table, batch.last_id ?? maxId, batch.removed]
+      );
+      await client.query('COMMIT');
+    } catch (error) {
+      await client.query('ROLLBACK').catch(() => {});
+      // lock_not_available: back off and retry the same batch
+      if (error.code !== '55P03') throw error;
+      batch = null;
+    } finally {
+      client.release();
+    }
+
+    if (batch) {
+      lastId = batch.last_id ?? maxId;
+      removed += batch.removed;
+      onProgress?.({ table, lastId, maxId, removed, batchRemoved: batch.removed });
+    }
+    if (pauseMs > 0) await sleep(batch ? pauseMs : Math.max(pauseMs, 1000));
+  }
+
+  await pool.query('UPDATE dedup_progress SET completed_at = NOW() WHERE target = $1', [table]);
+  return { removed, completed: true };
+};
+
+/**
+ * Build the unique index for `table` (without blocking writes) and drop the
+ * cleanup helper index. Rows written since the cleanup pass can still collide;
+ * then the invalid index is dropped, the progress reset, and false returned so
+ * the cleanup can run again.
+ */
+export const enforceUnique = async (table) => {
+  const { key, uniqueIndex } = dedupTargets[table];
+  if (await isUniqueEnforced(table)) return true;
+  try {
+    // A failed earlier attempt leaves an invalid index behind
+    await pool.query(`DROP INDEX CONCURRENTLY IF EXISTS ${uniqueIndex}`);
+    await pool.query(`CREATE UNIQUE INDEX CONCURRENTLY ${uniqueIndex} ON ${table} (${key()})`);
+  } catch (error) {
+    if (error.code !== '23505') throw error;
+    await pool.query(`DROP INDEX CONCURRENTLY IF EXISTS ${uniqueIndex}`);
+    await pool.query('DELETE FROM dedup_progress WHERE target = $1', [table]);
+    return false;
+  }
+  await pool.query(`DROP INDEX CONCURRENTLY IF EXISTS ${helperIndex(table)}`);
+  return true;
+};
+
+/** Groups of duplicate users by case-insensitive email (report only). */
+export const findDuplicateUsers = async ({ limit = 500 } = {}, db = pool) => {
+  if (await isUniqueEnforced('users', db)) return [];
+  const result = await db.query(
+    `SELECT lower(email) AS email, COUNT(*) AS count,
+            ARRAY_AGG(user_id ORDER BY user_id) AS user_ids,
+            ARRAY_AGG(name ORDER BY user_id) AS names
+     FROM users
+     GROUP BY lower(email)
+     HAVING COUNT(*) > 1
+     ORDER BY count DESC, lower(email)
+     LIMIT $1`,
+    [limit]
+  );
+  return result.rows;
+};
@@ -0,0 +1,283 @@
+// Transactional email outbox.
+//
+// Handlers never talk to SMTP. They call queueEmails(client, ...) inside the
+// transaction that makes the change the email is about; it writes the
+// email_logs rows (the recruiter's Sent list) and email_outbox rows, which
+// commit or roll back with that change.
+//
+// Every server process runs a dispatcher that drains the outbox
+// (migrations/015_email_outbox.sql):
+//   - due rows are claimed with FOR UPDATE SKIP LOCKED, so instances never
+//     pick the same row; claiming pushes next_attempt_at out by
+//     EMAIL_CLAIM_TIMEOUT_MS, which acts as a lease if the process dies
+//   - messages go out over one pooled nodemailer transport, at most
+//     SMTP_MAX_CONNECTIONS connections and SMTP_RATE_PER_SECOND messages
+//   - a failed send is retried with exponential backoff and jitter; after
+//     EMAIL_MAX_ATTEMPTS, or when the server rejects it permanently (5xx), the
+//     row is dead-lettered (status 'dead') until an admin retries it
+//
+// Server-side delivery is on when SMTP_HOST is set. Without it the recruiter's
+// mail client sends the message and only email_logs is written, as before.
+import pool from '../db.js';
+
+const SMTP_HOST = process.env.SMTP_HOST || '';
+const SMTP_PORT = Number(process.env.SMTP_PORT || 587);
+const SMTP_SECURE = process.env.SMTP_SECURE === 'true';
+const SMTP_USER = process.env.SMTP_USER || '';
+const SMTP_PASSWORD = process.env.SMTP_PASSWORD || '';
+const EMAIL_FROM = process.env.EMAIL_FROM || SMTP_USER;
+const MAX_CONNECTIONS = Number(process.env.SMTP_MAX_CONNECTIONS || 3);
+const RATE_PER_SECOND = Number(process.env.SMTP_RATE_PER_SECOND || 5);
+
+const BATCH_SIZE = Number(process.env.EMAIL_BATCH_SIZE || 50);
+const POLL_INTERVAL_MS = Number(process.env.EMAIL_POLL_INTERVAL_MS || 2000);
+const MAX_ATTEMPTS = Number(process.env.EMAIL_MAX_ATTEMPTS || 8);
+const RETRY_BASE_MS = Number(process.env.EMAIL_RETRY_BASE_MS || 30 * 1000);
+const RETRY_MAX_MS = Number(process.env.EMAIL_RETRY_MAX_MS || 60 * 60 * 1000);
+const CLAIM_TIMEOUT_MS = Number(process.env.EMAIL_CLAIM_TIMEOUT_MS || 2 * 60 * 1000);
+
+export const emailDeliveryEnabled = () => SMTP_HOST !== '';
+
+/**
+ * Log and queue emails from `senderUserId` on `db` (a client inside the
+ * caller's transaction). `emails` is a list of { to, subject, body,
+ * application_id }. Returns the email_logs ids in input order. Call
+ * wakeDispatcher() after COMMIT to send without waiting for the next poll.
+ */
+export const queueEmails = async (db, senderUserId, emails) => {
+  if (emails.length === 0) return [];
+  const logged = await db.query(
+    `INSERT INTO email_logs (sender_user_id, to_email, subject, body_preview, application_id, delivery_status)
+     SELECT $1, t.to_email, t.subject, left(t.body, 1000), t.application_id, 'queued'
+     FROM unnest($2::text[], $3::text[], $4::text[], $5::int[]) WITH ORDINALITY
+       AS t(to_email, subject, body, application_id, ord)
+     ORDER BY t.ord
+     RETURNING id`,
+    [
+      senderUserId,
+      emails.map(e => e.to),
+      emails.map(e => e.subject),
+      emails.map(e => String(e.body)),
+      emails.map(e => e.application_id ?? null)
+    ]
+  );
+  const ids = logged.rows.map(r => r.id);
+  // Replies go to the recruiter, not to the shared sending address
+  await db.query(
+    `INSERT INTO email_outbox (email_log_id, to_email, reply_to, subject, body)
+     SELECT t.email_log_id, t.to_email, (SELECT email FROM users WHERE user_id = $1), t.subject, t.body
+     FROM unnest($2::int[], $3::text[], $4::text[], $5::text[]) AS t(email_log_id, to_email, subject, body)`,
+    [senderUserId, ids, emails.map(e => e.to), emails.map(e => e.subject), emails.map(e => String(e.body))]
+  );
+  return ids;
+};
+
+// ---------------------------------------------------------------------------
+// Dispatcher
+
+let transport = null;
+
+const getTransport = async () => {
+  if (!transport) {
+    // Loaded on first send: processes without SMTP never import nodemailer
+    const { default: nodemailer } = await import('nodemailer');
+    transport = nodemailer.createTransport({
+      pool: true,
+      host: SMTP_HOST,
+      port: SMTP_PORT,
+      secure: SMTP_SECURE,
+      auth: SMTP_USER ? { user: SMTP_USER, pass: SMTP_PASSWORD } : undefined,
+      maxConnections: MAX_CONNECTIONS,
+      maxMessages: 100,
+      rateDelta: 1000,
+      rateLimit: RATE_PER_SECOND,
+    });
+  }
+  return transport;
+};
+
+const claimBatch = async () => {
+  const result = await pool.query(
+    `UPDATE email_outbox o
+     SET attempts = o.attempts + 1,
+         next_attempt_at = NOW() + $2 * INTERVAL '1 millisecond'
+     FROM (
+       SELECT id FROM email_outbox
+       WHERE status = 'pending' AND next_attempt_at <= NOW()
+       ORDER BY next_attempt_at, id
+       LIMIT $1
+       FOR UPDATE SKIP LOCKED
+     ) due
+     WHERE o.id = due.id
+     RETURNING o.id, o.email_log_id, o.to_email, o.reply_to, o.subject, o.body, o.attempts`,
+    [BATCH_SIZE, CLAIM_TIMEOUT_MS]
+  );
+  return result.rows;
+};
+
+// SMTP 5xx replies (bad address, rejected content) will not succeed on retry
+const isPermanent = (error) => error?.responseCode >= 500 && error.responseCode < 600;
+
+const retryDelay = (attempts) => {
+  const delay = Math.min(RETRY_MAX_MS, RETRY_BASE_MS * 2 ** (attempts - 1));
+  return Math.round(delay * (0.5 + Math.random() / 2));
+};
+
+const recordSent = async (ids) => {
+  if (ids.length === 0) return;
+  await pool.query(
+    `WITH sent AS (
+       UPDATE email_outbox SET status = 'sent', sent_at = NOW(), last_error = NULL
+       WHERE id = ANY($1::bigint[])
+       RETURNING email_log_id
+     )
+     UPDATE email_logs SET delivery_status = 'sent'
+     WHERE id IN (SELECT email_log_id FROM sent)`,
+    [ids]
+  );
+};
+
+const recordFailed = async (failures) => {
+  if (failures.length === 0) return;
+  await pool.query(
+    `WITH failed AS (
+       UPDATE email_outbox o
+       SET status = CASE WHEN f.dead THEN 'dead' ELSE 'pending' END,
+           next_attempt_at = NOW() + f.delay_ms * INTERVAL '1 millisecond',
+           last_error = f.error
+       FROM unnest($1::bigint[], $2::boolean[], $3::int[], $4::text[]) AS f(id, dead, delay_ms, error)
+       WHERE o.id = f.id
+       RETURNING o.email_log_id, o.status
+     )
+     UPDATE email_logs SET delivery_status = 'failed'
+     WHERE id IN (SELECT email_log_id FROM failed WHERE status = 'dead')`,
+    [
+      failures.map(f => f.id),
+      failures.map(f => f.dead),
+      failures.map(f => f.delayMs),
+      failures.map(f => f.error)
+    ]
+  );
+};
+
+/**
+ * Claim one batch of due emails and send it. The transport queues the
+ * messages over its pooled connections at the configured rate.
+ * Returns { claimed, sent, retrying, dead }.
+ */
+export const dispatchOnce = async () => {
+  const rows = await claimBatch();
+  if (rows.length === 0) return { claimed: 0, sent: 0, retrying: 0, dead: 0 };
+
+  const mailer = await getTransport();
+  const outcomes = await Promise.allSettled(rows.map(row => mailer.sendMail({
+    from: EMAIL_FROM,
+    to: row.to_email,
+    replyTo: row.reply_to || undefined,
+    subject: row.subject,
+    text: row.body,
+  })));
+
+  const sent = [];
+  const failures = [];
+  outcomes.forEach((outcome, i) => {
+    const row = rows[i];
+    if (outcome.status === 'fulfilled') {
+      sent.push(row.id);
+      return;
+    }
+    const dead = isPermanent(outcome.reason) || row.attempts >= MAX_ATTEMPTS;
+    failures.push({
+      id: row.id,
+      dead,
+      delayMs: dead ? 0 : retryDelay(row.attempts),
+      error: String(outcome.reason?.message || outcome.reason).slice(0, 1000),
+    });
+  });
+
+  await recordSent(sent);
+  await recordFailed(failures);
+  const dead = failures.filter(f => f.dead).length;
+  return { claimed: rows.length, sent: sent.length, retrying: failures.length - dead, dead };
+};
+
+let timer = null;
+let running = false;
+let again = false;
+
+const drain = async () => {
+  if (running) {
+    again = true;
+    return;
+  }
+  running = true;
+  try {
+    do {
+      again = false;
+      // Keep going while batches come back full
+      let batch;
+      do {
+        batch = await dispatchOnce();
+      } while (batch.claimed === BATCH_SIZE);
+    } while (again);
+  } catch (error) {
+    if (error.code === '42P01') {
+      console.error('email_outbox is missing: apply migrations/015_email_outbox.sql');
+    } else {
+      console.error('Email dispatch failed:', error.message);
+    }
+  } finally {
+    running = false;
+  }
+};
+
+/** Run the dispatcher now instead of at the next poll (call after COMMIT). */
+export const wakeDispatcher = () => {
+  if (timer) setImmediate(drain);
+};
+
+export const startEmailDispatcher = () => {
+  if (timer || !emailDeliveryEnabled() || POLL_INTERVAL_MS <= 0) return;
+  timer = setInterval(drain, POLL_INTERVAL_MS);
+  timer.unref?.();
+  drain();
+};
+
+export const stopEmailDispatcher = () => {
+  clearInterval(timer);
+  timer = null;
+  transport?.close();
+  transport = null;
+};
+
+// ---------------------------------------------------------------------------
+// Dead letters
+
+export const listOutbox = async ({ status = 'dead', limit = 100 } = {}) => {
+  const result = await pool.query(
+    `SELECT id, email_log_id, to_email, subject, status, attempts, next_attempt_at, last_error, created_at, sent_at
+     FROM email_outbox WHERE status = $1
+     ORDER BY id DESC LIMIT $2`,
+    [status, limit]
+  );
+  return result.rows;
+};
+
+/** Put dead-lettered emails (all of them when `ids` is empty) back in the queue. */
+export const retryDeadEmails = async (ids = []) => {
+  const result = await pool.query(
+    `WITH requeued AS (
+       UPDATE email_outbox
+       SET status = 'pending', attempts = 0, next_attempt_at = NOW(), last_error = NULL
+       WHERE status = 'dead' AND (cardinality($1::bigint[]) = 0 OR id = ANY($1::bigint[]))
+       RETURNING id, email_log_id
+     ), logged AS (
+       UPDATE email_logs SET delivery_status = 'queued'
+       WHERE id IN (SELECT email_log_id FROM requeued)
+     )
+     SELECT id FROM requeued`,
+    [ids]
+  );
+  wakeDispatcher();
+  return result.rows.map(r => r.id);
+};
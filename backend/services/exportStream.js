@@ -0,0 +1,156 @@
+// Streaming CSV / NDJSON exports.
+//
+// An export reads its query through a server-side cursor (DECLARE ... FETCH)
+// inside a read-only transaction and writes each fetched batch to the
+// response before fetching the next one. When the client reads slower than
+// the database produces, the next FETCH waits for the socket to drain, so
+// memory stays at one batch however many rows the export has.
+//
+// The cursor pins a pool connection for the duration of the export, so:
+//   - at most EXPORT_MAX_CONCURRENT exports run at once (429 beyond that)
+//   - a client that stops reading for EXPORT_STALL_TIMEOUT_MS is cut off
+//   - the connection is released as soon as the last batch is fetched, before
+//     the response is flushed
+
+import pool from '../db.js';
+
+const BATCH_SIZE = Number(process.env.EXPORT_BATCH_SIZE || 1000);
+const MAX_CONCURRENT = Number(process.env.EXPORT_MAX_CONCURRENT || 2);
+const STALL_TIMEOUT_MS = Number(process.env.EXPORT_STALL_TIMEOUT_MS || 30000);
+
+let activeExports = 0;
+
+const toText = (value) => {
+  if (value === null || value === undefined) return '';
+  if (value instanceof Date) return value.toISOString();
+  if (typeof value === 'object') return JSON.stringify(value);
+  return String(value);
+};
+
+// Text that a spreadsheet would evaluate as a formula is prefixed with '
+// (negative numbers are left alone)
+const FORMULA_START = /^(?:[=+@\t\r]|-(?![\d.]))/;
+
+const csvCell = (value) => {
+  let text = toText(value);
+  if (typeof value === 'string' && FORMULA_START.test(text)) text = `'${text}`;
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+};
+
+const formats = {
+  csv: {
+    contentType: 'text/csv; charset=utf-8',
+    header: (columns) => columns.map((c) => csvCell(c.header)).join(',') + '\r\n',
+    row: (columns, row) => columns.map((c) => csvCell(row[c.key])).join(',') + '\r\n',
+  },
+  ndjson: {
+    contentType: 'application/x-ndjson; charset=utf-8',
+    header: () => '',
+    row: (columns, row) => {
+      const record = {};
+      for (const c of columns) record[c.key] = row[c.key] ?? null;
+      return JSON.stringify(record) + '\n';
+    },
+  },
+};
+
+class ExportAborted extends Error {}
+
+// Resolve once the response can take more data; reject if the client goes
+// away or stops reading for too long
+const waitForDrain = (res) => new Promise((resolve, reject) => {
+  function finish(error) {
+    clearTimeout(timer);
+    res.off('drain', onDrain);
+    res.off('close', onClose);
+    if (error) reject(error);
+    else resolve();
+  }
+  function onDrain() { finish(); }
+  function onClose() { finish(new ExportAborted('Client disconnected')); }
+  const timer = setTimeout(() => finish(new ExportAborted('Client stopped reading')), STALL_TIMEOUT_MS);
+  res.on('drain', onDrain);
+  res.on('close', onClose);
+});
+
+/**
+ * Stream the rows of `sql` to the response as CSV (default) or NDJSON
+ * (`?format=ndjson`). `columns` is a list of { key, header } picking and
+ * ordering the row fields; `filename` is the download name without extension.
+ * `db` is the pool to read from. Keep exports on the primary: a cursor held
+ * open for a whole download on a replica can be cancelled by WAL replay, and
+ * once headers are out the request cannot be retried elsewhere.
+ */
+export const streamExport = async (req, res, { sql, params = [], columns, filename, db = pool }) => {
+  const format = req.query.format || 'csv';
+  if (!formats[format]) {
+    return res.status(400).json({ success: false, error: 'format must be csv or ndjson' });
+  }
+  if (activeExports >= MAX_CONCURRENT) {
+    res.set('Retry-After', '30');
+    return res.status(429).json({ success: false, error: 'Too many exports in progress, try again shortly' });
+  }
+
+  activeExports++;
+  const { contentType, header, row } = formats[format];
+  let client = null;
+  let closed = false;
+  res.once('close', () => { closed = true; });
+
+  const release = async (ok) => {
+    const current = client;
+    client = null;
+    if (!current) return;
+    if (ok) {
+      current.release();
+      return;
+    }
+    // Discard the connection if it cannot even roll back
+    await current.query('ROLLBACK').then(() => current.release(), (error) => current.release(error));
+  };
+
+  try {
+    client = await db.connect();
+    await client.query('BEGIN READ ONLY');
+    // The server ends the transaction itself if this process stalls mid-export
+    await client.query(`SET LOCAL idle_in_transaction_session_timeout = ${STALL_TIMEOUT_MS + 5000}`);
+    await client.query(`DECLARE export_cursor NO SCROLL CURSOR FOR ${sql}`, params);
+
+    const date = new Date().toISOString().slice(0, 10);
+    res.status(200).set({
+      'Content-Type': contentType,
+      'Content-Disposition': `attachment; filename="${filename}-${date}.${format}"`,
+      'Cache-Control': 'no-store',
+    });
+    const head = header(columns);
+    if (head) res.write(head);
+
+    for (;;) {
+      if (closed) throw new ExportAborted('Client disconnected');
+      const { rows } = await client.query(`FETCH ${BATCH_SIZE} FROM export_cursor`);
+      if (rows.length === 0) break;
+
+      let chunk = '';
+      for (const r of rows) chunk += row(columns, r);
+      if (!res.write(chunk)) await waitForDrain(res);
+      if (rows.length < BATCH_SIZE) break;
+    }
+
+    await client.query('CLOSE export_cursor');
+    await client.query('COMMIT');
+    await release(true);
+    res.end();
+  } catch (error) {
+    await release(false);
+    if (!res.headersSent) {
+      console.error(`Error exporting ${filename}:`, error);
+      res.status(500).json({ success: false, error: 'Export failed' });
+    } else {
+      if (!(error instanceof ExportAborted)) console.error(`Error exporting ${filename}:`, error);
+      // End the download with an error instead of a silently truncated file
+      res.destroy();
+    }
+  } finally {
+    activeExports--;
+  }
+};
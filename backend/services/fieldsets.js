@@ -0,0 +1,74 @@
+// Sparse fieldsets: `?fields=a,b,c` on list endpoints.
+//
+// An endpoint declares the fields a client may ask for, each with its SQL
+// expression and the optional joins it needs. selectFields() turns the request
+// into a select list plus only the joins those fields use, so a list page that
+// shows five columns does not read (or serialize) the rest of the row and does
+// not join tables it never displays. Without `fields` an endpoint returns its
+// full response as before.
+
+const IDENTIFIER = /^[a-z_][a-z0-9_]*$/;
+
+/**
+ * `fields` maps response names to a SQL expression, or to { sql, join } where
+ * join names one or more entries of `joins`. `joins` maps names to a SQL join
+ * clause, or to { sql, requires } for joins that build on others. `required`
+ * fields are always returned (row ids the client keys on).
+ */
+export const defineFieldset = ({ fields, joins = {}, required = [] }) => {
+  const normalized = {};
+  for (const [name, spec] of Object.entries(fields)) {
+    if (!IDENTIFIER.test(name)) throw new Error(`Invalid field name "${name}"`);
+    const { sql, join = [] } = typeof spec === 'string' ? { sql: spec } : spec;
+    const needs = [].concat(join);
+    for (const j of needs) {
+      if (!joins[j]) throw new Error(`Field "${name}" uses unknown join "${j}"`);
+    }
+    normalized[name] = { sql, joins: needs };
+  }
+  const normalizedJoins = {};
+  for (const [name, spec] of Object.entries(joins)) {
+    normalizedJoins[name] = typeof spec === 'string' ? { sql: spec, requires: [] } : { requires: [], ...spec };
+  }
+  return { fields: normalized, joins: normalizedJoins, required, names: Object.keys(normalized) };
+};
+
+/**
+ * Resolve `?fields=` against `fieldset`. Returns null when the parameter is
+ * absent (full response), { error } when it names unknown fields, otherwise
+ * { fields, select, joins, uses(join) } with `select` and `joins` ready to
+ * interpolate.
+ */
+export const selectFields = (query, fieldset) => {
+  const raw = query.fields;
+  if (raw === undefined || raw === '') return null;
+
+  const requested = (Array.isArray(raw) ? raw.join(',') : String(raw))
+    .split(',')
+    .map(f => f.trim())
+    .filter(Boolean);
+  const unknown = requested.filter(f => !Object.hasOwn(fieldset.fields, f));
+  if (unknown.length > 0) {
+    return { error: `Unknown fields: ${unknown.join(', ')} (allowed: ${fieldset.names.join(', ')})` };
+  }
+
+  const names = [...new Set([...fieldset.required, ...requested])];
+  const needed = new Set();
+  const addJoin = (name) => {
+    if (needed.has(name)) return;
+    fieldset.joins[name].requires.forEach(addJoin);
+    needed.add(name);
+  };
+  names.forEach(name => fieldset.fields[name].joins.forEach(addJoin));
+
+  return {
+    fields: names,
+    select: names.map(name => `${fieldset.fields[name].sql} AS ${name}`).join(', '),
+    // Declaration order, so a join always follows the ones it builds on
+    joins: Object.keys(fieldset.joins)
+      .filter(name => needed.has(name))
+      .map(name => fieldset.joins[name].sql)
+      .join('\n'),
+    uses: (join) => needed.has(join),
+  };
+};
@@ -0,0 +1,109 @@
+// Interview calendar helpers (interviews.slot and exclusion constraints, migration 010).
+//
+// The database is the source of truth for double-booking: the exclusion
+// constraints reject an overlapping insert/update atomically (SQLSTATE 23P01).
+// findConflicts() is used to explain a rejection and to pre-filter bulk
+// scheduling so one overlap does not fail a whole batch.
+import pool from '../db.js';
+
+// Interviews in these states do not occupy the calendar (mirrors the constraints)
+export const INACTIVE_STATUSES = ['cancelled', 'completed', 'declined'];
+
+// Longest window a listing or availability query may cover
+const MAX_WINDOW_DAYS = 93;
+
+export const isOverlapError = (err) => err?.code === '23P01';
+
+/**
+ * Parse ?from=&to= into ISO strings. Returns null when neither is given (full
+ * history), or { error } when the window is invalid or too large.
+ */
+export const parseWindow = (query) => {
+  if (!query.from && !query.to) return null;
+  const from = new Date(query.from);
+  const to = new Date(query.to);
+  if (isNaN(from) || isNaN(to) || to <= from) {
+    return { error: 'from and to must be valid dates with from < to' };
+  }
+  if (to - from > MAX_WINDOW_DAYS * 24 * 60 * 60 * 1000) {
+    return { error: `Window may span at most ${MAX_WINDOW_DAYS} days` };
+  }
+  return { from: from.toISOString(), to: to.toISOString() };
+};
+
+/**
+ * Find active interviews overlapping each candidate, and overlaps between the
+ * candidates themselves (a later candidate conflicts with an earlier one).
+ * candidates: [{ seeker_id, recruiter_id, schedule, duration, interview_id? }]
+ * Returns Map(candidate index -> [{ interview_id, party, schedule, duration }]);
+ * interview_id is null when the clash is with an earlier candidate.
+ */
+export const findConflicts = async (candidates, db = pool) => {
+  const conflicts = new Map();
+  if (candidates.length === 0) return conflicts;
+
+  const result = await db.query(
+    `WITH c AS (
+       SELECT t.ord, t.seeker_id, t.recruiter_id, t.interview_id,
+              tsrange(t.schedule, t.schedule + make_interval(mins => COALESCE(t.duration, 60)), '[)') AS slot
+       FROM unnest($1::int[], $2::int[], $3::timestamp[], $4::int[], $5::int[])
+         WITH ORDINALITY AS t(seeker_id, recruiter_id, schedule, duration, interview_id, ord)
+     )
+     SELECT c.ord, i.interview_id, i.schedule, i.duration,
+            CASE WHEN i.recruiter_id = c.recruiter_id THEN 'recruiter' ELSE 'seeker' END AS party
+     FROM c
+     JOIN interviews i
+       ON i.slot && c.slot
+      AND (i.recruiter_id = c.recruiter_id OR i.seeker_id = c.seeker_id)
+      AND i.interview_id IS DISTINCT FROM c.interview_id
+      AND COALESCE(i.status, 'scheduled') <> ALL($6::text[])
+     UNION ALL
+     SELECT c.ord, NULL, lower(p.slot), NULL,
+            CASE WHEN p.recruiter_id = c.recruiter_id THEN 'recruiter' ELSE 'seeker' END
+     FROM c
+     JOIN c p
+       ON p.ord < c.ord AND p.slot && c.slot
+      AND (p.recruiter_id = c.recruiter_id OR p.seeker_id = c.seeker_id)
+     ORDER BY 1`,
+    [
+      candidates.map(c => c.seeker_id),
+      candidates.map(c => c.recruiter_id),
+      candidates.map(c => c.schedule),
+      candidates.map(c => c.duration || null),
+      candidates.map(c => c.interview_id || null),
+      INACTIVE_STATUSES
+    ]
+  );
+
+  for (const row of result.rows) {
+    const index = Number(row.ord) - 1;
+    if (!conflicts.has(index)) conflicts.set(index, []);
+    conflicts.get(index).push({
+      interview_id: row.interview_id,
+      party: row.party,
+      schedule: row.schedule,
+      duration: row.duration
+    });
+  }
+  return conflicts;
+};
+
+/**
+ * Start times in [from, to) where a meeting of `duration` minutes fits the
+ * recruiter's calendar (and the seeker's, when given), on a `step`-minute grid.
+ */
+export const findFreeSlots = async ({ recruiterId, seekerId = null, from, to, duration = 60, step = 30 }, db = pool) => {
+  const result = await db.query(
+    `SELECT s.start, s.start + make_interval(mins => $4) AS "end"
+     FROM generate_series($2::timestamp, $3::timestamp - make_interval(mins => $4), make_interval(mins => $5)) AS s(start)
+     WHERE NOT EXISTS (
+       SELECT 1 FROM interviews i
+       WHERE (i.recruiter_id = $1 OR i.seeker_id = $6)
+         AND i.slot && tsrange(s.start, s.start + make_interval(mins => $4), '[)')
+         AND COALESCE(i.status, 'scheduled') <> ALL($7::text[])
+     )
+     ORDER BY s.start`,
+    [recruiterId, from, to, duration, step, seekerId, INACTIVE_STATUSES]
+  );
+  return result.rows;
+};
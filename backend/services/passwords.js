@@ -0,0 +1,41 @@
+// Password checks that accept hashes written before passwords were exempt
+// from input sanitization.
+//
+// Until middleware/sanitizer.js skipped them, passwords went through the xss
+// filter like every other body field, so an account whose password contains
+// '<' or '>' may have bcrypt(xss(password)) stored. A failed compare is retried
+// with the filtered value; callers rehash the raw password when that matches,
+// after which the account no longer depends on the old filter.
+
+import bcrypt from 'bcrypt';
+import xss from 'xss';
+
+const BCRYPT_ROUNDS = 10;
+
+/**
+ * Compare `password` with a stored bcrypt `hash`. Returns { match, legacy };
+ * `legacy` is true when only the xss-filtered password matched.
+ */
+export const checkPassword = async (password, hash) => {
+  if (await bcrypt.compare(password, hash)) return { match: true, legacy: false };
+  if (/[<>]/.test(password)) {
+    const filtered = xss(password);
+    if (filtered !== password && await bcrypt.compare(filtered, hash)) {
+      return { match: true, legacy: true };
+    }
+  }
+  return { match: false, legacy: false };
+};
+
+/**
+ * Replace a legacy hash with one of the raw password. Best effort: the login
+ * already succeeded, and the fallback keeps working if this fails.
+ */
+export const rehashPassword = async (db, table, idColumn, id, password) => {
+  try {
+    const hash = await bcrypt.hash(password, BCRYPT_ROUNDS);
+    await db.query(`UPDATE ${table} SET password = $1 WHERE ${idColumn} = $2`, [hash, id]);
+  } catch (err) {
+    console.warn(`Failed to rehash legacy password for ${table}.${idColumn}=${id}:`, err.message);
+  }
+};
@@ -0,0 +1,175 @@
+// Read-replica routing.
+//
+// Read-only handlers ask for `readPool(req)` instead of using the primary pool.
+// It returns a healthy replica (round robin) unless:
+//   - no replicas are configured (DATABASE_REPLICA_URLS),
+//   - the user made a successful write in the last READ_YOUR_WRITES_MS, so
+//     they see their own change even if the replicas have not replayed it yet,
+//   - every replica is lagging more than REPLICA_MAX_LAG_MS, unreachable, or
+//     not checked yet.
+// In all of those cases reads go to the primary. Replica lag is polled every
+// REPLICA_CHECK_INTERVAL_MS. A read that fails on a replica because of the
+// connection (or a recovery conflict) is retried once on the primary.
+//
+// The write pins live in this process: behind a load balancer without sticky
+// sessions, a user's next request can land on an instance that has not seen
+// their write and read from a replica up to REPLICA_MAX_LAG_MS behind.
+import pool, { replicaPools } from '../db.js';
+
+const PIN_MS = Number(process.env.READ_YOUR_WRITES_MS || 5000);
+const MAX_LAG_MS = Number(process.env.REPLICA_MAX_LAG_MS || 2000);
+const CHECK_INTERVAL_MS = Number(process.env.REPLICA_CHECK_INTERVAL_MS || 5000);
+const MAX_PINNED = 50000;
+
+const replicas = replicaPools.map((replicaPool, index) => ({
+  name: `replica${index + 1}`,
+  pool: replicaPool,
+  healthy: false,
+  lagMs: null,
+  error: 'not checked yet',
+}));
+
+// Idle clients of a restarting replica emit 'error' on the pool; without a
+// listener that would take the process down
+for (const replica of replicas) {
+  replica.pool.on('error', (error) => {
+    replica.healthy = false;
+    replica.error = error.message;
+  });
+}
+
+// ---------------------------------------------------------------------------
+// Read-your-writes pins: user key -> time the pin ends. Insertion order is
+// pin order, so the oldest pins are at the front.
+
+const pins = new Map();
+
+// Admin tokens carry admins.admin_id, a different id space from users
+const userKey = (user) => (user?.id == null ? null : `${user.role === 'admin' ? 'admin' : 'user'}:${user.id}`);
+
+const isPinned = (user) => {
+  const key = userKey(user);
+  if (!key) return false;
+  const until = pins.get(key);
+  if (until === undefined) return false;
+  if (until > Date.now()) return true;
+  pins.delete(key);
+  return false;
+};
+
+export const pinToPrimary = (user) => {
+  const key = userKey(user);
+  if (!key || PIN_MS <= 0) return;
+  pins.delete(key);
+  pins.set(key, Date.now() + PIN_MS);
+  if (pins.size > MAX_PINNED) pins.delete(pins.keys().next().value);
+};
+
+const SAFE_METHODS = new Set(['GET', 'HEAD', 'OPTIONS']);
+
+/**
+ * Pin the user to the primary after a successful write. Mounted before the
+ * routes; req.user is set by authenticateToken by the time the response ends.
+ */
+export const trackWrites = (req, res, next) => {
+  if (replicas.length > 0 && !SAFE_METHODS.has(req.method)) {
+    res.once('finish', () => {
+      if (res.statusCode < 400) pinToPrimary(req.user);
+    });
+  }
+  next();
+};
+
+// ---------------------------------------------------------------------------
+// Lag monitoring
+
+// Replay lag in ms; 0 when the replica has replayed everything it received
+// (an idle primary would otherwise look like a growing lag)
+const LAG_QUERY = `
+  SELECT CASE
+           WHEN NOT pg_is_in_recovery() THEN 0
+           WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+           ELSE COALESCE(EXTRACT(EPOCH FROM (now() - pg_last_xact_replay_timestamp())) * 1000, 0)
+         END AS lag_ms`;
+
+export const checkReplicas = () => Promise.all(replicas.map(async (replica) => {
+  try {
+    const { rows } = await replica.pool.query(LAG_QUERY);
+    replica.lagMs = Math.round(Number(rows[0].lag_ms));
+    replica.error = null;
+    replica.healthy = replica.lagMs <= MAX_LAG_MS;
+  } catch (error) {
+    replica.healthy = false;
+    replica.lagMs = null;
+    replica.error = error.message;
+  }
+}));
+
+let monitor = null;
+
+export const startReplicaMonitor = () => {
+  if (monitor || replicas.length === 0 || CHECK_INTERVAL_MS <= 0) return;
+  checkReplicas().catch(() => {});
+  monitor = setInterval(() => checkReplicas().catch(() => {}), CHECK_INTERVAL_MS);
+  monitor.unref?.();
+};
+
+export const replicaStatus = () => replicas.map(({ name, healthy, lagMs, error }) => ({ name, healthy, lagMs, error }));
+
+// ---------------------------------------------------------------------------
+// Routing
+
+let nextReplica = 0;
+
+const pickReplica = () => {
+  for (let i = 0; i < replicas.length; i++) {
+    const replica = replicas[(nextReplica + i) % replicas.length];
+    if (replica.healthy) {
+      nextReplica = (nextReplica + i + 1) % replicas.length;
+      return replica;
+    }
+  }
+  return null;
+};
+
+// Errors that say the replica (not the query) is the problem: connection
+// failures (no server severity), admin shutdown, and queries cancelled by WAL
+// replay conflicts
+const isReplicaFailure = (error) => {
+  if (!error?.severity) return true;
+  return /^(08|57P)/.test(error.code) || error.code === '40001';
+};
+
+const onReplica = (replica) => ({
+  query: async (...args) => {
+    try {
+      return await replica.pool.query(...args);
+    } catch (error) {
+      if (!isReplicaFailure(error)) throw error;
+      if (error.code !== '40001') {
+        replica.healthy = false;
+        replica.error = error.message;
+      }
+      return pool.query(...args);
+    }
+  },
+  connect: async () => {
+    try {
+      return await replica.pool.connect();
+    } catch (error) {
+      replica.healthy = false;
+      replica.error = error.message;
+      return pool.connect();
+    }
+  },
+});
+
+/**
+ * Pool (query/connect) for a read-only handler. Only use it for handlers that
+ * never write: a write sent to a replica fails.
+ */
+export const readPool = (req) => {
+  if (replicas.length === 0 || isPinned(req?.user)) return pool;
+  const replica = pickReplica();
+  return replica ? onReplica(replica) : pool;
+};
@@ -0,0 +1,212 @@
+// Materialized dashboard counters (recruiter_stats / seeker_stats, migration 006).
+//
+// Write paths call the bump* helpers after their change has been committed so a
+// counter failure can never fail or abort the user's request. Bumps only touch
+// rows that already exist: a missing row is built from the source tables the
+// first time the stats endpoint reads it (reconcile*Stats with an id), so a
+// delta is never mistaken for an absolute count.
+//
+// Time-windowed counters (new applications in 7 days, upcoming interviews,
+// hires in 30 days) age out without any write happening, and best-effort bumps
+// can be lost, so startStatsReconciler() periodically recomputes every row.
+import pool from '../db.js';
+
+const RECRUITER_COUNTERS = [
+  'total_jobs', 'active_jobs', 'total_applications', 'total_views',
+  'new_applications', 'scheduled_interviews', 'hired_candidates'
+];
+const SEEKER_COUNTERS = ['applied_jobs', 'interviews_scheduled', 'profile_views'];
+
+// Statuses counted as a hire on the recruiter dashboard
+export const HIRED_STATUSES = ['hired', 'accepted'];
+
+const RECONCILE_INTERVAL_MS = Number(process.env.STATS_RECONCILE_INTERVAL_MS || 5 * 60 * 1000);
+
+// Build "col = GREATEST(col + $n, 0)" assignments for the non-zero deltas
+const buildDeltaSet = (allowed, deltas, firstParam) => {
+  const sets = [];
+  const values = [];
+  for (const [col, delta] of Object.entries(deltas)) {
+    if (!allowed.includes(col)) throw new Error(`Unknown stats counter: ${col}`);
+    if (!delta) continue;
+    values.push(Number(delta));
+    sets.push(`${col} = GREATEST(${col} + $${firstParam + values.length - 1}, 0)`);
+  }
+  return { sets, values };
+};
+
+const reconcileResult = (requested, ids, result) => {
+  if (ids === null) return result.rowCount;
+  return Array.isArray(requested) ? result.rows : result.rows[0] || null;
+};
+
+const logBumpFailure = (err) => {
+  // 42P01: migration 006 not applied yet; the endpoints fall back to live counts
+  if (err?.code !== '42P01') console.warn('Failed to update dashboard counters:', err.message);
+};
+
+export const bumpRecruiterStats = async (recruiterId, deltas) => {
+  const { sets, values } = buildDeltaSet(RECRUITER_COUNTERS, deltas, 2);
+  if (!recruiterId || sets.length === 0) return;
+  try {
+    await pool.query(
+      `UPDATE recruiter_stats SET ${sets.join(', ')}, updated_at = NOW() WHERE recruiter_id = $1`,
+      [recruiterId, ...values]
+    );
+  } catch (err) {
+    logBumpFailure(err);
+  }
+};
+
+// Apply the same deltas to every recruiter operating a job
+export const bumpRecruiterStatsForJob = async (jobId, deltas) => {
+  const { sets, values } = buildDeltaSet(RECRUITER_COUNTERS, deltas, 2);
+  if (!jobId || sets.length === 0) return;
+  try {
+    await pool.query(
+      `UPDATE recruiter_stats SET ${sets.join(', ')}, updated_at = NOW()
+       WHERE recruiter_id IN (SELECT recruiter_id FROM operates WHERE job_id = $1)`,
+      [jobId, ...values]
+    );
+  } catch (err) {
+    logBumpFailure(err);
+  }
+};
+
+export const bumpSeekerStats = async (seekerId, deltas) => {
+  const { sets, values } = buildDeltaSet(SEEKER_COUNTERS, deltas, 2);
+  if (!seekerId || sets.length === 0) return;
+  try {
+    await pool.query(
+      `UPDATE seeker_stats SET ${sets.join(', ')}, updated_at = NOW() WHERE seeker_id = $1`,
+      [seekerId, ...values]
+    );
+  } catch (err) {
+    logBumpFailure(err);
+  }
+};
+
+export const bumpSeekerStatsForUser = async (userId, deltas) => {
+  const { sets, values } = buildDeltaSet(SEEKER_COUNTERS, deltas, 2);
+  if (!userId || sets.length === 0) return;
+  try {
+    await pool.query(
+      `UPDATE seeker_stats SET ${sets.join(', ')}, updated_at = NOW()
+       WHERE seeker_id IN (SELECT seeker_id FROM job_seekers WHERE user_id = $1)`,
+      [userId, ...values]
+    );
+  } catch (err) {
+    logBumpFailure(err);
+  }
+};
+
+// null -> every row, otherwise a single id or a list of ids
+const toIdArray = (ids) => (ids === null || ids === undefined ? null : [].concat(ids).map(Number));
+
+// Recompute recruiter rows from the source tables. Targeted calls rebuild and
+// return the given rows (a single id returns its row); a full run (null) only
+// writes rows that drifted and returns how many.
+export const reconcileRecruiterStats = async (recruiterIds = null, db = pool) => {
+  const ids = toIdArray(recruiterIds);
+  const result = await db.query(
+    `INSERT INTO recruiter_stats (recruiter_id, ${RECRUITER_COUNTERS.join(', ')}, updated_at)
+     SELECT r.recruiter_id,
+            COUNT(j.job_id)::int,
+            COUNT(j.job_id) FILTER (WHERE j.status = 'active')::int,
+            COALESCE(SUM(ja.total), 0)::int,
+            COALESCE(SUM(j.view_count), 0)::bigint,
+            COALESCE(SUM(ja.recent), 0)::int,
+            (SELECT COUNT(*) FROM interviews i
+             WHERE i.recruiter_id = r.recruiter_id AND i.schedule >= NOW() AT TIME ZONE 'UTC')::int,
+            COALESCE(SUM(ja.hired), 0)::int,
+            NOW()
+     FROM recruiters r
+     LEFT JOIN (SELECT DISTINCT recruiter_id, job_id FROM operates) o ON o.recruiter_id = r.recruiter_id
+     LEFT JOIN jobs j ON j.job_id = o.job_id
+     LEFT JOIN LATERAL (
+       SELECT COUNT(*) AS total,
+              COUNT(*) FILTER (WHERE a.applied_timestamp >= NOW() - INTERVAL '7 days') AS recent,
+              COUNT(*) FILTER (WHERE a.status = ANY($2::text[])
+                                 AND a.applied_timestamp >= NOW() - INTERVAL '30 days') AS hired
+       FROM applications a WHERE a.job_id = j.job_id
+     ) ja ON true
+     WHERE ($1::int[] IS NULL OR r.recruiter_id = ANY($1))
+     GROUP BY r.recruiter_id
+     ON CONFLICT (recruiter_id) DO UPDATE SET
+       ${RECRUITER_COUNTERS.map(c => `${c} = EXCLUDED.${c}`).join(', ')},
+       updated_at = NOW()
+     WHERE ($1::int[] IS NOT NULL)
+        OR (${RECRUITER_COUNTERS.map(c => `recruiter_stats.${c}`).join(', ')})
+           IS DISTINCT FROM (${RECRUITER_COUNTERS.map(c => `EXCLUDED.${c}`).join(', ')})
+     RETURNING *`,
+    [ids, HIRED_STATUSES]
+  );
+  return reconcileResult(recruiterIds, ids, result);
+};
+
+export const reconcileSeekerStats = async (seekerIds = null, db = pool) => {
+  const ids = toIdArray(seekerIds);
+  const result = await db.query(
+    `INSERT INTO seeker_stats (seeker_id, ${SEEKER_COUNTERS.join(', ')}, updated_at)
+     SELECT js.seeker_id,
+            (SELECT COUNT(*) FROM applications a WHERE a.seeker_id = js.seeker_id)::int,
+            (SELECT COUNT(*) FROM interviews i
+             WHERE i.seeker_id = js.seeker_id AND i.schedule >= NOW() AT TIME ZONE 'UTC')::int,
+            (SELECT COUNT(DISTINCT pv.viewer_id) FROM profile_views pv WHERE pv.viewed_user_id = js.user_id)::int,
+            NOW()
+     FROM job_seekers js
+     WHERE ($1::int[] IS NULL OR js.seeker_id = ANY($1))
+     ON CONFLICT (seeker_id) DO UPDATE SET
+       ${SEEKER_COUNTERS.map(c => `${c} = EXCLUDED.${c}`).join(', ')},
+       updated_at = NOW()
+     WHERE ($1::int[] IS NOT NULL)
+        OR (${SEEKER_COUNTERS.map(c => `seeker_stats.${c}`).join(', ')})
+           IS DISTINCT FROM (${SEEKER_COUNTERS.map(c => `EXCLUDED.${c}`).join(', ')})
+     RETURNING *`,
+    [ids]
+  );
+  return reconcileResult(seekerIds, ids, result);
+};
+
+// Best-effort targeted rebuild, for write paths whose effect on the counters is
+// easier to recompute than to express as deltas (bulk updates, job deletion)
+export const refreshRecruiterStats = async (recruiterIds) => {
+  if ([].concat(recruiterIds).length === 0) return;
+  await reconcileRecruiterStats(recruiterIds).catch(logBumpFailure);
+};
+
+export const refreshSeekerStats = async (seekerIds) => {
+  if ([].concat(seekerIds).length === 0) return;
+  await reconcileSeekerStats(seekerIds).catch(logBumpFailure);
+};
+
+let reconcileTimer = null;
+let reconciling = false;
+
+export const runStatsReconciliation = async () => {
+  if (reconciling) return;
+  reconciling = true;
+  const started = Date.now();
+  try {
+    const recruiters = await reconcileRecruiterStats();
+    const seekers = await reconcileSeekerStats();
+    if (recruiters + seekers > 0) {
+      console.log(`📊 Stats reconciliation repaired ${recruiters} recruiter / ${seekers} seeker rows in ${Date.now() - started}ms`);
+    }
+  } catch (err) {
+    logBumpFailure(err);
+  } finally {
+    reconciling = false;
+  }
+};
+
+export const startStatsReconciler = (intervalMs = RECONCILE_INTERVAL_MS) => {
+  if (reconcileTimer || !(intervalMs > 0)) return;
+  reconcileTimer = setInterval(runStatsReconciliation, intervalMs);
+  reconcileTimer.unref();
+};
+
+export const stopStatsReconciler = () => {
+  clearInterval(reconcileTimer);
+  reconcileTimer = null;
+};
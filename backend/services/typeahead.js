@@ -0,0 +1,359 @@
+// In-memory typeahead for the job search boxes.
+//
+// Distinct job titles, companies, locations and required skills of job
+// postings are kept per kind in a sorted array of search keys. Each term
+// is indexed under every word it contains, so "eng" finds "Software Engineer";
+// a lookup is a binary search for the prefix and a scan of the matching range,
+// ranked by how many jobs use the term. A prefix
+// that matches more than SCAN_LIMIT keys (all one- to three-letter prefixes,
+// and common longer ones like "senior") is too wide to scan per keystroke, so
+// its top MAX_SUGGESTIONS terms are kept as a list, updated with the counts.
+// Nothing on the request path touches Postgres.
+//
+// Job changes made by this process are applied immediately (indexJob,
+// unindexJob, reindexJob); every TYPEAHEAD_REFRESH_MS the index is rebuilt
+// from the database, which picks up other instances' edits. Only postings are
+// indexed: resume skills are users' private free text, and suggestions are
+// visible to every job seeker.
+import pool from '../db.js';
+
+const REFRESH_MS = Number(process.env.TYPEAHEAD_REFRESH_MS || 10 * 60 * 1000);
+const RESULT_CACHE_SIZE = 2000;
+const MAX_WORDS = 6;
+const HEAD_DEPTH = 3;
+const SCAN_LIMIT = 256;
+const SEPARATOR = '\u0001';
+
+export const KINDS = ['title', 'company', 'location', 'skill'];
+export const MAX_SUGGESTIONS = 20;
+// Top lists keep spare entries so a falling term rarely forces a rescan
+const HEAD_SIZE = 2 * MAX_SUGGESTIONS;
+
+const display = (value) => String(value ?? '').trim().replace(/\s+/g, ' ');
+const normalize = (value) => display(value).toLowerCase();
+
+const lowerBound = (keys, target) => {
+  let lo = 0;
+  let hi = keys.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (keys[mid] < target) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+};
+
+// Search keys for a term: the term itself and the remainder after each word
+// break, each suffixed with the term so keys are unique
+const searchKeys = (norm) => {
+  const keys = [`${norm}${SEPARATOR}${norm}`];
+  const breaks = /[\s\-/,()&.+]+/g;
+  let match;
+  while (keys.length < MAX_WORDS && (match = breaks.exec(norm)) !== null) {
+    const rest = norm.slice(match.index + match[0].length);
+    if (rest) keys.push(`${rest}${SEPARATOR}${norm}`);
+  }
+  return keys;
+};
+
+// Prefixes of a key's searchable part, shortest first
+const keyPrefixes = (key, maxLength) => {
+  const word = key.slice(0, Math.min(key.indexOf(SEPARATOR), maxLength));
+  const prefixes = [];
+  for (let length = 1; length <= word.length; length++) prefixes.push(word.slice(0, length));
+  return prefixes;
+};
+
+const ranksBefore = (a, b) => a.count > b.count || (a.count === b.count && a.value < b.value);
+
+// Insert `term` into the sorted top list if it makes the cut
+const offer = (list, term, limit) => {
+  if (limit <= 0) return;
+  if (list.length === limit && !ranksBefore(term, list[limit - 1])) return;
+  let at = list.length;
+  while (at > 0 && ranksBefore(term, list[at - 1])) at--;
+  list.splice(at, 0, term);
+  if (list.length > limit) list.pop();
+};
+
+let searchStamp = 0;
+
+class PrefixIndex {
+  constructor() {
+    this.terms = new Map(); // normalized term -> { value, count, seen }
+    this.keys = []; // sorted search keys
+    this.refs = []; // term object for each key
+    this.heads = new Map(); // wide prefix -> { terms: best first, complete }
+  }
+
+  add(value, delta = 1) {
+    const norm = normalize(value);
+    if (!norm) return;
+    let term = this.terms.get(norm);
+    if (!term) {
+      if (delta <= 0) return;
+      term = { value: display(value), count: 0, seen: 0 };
+      this.terms.set(norm, term);
+      for (const key of searchKeys(norm)) {
+        const at = lowerBound(this.keys, key);
+        this.keys.splice(at, 0, key);
+        this.refs.splice(at, 0, term);
+      }
+    }
+    term.count += delta;
+
+    const keys = searchKeys(norm);
+    if (term.count <= 0) {
+      this.terms.delete(norm);
+      for (const key of keys) {
+        const at = lowerBound(this.keys, key);
+        if (this.keys[at] === key) {
+          this.keys.splice(at, 1);
+          this.refs.splice(at, 1);
+        }
+      }
+    }
+    this.updateHeads(term, delta, keys);
+  }
+
+  // Keep the top lists in step with a count change. A list always holds the
+  // best terms of its prefix (all of them when `complete`). A term that
+  // falls to the end of an incomplete list may now rank below one outside
+  // it, so it leaves and the list gets shorter; a lookup that needs more
+  // entries than are left rescans the prefix.
+  updateHeads(term, delta, keys) {
+    for (const prefix of new Set(keys.flatMap((key) => keyPrefixes(key, Infinity)))) {
+      const head = this.heads.get(prefix);
+      if (!head) continue;
+      const list = head.terms;
+      const at = list.indexOf(term);
+      if (at >= 0) list.splice(at, 1);
+      if (term.count <= 0) continue;
+      if (head.complete) {
+        offer(list, term, HEAD_SIZE);
+        if (list.length === HEAD_SIZE) head.complete = false;
+      } else if (at >= 0 || delta > 0) {
+        const size = at >= 0 ? list.length + 1 : list.length;
+        offer(list, term, size);
+        if (delta < 0 && list[list.length - 1] === term) list.pop();
+      }
+    }
+  }
+
+  // Bulk build: much cheaper than sorted inserts one at a time
+  static fromCounts(counts) {
+    const index = new PrefixIndex();
+    const entries = [];
+    for (const [norm, term] of counts) {
+      const ref = { value: term.value, count: term.count, seen: 0 };
+      index.terms.set(norm, ref);
+      for (const key of searchKeys(norm)) entries.push([key, ref]);
+    }
+    entries.sort((a, b) => (a[0] < b[0] ? -1 : 1));
+    index.keys = entries.map((e) => e[0]);
+    index.refs = entries.map((e) => e[1]);
+    // Top lists for every one- to three-letter prefix, in one pass
+    const seen = new Map();
+    for (const [key, ref] of entries) {
+      for (const prefix of keyPrefixes(key, HEAD_DEPTH)) {
+        let head = index.heads.get(prefix);
+        if (!head) {
+          index.heads.set(prefix, (head = { terms: [], complete: true }));
+          seen.set(prefix, new Set());
+        }
+        if (seen.get(prefix).has(ref)) continue;
+        seen.get(prefix).add(ref);
+        offer(head.terms, ref, HEAD_SIZE);
+      }
+    }
+    for (const [prefix, terms] of seen) index.heads.get(prefix).complete = terms.size < HEAD_SIZE;
+    return index;
+  }
+
+  scan(limit, from, to) {
+    const out = [];
+    const stamp = ++searchStamp;
+    for (let i = from; i < to; i++) {
+      const term = this.refs[i];
+      if (term.seen === stamp) continue;
+      term.seen = stamp;
+      offer(out, term, limit);
+    }
+    return out;
+  }
+
+  // Top `limit` terms with a word starting with `prefix`, most used first
+  search(prefix, limit) {
+    let head = this.heads.get(prefix);
+    if (!head || (!head.complete && head.terms.length < limit)) {
+      const from = lowerBound(this.keys, prefix);
+      const to = lowerBound(this.keys, `${prefix}\uffff`);
+      if (to - from <= SCAN_LIMIT) {
+        this.heads.delete(prefix);
+        return this.scan(limit, from, to);
+      }
+      const terms = this.scan(HEAD_SIZE, from, to);
+      head = { terms, complete: terms.length < HEAD_SIZE };
+      this.heads.set(prefix, head);
+    }
+    return head.terms.slice(0, limit);
+  }
+}
+
+// ---------------------------------------------------------------------------
+// State
+
+let indexes = Object.fromEntries(KINDS.map((kind) => [kind, new PrefixIndex()]));
+// job_id -> the terms it contributed, so an edit can subtract the old ones
+let jobTerms = new Map();
+let loadedAt = null;
+let loading = null;
+let changedWhileLoading = null;
+const results = new Map();
+
+const jobContribution = (job) => ({
+  title: job.title || null,
+  company: job.company || null,
+  location: job.location || null,
+  skill: Array.isArray(job.skills_required) ? [...new Set(job.skills_required.filter(Boolean))] : [],
+});
+
+const applyContribution = (contribution, delta) => {
+  for (const kind of KINDS) {
+    for (const value of [].concat(contribution[kind] ?? [])) {
+      if (value) indexes[kind].add(value, delta);
+    }
+  }
+};
+
+const changed = (jobId) => {
+  results.clear();
+  changedWhileLoading?.add(Number(jobId));
+};
+
+/** Add (or replace) a job's terms; `job` needs job_id, title, company, location, skills_required. */
+export const indexJob = (job) => {
+  if (!job?.job_id) return;
+  const id = Number(job.job_id);
+  const previous = jobTerms.get(id);
+  if (previous) applyContribution(previous, -1);
+  const contribution = jobContribution(job);
+  applyContribution(contribution, 1);
+  jobTerms.set(id, contribution);
+  changed(id);
+};
+
+export const unindexJob = (jobId) => {
+  const id = Number(jobId);
+  const previous = jobTerms.get(id);
+  if (!previous) return;
+  applyContribution(previous, -1);
+  jobTerms.delete(id);
+  changed(id);
+};
+
+const selectJobs = async (where = '', params = []) => {
+  try {
+    return (await pool.query(`SELECT job_id, title, company, location, skills_required FROM jobs ${where}`, params)).rows;
+  } catch (err) {
+    // 42703: older schemas without location/skills_required
+    if (err?.code !== '42703') throw err;
+    return (await pool.query(`SELECT job_id, title, company FROM jobs ${where}`, params)).rows;
+  }
+};
+
+/** Re-read one job after an edit made elsewhere in the handler (or remove it if it is gone). */
+export const reindexJob = async (jobId) => {
+  try {
+    const [job] = await selectJobs('WHERE job_id = $1', [jobId]);
+    if (job) indexJob(job);
+    else unindexJob(jobId);
+  } catch (err) {
+    console.warn('Failed to update typeahead index:', err.message);
+  }
+};
+
+const countInto = (counts, value) => {
+  const norm = normalize(value);
+  if (!norm) return;
+  const term = counts.get(norm);
+  if (term) term.count += 1;
+  else counts.set(norm, { value: display(value), count: 1 });
+};
+
+/** Rebuild every index from the database and swap it in. */
+export const loadTypeahead = () => {
+  loading ??= (async () => {
+    changedWhileLoading = new Set();
+    try {
+      const jobs = await selectJobs();
+
+      const counts = Object.fromEntries(KINDS.map((kind) => [kind, new Map()]));
+      const nextJobTerms = new Map();
+      for (const job of jobs) {
+        const contribution = jobContribution(job);
+        for (const kind of KINDS) {
+          for (const value of [].concat(contribution[kind] ?? [])) countInto(counts[kind], value);
+        }
+        nextJobTerms.set(Number(job.job_id), contribution);
+      }
+
+      indexes = Object.fromEntries(KINDS.map((kind) => [kind, PrefixIndex.fromCounts(counts[kind])]));
+      jobTerms = nextJobTerms;
+      loadedAt = new Date();
+      results.clear();
+
+      // Edits that raced with the load may be missing from the snapshot
+      const racing = [...changedWhileLoading];
+      changedWhileLoading = null;
+      await Promise.all(racing.map(reindexJob));
+    } catch (err) {
+      console.warn('Failed to load typeahead index:', err.message);
+    } finally {
+      changedWhileLoading = null;
+      loading = null;
+    }
+  })();
+  return loading;
+};
+
+/**
+ * Suggestions for `query` from the given kinds (all by default), most used
+ * first. Returns [] until the first load has finished.
+ */
+export const suggest = (query, { kinds = KINDS, limit = 8 } = {}) => {
+  limit = Math.min(limit, MAX_SUGGESTIONS);
+  const prefix = normalize(query);
+  if (!prefix || prefix.includes(SEPARATOR)) return [];
+  const cacheKey = `${kinds.join(',')}|${limit}|${prefix}`;
+  const cached = results.get(cacheKey);
+  if (cached) return cached;
+
+  const out = [];
+  for (const kind of kinds) {
+    for (const { value, count } of indexes[kind].search(prefix, limit)) {
+      offer(out, { value, kind, count }, limit);
+    }
+  }
+
+  results.set(cacheKey, out);
+  if (results.size > RESULT_CACHE_SIZE) results.delete(results.keys().next().value);
+  return out;
+};
+
+export const typeaheadReady = () => loadedAt !== null;
+
+let refreshTimer = null;
+
+export const startTypeaheadRefresh = (intervalMs = REFRESH_MS) => {
+  if (refreshTimer) return;
+  loadTypeahead();
+  if (!(intervalMs > 0)) return;
+  refreshTimer = setInterval(loadTypeahead, intervalMs);
+  refreshTimer.unref();
+};
+
+export const stopTypeaheadRefresh = () => {
+  clearInterval(refreshTimer);
+  refreshTimer = null;
+};
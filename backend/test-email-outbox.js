@@ -0,0 +1,147 @@
+// Check outbox delivery against a local SMTP stand-in (started by this script).
+// The stand-in answers the first message to a "retry" address with a
+// temporary failure (451) and rejects any "bounce" address (550), so one run
+// covers delivery, retry with backoff, and dead-lettering. Needs migrations/015_email_outbox.sql.
+//   node test-email-outbox.js
+import net from 'net';
+
+const startSmtpStandIn = () => new Promise((resolve) => {
+  const received = [];
+  const deferred = new Set();
+  const server = net.createServer((socket) => {
+    let buffer = '';
+    let inData = false;
+    let recipients = [];
+    let data = '';
+    const reply = (line) => socket.write(`${line}\r\n`);
+    reply('220 stand-in ESMTP');
+    socket.on('data', (chunk) => {
+      buffer += chunk.toString('utf8');
+      let end;
+      while ((end = buffer.indexOf('\r\n')) >= 0) {
+        const line = buffer.slice(0, end);
+        buffer = buffer.slice(end + 2);
+        if (inData) {
+          if (line !== '.') {
+            data += `${line}\n`;
+            continue;
+          }
+          inData = false;
+          const retry = recipients.find(r => /retry/i.test(r) && !deferred.has(r));
+          if (retry) {
+            deferred.add(retry);
+            reply('451 4.3.0 Try again later');
+          } else {
+            received.push({ recipients, data });
+            reply('250 2.0.0 Queued');
+          }
+          recipients = [];
+          data = '';
+          continue;
+        }
+        const command = line.slice(0, 4).toUpperCase();
+        if (command === 'EHLO' || command === 'HELO') reply('250 stand-in');
+        else if (command === 'MAIL' || command === 'RSET') { recipients = []; reply('250 OK'); }
+        else if (command === 'RCPT') {
+          if (/bounce/i.test(line)) reply('550 5.1.1 No such user');
+          else { recipients.push(line.replace(/^RCPT TO:/i, '')); reply('250 OK'); }
+        }
+        else if (command === 'DATA') { inData = true; reply('354 End data with <CR><LF>.<CR><LF>'); }
+        else if (command === 'NOOP') reply('250 OK');
+        else if (command === 'QUIT') socket.end('221 Bye\r\n');
+        else reply('502 Command not implemented');
+      }
+    });
+    socket.on('error', () => {});
+  });
+  server.listen(0, '127.0.0.1', () => resolve({ server, received, port: server.address().port }));
+});
+
+async function testEmailOutbox() {
+  const smtp = await startSmtpStandIn();
+  console.log(`SMTP stand-in listening on 127.0.0.1:${smtp.port}`);
+
+  // The outbox reads its settings at import time
+  Object.assign(process.env, {
+    SMTP_HOST: '127.0.0.1',
+    SMTP_PORT: String(smtp.port),
+    SMTP_USER: '',
+    EMAIL_FROM: 'jobportal@example.test',
+    EMAIL_RETRY_BASE_MS: '100',
+    EMAIL_MAX_ATTEMPTS: '3',
+  });
+  const { default: pool } = await import('./db.js');
+  const { queueEmails, dispatchOnce, stopEmailDispatcher } = await import('./services/emailOutbox.js');
+
+  let failed = false;
+  const expect = (label, ok) => {
+    console.log(`${ok ? '✓' : '✗'} ${label}`);
+    if (!ok) failed = true;
+  };
+
+  let logIds = [];
+  try {
+    const sender = await pool.query('SELECT user_id FROM users ORDER BY user_id LIMIT 1');
+    if (sender.rows.length === 0) throw new Error('No users to send from; seed the database first');
+
+    const client = await pool.connect();
+    try {
+      await client.query('BEGIN');
+      logIds = await queueEmails(client, sender.rows[0].user_id, [
+        { to: 'retry@example.test', subject: 'Outbox test 1', body: 'Hello from the outbox' },
+        { to: 'plain@example.test', subject: 'Outbox test 2', body: 'Hello again' },
+        { to: 'bounce@example.test', subject: 'Outbox test 3', body: 'Nobody home' },
+      ]);
+      await client.query('COMMIT');
+    } catch (error) {
+      await client.query('ROLLBACK').catch(() => {});
+      throw error;
+    } finally {
+      client.release();
+    }
+    console.log(`Queued email_logs ${logIds.join(', ')}`);
+
+    const started = Date.now();
+    for (let round = 1; round <= 20; round++) {
+      const result = await dispatchOnce();
+      if (result.claimed > 0) console.log(`  round ${round}: ${JSON.stringify(result)}`);
+      const pending = await pool.query(
+        "SELECT COUNT(*)::int AS n FROM email_outbox WHERE email_log_id = ANY($1) AND status = 'pending'",
+        [logIds]
+      );
+      if (pending.rows[0].n === 0) break;
+      await new Promise(resolve => setTimeout(resolve, 150));
+    }
+    console.log(`Dispatch finished in ${Date.now() - started} ms`);
+
+    const rows = (await pool.query(
+      `SELECT o.to_email, o.status, o.attempts, o.last_error, l.delivery_status
+       FROM email_outbox o JOIN email_logs l ON l.id = o.email_log_id
+       WHERE o.email_log_id = ANY($1) ORDER BY o.id`,
+      [logIds]
+    )).rows;
+    rows.forEach(r => console.log(`  - ${r.to_email}: ${r.status} after ${r.attempts} attempt(s)${r.last_error ? ` (${r.last_error})` : ''}`));
+
+    const byAddress = Object.fromEntries(rows.map(r => [r.to_email, r]));
+    expect('deferred email delivered on retry', byAddress['retry@example.test']?.status === 'sent' && byAddress['retry@example.test'].attempts === 2);
+    expect('plain email delivered first time', byAddress['plain@example.test']?.status === 'sent' && byAddress['plain@example.test'].attempts === 1);
+    expect('rejected recipient dead-lettered without retries', byAddress['bounce@example.test']?.status === 'dead' && byAddress['bounce@example.test'].attempts === 1);
+    expect('delivery status mirrored to email_logs', rows.every(r => r.delivery_status === (r.status === 'dead' ? 'failed' : 'sent')));
+    expect('stand-in received two messages', smtp.received.length === 2);
+  } catch (error) {
+    if (error.code === '42P01') console.error('✗ email_outbox is missing: apply migrations/015_email_outbox.sql');
+    else console.error('✗ Error:', error.message);
+    failed = true;
+  } finally {
+    if (logIds.length > 0) {
+      await pool.query('DELETE FROM email_outbox WHERE email_log_id = ANY($1)', [logIds]).catch(() => {});
+      await pool.query('DELETE FROM email_logs WHERE id = ANY($1)', [logIds]).catch(() => {});
+    }
+    stopEmailDispatcher();
+    smtp.server.close();
+    await pool.end().catch(() => {});
+  }
+  process.exit(failed ? 1 : 0);
+}
+
+testEmailOutbox();
@@ -0,0 +1,57 @@
+// Check the shared rate limit store against the database with real epoch-ms
+// windows. PostgresStore falls back to memory on any query error, so this also
+// fails if a single hit was answered by the fallback. Needs
+// migrations/008_add_rate_limit_buckets.sql.
+//   node test-rate-limit-store.js
+import pool from './db.js';
+import { PostgresStore } from './middleware/rateLimiter.js';
+
+const WINDOW_MS = 60 * 1000;
+
+async function testRateLimitStore() {
+  let failed = false;
+  const expect = (label, ok) => {
+    console.log(`${ok ? '✓' : '✗'} ${label}`);
+    if (!ok) failed = true;
+  };
+
+  const store = new PostgresStore();
+  clearInterval(store.pruneTimer);
+  const key = `test-store:${process.pid}:${Date.now()}`;
+
+  try {
+    const now = Date.now();
+    const windowStart = now - (now % WINDOW_MS);
+
+    const first = await store.hit(key, 1, windowStart, WINDOW_MS);
+    const second = await store.hit(key, 2.5, windowStart, WINDOW_MS);
+    expect('costs add up within a window', first.curr === 1 && second.curr === 3.5 && second.prev === 0);
+
+    const next = await store.hit(key, 1, windowStart + WINDOW_MS, WINDOW_MS);
+    expect('the next window carries the count over as prev', next.prev === 3.5 && next.curr === 1);
+
+    const skipped = await store.hit(key, 1, windowStart + 3 * WINDOW_MS, WINDOW_MS);
+    expect('a gap of more than one window resets prev', skipped.prev === 0 && skipped.curr === 1);
+
+    const row = (await pool.query(
+      'SELECT window_start, expires_at FROM rate_limit_buckets WHERE bucket_key = $1',
+      [key]
+    )).rows[0];
+    expect(
+      'window_start and expires_at stored as epoch ms',
+      Number(row?.window_start) === windowStart + 3 * WINDOW_MS
+        && Number(row?.expires_at) === windowStart + 5 * WINDOW_MS
+    );
+
+    expect('no hit fell back to the in-memory store', store.fallback.buckets.size === 0);
+  } catch (error) {
+    console.error('✗ Error:', error.message);
+    failed = true;
+  }
+
+  await pool.query('DELETE FROM rate_limit_buckets WHERE bucket_key = $1', [key]).catch(() => {});
+  await pool.end().catch(() => {});
+  process.exit(failed ? 1 : 0);
+}
+
+testRateLimitStore();